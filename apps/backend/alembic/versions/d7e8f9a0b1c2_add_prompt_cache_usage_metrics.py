@@ -0,0 +1,35 @@
+"""Add prompt cache token columns to usage_metrics
+
+Revision ID: d7e8f9a0b1c2
+Revises: c5d6e7f8g9h0
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e8f9a0b1c2"
+down_revision: str | None = "c5d6e7f8g9h0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "usage_metrics",
+        sa.Column("cache_read_tokens", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "usage_metrics",
+        sa.Column("cache_creation_tokens", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("usage_metrics", "cache_creation_tokens")
+    op.drop_column("usage_metrics", "cache_read_tokens")
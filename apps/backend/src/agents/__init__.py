@@ -62,6 +62,7 @@ from src.agents.interrupts import (
 from src.agents.resilience import (
     create_resilient_node,
     reset_workflow_error_handler,
+    workflow_error_scope,
 )
 
 # State types
@@ -91,6 +92,7 @@ __all__ = [
     # Error recovery
     "create_resilient_node",
     "reset_workflow_error_handler",
+    "workflow_error_scope",
     # State types
     "WorkflowState",
     "CouncilState",
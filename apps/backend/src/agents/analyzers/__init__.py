@@ -4,9 +4,13 @@ Provides static analysis capabilities for:
 - Code quality scoring and issue detection
 - Test coverage and quality analysis
 - Plan validation and complexity scoring
+- Keyword classification shared by plan, task and security checks
+- Parse-once AST analysis shared by all analyzers
 """
 
+from src.agents.analyzers.ast_cache import ASTAnalysisCache, CodeAnalysis, analyze_source
 from src.agents.analyzers.code_quality import CodeQualityAnalyzer, analyze_code_quality
+from src.agents.analyzers.keyword_classifier import KeywordClassifier, KeywordFeatures
 from src.agents.analyzers.plan_validator import PlanValidation, validate_plan
 from src.agents.analyzers.test_analyzer import (
     TestAnalysis,
@@ -16,8 +20,13 @@ from src.agents.analyzers.test_analyzer import (
 )
 
 __all__ = [
+    "ASTAnalysisCache",
+    "CodeAnalysis",
+    "analyze_source",
     "CodeQualityAnalyzer",
     "analyze_code_quality",
+    "KeywordClassifier",
+    "KeywordFeatures",
     "validate_plan",
     "PlanValidation",
     "create_test_analysis",
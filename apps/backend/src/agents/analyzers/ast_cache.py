@@ -0,0 +1,490 @@
+"""Parse-once AST analysis shared by all code analyzers.
+
+In one workflow iteration the same generated code goes through syntax
+validation, linting, quality scoring, test extraction, coverage estimation
+and dependency detection. analyze_source parses it once and collects
+everything those analyzers need in a single visitor pass:
+
+- functions: name, location, docstring, decorators, cyclomatic complexity,
+  type hint coverage, assertions, mutable defaults
+- classes: name, location, docstring
+- imports, defined/used names and the lines each name is referenced on
+- bare except clauses
+
+Results are immutable CodeAnalysis artifacts cached by a hash of the source
+in a bounded LRU, so every analyzer after the first reads the artifact
+instead of re-parsing.
+
+Usage:
+    analysis = analyze_source(code)
+    if analysis.syntax_error is None:
+        for func in analysis.functions:
+            print(func.name, func.complexity)
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+from src.core.config import settings
+
+# Parameters that are not counted for type hint coverage
+_IMPLICIT_PARAMETERS = ("self", "cls")
+
+
+@dataclass(frozen=True)
+class FunctionInfo:
+    """A function or method definition.
+
+    Attributes:
+        name: Function name
+        lineno: Line of the ``def`` statement
+        depth: Number of enclosing class/function scopes (0 = module level)
+        class_name: Directly enclosing class, if this is a method
+        is_async: Whether it is an ``async def``
+        docstring: Cleaned docstring, if any
+        decorators: Decorator names (e.g. "pytest.mark.parametrize")
+        complexity: Cyclomatic complexity (nested definitions included)
+        assertions: Number of assert statements (nested definitions included)
+        has_return_annotation: Whether the return type is annotated
+        typed_parameters: Positional parameters with annotations (self/cls excluded)
+        untyped_parameters: Positional parameters without annotations (self/cls excluded)
+        mutable_defaults: Number of list/dict/set literal defaults
+    """
+
+    name: str
+    lineno: int
+    depth: int
+    class_name: str | None
+    is_async: bool
+    docstring: str | None
+    decorators: tuple[str, ...]
+    complexity: int
+    assertions: int
+    has_return_annotation: bool
+    typed_parameters: tuple[str, ...]
+    untyped_parameters: tuple[str, ...]
+    mutable_defaults: int
+
+
+@dataclass(frozen=True)
+class ClassInfo:
+    """A class definition.
+
+    Attributes:
+        name: Class name
+        lineno: Line of the ``class`` statement
+        depth: Number of enclosing class/function scopes (0 = module level)
+        docstring: Cleaned docstring, if any
+    """
+
+    name: str
+    lineno: int
+    depth: int
+    docstring: str | None
+
+
+@dataclass(frozen=True)
+class ImportInfo:
+    """An import statement.
+
+    Attributes:
+        module: Module of a ``from`` import ("" for relative imports), None for ``import``
+        names: (name, asname) pairs as written in the statement
+        lineno: Line of the statement
+    """
+
+    module: str | None
+    names: tuple[tuple[str, str | None], ...]
+    lineno: int
+
+    @property
+    def is_from(self) -> bool:
+        """Whether this is a ``from ... import`` statement."""
+        return self.module is not None
+
+
+@dataclass(frozen=True)
+class CodeAnalysis:
+    """Everything the analyzers need from one parse of a source file.
+
+    Artifacts are shared between callers through the cache and must be
+    treated as read-only.
+
+    Attributes:
+        syntax_error: Parse error, or None if the source is valid Python
+        module_docstring: Module docstring, if any
+        functions: Function and method definitions in source order
+        classes: Class definitions in source order
+        imports: Import statements in source order
+        defined_names: Names bound by definitions or assignments
+        used_names: Names read anywhere in the source
+        name_references: Lines on which each name is referenced, directly or
+            as the base of an attribute access
+        bare_except_lines: Lines of ``except:`` clauses without a type
+        tree: The parsed module, None if the source does not parse
+    """
+
+    syntax_error: SyntaxError | None = None
+    module_docstring: str | None = None
+    functions: tuple[FunctionInfo, ...] = ()
+    classes: tuple[ClassInfo, ...] = ()
+    imports: tuple[ImportInfo, ...] = ()
+    defined_names: frozenset[str] = frozenset()
+    used_names: frozenset[str] = frozenset()
+    name_references: Mapping[str, tuple[int, ...]] = field(default_factory=dict)
+    bare_except_lines: tuple[int, ...] = ()
+    tree: ast.Module | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the source parsed."""
+        return self.syntax_error is None
+
+    def definitions(self) -> list[FunctionInfo | ClassInfo]:
+        """Functions and classes merged in source order."""
+        return sorted([*self.functions, *self.classes], key=lambda d: d.lineno)
+
+
+def decorator_name(decorator: ast.expr) -> str:
+    """Get the dotted name of a decorator (calls are unwrapped).
+
+    Args:
+        decorator: Decorator expression
+
+    Returns:
+        Name like "pytest.fixture", or "unknown"
+    """
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    elif isinstance(decorator, ast.Attribute):
+        parts: list[str] = []
+        current: ast.expr = decorator
+        while isinstance(current, ast.Attribute):
+            parts.append(current.attr)
+            current = current.value
+        if isinstance(current, ast.Name):
+            parts.append(current.id)
+        return ".".join(reversed(parts))
+    elif isinstance(decorator, ast.Call):
+        return decorator_name(decorator.func)
+    return "unknown"
+
+
+class _FunctionFrame:
+    """Counters of a function whose body is being visited."""
+
+    __slots__ = ("node", "depth", "class_name", "complexity", "assertions", "index")
+
+    def __init__(
+        self,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+        depth: int,
+        class_name: str | None,
+        index: int,
+    ) -> None:
+        self.node = node
+        self.depth = depth
+        self.class_name = class_name
+        self.complexity = 1  # Base complexity
+        self.assertions = 0
+        self.index = index
+
+
+class _AnalysisVisitor(ast.NodeVisitor):
+    """Single pass collecting every fact in CodeAnalysis."""
+
+    def __init__(self) -> None:
+        self.functions: list[FunctionInfo | None] = []
+        self.classes: list[ClassInfo] = []
+        self.imports: list[ImportInfo] = []
+        self.defined_names: set[str] = set()
+        self.used_names: set[str] = set()
+        self.name_references: dict[str, list[int]] = {}
+        self.bare_except_lines: list[int] = []
+        # Open scopes: function frames, or class names
+        self._scopes: list[_FunctionFrame | str] = []
+        self._open_functions: list[_FunctionFrame] = []
+
+    def _add_complexity(self, amount: int) -> None:
+        # Decision points count for every enclosing function
+        for frame in self._open_functions:
+            frame.complexity += amount
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self.defined_names.add(node.name)
+        parent = self._scopes[-1] if self._scopes else None
+        frame = _FunctionFrame(
+            node,
+            depth=len(self._scopes),
+            class_name=parent if isinstance(parent, str) else None,
+            index=len(self.functions),
+        )
+        # Reserve the slot so functions stay in source order
+        self.functions.append(None)
+        self._scopes.append(frame)
+        self._open_functions.append(frame)
+        self.generic_visit(node)
+        self._open_functions.pop()
+        self._scopes.pop()
+        self.functions[frame.index] = self._function_info(frame)
+
+    def _function_info(self, frame: _FunctionFrame) -> FunctionInfo:
+        node = frame.node
+        typed: list[str] = []
+        untyped: list[str] = []
+        for arg in node.args.args:
+            if arg.arg in _IMPLICIT_PARAMETERS:
+                continue
+            (typed if arg.annotation is not None else untyped).append(arg.arg)
+        mutable_defaults = sum(
+            1
+            for default in node.args.defaults + node.args.kw_defaults
+            if isinstance(default, ast.List | ast.Dict | ast.Set)
+        )
+        return FunctionInfo(
+            name=node.name,
+            lineno=node.lineno,
+            depth=frame.depth,
+            class_name=frame.class_name,
+            is_async=isinstance(node, ast.AsyncFunctionDef),
+            docstring=ast.get_docstring(node),
+            decorators=tuple(decorator_name(d) for d in node.decorator_list),
+            complexity=frame.complexity,
+            assertions=frame.assertions,
+            has_return_annotation=node.returns is not None,
+            typed_parameters=tuple(typed),
+            untyped_parameters=tuple(untyped),
+            mutable_defaults=mutable_defaults,
+        )
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.defined_names.add(node.name)
+        self.classes.append(
+            ClassInfo(
+                name=node.name,
+                lineno=node.lineno,
+                depth=len(self._scopes),
+                docstring=ast.get_docstring(node),
+            )
+        )
+        self._scopes.append(node.name)
+        self.generic_visit(node)
+        self._scopes.pop()
+
+    def _branch(self, node: ast.AST) -> None:
+        self._add_complexity(1)
+        self.generic_visit(node)
+
+    def visit_If(self, node: ast.If) -> None:
+        self._branch(node)
+
+    def visit_While(self, node: ast.While) -> None:
+        self._branch(node)
+
+    def visit_For(self, node: ast.For) -> None:
+        self._branch(node)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        self._branch(node)
+
+    def visit_IfExp(self, node: ast.IfExp) -> None:
+        self._branch(node)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        self._add_complexity(1)
+        if node.type is None:
+            self.bare_except_lines.append(node.lineno)
+        self.generic_visit(node)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        self._add_complexity(len(node.values) - 1)
+        self.generic_visit(node)
+
+    def visit_comprehension(self, node: ast.comprehension) -> None:
+        self._add_complexity(len(node.ifs))
+        self.generic_visit(node)
+
+    def visit_Assert(self, node: ast.Assert) -> None:
+        for frame in self._open_functions:
+            frame.assertions += 1
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self.imports.append(
+            ImportInfo(
+                module=None,
+                names=tuple((alias.name, alias.asname) for alias in node.names),
+                lineno=node.lineno,
+            )
+        )
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self.imports.append(
+            ImportInfo(
+                module=node.module or "",
+                names=tuple((alias.name, alias.asname) for alias in node.names),
+                lineno=node.lineno,
+            )
+        )
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, ast.Store):
+            self.defined_names.add(node.id)
+        elif isinstance(node.ctx, ast.Load):
+            self.used_names.add(node.id)
+        self.name_references.setdefault(node.id, []).append(node.lineno)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        if isinstance(node.value, ast.Name):
+            # "requests.get" references "requests" once more (like the walk it replaces)
+            self.name_references.setdefault(node.value.id, []).append(node.lineno)
+        self.generic_visit(node)
+
+
+def _analyze(source: str) -> CodeAnalysis:
+    """Parse source and collect its analysis (uncached)."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as e:
+        return CodeAnalysis(syntax_error=e.with_traceback(None))
+
+    visitor = _AnalysisVisitor()
+    visitor.visit(tree)
+    return CodeAnalysis(
+        module_docstring=ast.get_docstring(tree),
+        functions=tuple(f for f in visitor.functions if f is not None),
+        classes=tuple(visitor.classes),
+        imports=tuple(visitor.imports),
+        defined_names=frozenset(visitor.defined_names),
+        used_names=frozenset(visitor.used_names),
+        name_references={name: tuple(lines) for name, lines in visitor.name_references.items()},
+        bare_except_lines=tuple(visitor.bare_except_lines),
+        tree=tree,
+    )
+
+
+class ASTAnalysisCache:
+    """Bounded LRU of CodeAnalysis artifacts keyed by source hash."""
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum artifacts kept (default: settings.ast_cache_max_entries;
+                0 disables caching)
+        """
+        self.max_entries = (
+            settings.ast_cache_max_entries if max_entries is None else max(max_entries, 0)
+        )
+        self._entries: OrderedDict[str, CodeAnalysis] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key_for(source: str) -> str:
+        """Content hash identifying a source."""
+        return hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def analyze(self, source: str) -> CodeAnalysis:
+        """Get the analysis of a source, parsing it only on a cache miss.
+
+        Args:
+            source: Python source code
+
+        Returns:
+            The (possibly shared) CodeAnalysis
+        """
+        key = self.key_for(source)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # Parse outside the lock; a concurrent miss on the same source only
+        # costs a duplicate parse
+        analysis = _analyze(source)
+
+        if self.max_entries:
+            with self._lock:
+                self._entries[key] = analysis
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return analysis
+
+    def clear(self) -> None:
+        """Drop all cached artifacts."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Global cache instance
+_analysis_cache: ASTAnalysisCache | None = None
+_analysis_cache_lock = Lock()
+
+
+def get_analysis_cache() -> ASTAnalysisCache:
+    """Get the global AST analysis cache (singleton).
+
+    Returns:
+        The global ASTAnalysisCache instance
+    """
+    global _analysis_cache
+
+    if _analysis_cache is None:
+        with _analysis_cache_lock:
+            if _analysis_cache is None:
+                _analysis_cache = ASTAnalysisCache()
+
+    return _analysis_cache
+
+
+def reset_analysis_cache() -> None:
+    """Drop the global cache.
+
+    Useful for testing.
+    """
+    global _analysis_cache
+
+    with _analysis_cache_lock:
+        _analysis_cache = None
+
+
+def analyze_source(source: str) -> CodeAnalysis:
+    """Analyze Python source through the global cache.
+
+    Args:
+        source: Python source code
+
+    Returns:
+        CodeAnalysis (syntax_error is set if the source does not parse)
+    """
+    return get_analysis_cache().analyze(source)
@@ -23,12 +23,13 @@ Usage:
         print(f"{issue.severity}: {issue.message}")
 """
 
-import ast
-import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from src.agents.analyzers.ast_cache import CodeAnalysis, FunctionInfo, analyze_source
+from src.agents.analyzers.rule_scanner import RuleScanner, ScanRule
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -214,67 +215,100 @@ class QualityAnalysisResult:
 
 
 # Security patterns to detect
-SECURITY_PATTERNS = [
-    {
-        "pattern": r"exec\s*\(",
-        "message": "Use of exec() can lead to code injection",
-        "severity": IssueSeverity.CRITICAL,
-    },
-    {
-        "pattern": r"eval\s*\(",
-        "message": "Use of eval() can lead to code injection",
-        "severity": IssueSeverity.CRITICAL,
-    },
-    {
-        "pattern": r"os\.system\s*\(",
-        "message": "Use of os.system() is vulnerable to shell injection",
-        "severity": IssueSeverity.HIGH,
-    },
-    {
-        "pattern": r"subprocess\.(?:call|run|Popen)\s*\([^)]*shell\s*=\s*True",
-        "message": "subprocess with shell=True is vulnerable to injection",
-        "severity": IssueSeverity.HIGH,
-    },
-    {
-        "pattern": r"pickle\.loads?\s*\(",
-        "message": "Unpickling data can lead to code execution",
-        "severity": IssueSeverity.HIGH,
-    },
-    {
-        "pattern": r"yaml\.load\s*\([^)]*(?!Loader)",
-        "message": "yaml.load without Loader parameter is unsafe",
-        "severity": IssueSeverity.HIGH,
-    },
-    {
-        "pattern": r'password\s*=\s*["\'][^"\']+["\']',
-        "message": "Hardcoded password detected",
-        "severity": IssueSeverity.CRITICAL,
-    },
-    {
-        "pattern": r"api_key\s*=\s*[\"'][^\"']+[\"']",
-        "message": "Hardcoded API key detected",
-        "severity": IssueSeverity.CRITICAL,
-    },
-]
+SECURITY_RULES = (
+    ScanRule(
+        "exec-call",
+        r"exec\s*\(",
+        "Use of exec() can lead to code injection",
+        IssueSeverity.CRITICAL,
+        IssueCategory.SECURITY,
+        ignore_case=True,
+    ),
+    ScanRule(
+        "eval-call",
+        r"eval\s*\(",
+        "Use of eval() can lead to code injection",
+        IssueSeverity.CRITICAL,
+        IssueCategory.SECURITY,
+        ignore_case=True,
+    ),
+    ScanRule(
+        "os-system",
+        r"os\.system\s*\(",
+        "Use of os.system() is vulnerable to shell injection",
+        IssueSeverity.HIGH,
+        IssueCategory.SECURITY,
+        ignore_case=True,
+    ),
+    ScanRule(
+        "subprocess-shell",
+        r"subprocess\.(?:call|run|Popen)\s*\([^)]*shell\s*=\s*True",
+        "subprocess with shell=True is vulnerable to injection",
+        IssueSeverity.HIGH,
+        IssueCategory.SECURITY,
+        ignore_case=True,
+    ),
+    ScanRule(
+        "pickle-load",
+        r"pickle\.loads?\s*\(",
+        "Unpickling data can lead to code execution",
+        IssueSeverity.HIGH,
+        IssueCategory.SECURITY,
+        ignore_case=True,
+    ),
+    ScanRule(
+        "yaml-load",
+        r"yaml\.load\s*\([^)]*(?!Loader)",
+        "yaml.load without Loader parameter is unsafe",
+        IssueSeverity.HIGH,
+        IssueCategory.SECURITY,
+        ignore_case=True,
+    ),
+    ScanRule(
+        "hardcoded-password",
+        r'password\s*=\s*["\'][^"\']+["\']',
+        "Hardcoded password detected",
+        IssueSeverity.CRITICAL,
+        IssueCategory.SECURITY,
+        ignore_case=True,
+    ),
+    ScanRule(
+        "hardcoded-api-key",
+        r"api_key\s*=\s*[\"'][^\"']+[\"']",
+        "Hardcoded API key detected",
+        IssueSeverity.CRITICAL,
+        IssueCategory.SECURITY,
+        ignore_case=True,
+    ),
+)
 
 # Performance anti-patterns
-PERFORMANCE_PATTERNS = [
-    {
-        "pattern": r"for\s+\w+\s+in\s+range\(len\(",
-        "message": "Use enumerate() instead of range(len())",
-        "severity": IssueSeverity.LOW,
-    },
-    {
-        "pattern": r"\+\s*=\s*.*\+",
-        "message": "String concatenation in loop may be inefficient",
-        "severity": IssueSeverity.LOW,
-    },
-    {
-        "pattern": r"\.append\([^)]+\)\s*$",
-        "message": "Consider list comprehension instead of repeated append",
-        "severity": IssueSeverity.INFO,
-    },
-]
+PERFORMANCE_RULES = (
+    ScanRule(
+        "range-len",
+        r"for\s+\w+\s+in\s+range\(len\(",
+        "Use enumerate() instead of range(len())",
+        IssueSeverity.LOW,
+        IssueCategory.PERFORMANCE,
+    ),
+    ScanRule(
+        "string-concat",
+        r"\+\s*=\s*.*\+",
+        "String concatenation in loop may be inefficient",
+        IssueSeverity.LOW,
+        IssueCategory.PERFORMANCE,
+    ),
+    ScanRule(
+        "append-loop",
+        r"\.append\([^)]+\)\s*$",
+        "Consider list comprehension instead of repeated append",
+        IssueSeverity.INFO,
+        IssueCategory.PERFORMANCE,
+    ),
+)
+
+# Built-in rules, compiled once
+DEFAULT_RULE_SCANNER = RuleScanner([*SECURITY_RULES, *PERFORMANCE_RULES])
 
 
 class CodeQualityAnalyzer:
@@ -312,6 +346,7 @@ class CodeQualityAnalyzer:
         complexity_threshold: int = 10,
         min_docstring_coverage: float = 80.0,
         min_type_coverage: float = 80.0,
+        extra_rules: Sequence[ScanRule] = (),
     ) -> None:
         """Initialize the analyzer.
 
@@ -319,10 +354,16 @@ class CodeQualityAnalyzer:
             complexity_threshold: Max complexity before flagging
             min_docstring_coverage: Minimum docstring coverage target
             min_type_coverage: Minimum type hint coverage target
+            extra_rules: User-defined line rules applied after the built-in
+                security and performance rules (severity and category must be
+                IssueSeverity and IssueCategory values)
         """
         self.complexity_threshold = complexity_threshold
         self.min_docstring_coverage = min_docstring_coverage
         self.min_type_coverage = min_type_coverage
+        self.rule_scanner = (
+            DEFAULT_RULE_SCANNER.extend(extra_rules) if extra_rules else DEFAULT_RULE_SCANNER
+        )
 
     def analyze(self, source_code: str) -> QualityAnalysisResult:
         """Perform complete quality analysis on source code.
@@ -335,10 +376,10 @@ class CodeQualityAnalyzer:
         """
         result = QualityAnalysisResult()
 
-        # Try to parse the code
-        try:
-            tree = ast.parse(source_code)
-        except SyntaxError as e:
+        # Parse once; every metric reads the shared analysis
+        analysis = analyze_source(source_code)
+        e = analysis.syntax_error
+        if e is not None:
             result.issues.append(
                 CodeIssue(
                     category=IssueCategory.CORRECTNESS,
@@ -352,17 +393,15 @@ class CodeQualityAnalyzer:
             return result
 
         # Calculate metrics
-        result.complexity = self._calculate_complexity(tree)
-        result.documentation = self._analyze_documentation(tree)
-        result.type_hints = self._analyze_type_coverage(tree)
+        result.complexity = self._calculate_complexity(analysis)
+        result.documentation = self._analyze_documentation(analysis)
+        result.type_hints = self._analyze_type_coverage(analysis)
 
         # Detect issues
-        security_issues = self._detect_security_issues(source_code)
-        performance_issues = self._detect_performance_issues(source_code)
-        style_issues = self._detect_style_issues(tree, source_code)
+        pattern_issues = self._detect_pattern_issues(source_code)
+        style_issues = self._detect_style_issues(analysis, source_code)
 
-        result.issues.extend(security_issues)
-        result.issues.extend(performance_issues)
+        result.issues.extend(pattern_issues)
         result.issues.extend(style_issues)
 
         # Calculate overall score
@@ -381,11 +420,15 @@ class CodeQualityAnalyzer:
 
         return result
 
-    def _calculate_complexity(self, tree: ast.AST) -> ComplexityMetrics:
+    def _calculate_complexity(self, analysis: CodeAnalysis) -> ComplexityMetrics:
         """Calculate cyclomatic complexity metrics.
 
+        Complexity = 1 + number of decision points
+        Decision points: if, elif, for, while, except, and, or, ternary,
+        comprehension conditions
+
         Args:
-            tree: Parsed AST
+            analysis: Shared analysis of the source
 
         Returns:
             ComplexityMetrics
@@ -393,14 +436,11 @@ class CodeQualityAnalyzer:
         metrics = ComplexityMetrics()
         complexities: dict[str, int] = {}
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-                complexity = self._function_complexity(node)
-                func_name = node.name
-                complexities[func_name] = complexity
+        for func in analysis.functions:
+            complexities[func.name] = func.complexity
 
-                if complexity > self.complexity_threshold:
-                    metrics.complex_functions.append(f"{func_name} ({complexity})")
+            if func.complexity > self.complexity_threshold:
+                metrics.complex_functions.append(f"{func.name} ({func.complexity})")
 
         if complexities:
             metrics.complexity_by_function = complexities
@@ -410,36 +450,14 @@ class CodeQualityAnalyzer:
 
         return metrics
 
-    def _function_complexity(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
-        """Calculate cyclomatic complexity for a function.
-
-        Complexity = 1 + number of decision points
-        Decision points: if, elif, for, while, except, and, or, ternary
-        """
-        complexity = 1  # Base complexity
-
-        for child in ast.walk(node):
-            if isinstance(child, ast.If | ast.While | ast.For | ast.AsyncFor):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                # and/or add complexity
-                complexity += len(child.values) - 1
-            elif isinstance(child, ast.IfExp):
-                # Ternary expression
-                complexity += 1
-            elif isinstance(child, ast.comprehension):
-                # List/dict/set comprehension with if
-                complexity += len(child.ifs)
-
-        return complexity
-
-    def _analyze_documentation(self, tree: ast.AST) -> DocumentationMetrics:
+    def _analyze_documentation(self, analysis: CodeAnalysis) -> DocumentationMetrics:
         """Analyze docstring coverage.
 
+        Counts the module docstring, module-level functions and classes, and
+        the methods of module-level classes.
+
         Args:
-            tree: Parsed AST
+            analysis: Shared analysis of the source
 
         Returns:
             DocumentationMetrics
@@ -447,30 +465,25 @@ class CodeQualityAnalyzer:
         metrics = DocumentationMetrics()
         missing: list[str] = []
 
-        for node in ast.iter_child_nodes(tree):
-            # Check module docstring
-            if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
-                if isinstance(node.value.value, str):
-                    metrics.documented_items += 1
-                    metrics.total_items += 1
-
-            # Check functions and classes
-            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
-                metrics.total_items += 1
-                if ast.get_docstring(node):
-                    metrics.documented_items += 1
-                else:
-                    missing.append(node.name)
-
-                # Check methods inside classes
-                if isinstance(node, ast.ClassDef):
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
-                            metrics.total_items += 1
-                            if ast.get_docstring(item):
-                                metrics.documented_items += 1
-                            else:
-                                missing.append(f"{node.name}.{item.name}")
+        if analysis.module_docstring is not None:
+            metrics.documented_items += 1
+            metrics.total_items += 1
+
+        for definition in analysis.definitions():
+            if definition.depth == 0:
+                name = definition.name
+            elif isinstance(definition, FunctionInfo) and definition.depth == 1:
+                if definition.class_name is None:
+                    continue  # Nested function
+                name = f"{definition.class_name}.{definition.name}"
+            else:
+                continue
+
+            metrics.total_items += 1
+            if definition.docstring:
+                metrics.documented_items += 1
+            else:
+                missing.append(name)
 
         metrics.missing_docstrings = missing
         if metrics.total_items > 0:
@@ -478,11 +491,11 @@ class CodeQualityAnalyzer:
 
         return metrics
 
-    def _analyze_type_coverage(self, tree: ast.AST) -> TypeHintMetrics:
+    def _analyze_type_coverage(self, analysis: CodeAnalysis) -> TypeHintMetrics:
         """Analyze type hint coverage.
 
         Args:
-            tree: Parsed AST
+            analysis: Shared analysis of the source
 
         Returns:
             TypeHintMetrics
@@ -490,23 +503,18 @@ class CodeQualityAnalyzer:
         metrics = TypeHintMetrics()
         untyped: list[str] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-                # Check return type
-                metrics.total_return_types += 1
-                if node.returns is not None:
-                    metrics.typed_return_types += 1
-                else:
-                    untyped.append(f"{node.name} return type")
-
-                # Check parameters (skip self, cls)
-                for arg in node.args.args:
-                    if arg.arg not in ("self", "cls"):
-                        metrics.total_parameters += 1
-                        if arg.annotation is not None:
-                            metrics.typed_parameters += 1
-                        else:
-                            untyped.append(f"{node.name}.{arg.arg}")
+        for func in analysis.functions:
+            # Check return type
+            metrics.total_return_types += 1
+            if func.has_return_annotation:
+                metrics.typed_return_types += 1
+            else:
+                untyped.append(f"{func.name} return type")
+
+            # Check parameters (self and cls are not counted)
+            metrics.total_parameters += len(func.typed_parameters) + len(func.untyped_parameters)
+            metrics.typed_parameters += len(func.typed_parameters)
+            untyped.extend(f"{func.name}.{param}" for param in func.untyped_parameters)
 
         metrics.untyped_items = untyped
         total = metrics.total_parameters + metrics.total_return_types
@@ -516,70 +524,40 @@ class CodeQualityAnalyzer:
 
         return metrics
 
-    def _detect_security_issues(self, source_code: str) -> list[CodeIssue]:
-        """Detect security issues using pattern matching.
+    def _detect_pattern_issues(self, source_code: str) -> list[CodeIssue]:
+        """Detect security issues and performance anti-patterns.
 
-        Args:
-            source_code: Source code to analyze
-
-        Returns:
-            List of security issues
-        """
-        issues: list[CodeIssue] = []
-        lines = source_code.splitlines()
-
-        for pattern_info in SECURITY_PATTERNS:
-            pattern = re.compile(str(pattern_info["pattern"]), re.IGNORECASE)
-            severity = pattern_info["severity"]
-            assert isinstance(severity, IssueSeverity)  # nosec B101
-            for i, line in enumerate(lines):
-                if pattern.search(line):
-                    issues.append(
-                        CodeIssue(
-                            category=IssueCategory.SECURITY,
-                            severity=severity,
-                            message=str(pattern_info["message"]),
-                            line_number=i + 1,
-                            code_snippet=line.strip()[:80],
-                        )
-                    )
-
-        return issues
-
-    def _detect_performance_issues(self, source_code: str) -> list[CodeIssue]:
-        """Detect performance anti-patterns.
+        All line rules are applied in a single pass (see RuleScanner).
 
         Args:
             source_code: Source code to analyze
 
         Returns:
-            List of performance issues
+            List of issues, ordered by line
         """
         issues: list[CodeIssue] = []
-        lines = source_code.splitlines()
-
-        for pattern_info in PERFORMANCE_PATTERNS:
-            pattern = re.compile(str(pattern_info["pattern"]))
-            severity = pattern_info["severity"]
-            assert isinstance(severity, IssueSeverity)  # nosec B101
-            for i, line in enumerate(lines):
-                if pattern.search(line):
-                    issues.append(
-                        CodeIssue(
-                            category=IssueCategory.PERFORMANCE,
-                            severity=severity,
-                            message=str(pattern_info["message"]),
-                            line_number=i + 1,
-                        )
-                    )
+
+        for match in self.rule_scanner.scan(source_code):
+            category = IssueCategory(match.rule.category)
+            issues.append(
+                CodeIssue(
+                    category=category,
+                    severity=IssueSeverity(match.rule.severity),
+                    message=match.rule.message,
+                    line_number=match.line_number,
+                    code_snippet=(
+                        match.line.strip()[:80] if category == IssueCategory.SECURITY else ""
+                    ),
+                )
+            )
 
         return issues
 
-    def _detect_style_issues(self, tree: ast.AST, source_code: str) -> list[CodeIssue]:
+    def _detect_style_issues(self, analysis: CodeAnalysis, source_code: str) -> list[CodeIssue]:
         """Detect style issues.
 
         Args:
-            tree: Parsed AST
+            analysis: Shared analysis of the source
             source_code: Source code
 
         Returns:
@@ -600,33 +578,30 @@ class CodeQualityAnalyzer:
                 )
 
         # Check for bare except
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ExceptHandler) and node.type is None:
+        for line_number in analysis.bare_except_lines:
+            issues.append(
+                CodeIssue(
+                    category=IssueCategory.STYLE,
+                    severity=IssueSeverity.MEDIUM,
+                    message="Bare except clause catches all exceptions",
+                    line_number=line_number,
+                    suggestion="Specify exception type or use 'except Exception:'",
+                )
+            )
+
+        # Check for mutable default arguments
+        for func in analysis.functions:
+            for _ in range(func.mutable_defaults):
                 issues.append(
                     CodeIssue(
-                        category=IssueCategory.STYLE,
-                        severity=IssueSeverity.MEDIUM,
-                        message="Bare except clause catches all exceptions",
-                        line_number=node.lineno,
-                        suggestion="Specify exception type or use 'except Exception:'",
+                        category=IssueCategory.CORRECTNESS,
+                        severity=IssueSeverity.HIGH,
+                        message="Mutable default argument",
+                        line_number=func.lineno,
+                        suggestion="Use None and initialize in function body",
                     )
                 )
 
-        # Check for mutable default arguments
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-                for default in node.args.defaults + node.args.kw_defaults:
-                    if default and isinstance(default, ast.List | ast.Dict | ast.Set):
-                        issues.append(
-                            CodeIssue(
-                                category=IssueCategory.CORRECTNESS,
-                                severity=IssueSeverity.HIGH,
-                                message="Mutable default argument",
-                                line_number=node.lineno,
-                                suggestion="Use None and initialize in function body",
-                            )
-                        )
-
         return issues
 
     def _calculate_overall_score(self, result: QualityAnalysisResult) -> float:
@@ -26,6 +26,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from src.agents.analyzers.keyword_classifier import KeywordClassifier, KeywordFeatures
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -230,6 +231,50 @@ TECHNICAL_KEYWORDS = {
     ],
 }
 
+# Verbs that make a plan actionable
+ACTIONABLE_VERBS = [
+    "create",
+    "implement",
+    "add",
+    "update",
+    "modify",
+    "remove",
+    "delete",
+    "configure",
+    "setup",
+    "test",
+    "verify",
+    "deploy",
+    "build",
+    "write",
+    "design",
+    "define",
+    "refactor",
+    "optimize",
+    "fix",
+    "integrate",
+]
+
+# Scope indicators counted in a plan
+FILE_MENTION_PATTERN = r"\b\w+\.(py|ts|js|tsx|jsx|sql|yaml|json)\b"
+COMPONENT_MENTION_PATTERN = r"(?:component|service|model|controller|handler|router|schema)"
+
+# Classifies whole plans: technical level, actionability and scope
+PLAN_CLASSIFIER = KeywordClassifier(
+    {
+        "high": TECHNICAL_KEYWORDS["high"],
+        "medium": TECHNICAL_KEYWORDS["medium"],
+        "action": ACTIONABLE_VERBS,
+    },
+    counters={"files": FILE_MENTION_PATTERN, "components": COMPONENT_MENTION_PATTERN},
+)
+
+# Classifies single steps (each step is seen once, so nothing is cached)
+STEP_CLASSIFIER = KeywordClassifier(
+    {"high": TECHNICAL_KEYWORDS["high"], "medium": TECHNICAL_KEYWORDS["medium"]},
+    cache_size=0,
+)
+
 
 def extract_plan_sections(plan: str) -> list[PlanSection]:
     """Extract structured sections from a plan.
@@ -320,23 +365,20 @@ def _extract_steps(content: str) -> list[PlanStep]:
 
 def _estimate_step_complexity(content: str) -> float:
     """Estimate complexity of a single step (0.0 - 1.0)."""
-    content_lower = content.lower()
-    score = 0.0
+    features = STEP_CLASSIFIER.classify(content)
 
     # Check for technical keywords
-    for keyword in TECHNICAL_KEYWORDS["high"]:
-        if keyword in content_lower:
-            score += 0.15
-
-    for keyword in TECHNICAL_KEYWORDS["medium"]:
-        if keyword in content_lower:
-            score += 0.08
+    score = features.count("high") * 0.15 + features.count("medium") * 0.08
 
     # Cap at 1.0
     return min(score, 1.0)
 
 
-def calculate_complexity(plan: str, sections: list[PlanSection]) -> ComplexityScore:
+def calculate_complexity(
+    plan: str,
+    sections: list[PlanSection],
+    features: KeywordFeatures | None = None,
+) -> ComplexityScore:
     """Calculate complexity score for a plan.
 
     The complexity score is a weighted combination of:
@@ -348,11 +390,13 @@ def calculate_complexity(plan: str, sections: list[PlanSection]) -> ComplexitySc
     Args:
         plan: Raw plan text
         sections: Extracted plan sections
+        features: PLAN_CLASSIFIER features of the plan, if already computed
 
     Returns:
         ComplexityScore with breakdown and overall score
     """
-    plan_lower = plan.lower()
+    if features is None:
+        features = PLAN_CLASSIFIER.classify(plan)
     all_steps = [step for section in sections for step in section.steps]
     total_steps = len(all_steps)
 
@@ -364,21 +408,12 @@ def calculate_complexity(plan: str, sections: list[PlanSection]) -> ComplexitySc
     dependency_score = deps_count / max(total_steps, 1)
 
     # Technical complexity score
-    tech_score = 0.0
-    for keyword in TECHNICAL_KEYWORDS["high"]:
-        if keyword in plan_lower:
-            tech_score += 0.1
-    for keyword in TECHNICAL_KEYWORDS["medium"]:
-        if keyword in plan_lower:
-            tech_score += 0.05
+    tech_score = features.count("high") * 0.1 + features.count("medium") * 0.05
     technical_score = min(tech_score, 1.0)
 
     # Scope score (based on file/component mentions)
-    file_mentions = len(re.findall(r"\b\w+\.(py|ts|js|tsx|jsx|sql|yaml|json)\b", plan_lower))
-    component_mentions = len(
-        re.findall(r"(?:component|service|model|controller|handler|router|schema)", plan_lower)
-    )
-    scope_score = min((file_mentions + component_mentions) / 10, 1.0)
+    mentions = features.counter("files") + features.counter("components")
+    scope_score = min(mentions / 10, 1.0)
 
     # Calculate weighted overall score
     overall_score = (
@@ -506,30 +541,8 @@ def validate_plan(plan: str, min_steps: int = 2, max_steps: int = 20) -> PlanVal
         )
 
     # Check actionability
-    actionable_verbs = [
-        "create",
-        "implement",
-        "add",
-        "update",
-        "modify",
-        "remove",
-        "delete",
-        "configure",
-        "setup",
-        "test",
-        "verify",
-        "deploy",
-        "build",
-        "write",
-        "design",
-        "define",
-        "refactor",
-        "optimize",
-        "fix",
-        "integrate",
-    ]
-    plan_lower = plan.lower()
-    has_action_verbs = any(verb in plan_lower for verb in actionable_verbs)
+    features = PLAN_CLASSIFIER.classify(plan)
+    has_action_verbs = features.has("action")
 
     if not has_action_verbs:
         issues.append(
@@ -540,7 +553,7 @@ def validate_plan(plan: str, min_steps: int = 2, max_steps: int = 20) -> PlanVal
         )
 
     # Calculate complexity
-    complexity = calculate_complexity(plan, sections)
+    complexity = calculate_complexity(plan, sections, features)
 
     # Determine if plan is actionable
     is_actionable = total_steps >= min_steps and vague_count < total_steps / 2 and has_action_verbs
@@ -17,7 +17,6 @@ Features:
 TODO: Add mutation testing support
 """
 
-import ast
 import asyncio
 import json
 import re
@@ -28,6 +27,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from src.agents.analyzers.ast_cache import CodeAnalysis, FunctionInfo, analyze_source
 from src.core.config import settings
 from src.core.logging import get_logger
 
@@ -313,10 +313,10 @@ def extract_test_functions(test_code: str) -> TestSuite:
     suite = TestSuite()
 
     # Try AST parsing for accurate extraction
-    try:
-        tree = ast.parse(test_code)
-        suite = _extract_from_ast(tree, test_code)
-    except SyntaxError:
+    analysis = analyze_source(test_code)
+    if analysis.syntax_error is None:
+        suite = _extract_from_ast(analysis)
+    else:
         # Fall back to regex if AST fails
         logger.warning("AST parsing failed, falling back to regex extraction")
         suite = _extract_from_regex(test_code)
@@ -331,97 +331,62 @@ def extract_test_functions(test_code: str) -> TestSuite:
     return suite
 
 
-def _extract_from_ast(tree: ast.AST, source: str) -> TestSuite:
-    """Extract tests using AST parsing."""
+def _extract_from_ast(analysis: CodeAnalysis) -> TestSuite:
+    """Extract tests from the shared AST analysis."""
     suite = TestSuite()
-    lines = source.splitlines()
-
-    for node in ast.walk(tree):
-        # Extract imports
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                suite.imports.append(f"import {alias.name}")
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module or ""
-            names = ", ".join(alias.name for alias in node.names)
-            suite.imports.append(f"from {module} import {names}")
-
-    # Process top-level and class-level functions
-    for node in ast.iter_child_nodes(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            _process_function(node, None, suite, lines)
-        elif isinstance(node, ast.ClassDef):
-            if node.name.startswith("Test"):
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
-                        _process_function(item, node.name, suite, lines)
+
+    # Extract imports
+    for statement in analysis.imports:
+        if statement.is_from:
+            names = ", ".join(name for name, _ in statement.names)
+            suite.imports.append(f"from {statement.module} import {names}")
+        else:
+            suite.imports.extend(f"import {name}" for name, _ in statement.names)
+
+    # Process top-level functions and methods of top-level Test* classes
+    for func in analysis.functions:
+        if func.depth == 0:
+            _process_function(func, suite)
+        elif func.depth == 1 and func.class_name and func.class_name.startswith("Test"):
+            _process_function(func, suite)
 
     return suite
 
 
-def _process_function(
-    node: ast.FunctionDef | ast.AsyncFunctionDef,
-    class_name: str | None,
-    suite: TestSuite,
-    lines: list[str],
-) -> None:
-    """Process a function node and add to suite if it's a test or fixture."""
-    decorators = [_get_decorator_name(d) for d in node.decorator_list]
+def _process_function(func: FunctionInfo, suite: TestSuite) -> None:
+    """Add a function to the suite if it's a test or fixture."""
+    decorators = list(func.decorators)
 
     # Check for fixtures
     if "pytest.fixture" in decorators or "fixture" in decorators:
-        suite.fixtures.append(node.name)
+        suite.fixtures.append(func.name)
         return
 
     # Check for test functions
-    if not node.name.startswith("test_"):
+    if not func.name.startswith("test_"):
         return
 
-    # Extract docstring
-    docstring = ast.get_docstring(node)
-
-    # Count assertions
-    assertions = sum(1 for n in ast.walk(node) if isinstance(n, ast.Assert))
-
     # Determine test type
-    test_type = _classify_test(node.name, docstring, decorators)
+    test_type = _classify_test(func.name, func.docstring, decorators)
 
     # Check for parametrize
     is_parametrized = any("parametrize" in d for d in decorators)
 
     test_case = TestCase(
-        name=node.name,
-        class_name=class_name,
-        docstring=docstring,
-        line_number=node.lineno,
+        name=func.name,
+        class_name=func.class_name,
+        docstring=func.docstring,
+        line_number=func.lineno,
         test_type=test_type,
         is_parametrized=is_parametrized,
-        is_async=isinstance(node, ast.AsyncFunctionDef),
+        is_async=func.is_async,
         decorators=decorators,
-        assertions=assertions,
+        assertions=func.assertions,
     )
 
     suite.test_cases.append(test_case)
 
 
-def _get_decorator_name(decorator: ast.expr) -> str:
-    """Extract decorator name from AST node."""
-    if isinstance(decorator, ast.Name):
-        return decorator.id
-    elif isinstance(decorator, ast.Attribute):
-        parts: list[str] = []
-        current: ast.expr = decorator
-        while isinstance(current, ast.Attribute):
-            parts.append(current.attr)
-            current = current.value
-        if isinstance(current, ast.Name):
-            parts.append(current.id)
-        return ".".join(reversed(parts))
-    elif isinstance(decorator, ast.Call):
-        return _get_decorator_name(decorator.func)
-    return "unknown"
-
-
 def _classify_test(name: str, docstring: str | None, decorators: list[str]) -> TestType:
     """Classify test type based on name, docstring, and decorators."""
     name_lower = name.lower()
@@ -501,18 +466,16 @@ def analyze_coverage(source_code: str, test_suite: TestSuite) -> CoverageMetrics
     metrics = CoverageMetrics()
 
     # Extract functions and classes from source code
-    try:
-        tree = ast.parse(source_code)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-                # Skip private functions and test functions
-                if not node.name.startswith("_") and not node.name.startswith("test_"):
-                    metrics.functions_in_code.append(node.name)
-            elif isinstance(node, ast.ClassDef):
-                if not node.name.startswith("_"):
-                    metrics.classes_in_code.append(node.name)
-    except SyntaxError:
+    analysis = analyze_source(source_code)
+    if analysis.syntax_error is None:
+        # Skip private functions and test functions
+        metrics.functions_in_code = [
+            f.name
+            for f in analysis.functions
+            if not f.name.startswith("_") and not f.name.startswith("test_")
+        ]
+        metrics.classes_in_code = [c.name for c in analysis.classes if not c.name.startswith("_")]
+    else:
         # Fall back to regex
         func_pattern = re.compile(r"^(?:async\s+)?def\s+(\w+)\s*\(", re.MULTILINE)
         class_pattern = re.compile(r"^class\s+(\w+)\s*[:\(]", re.MULTILINE)
@@ -6,12 +6,16 @@ different personas on the same model) to provide comprehensive code review.
 Components:
 - orchestrator: Main council logic and judge coordination
 - node: LangGraph node integration
+- speculation: Code-only judges run alongside the tester
+- incremental: Re-review of only the code changed since the last round
 """
 
 from src.agents.council.node import council_reviewer_node
 from src.agents.council.orchestrator import CodeReviewCouncil
+from src.agents.council.speculation import with_speculative_review
 
 __all__ = [
     "CodeReviewCouncil",
     "council_reviewer_node",
+    "with_speculative_review",
 ]
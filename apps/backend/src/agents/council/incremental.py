@@ -0,0 +1,541 @@
+"""Incremental council review of revised code.
+
+After a REVISE verdict the coder revises the code and the council reviews
+it again. Instead of sending every judge the full code, tests and plan
+once more, an incremental review sends only what changed:
+
+1. The reviewed code and tests are split into units: top-level functions,
+   class methods, the rest of each class body and the module-level code.
+   Each unit is fingerprinted by a hash of its AST, so reformatting and
+   comment changes do not count as changes.
+2. Units are compared with the ones recorded after the previous review
+   (``state["review_memory"]``); only added and modified units are shown
+   to the judges, together with a compact list of earlier findings.
+3. Every finding gets an issue ID. Findings in unchanged units are carried
+   forward unresolved; findings in changed code, or without a location,
+   are resolved unless a judge reports them again (judges prefix repeated
+   findings with their ID).
+
+The full review is used for the first round, when the plan changed, or
+when so much changed that a full review is as cheap
+(council_incremental_max_changed_ratio).
+
+Example:
+    files = review_files(state)
+    incremental = prepare_incremental_review(state.get("review_memory"), files, plan)
+    council_state = await council.convene(
+        code, tests, plan,
+        review_context=incremental.context if incremental else None,
+        carried_issues=incremental.carried_issues if incremental else None,
+    )
+    memory = build_review_memory(files, plan, council_state["judge_verdicts"], previous, incremental)
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.agents.analyzers.ast_cache import analyze_source
+from src.agents.state import JudgeVerdictState, WorkflowState
+from src.core.config import settings
+
+# Pseudo file path of the test suite among the reviewed files
+TESTS_FILEPATH = "<tests>"
+
+# File path used for the code when the coder did not name its primary file
+DEFAULT_CODE_FILEPATH = "<code>"
+
+# Unit name of a file's module-level statements (or of a whole non-Python file)
+MODULE_UNIT = "<module>"
+
+# Characters of the unchanged plan repeated in an incremental review
+PLAN_SUMMARY_CHARS = 1000
+
+# Prefix judges put in front of a repeated finding, e.g. "[I-1a2b3c4d] ..."
+ISSUE_ID_PATTERN = re.compile(r"^\s*\[(I-[0-9a-f]{8})\]\s*")
+
+INCREMENTAL_REVIEW_CONTEXT_PROMPT = """This is review round {round}. The code was revised \
+after the previous round's feedback. Only the units (functions, methods, class bodies, \
+module-level code) that changed since then are shown; the rest was reviewed before and \
+is unchanged.
+
+Judge the revision as a whole: open findings in unchanged code still count towards your \
+verdict. If an earlier finding is still present in the changed code, report it again and \
+start its description with its ID, e.g. "[I-1a2b3c4d] ...". Earlier findings in changed \
+code that you do not report again are treated as resolved.
+
+## Changes Since Last Review
+{changes}
+
+## Changed Code
+{changed_code}
+
+## Earlier Findings
+{findings}
+
+## Context (Execution Plan, unchanged)
+{plan}"""
+
+
+@dataclass(frozen=True)
+class ReviewUnit:
+    """A separately fingerprinted part of a reviewed file.
+
+    Attributes:
+        unit_id: "<filepath>::<name>"
+        filepath: File the unit belongs to
+        name: Qualified name (e.g. "Client.fetch") or MODULE_UNIT
+        start_line: First line (1-based, including decorators)
+        end_line: Last line
+        digest: Hash of the unit's AST (or text, for non-Python files)
+        source: The unit's source text
+    """
+
+    unit_id: str
+    filepath: str
+    name: str
+    start_line: int
+    end_line: int
+    digest: str
+    source: str
+
+
+@dataclass(frozen=True)
+class StructuralDiff:
+    """Units added, modified and removed between two reviews."""
+
+    added: tuple[str, ...] = ()
+    modified: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    unchanged: tuple[str, ...] = ()
+
+    @property
+    def changed(self) -> tuple[str, ...]:
+        """Units the judges have not seen in their current form."""
+        return self.added + self.modified
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether nothing changed."""
+        return not (self.added or self.modified or self.removed)
+
+
+@dataclass
+class IncrementalReview:
+    """Everything the council needs for an incremental review.
+
+    Attributes:
+        round: Review round number (2 for the first re-review)
+        diff: Structural diff against the previous review
+        context: Judge context replacing the full review context
+        carried_issues: Unresolved issues in unchanged code, by judge name
+        changed_ratio: Share of the reviewed source that changed
+    """
+
+    round: int
+    diff: StructuralDiff
+    context: str
+    carried_issues: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    changed_ratio: float = 0.0
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _node_start(node: ast.stmt) -> int:
+    decorators: list[ast.expr] = getattr(node, "decorator_list", [])
+    return min([node.lineno, *(d.lineno for d in decorators)])
+
+
+def _segment(lines: list[str], start: int, end: int) -> str:
+    return "".join(lines[start - 1 : end])
+
+
+def _whole_file_unit(filepath: str, content: str) -> ReviewUnit:
+    return ReviewUnit(
+        unit_id=f"{filepath}::{MODULE_UNIT}",
+        filepath=filepath,
+        name=MODULE_UNIT,
+        start_line=1,
+        end_line=max(content.count("\n"), 1),
+        digest=_digest(content),
+        source=content,
+    )
+
+
+def _statements_unit(
+    filepath: str,
+    name: str,
+    statements: list[ast.stmt],
+    lines: list[str],
+    header: str = "",
+    span: tuple[int, int] | None = None,
+) -> ReviewUnit | None:
+    """Unit made of several statements (module level or a class body).
+
+    The unit spans its statements, or the given (start, end) lines.
+    """
+    if not statements and not header:
+        return None
+    parts = [header] if header else []
+    parts.extend(_segment(lines, _node_start(s), s.end_lineno or s.lineno) for s in statements)
+    dumped = "\n".join(ast.dump(s) for s in statements)
+    if span is None:
+        span = (
+            min(_node_start(s) for s in statements),
+            max(s.end_lineno or s.lineno for s in statements),
+        )
+    return ReviewUnit(
+        unit_id=f"{filepath}::{name}",
+        filepath=filepath,
+        name=name,
+        start_line=span[0],
+        end_line=span[1],
+        digest=_digest(f"{header.strip()}\n{dumped}"),
+        source="".join(parts),
+    )
+
+
+def _definition_unit(filepath: str, name: str, node: ast.stmt, lines: list[str]) -> ReviewUnit:
+    start, end = _node_start(node), node.end_lineno or node.lineno
+    return ReviewUnit(
+        unit_id=f"{filepath}::{name}",
+        filepath=filepath,
+        name=name,
+        start_line=start,
+        end_line=end,
+        digest=_digest(ast.dump(node)),
+        source=_segment(lines, start, end),
+    )
+
+
+def extract_units(filepath: str, content: str) -> list[ReviewUnit]:
+    """Split a file into review units.
+
+    Python files are split into top-level functions, class methods, the
+    rest of each class body and the module-level statements. Other files,
+    and Python that does not parse, are a single unit.
+
+    Args:
+        filepath: Path of the file
+        content: File content
+
+    Returns:
+        Units in source order
+    """
+    if not content.strip():
+        return []
+    # Shared with the analyzers, so each revision is parsed once per round
+    tree = analyze_source(content).tree
+    if tree is None:
+        return [_whole_file_unit(filepath, content)]
+
+    lines = content.splitlines(keepends=True)
+    units: list[ReviewUnit] = []
+    module_statements: list[ast.stmt] = []
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            units.append(_definition_unit(filepath, node.name, node, lines))
+        elif isinstance(node, ast.ClassDef):
+            methods = [
+                child
+                for child in node.body
+                if isinstance(child, ast.FunctionDef | ast.AsyncFunctionDef)
+            ]
+            body = [child for child in node.body if child not in methods]
+            header_end = _node_start(node.body[0]) - 1 if node.body else node.lineno
+            header = _segment(lines, _node_start(node), max(header_end, node.lineno))
+            class_unit = _statements_unit(
+                filepath,
+                node.name,
+                body,
+                lines,
+                header=header,
+                span=(_node_start(node), node.end_lineno or node.lineno),
+            )
+            if class_unit is not None:
+                units.append(class_unit)
+            units.extend(
+                _definition_unit(filepath, f"{node.name}.{method.name}", method, lines)
+                for method in methods
+            )
+        else:
+            module_statements.append(node)
+
+    module_unit = _statements_unit(filepath, MODULE_UNIT, module_statements, lines)
+    if module_unit is not None:
+        units.insert(0, module_unit)
+    return units
+
+
+def collect_units(files: Mapping[str, str]) -> dict[str, ReviewUnit]:
+    """Review units of several files, keyed by unit ID."""
+    return {
+        unit.unit_id: unit
+        for filepath, content in files.items()
+        for unit in extract_units(filepath, content)
+    }
+
+
+def diff_units(previous: Mapping[str, str], current: Mapping[str, ReviewUnit]) -> StructuralDiff:
+    """Compare units with the digests recorded at the previous review.
+
+    Args:
+        previous: Digest by unit ID from the previous review
+        current: Current units by unit ID
+
+    Returns:
+        The structural diff, each list in source order
+    """
+    added = tuple(unit_id for unit_id in current if unit_id not in previous)
+    modified = tuple(
+        unit_id
+        for unit_id, unit in current.items()
+        if unit_id in previous and previous[unit_id] != unit.digest
+    )
+    unchanged = tuple(
+        unit_id
+        for unit_id, unit in current.items()
+        if unit_id in previous and previous[unit_id] == unit.digest
+    )
+    removed = tuple(unit_id for unit_id in previous if unit_id not in current)
+    return StructuralDiff(added=added, modified=modified, removed=removed, unchanged=unchanged)
+
+
+def review_files(state: WorkflowState) -> dict[str, str]:
+    """The files a council review covers: the primary code and the tests.
+
+    Args:
+        state: Workflow state about to be reviewed
+
+    Returns:
+        Content by file path
+    """
+    filepath = (state.get("code_files") or {}).get("primary_filepath") or DEFAULT_CODE_FILEPATH
+    return {filepath: state.get("code", ""), TESTS_FILEPATH: state.get("test_results", "")}
+
+
+def plan_fingerprint(plan: str) -> str:
+    """Fingerprint of the plan the code was reviewed against."""
+    return _digest(plan)
+
+
+def issue_id(judge_name: str, issue: Mapping[str, Any]) -> str:
+    """Stable ID of a judge's finding.
+
+    A finding repeated with an "[I-xxxxxxxx]" prefix keeps that ID;
+    otherwise the ID is derived from the judge, category, file and text.
+
+    Args:
+        judge_name: Judge that reported the finding
+        issue: Issue dict from a JudgeVerdictState
+
+    Returns:
+        ID of the form "I-" followed by 8 hex digits
+    """
+    description = str(issue.get("description") or "")
+    repeated = ISSUE_ID_PATTERN.match(description)
+    if repeated:
+        return repeated.group(1)
+    key = "\0".join(
+        [
+            judge_name,
+            str(issue.get("category") or ""),
+            str(issue.get("file_path") or ""),
+            " ".join(description.lower().split()),
+        ]
+    )
+    return f"I-{_digest(key)[:8]}"
+
+
+def locate_issue(issue: Mapping[str, Any], units: Mapping[str, ReviewUnit]) -> str | None:
+    """Unit a finding refers to, from its file path and line number.
+
+    Args:
+        issue: Issue dict with optional file_path and line_number
+        units: Units reviewed when the finding was reported
+
+    Returns:
+        Unit ID, or None if the finding has no usable location
+    """
+    file_path = issue.get("file_path")
+    line_number = issue.get("line_number")
+    if not file_path or not isinstance(line_number, int):
+        return None
+
+    containing = [
+        unit
+        for unit in units.values()
+        if (unit.filepath == file_path or unit.filepath.endswith(f"/{file_path}"))
+        and unit.start_line <= line_number <= unit.end_line
+    ]
+    if not containing:
+        return None
+    # Methods lie within their class, definitions within the module's span
+    return min(containing, key=lambda unit: unit.end_line - unit.start_line).unit_id
+
+
+def _format_changes(diff: StructuralDiff) -> str:
+    lines = [f"- added: {unit_id}" for unit_id in diff.added]
+    lines.extend(f"- modified: {unit_id}" for unit_id in diff.modified)
+    lines.extend(f"- removed: {unit_id}" for unit_id in diff.removed)
+    return "\n".join(lines) or "No structural changes (formatting or comments only)."
+
+
+def _format_changed_code(diff: StructuralDiff, units: Mapping[str, ReviewUnit]) -> str:
+    added = set(diff.added)
+    sections = []
+    for unit_id in diff.changed:
+        unit = units[unit_id]
+        status = "added" if unit_id in added else "modified"
+        sections.append(
+            f"### {unit_id} ({status}, lines {unit.start_line}-{unit.end_line})\n"
+            f"```\n{unit.source.rstrip()}\n```"
+        )
+    return "\n\n".join(sections) or "(none)"
+
+
+def _format_findings(issues: list[dict[str, Any]], diff: StructuralDiff) -> str:
+    unchanged = set(diff.unchanged)
+    lines = []
+    for issue in issues:
+        unit_id = issue.get("unit_id")
+        if unit_id in unchanged:
+            where = f"{unit_id}, unchanged"
+        elif unit_id:
+            where = f"{unit_id}, changed or removed"
+        else:
+            where = "no location"
+        lines.append(
+            f"- [{issue['issue_id']}] {issue.get('severity', 'minor')} "
+            f"{issue.get('category', '')} ({issue['judge_name']}; {where}): "
+            f"{issue.get('description', '')}"
+        )
+    return "\n".join(lines) or "None."
+
+
+def _plan_summary(plan: str) -> str:
+    if len(plan) <= PLAN_SUMMARY_CHARS:
+        return plan
+    return f"{plan[:PLAN_SUMMARY_CHARS].rstrip()}\n[... plan truncated, unchanged since last round]"
+
+
+def prepare_incremental_review(
+    memory: Mapping[str, Any] | None,
+    files: Mapping[str, str],
+    plan: str,
+) -> IncrementalReview | None:
+    """Plan an incremental review against the previous review's memory.
+
+    Args:
+        memory: ``state["review_memory"]`` from the previous review
+        files: Files under review (see review_files)
+        plan: The execution plan
+
+    Returns:
+        The incremental review, or None if a full review is needed
+    """
+    if not memory or not memory.get("units"):
+        return None
+    if memory.get("plan_fingerprint") != plan_fingerprint(plan):
+        return None
+
+    units = collect_units(files)
+    diff = diff_units(memory["units"], units)
+    # Changed share of the source, or of the units when many were removed
+    total = sum(len(unit.source) for unit in units.values())
+    changed = sum(len(units[unit_id].source) for unit_id in diff.changed)
+    touched_units = len(diff.changed) + len(diff.removed)
+    changed_ratio = max(
+        changed / total if total else 1.0,
+        touched_units / (len(units) + len(diff.removed)) if units or diff.removed else 1.0,
+    )
+    if changed_ratio > settings.council_incremental_max_changed_ratio:
+        return None
+
+    open_issues: list[dict[str, Any]] = list(memory.get("issues", []))
+    unchanged = set(diff.unchanged)
+    carried: dict[str, list[dict[str, Any]]] = {}
+    for issue in open_issues:
+        if issue.get("unit_id") in unchanged:
+            carried.setdefault(issue["judge_name"], []).append(issue)
+
+    round_number = int(memory.get("round", 1)) + 1
+    context = INCREMENTAL_REVIEW_CONTEXT_PROMPT.format(
+        round=round_number,
+        changes=_format_changes(diff),
+        changed_code=_format_changed_code(diff, units),
+        findings=_format_findings(open_issues, diff),
+        plan=_plan_summary(plan),
+    )
+    return IncrementalReview(
+        round=round_number,
+        diff=diff,
+        context=context,
+        carried_issues=carried,
+        changed_ratio=changed_ratio,
+    )
+
+
+def build_review_memory(
+    files: Mapping[str, str],
+    plan: str,
+    verdicts: Mapping[str, JudgeVerdictState],
+    previous: Mapping[str, Any] | None = None,
+    incremental: IncrementalReview | None = None,
+) -> dict[str, Any]:
+    """Record a finished review for the next incremental review.
+
+    Args:
+        files: Files that were reviewed
+        plan: The execution plan
+        verdicts: Final judge verdicts (carried issues included)
+        previous: Memory of the previous review, if any
+        incremental: The incremental review that was run, if any
+
+    Returns:
+        Memory for ``state["review_memory"]``: unit digests, open issues
+        with their IDs and units, and all issue IDs resolved so far
+    """
+    units = collect_units(files)
+    issues: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for judge_name, verdict in verdicts.items():
+        for issue in verdict["issues"]:
+            identifier = issue.get("issue_id") or issue_id(judge_name, issue)
+            if identifier in seen:
+                continue
+            seen.add(identifier)
+            description = ISSUE_ID_PATTERN.sub("", str(issue.get("description") or ""))
+            issues.append(
+                {
+                    **issue,
+                    "description": description,
+                    "issue_id": identifier,
+                    "judge_name": judge_name,
+                    "unit_id": issue.get("unit_id") or locate_issue(issue, units),
+                }
+            )
+
+    resolved = list((previous or {}).get("resolved_issue_ids", []))
+    if previous:
+        resolved.extend(
+            issue["issue_id"]
+            for issue in previous.get("issues", [])
+            if issue["issue_id"] not in seen and issue["issue_id"] not in resolved
+        )
+
+    return {
+        "round": incremental.round if incremental else int((previous or {}).get("round", 0)) + 1,
+        "plan_fingerprint": plan_fingerprint(plan),
+        "units": {unit_id: unit.digest for unit_id, unit in units.items()},
+        "issues": issues,
+        "resolved_issue_ids": resolved,
+    }
@@ -7,6 +7,8 @@ standard reviewer_node when council review is enabled.
 Features:
 - Multi-judge code review with parallel execution
 - Verdict aggregation with confidence scoring
+- Reuse of speculative code-only verdicts computed during testing
+- Incremental re-review of the units changed since the previous round
 - Detailed metrics collection per judge
 - Seamless integration with workflow state
 """
@@ -16,7 +18,13 @@ from typing import Any
 
 from langchain_core.runnables import RunnableConfig
 
-from src.agents.council.orchestrator import CodeReviewCouncil, CouncilConfig
+from src.agents.council.incremental import (
+    build_review_memory,
+    prepare_incremental_review,
+    review_files,
+)
+from src.agents.council.orchestrator import CodeReviewCouncil
+from src.agents.council.speculation import default_council_config, reusable_verdicts
 from src.agents.nodes.reviewer import ReviewVerdict
 from src.agents.state import WorkflowState
 from src.core.config import settings
@@ -71,18 +79,42 @@ async def council_reviewer_node(
     )
 
     # Create council with appropriate configuration
-    council_config = (
-        CouncilConfig.default_local() if settings.use_local_llm else CouncilConfig.default_cloud()
+    council = CodeReviewCouncil(config=default_council_config())
+
+    # After a REVISE, review only what changed since the previous round
+    plan = state.get("plan", "")
+    files = review_files(state)
+    previous_memory = state.get("review_memory")
+    incremental = (
+        prepare_incremental_review(previous_memory, files, plan)
+        if settings.council_incremental_review
+        else None
     )
-    council = CodeReviewCouncil(config=council_config)
 
-    # Convene the council
+    # Convene the council, reusing verdicts reached while the tester ran
+    speculative = reusable_verdicts(state)
     council_state = await council.convene(
         code=state.get("code", ""),
         tests=state.get("test_results", ""),
-        plan=state.get("plan", ""),
+        plan=plan,
         config=config,
+        precomputed=speculative,
+        review_context=incremental.context if incremental else None,
+        # Speculative verdicts already cover the full code
+        carried_issues=(
+            {
+                name: issues
+                for name, issues in incremental.carried_issues.items()
+                if name not in speculative
+            }
+            if incremental
+            else None
+        ),
     )
+    review_memory = build_review_memory(
+        files, plan, council_state["judge_verdicts"], previous_memory, incremental
+    )
+    previous_ids = {issue["issue_id"] for issue in (previous_memory or {}).get("issues", [])}
 
     # Extract final verdict and confidence
     final_verdict = council_state["final_verdict"]
@@ -99,6 +131,8 @@ async def council_reviewer_node(
         dissenting_count=len(council_state["dissenting_opinions"]),
         deliberation_time_ms=council_state["deliberation_time_ms"],
         total_cost_usd=council_state["total_cost_usd"],
+        review_mode="incremental" if incremental else "full",
+        changed_units=len(incremental.diff.changed) if incremental else None,
     )
 
     # Determine next status based on verdict
@@ -119,6 +153,7 @@ async def council_reviewer_node(
         "status": next_status,
         "messages": [],  # Council handles messages internally
         "iterations": iterations,
+        "review_memory": review_memory,
         "metadata": {
             **(state.get("metadata", {})),
             "review_completed_at": datetime.now(UTC).isoformat(),
@@ -129,6 +164,9 @@ async def council_reviewer_node(
                 "input_tokens": 0,  # Aggregate from judges
                 "output_tokens": 0,
                 "total_tokens": total_tokens,
+                "response_cache_hits": sum(
+                    1 for v in council_state["judge_verdicts"].values() if v.get("response_cached")
+                ),
                 "latency_ms": council_state["deliberation_time_ms"],
             },
             # Council-specific metadata
@@ -141,6 +179,29 @@ async def council_reviewer_node(
                 "total_cost_usd": council_state["total_cost_usd"],
                 "llm_mode": council_state["llm_mode"],
                 "judge_count": len(council_state["judge_verdicts"]),
+                "cancelled_judges": council_state["cancelled_judges"],
+                "latency_saved_ms": council_state["latency_saved_ms"],
+                "cost_saved_usd": council_state["cost_saved_usd"],
+                "speculative_judges": list(speculative),
+                "fallback_verdicts": sum(
+                    1
+                    for v in council_state["judge_verdicts"].values()
+                    if v.get("verdict_source") == "fallback"
+                ),
+                "review_mode": "incremental" if incremental else "full",
+                "review_round": review_memory["round"],
+                "changed_units": list(incremental.diff.changed) if incremental else None,
+                "removed_units": list(incremental.diff.removed) if incremental else None,
+                "unresolved_issue_ids": [
+                    issue["issue_id"]
+                    for issue in review_memory["issues"]
+                    if issue["issue_id"] in previous_ids
+                ],
+                "resolved_issue_ids": [
+                    issue_id
+                    for issue_id in review_memory["resolved_issue_ids"]
+                    if issue_id in previous_ids
+                ],
             },
             "judge_verdicts": {
                 name: {
@@ -153,6 +214,8 @@ async def council_reviewer_node(
                     "tokens_used": v["tokens_used"],
                     "latency_ms": v["latency_ms"],
                     "cost_usd": v["cost_usd"],
+                    "response_cached": v.get("response_cached", False),
+                    "verdict_source": v.get("verdict_source"),
                 }
                 for name, v in council_state["judge_verdicts"].items()
             },
@@ -8,23 +8,31 @@ Features:
 - Prompt-based personas for local vLLM (security, performance, maintainability)
 - Real multi-model judges for Claude API (haiku, sonnet, opus)
 - Parallel judge execution for efficiency
+- Streamed judge output with incremental verdict parsing
+- Quorum mode that cancels judges once the verdict can no longer change
 - Weighted voting for verdict aggregation
 - Consensus detection and confidence scoring
 """
 
 import asyncio
+import itertools
+import statistics
 import time
+from collections.abc import Callable, Collection, Mapping
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Any, Literal
 
 from langchain_core.messages import BaseMessage
 from langchain_core.runnables import RunnableConfig
 
-from src.agents.infrastructure.models import ModelFactory
-from src.agents.nodes.reviewer import (
-    create_fallback_verdict,
-    parse_structured_verdict,
+from src.agents.council.streaming import JudgeProgress
+from src.agents.infrastructure.models import CHARS_PER_TOKEN, get_model_pool
+from src.agents.infrastructure.prompt_cache import extract_cache_usage
+from src.agents.infrastructure.response_cache import (
+    extract_response_cache_usage,
+    get_response_cache,
 )
+from src.agents.nodes.reviewer import bind_verdict_output, parse_verdict
 from src.agents.state import CouncilState, JudgeVerdictState
 from src.core.config import settings
 from src.core.logging import get_logger
@@ -32,6 +40,19 @@ from src.services.cost_calculator import CostCalculator
 
 logger = get_logger(__name__)
 
+type Verdict = Literal["APPROVE", "REVISE", "REJECT"]
+
+VERDICTS: tuple[Verdict, ...] = ("APPROVE", "REVISE", "REJECT")
+
+# Confidences tried for each outstanding judge when checking whether the
+# final verdict is settled. Votes are linear in confidence, so the extremes
+# bound the outcome; the midpoint guards against ties between them.
+QUORUM_CONFIDENCE_GRID = (0.0, 0.5, 1.0)
+
+# Beyond this many outstanding judges the settledness check (9^n outcomes)
+# is skipped and the council waits
+MAX_QUORUM_PENDING = 4
+
 
 # =============================================================================
 # Judge Persona Definitions
@@ -137,6 +158,32 @@ IMPORTANT: You MUST respond with a valid JSON object following this exact schema
 Always respond with valid JSON only."""
 
 
+# Review context sent in the human turn, after the judge's static persona and
+# rubric in the system prompt, so the cacheable prefix (Anthropic prompt
+# caching, vLLM prefix caching) is never displaced by per-call code
+COUNCIL_REVIEW_CONTEXT_PROMPT = """Please provide a focused code review from your expert \
+perspective:
+
+## Generated Code
+{code}
+
+## Test Suite
+{tests}
+
+## Context (Execution Plan)
+{plan}"""
+
+JUDGE_REVIEW_INSTRUCTION = (
+    "Review the code from your specialized perspective and provide your verdict in JSON format."
+)
+
+# Stands in for the test suite when judges review the code speculatively,
+# before the tester has finished
+SPECULATIVE_TESTS_PLACEHOLDER = (
+    "(The test suite is still being generated. Review the code on its own merits.)"
+)
+
+
 @dataclass
 class JudgeConfig:
     """Configuration for a single judge in the council."""
@@ -146,6 +193,7 @@ class JudgeConfig:
     system_prompt: str
     model_tier: Literal["haiku", "sonnet", "opus", "local"]
     weight: float = 0.33  # Weight in final verdict calculation
+    needs_tests: bool = True  # False if the review only depends on code and plan
 
     def __post_init__(self) -> None:
         """Validate weight is in valid range."""
@@ -162,6 +210,12 @@ class CouncilConfig:
     require_unanimous_reject: bool = True  # REJECT only if all judges agree
     confidence_threshold: float = 0.7  # Minimum confidence for APPROVE
     parallel_execution: bool = True  # Run judges in parallel
+    # Cancel outstanding judges once the final verdict can no longer change
+    # (parallel execution only)
+    early_quorum: bool = False
+    # Reuse a judge's earlier verdict on identical code, tests and plan
+    # (needs enable_llm_response_cache)
+    cache_responses: bool = True
 
     @classmethod
     def default_local(cls) -> "CouncilConfig":
@@ -174,6 +228,7 @@ class CouncilConfig:
                     system_prompt=SECURITY_JUDGE_PROMPT,
                     model_tier="local",
                     weight=0.35,
+                    needs_tests=False,
                 ),
                 JudgeConfig(
                     name="performance_judge",
@@ -203,6 +258,7 @@ class CouncilConfig:
                     system_prompt=SECURITY_JUDGE_PROMPT,  # Haiku focuses on security
                     model_tier="haiku",
                     weight=0.20,
+                    needs_tests=False,
                 ),
                 JudgeConfig(
                     name="balanced_review",
@@ -222,6 +278,57 @@ class CouncilConfig:
         )
 
 
+@dataclass
+class QuorumOutcome:
+    """What quorum mode cut short in one council session.
+
+    Savings are estimates: a cancelled judge's remaining output is projected
+    from the output length of the judges that finished and the judge's own
+    streaming rate. Input tokens of cancelled requests are billed anyway.
+
+    Attributes:
+        cancelled_judges: Judges cancelled before their verdict was known
+        latency_saved_ms: Projected finish of the slowest cancelled judge
+            minus the actual end of deliberation
+        cost_saved_usd: Projected output cost of the cancelled judges
+    """
+
+    cancelled_judges: list[str] = field(default_factory=list)
+    latency_saved_ms: int = 0
+    cost_saved_usd: float = 0.0
+
+
+def _content_text(content: Any) -> str:
+    """Text of message content that may be a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for item in content:
+            if isinstance(item, str):
+                parts.append(item)
+            elif isinstance(item, dict) and isinstance(item.get("text"), str):
+                parts.append(item["text"])
+        return "".join(parts)
+    return str(content)
+
+
+def _message_text(message: Any) -> str:
+    """Text of a (streamed) message, including native structured-output arguments."""
+    if not isinstance(message, BaseMessage):
+        return _content_text(message)
+    arguments = "".join(
+        chunk.get("args") or "" for chunk in getattr(message, "tool_call_chunks", None) or []
+    )
+    return _content_text(message.content) + arguments
+
+
+def _task_result(task: "asyncio.Task[JudgeVerdictState]") -> JudgeVerdictState | BaseException:
+    """Result of a finished judge task, or the exception it raised."""
+    error = task.exception()
+    return error if error is not None else task.result()
+
+
 class CodeReviewCouncil:
     """Multi-judge code review council.
 
@@ -263,17 +370,28 @@ class CodeReviewCouncil:
         tests: str,
         plan: str,
         config: RunnableConfig | None = None,
+        precomputed: dict[str, JudgeVerdictState] | None = None,
+        review_context: str | None = None,
+        carried_issues: Mapping[str, list[dict[str, Any]]] | None = None,
     ) -> CouncilState:
         """Convene the council to review code.
 
         Runs all judges (in parallel if configured) and aggregates their
-        verdicts into a final decision.
+        verdicts into a final decision. With early_quorum, judges whose vote
+        can no longer change the decision are cancelled and counted as
+        abstaining.
 
         Args:
             code: The code to review
             tests: The test suite
             plan: The execution plan for context
             config: Optional LangChain runnable config
+            precomputed: Verdicts already reached on this code (e.g. by
+                review_code_only); those judges are not invoked again
+            review_context: Judge context to send instead of the full code,
+                tests and plan (e.g. an incremental review's changed units)
+            carried_issues: Unresolved issues from earlier reviews, added to
+                the issues of the judge that reported them (by judge name)
 
         Returns:
             CouncilState with all judge verdicts and final decision
@@ -286,16 +404,37 @@ class CodeReviewCouncil:
 
         start_time = time.time()
 
-        # Run judges
-        if self.config.parallel_execution:
-            verdicts = await self._run_judges_parallel(code, tests, plan, config)
+        # Run the judges without a precomputed verdict
+        known = {
+            name: verdict
+            for name, verdict in (precomputed or {}).items()
+            if any(judge.name == name for judge in self.config.judges)
+        }
+        judges = [judge for judge in self.config.judges if judge.name not in known]
+        if review_context is None:
+            review_context = COUNCIL_REVIEW_CONTEXT_PROMPT.format(code=code, tests=tests, plan=plan)
+        quorum = QuorumOutcome()
+        if self.config.parallel_execution and self.config.early_quorum:
+            ran, quorum = await self._run_judges_quorum(judges, review_context, config, known)
+        elif self.config.parallel_execution:
+            ran = await self._run_judges_parallel(judges, review_context, config)
         else:
-            verdicts = await self._run_judges_sequential(code, tests, plan, config)
+            ran = await self._run_judges_sequential(judges, review_context, config)
+        verdicts = {
+            judge.name: known.get(judge.name) or ran[judge.name]
+            for judge in self.config.judges
+            if judge.name in known or judge.name in ran
+        }
+        for name, issues in (carried_issues or {}).items():
+            if name in verdicts and issues:
+                verdicts[name] = {**verdicts[name], "issues": [*verdicts[name]["issues"], *issues]}
 
         deliberation_time_ms = int((time.time() - start_time) * 1000)
 
-        # Aggregate verdicts
-        final_verdict, confidence, consensus_type, dissenting = self._aggregate_verdicts(verdicts)
+        # Aggregate verdicts; cancelled judges abstain
+        final_verdict, confidence, consensus_type, dissenting = self._aggregate_verdicts(
+            verdicts, abstained=quorum.cancelled_judges
+        )
 
         # Build council conclusion text
         council_conclusion = self._build_conclusion(
@@ -313,6 +452,9 @@ class CodeReviewCouncil:
             dissenting_count=len(dissenting),
             deliberation_time_ms=deliberation_time_ms,
             total_cost_usd=total_cost,
+            cancelled_judges=quorum.cancelled_judges,
+            latency_saved_ms=quorum.latency_saved_ms,
+            cost_saved_usd=quorum.cost_saved_usd,
         )
 
         return CouncilState(
@@ -325,71 +467,276 @@ class CodeReviewCouncil:
             deliberation_time_ms=deliberation_time_ms,
             total_cost_usd=total_cost,
             llm_mode="local" if settings.use_local_llm else "cloud",
+            cancelled_judges=quorum.cancelled_judges,
+            latency_saved_ms=quorum.latency_saved_ms,
+            cost_saved_usd=quorum.cost_saved_usd,
         )
 
-    async def _run_judges_parallel(
+    async def review_code_only(
         self,
         code: str,
-        tests: str,
         plan: str,
-        config: RunnableConfig | None,
+        config: RunnableConfig | None = None,
     ) -> dict[str, JudgeVerdictState]:
-        """Run all judges in parallel."""
-        tasks = [
-            self._invoke_judge(judge, code, tests, plan, config) for judge in self.config.judges
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        """Run the judges that do not need the test suite.
+
+        Used to review code speculatively while tests are still being
+        generated. Failed judges are left out so that the full review runs
+        them again.
+
+        Args:
+            code: The code to review
+            plan: The execution plan for context
+            config: Optional LangChain runnable config
+
+        Returns:
+            Verdicts of the code-only judges that succeeded, by judge name
+        """
+        judges = [judge for judge in self.config.judges if not judge.needs_tests]
+        review_context = COUNCIL_REVIEW_CONTEXT_PROMPT.format(
+            code=code, tests=SPECULATIVE_TESTS_PLACEHOLDER, plan=plan
+        )
+        results = await asyncio.gather(
+            *(self._invoke_judge(judge, review_context, config) for judge in judges),
+            return_exceptions=True,
+        )
 
         verdicts: dict[str, JudgeVerdictState] = {}
-        for judge, result in zip(self.config.judges, results, strict=False):
+        for judge, result in zip(judges, results, strict=True):
             if isinstance(result, BaseException):
-                logger.error(
-                    "Judge failed",
+                logger.warning(
+                    "Speculative judge failed",
                     judge_name=judge.name,
                     error=str(result),
                 )
-                # Create a fallback verdict for failed judge
-                verdicts[judge.name] = self._create_error_verdict(judge, str(result))
+                continue
+            verdicts[judge.name] = result
+        return verdicts
+
+    async def _run_judges_parallel(
+        self,
+        judges: list[JudgeConfig],
+        review_context: str,
+        config: RunnableConfig | None,
+    ) -> dict[str, JudgeVerdictState]:
+        """Run judges in parallel."""
+        tasks = [self._invoke_judge(judge, review_context, config) for judge in judges]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        return {
+            judge.name: self._judge_result(judge, result)
+            for judge, result in zip(judges, results, strict=False)
+        }
+
+    async def _run_judges_quorum(
+        self,
+        judge_list: list[JudgeConfig],
+        review_context: str,
+        config: RunnableConfig | None,
+        known: dict[str, JudgeVerdictState],
+    ) -> tuple[dict[str, JudgeVerdictState], QuorumOutcome]:
+        """Run judges in parallel and stop waiting once the verdict is settled.
+
+        A judge's vote is known as soon as its streamed verdict and
+        confidence have been parsed. After every new vote the council
+        checks whether any outcome of the remaining judges could still
+        change the final verdict; if not, those judges are cancelled. Judges
+        whose vote is already known run to completion so their issues and
+        action items are kept. Known verdicts count as votes from the start.
+        """
+        judges = {judge.name: judge for judge in judge_list}
+        progress = {name: JudgeProgress.start() for name in judges}
+        changed = asyncio.Event()
+        tasks = {
+            name: asyncio.create_task(
+                self._invoke_judge(
+                    judge,
+                    review_context,
+                    config,
+                    progress=progress[name],
+                    on_decided=changed.set,
+                )
+            )
+            for name, judge in judges.items()
+        }
+        for task in tasks.values():
+            task.add_done_callback(lambda _: changed.set())
+
+        finished: dict[str, JudgeVerdictState] = {}
+        cancelled: list[str] = []
+        try:
+            while True:
+                changed.clear()
+                votes: dict[str, tuple[Verdict, float]] = {
+                    name: (verdict["verdict"], verdict["confidence"])
+                    for name, verdict in known.items()
+                }
+                for name, task in tasks.items():
+                    if task.done():
+                        if name not in finished:
+                            finished[name] = self._judge_result(judges[name], _task_result(task))
+                        votes[name] = (finished[name]["verdict"], finished[name]["confidence"])
+                    else:
+                        parser = progress[name].parser
+                        if parser.verdict is not None and parser.confidence is not None:
+                            votes[name] = (parser.verdict, parser.confidence)
+
+                undecided = [name for name in tasks if name not in votes]
+                if not undecided:
+                    break
+                if self._verdict_is_settled(votes, undecided):
+                    cancelled = undecided
+                    break
+                await changed.wait()
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        cancelled_at = time.monotonic()
+        for name in cancelled:
+            tasks[name].cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        for name, task in tasks.items():
+            if name not in cancelled and name not in finished:
+                finished[name] = self._judge_result(judges[name], _task_result(task))
+
+        outcome = self._quorum_outcome(cancelled, judges, progress, cancelled_at)
+        if cancelled:
+            logger.info(
+                "Council quorum reached",
+                cancelled_judges=cancelled,
+                latency_saved_ms=outcome.latency_saved_ms,
+                cost_saved_usd=outcome.cost_saved_usd,
+            )
+
+        return {name: finished[name] for name in judges if name in finished}, outcome
+
+    def _verdict_is_settled(
+        self,
+        votes: dict[str, tuple[Verdict, float]],
+        pending: list[str],
+    ) -> bool:
+        """Check whether pending judges can still change the final verdict.
+
+        Every combination of verdict and grid confidence for the pending
+        judges is aggregated together with the known votes.
+        """
+        if len(pending) > MAX_QUORUM_PENDING:
+            return False
+
+        options = [(verdict, conf) for verdict in VERDICTS for conf in QUORUM_CONFIDENCE_GRID]
+        settled: Verdict | None = None
+        for outcome in itertools.product(options, repeat=len(pending)):
+            hypothetical = {**votes, **dict(zip(pending, outcome, strict=True))}
+            verdict = self._aggregate_votes(hypothetical)[0]
+            if settled is None:
+                settled = verdict
+            elif verdict != settled:
+                return False
+        return True
+
+    def _quorum_outcome(
+        self,
+        cancelled: list[str],
+        judges: dict[str, JudgeConfig],
+        progress: dict[str, JudgeProgress],
+        cancelled_at: float,
+    ) -> QuorumOutcome:
+        """Estimate the latency and cost saved by cancelling judges."""
+        if not cancelled:
+            return QuorumOutcome()
+
+        ended_at = time.monotonic()
+        completed = [
+            p for name, p in progress.items() if name not in cancelled and p.finished_at is not None
+        ]
+        expected_chars = statistics.mean(p.parser.chars for p in completed) if completed else 0.0
+        expected_latency = (
+            statistics.mean(p.finished_at - p.started_at for p in completed if p.finished_at)
+            if completed
+            else 0.0
+        )
+
+        projected_end = ended_at
+        cost_saved = 0.0
+        for name in cancelled:
+            judge_progress = progress[name]
+            received = judge_progress.parser.chars
+            remaining_chars = max(expected_chars - received, 0.0)
+            first_token_at = judge_progress.first_token_at
+            if received and first_token_at is not None and cancelled_at > first_token_at:
+                chars_per_second = received / (cancelled_at - first_token_at)
+                finish = cancelled_at + remaining_chars / chars_per_second
             else:
-                # Result is JudgeVerdictState when not an exception
-                verdict_state: JudgeVerdictState = result
-                verdicts[judge.name] = verdict_state
+                finish = judge_progress.started_at + expected_latency
+            projected_end = max(projected_end, finish)
+            cost_saved += self._judge_cost(
+                judges[name],
+                input_tokens=0,
+                output_tokens=int(remaining_chars // CHARS_PER_TOKEN),
+            )
 
-        return verdicts
+        return QuorumOutcome(
+            cancelled_judges=list(cancelled),
+            latency_saved_ms=int((projected_end - ended_at) * 1000),
+            cost_saved_usd=cost_saved,
+        )
 
     async def _run_judges_sequential(
         self,
-        code: str,
-        tests: str,
-        plan: str,
+        judges: list[JudgeConfig],
+        review_context: str,
         config: RunnableConfig | None,
     ) -> dict[str, JudgeVerdictState]:
         """Run judges one at a time (for debugging or rate limiting)."""
         verdicts: dict[str, JudgeVerdictState] = {}
 
-        for judge in self.config.judges:
+        for judge in judges:
             try:
-                verdict = await self._invoke_judge(judge, code, tests, plan, config)
+                verdict = await self._invoke_judge(judge, review_context, config)
                 verdicts[judge.name] = verdict
             except Exception as e:
-                logger.error(
-                    "Judge failed",
-                    judge_name=judge.name,
-                    error=str(e),
-                )
-                verdicts[judge.name] = self._create_error_verdict(judge, str(e))
+                verdicts[judge.name] = self._judge_result(judge, e)
 
         return verdicts
 
+    def _judge_result(
+        self,
+        judge: JudgeConfig,
+        result: JudgeVerdictState | BaseException,
+    ) -> JudgeVerdictState:
+        """Return a judge's verdict, or a fallback verdict if it failed."""
+        if isinstance(result, BaseException):
+            logger.error(
+                "Judge failed",
+                judge_name=judge.name,
+                error=str(result),
+            )
+            return self._create_error_verdict(judge, str(result))
+        return result
+
     async def _invoke_judge(
         self,
         judge: JudgeConfig,
-        code: str,
-        tests: str,
-        plan: str,
+        review_context: str,
         config: RunnableConfig | None,
+        progress: JudgeProgress | None = None,
+        on_decided: Callable[[], None] | None = None,
     ) -> JudgeVerdictState:
-        """Invoke a single judge to review the code."""
+        """Invoke a single judge to review the code.
+
+        The judge's output is streamed and parsed incrementally; on_decided
+        is called as soon as its verdict and confidence are known.
+
+        Args:
+            judge: Judge to invoke
+            review_context: Shared review context (code, tests and plan)
+            config: Optional LangChain runnable config
+            progress: Progress record to update while streaming
+            on_decided: Callback for when the verdict has been parsed
+        """
         logger.info(
             "Judge reviewing",
             judge_name=judge.name,
@@ -397,83 +744,77 @@ class CodeReviewCouncil:
             model_tier=judge.model_tier,
         )
 
-        # Create model based on tier
+        # Get the shared model for the tier
+        pool = get_model_pool()
         if judge.model_tier == "local":
-            model = ModelFactory.create("sonnet")  # Uses local vLLM
+            model = pool.get_model("sonnet")  # Uses local vLLM
         else:
-            model = ModelFactory.create(judge.model_tier)
-
-        # Build the review prompt
-        review_prompt = f"""Please provide a focused code review from your expert perspective:
-
-## Generated Code
-{code}
-
-## Test Suite
-{tests}
+            model = pool.get_model(judge.model_tier)
+        verdict_model = bind_verdict_output(model)
+        structured_output = verdict_model is not model
 
-## Context (Execution Plan)
-{plan}
+        # Static persona and rubric first, per-call code last, so the system
+        # prompt stays a cacheable prefix across rounds and tasks
+        persona_prompt = f"{judge.system_prompt}\n\n{JUDGE_REVIEW_INSTRUCTION}"
 
-Review the code from your specialized perspective and provide your verdict in JSON format."""
-
-        # Invoke the model
-        start_time = time.time()
-        response = await model.ainvoke(
-            [
-                ("system", judge.system_prompt),
-                ("human", review_prompt),
-            ],
-            config,
+        messages = [
+            ("system", persona_prompt),
+            ("human", review_context),
+        ]
+        response_cache = get_response_cache()
+        cache_key = (
+            response_cache.key_for(verdict_model, messages) if self.config.cache_responses else None
         )
-        latency_ms = int((time.time() - start_time) * 1000)
-
-        # Extract response content
-        raw_content = response.content if isinstance(response, BaseMessage) else str(response)
-        if isinstance(raw_content, list):
-            response_text = " ".join(str(item) for item in raw_content)
+        response: Any = await response_cache.lookup(cache_key) if cache_key else None
+
+        if progress is None:
+            progress = JudgeProgress.start()
+        if response is not None:
+            # Identical review already done: replay its verdict
+            if progress.feed(_message_text(response)) and on_decided is not None:
+                on_decided()
         else:
-            response_text = str(raw_content)
-
-        # Parse structured verdict
-        structured = parse_structured_verdict(response_text)
-        if structured is None:
+            # Stream the response, parsing the verdict as it arrives
+            async for chunk in verdict_model.astream(messages, config):
+                response = chunk if response is None else response + chunk
+                if progress.feed(_message_text(chunk)) and on_decided is not None:
+                    on_decided()
+            if cache_key and response is not None:
+                await response_cache.store(cache_key, response)
+        latency_ms = int(progress.finish() * 1000)
+
+        response_text = progress.parser.text
+
+        # Parse structured verdict (the response was scanned while streaming)
+        structured, verdict_source = parse_verdict(
+            response_text, progress.parser.scanner, structured_output
+        )
+        if verdict_source == "fallback":
             logger.warning(
                 "Judge returned non-JSON response, using fallback",
                 judge_name=judge.name,
             )
-            structured = create_fallback_verdict(response_text)
 
         # Extract usage metadata
         usage_metadata = getattr(response, "usage_metadata", None) or {}
         input_tokens = usage_metadata.get("input_tokens", 0)
         output_tokens = usage_metadata.get("output_tokens", 0)
         total_tokens = input_tokens + output_tokens
+        cache_usage = extract_cache_usage(usage_metadata)
 
         # Calculate cost
-        if judge.model_tier == "local":
-            cost_usd = 0.0
-        else:
-            cost_breakdown = self.cost_calculator.calculate(
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-            )
-            # Map judge model tier to cost breakdown field
-            tier_to_cost_field = {
-                "haiku": cost_breakdown.claude_haiku,
-                "sonnet": cost_breakdown.claude_sonnet,
-                "opus": cost_breakdown.claude_opus,
-            }
-            cost_usd = tier_to_cost_field.get(judge.model_tier, 0.0)
+        cost_usd = self._judge_cost(judge, input_tokens, output_tokens, **cache_usage)
 
         logger.info(
             "Judge completed",
             judge_name=judge.name,
             verdict=structured.verdict,
+            verdict_source=verdict_source,
             confidence=structured.confidence,
             issue_count=len(structured.issues),
             latency_ms=latency_ms,
             cost_usd=cost_usd,
+            cache_read_tokens=cache_usage["cache_read_tokens"],
         )
 
         return JudgeVerdictState(
@@ -499,7 +840,34 @@ Review the code from your specialized perspective and provide your verdict in JS
             tokens_used=total_tokens,
             latency_ms=latency_ms,
             cost_usd=cost_usd,
+            response_cached=extract_response_cache_usage(response)["response_cache_hits"] == 1,
+            verdict_source=verdict_source,
+        )
+
+    def _judge_cost(
+        self,
+        judge: JudgeConfig,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
+    ) -> float:
+        """Cost of a judge's token usage at its model tier (0.0 for local)."""
+        if judge.model_tier == "local":
+            return 0.0
+        cost_breakdown = self.cost_calculator.calculate(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_creation_tokens=cache_creation_tokens,
         )
+        # Map judge model tier to cost breakdown field
+        tier_to_cost_field = {
+            "haiku": cost_breakdown.claude_haiku,
+            "sonnet": cost_breakdown.claude_sonnet,
+            "opus": cost_breakdown.claude_opus,
+        }
+        return tier_to_cost_field.get(judge.model_tier, 0.0)
 
     def _create_error_verdict(
         self,
@@ -534,6 +902,7 @@ Review the code from your specialized perspective and provide your verdict in JS
     def _aggregate_verdicts(
         self,
         verdicts: dict[str, JudgeVerdictState],
+        abstained: Collection[str] = (),
     ) -> tuple[
         Literal["APPROVE", "REVISE", "REJECT"],
         float,
@@ -542,23 +911,53 @@ Review the code from your specialized perspective and provide your verdict in JS
     ]:
         """Aggregate judge verdicts into final decision.
 
+        Args:
+            verdicts: Verdicts of the judges that voted
+            abstained: Judges that were cancelled; their weight still counts
+
         Returns:
             Tuple of (final_verdict, confidence, consensus_type, dissenting_judges)
         """
+        return self._aggregate_votes(
+            {name: (v["verdict"], v["confidence"]) for name, v in verdicts.items()},
+            abstained,
+        )
+
+    def _aggregate_votes(
+        self,
+        ballots: dict[str, tuple[Verdict, float]],
+        abstained: Collection[str] = (),
+    ) -> tuple[
+        Literal["APPROVE", "REVISE", "REJECT"],
+        float,
+        Literal["unanimous", "majority", "tie_broken", "dissent"],
+        list[str],
+    ]:
+        """Aggregate (verdict, confidence) ballots into final decision.
+
+        An abstaining judge counts like a judge voting with zero confidence,
+        except that it does not break unanimity.
+        """
         # Calculate weighted votes for each verdict
         votes: dict[str, float] = {"APPROVE": 0.0, "REVISE": 0.0, "REJECT": 0.0}
         total_weight = 0.0
 
         judge_config_map = {j.name: j for j in self.config.judges}
 
-        for judge_name, verdict in verdicts.items():
+        def judge_weight(judge_name: str) -> float:
             judge_cfg = judge_config_map.get(judge_name)
-            weight = judge_cfg.weight if judge_cfg else 0.33
+            return judge_cfg.weight if judge_cfg else 0.33
+
+        for judge_name, (verdict, verdict_confidence) in ballots.items():
+            weight = judge_weight(judge_name)
             # Weight by both config weight and judge's confidence
-            effective_weight = weight * verdict["confidence"]
-            votes[verdict["verdict"]] += effective_weight
+            effective_weight = weight * verdict_confidence
+            votes[verdict] += effective_weight
             total_weight += weight
 
+        for judge_name in abstained:
+            total_weight += judge_weight(judge_name)
+
         # Normalize votes
         if total_weight > 0:
             for v in votes:
@@ -566,16 +965,16 @@ Review the code from your specialized perspective and provide your verdict in JS
 
         # Determine consensus type and final verdict
         verdict_counts = {
-            v: sum(1 for vd in verdicts.values() if vd["verdict"] == v) for v in votes
+            v: sum(1 for verdict, _ in ballots.values() if verdict == v) for v in votes
         }
-        all_same = len({vd["verdict"] for vd in verdicts.values()}) == 1
+        all_same = len({verdict for verdict, _ in ballots.values()}) == 1
 
         # Type alias for verdict literal
         VerdictType = Literal["APPROVE", "REVISE", "REJECT"]
 
         if all_same:
             consensus_type: Literal["unanimous", "majority", "tie_broken", "dissent"] = "unanimous"
-            final_verdict: VerdictType = list(verdicts.values())[0]["verdict"]
+            final_verdict: VerdictType = next(iter(ballots.values()))[0]
         elif max(votes.values()) >= 0.5:
             consensus_type = "majority"
             # Get the verdict with highest vote, cast to proper type
@@ -597,13 +996,13 @@ Review the code from your specialized perspective and provide your verdict in JS
 
         # Special handling for REJECT
         if final_verdict == "REJECT" and self.config.require_unanimous_reject:
-            if verdict_counts.get("REJECT", 0) < len(verdicts):
+            if verdict_counts.get("REJECT", 0) < len(ballots):
                 # Not unanimous REJECT, downgrade to REVISE
                 final_verdict = "REVISE"
                 consensus_type = "dissent"
 
         # Identify dissenting judges
-        dissenting = [name for name, v in verdicts.items() if v["verdict"] != final_verdict]
+        dissenting = [name for name, (v, _) in ballots.items() if v != final_verdict]
         if dissenting:
             consensus_type = "dissent" if consensus_type != "unanimous" else consensus_type
 
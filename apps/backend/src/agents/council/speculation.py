@@ -0,0 +1,160 @@
+"""Speculative council review that overlaps with the tester.
+
+Most council judges need the generated tests, but some (the security
+judges) only look at the code and the plan. Those can start as soon as the
+coder finishes instead of waiting for the tester, so the review step then
+only has to wait for the judges that really need the tests.
+
+with_speculative_review wraps the tester node: it runs the code-only
+judges concurrently with the tester and stores their verdicts in
+``state["speculative_review"]`` together with a fingerprint of the code
+and plan they reviewed. council_reviewer_node reuses those verdicts only
+if the fingerprint still matches; otherwise they are discarded and the
+judges run again as part of the full review.
+
+Example:
+    tester = with_speculative_review(create_resilient_node(tester_node, "tester"))
+    workflow.add_node("tester", tester)
+"""
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+
+from src.agents.council.orchestrator import CodeReviewCouncil, CouncilConfig
+from src.agents.state import JudgeVerdictState, WorkflowState
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+NodeFunction = Callable[[WorkflowState, RunnableConfig], Awaitable[dict[str, Any]]]
+
+
+def default_council_config() -> CouncilConfig:
+    """Council configuration for the current LLM mode and settings."""
+    config = (
+        CouncilConfig.default_local() if settings.use_local_llm else CouncilConfig.default_cloud()
+    )
+    config.early_quorum = settings.council_early_quorum
+    return config
+
+
+def review_fingerprint(code: str, plan: str) -> str:
+    """Fingerprint of everything a code-only judge sees."""
+    digest = hashlib.sha256()
+    digest.update(code.encode())
+    digest.update(b"\0")
+    digest.update(plan.encode())
+    return digest.hexdigest()
+
+
+async def run_speculative_review(
+    state: WorkflowState,
+    config: RunnableConfig | None = None,
+) -> dict[str, Any]:
+    """Run the code-only judges on the current code.
+
+    Args:
+        state: Workflow state with code and plan
+        config: Optional LangChain runnable config
+
+    Returns:
+        Speculative review record for ``state["speculative_review"]``
+    """
+    code = state.get("code", "")
+    plan = state.get("plan", "")
+    council = CodeReviewCouncil(config=default_council_config())
+
+    start_time = time.time()
+    verdicts = await council.review_code_only(code, plan, config)
+
+    return {
+        "fingerprint": review_fingerprint(code, plan),
+        "judge_verdicts": verdicts,
+        "latency_ms": int((time.time() - start_time) * 1000),
+    }
+
+
+def reusable_verdicts(state: WorkflowState) -> dict[str, JudgeVerdictState]:
+    """Speculative verdicts that are still valid for the state's code.
+
+    Args:
+        state: Workflow state about to be reviewed
+
+    Returns:
+        Verdicts by judge name; empty if there are none or the code changed
+    """
+    speculative = state.get("speculative_review")
+    if not speculative:
+        return {}
+
+    verdicts: dict[str, JudgeVerdictState] = speculative.get("judge_verdicts", {})
+    if speculative.get("fingerprint") != review_fingerprint(
+        state.get("code", ""), state.get("plan", "")
+    ):
+        logger.info(
+            "Speculative review discarded, code changed",
+            task_id=state.get("task_id"),
+            judges=list(verdicts),
+        )
+        return {}
+
+    return verdicts
+
+
+def with_speculative_review(tester: NodeFunction) -> NodeFunction:
+    """Wrap the tester node so code-only judges run alongside it.
+
+    The tester's result is returned unchanged apart from the added
+    ``speculative_review`` record. If the tester fails, the speculative
+    judges are cancelled; if they fail, the tester's result is returned
+    without speculation and the full review runs every judge.
+
+    Args:
+        tester: Tester node function (optionally already resilient)
+
+    Returns:
+        Node function running tester and speculative review concurrently
+    """
+
+    @wraps(tester)
+    async def speculative_tester(
+        state: WorkflowState,
+        config: RunnableConfig = {},  # noqa: B006
+    ) -> dict[str, Any]:
+        speculation = asyncio.create_task(run_speculative_review(state, config))
+        try:
+            result = await tester(state, config)
+        except BaseException:
+            speculation.cancel()
+            raise
+
+        if result.get("status") == "error" or result.get("error"):
+            speculation.cancel()
+            return result
+
+        try:
+            speculative = await speculation
+        except Exception as e:
+            logger.warning(
+                "Speculative review failed",
+                task_id=state.get("task_id"),
+                error=str(e),
+            )
+            return result
+
+        logger.info(
+            "Speculative review ready",
+            task_id=state.get("task_id"),
+            judges=list(speculative["judge_verdicts"]),
+            latency_ms=speculative["latency_ms"],
+        )
+        return {**result, "speculative_review": speculative}
+
+    return speculative_tester
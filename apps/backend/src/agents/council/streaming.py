@@ -0,0 +1,133 @@
+"""Incremental parsing of streamed judge verdicts.
+
+Judges answer with a JSON object whose ``verdict`` and ``confidence``
+fields come before the long issue and action lists. Parsing them as the
+tokens arrive tells the council a judge's vote well before the judge
+finishes, which is what quorum mode needs to stop waiting for judges that
+can no longer change the outcome.
+
+Usage:
+    parser = IncrementalVerdictParser()
+    async for chunk in model.astream(messages):
+        parser.feed(chunk.content)
+        if parser.decided:
+            print(parser.verdict, parser.confidence)
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+from src.agents.processing.json_extract import JsonObjectScanner
+
+# Longest text a verdict or confidence field can span; rescanning this much
+# of the previous buffer catches fields split across chunks
+MAX_FIELD_CHARS = 64
+
+_VERDICT_PATTERN = re.compile(r'"verdict"\s*:\s*"(APPROVE|REVISE|REJECT)"', re.IGNORECASE)
+# The number must be followed by a delimiter, otherwise more digits may follow
+_CONFIDENCE_PATTERN = re.compile(r'"confidence"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}\n]')
+
+
+class IncrementalVerdictParser:
+    """Extracts verdict and confidence from a streamed JSON response.
+
+    Each feed only rescans the new text plus a short overlap, so parsing
+    a whole response is linear in its length. The text is also fed to a
+    JsonObjectScanner, so the complete verdict object is located without
+    scanning the response again once the stream ends.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self.verdict: Literal["APPROVE", "REVISE", "REJECT"] | None = None
+        self.confidence: float | None = None
+        self.scanner = JsonObjectScanner()
+        self._tail = ""
+
+    @property
+    def text(self) -> str:
+        """The full text received so far."""
+        return self.scanner.text
+
+    @property
+    def chars(self) -> int:
+        """Number of characters received so far."""
+        return len(self.scanner)
+
+    @property
+    def decided(self) -> bool:
+        """Whether both verdict and confidence have been parsed."""
+        return self.verdict is not None and self.confidence is not None
+
+    def feed(self, chunk: str) -> bool:
+        """Add streamed text.
+
+        Args:
+            chunk: Next piece of the response
+
+        Returns:
+            True if this chunk completed the verdict and confidence
+        """
+        if not chunk:
+            return False
+        self.scanner.feed(chunk)
+        if self.decided:
+            return False
+
+        window = self._tail + chunk
+        self._tail = window[-MAX_FIELD_CHARS:]
+
+        if self.verdict is None:
+            match = _VERDICT_PATTERN.search(window)
+            if match:
+                verdict = match.group(1).upper()
+                self.verdict = (
+                    "APPROVE"
+                    if verdict == "APPROVE"
+                    else "REJECT" if verdict == "REJECT" else "REVISE"
+                )
+        if self.confidence is None:
+            match = _CONFIDENCE_PATTERN.search(window)
+            if match:
+                self.confidence = min(max(float(match.group(1)), 0.0), 1.0)
+
+        return self.decided
+
+
+@dataclass
+class JudgeProgress:
+    """Live progress of one streaming judge.
+
+    Attributes:
+        parser: Parser fed with the judge's streamed output
+        started_at: Monotonic time the judge's request was sent
+        first_token_at: Monotonic time the first token arrived
+        finished_at: Monotonic time the judge's stream ended
+    """
+
+    parser: IncrementalVerdictParser
+    started_at: float = 0.0
+    first_token_at: float | None = None
+    finished_at: float | None = None
+
+    @classmethod
+    def start(cls) -> "JudgeProgress":
+        """Create progress for a judge whose request is being sent."""
+        return cls(parser=IncrementalVerdictParser(), started_at=time.monotonic())
+
+    def feed(self, chunk: str) -> bool:
+        """Record streamed text; see IncrementalVerdictParser.feed."""
+        if chunk and self.first_token_at is None:
+            self.first_token_at = time.monotonic()
+        return self.parser.feed(chunk)
+
+    def finish(self) -> float:
+        """Mark the stream as complete.
+
+        Returns:
+            Seconds since the judge's request was sent
+        """
+        finished_at = self.finished_at = time.monotonic()
+        return finished_at - self.started_at
@@ -26,6 +26,8 @@ Example:
 """
 
 import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing, suppress
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -47,6 +49,9 @@ logger = get_logger(__name__)
 # Default workflow timeout (5 minutes)
 WORKFLOW_TIMEOUT_SECONDS = 300
 
+# Marks the end of a forwarded event stream
+_STREAM_END = object()
+
 
 class StreamEventType:
     """Event types emitted during workflow streaming.
@@ -220,6 +225,7 @@ async def invoke_workflow(
     """
     # Import here to avoid circular imports
     from src.agents.graph import get_compiled_graph, get_compiled_graph_with_checkpointer
+    from src.agents.resilience import workflow_error_scope
 
     # Determine if we should use checkpointing
     if use_checkpointing is None:
@@ -271,6 +277,8 @@ async def invoke_workflow(
         },
         "workspace_path": None,
         "tool_calls": [],
+        "speculative_review": None,
+        "review_memory": None,
     }
 
     config: dict[str, Any] = {}
@@ -295,9 +303,11 @@ async def invoke_workflow(
         # Check for pre-cancellation
         token.raise_if_cancelled()
 
-        result: WorkflowState = await asyncio.wait_for(
-            graph.ainvoke(initial_state, config), timeout=timeout
-        )
+        # Retry budgets are per run, never shared with concurrent workflows
+        with workflow_error_scope():
+            result: WorkflowState = await asyncio.wait_for(
+                graph.ainvoke(initial_state, config), timeout=timeout
+            )
 
         # Check for cancellation after completion
         if token.is_cancelled:
@@ -346,6 +356,53 @@ async def invoke_workflow(
         cleanup_cancellation_token(task_id)
 
 
+async def _stream_in_error_scope(
+    events: AsyncIterator[dict[str, Any]], timeout: float
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Iterate workflow events produced by a task that owns the run's scopes.
+
+    workflow_error_scope() and asyncio.timeout() must not stay entered across
+    a yield: while the generator is suspended the error scope's context
+    variable would be visible to the consumer, and closing the generator
+    from another context could not reset it. A task enters both and runs
+    the graph; its events are forwarded through a queue.
+
+    Args:
+        events: The graph's event stream (not yet started)
+        timeout: Maximum execution time in seconds
+
+    Yields:
+        The graph's events
+
+    Raises:
+        TimeoutError: If the workflow exceeds the timeout
+    """
+    from src.agents.resilience import workflow_error_scope
+
+    forwarded: asyncio.Queue[Any] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            async with asyncio.timeout(timeout):
+                with workflow_error_scope():
+                    async for event in events:
+                        forwarded.put_nowait(event)
+        finally:
+            forwarded.put_nowait(_STREAM_END)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (event := await forwarded.get()) is not _STREAM_END:
+            yield event
+        # Re-raise the producer's error, if any
+        await producer
+    finally:
+        if not producer.done():
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+
+
 async def stream_workflow(
     task_description: str,
     task_id: int,
@@ -437,6 +494,8 @@ async def stream_workflow(
         },
         "workspace_path": None,
         "tool_calls": [],
+        "speculative_review": None,
+        "review_memory": None,
     }
 
     config: dict[str, Any] = {}
@@ -451,9 +510,13 @@ async def stream_workflow(
         tracker = AgentRunTracker(db=db, task_id=task_id)
         config["callbacks"] = [tracker]
 
+    # Retry budgets are per run; the scope is owned by the task running the graph
+    events = _stream_in_error_scope(
+        graph.astream_events(initial_state, config, version="v2"), timeout
+    )
     try:
-        async with asyncio.timeout(timeout):
-            async for event in graph.astream_events(initial_state, config, version="v2"):
+        async with aclosing(events):
+            async for event in events:
                 # Apply event filtering if specified
                 if event_filter is not None:
                     event_type = event.get("event", "")
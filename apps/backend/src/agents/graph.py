@@ -6,6 +6,7 @@ and reviewer nodes with conditional routing for review loops and iteration limit
 
 Features:
 - Council-based review with multiple judges (optional, config-driven)
+- Speculative code-only judges running alongside the tester (optional)
 - Enhanced routing with confidence-based decisions
 - Error recovery with retry and fallback strategies
 - Checkpointing for workflow persistence and resumption
@@ -27,11 +28,12 @@ from langgraph.graph import END, START, StateGraph
 from langgraph.graph._node import StateNode
 
 from src.agents.council.node import council_reviewer_node
+from src.agents.council.speculation import with_speculative_review
 from src.agents.nodes.coder import coder_node
 from src.agents.nodes.planner import planner_node
 from src.agents.nodes.reviewer import reviewer_node
 from src.agents.nodes.tester import tester_node
-from src.agents.resilience import create_resilient_node, reset_workflow_error_handler
+from src.agents.resilience import create_resilient_node
 from src.agents.state import WorkflowState
 from src.core.config import settings
 from src.core.logging import get_logger
@@ -53,6 +55,7 @@ MAX_REVIEW_ITERATIONS = 3  # Maximum number of coder revisions after review feed
 def create_workflow(
     use_council_review: bool | None = None,
     use_error_recovery: bool | None = None,
+    use_speculative_review: bool | None = None,
 ) -> StateGraph[WorkflowState]:
     """Create the multi-agent coding workflow graph.
 
@@ -66,12 +69,17 @@ def create_workflow(
         - Council-based review with multiple judges (when use_council_review=True)
         - Enhanced routing with confidence-based decisions
         - Error recovery with retry and fallback (when use_error_recovery=True)
+        - Code-only council judges started alongside the tester
+          (when use_speculative_review=True and council review is used)
 
     Args:
         use_council_review: Whether to use council-based review. If None, uses
                            settings.use_council_review (defaults to True).
         use_error_recovery: Whether to wrap nodes with error recovery. If None,
                            uses settings.enable_error_recovery (defaults to True).
+        use_speculative_review: Whether to run code-only judges in parallel with
+                           the tester. If None, uses settings.enable_speculative_review
+                           (defaults to False). Ignored without council review.
 
     Returns:
         Compiled StateGraph ready for execution
@@ -89,11 +97,12 @@ def create_workflow(
     if use_error_recovery is None:
         use_error_recovery = getattr(settings, "enable_error_recovery", True)
 
-    workflow = StateGraph(WorkflowState)
+    # Determine if we should review speculatively (council review only)
+    if use_speculative_review is None:
+        use_speculative_review = getattr(settings, "enable_speculative_review", False)
+    use_speculative_review = use_speculative_review and use_council_review
 
-    # Reset error handler for clean state
-    if use_error_recovery:
-        reset_workflow_error_handler()
+    workflow = StateGraph(WorkflowState)
 
     # Prepare node functions - optionally wrap with error recovery
     if use_error_recovery:
@@ -112,6 +121,11 @@ def create_workflow(
         tester = tester_node
         reviewer = council_reviewer_node if use_council_review else reviewer_node
 
+    # Start code-only judges while the tester runs; the reviewer reuses them
+    if use_speculative_review:
+        tester = with_speculative_review(tester)
+        logger.info("Using speculative review alongside the tester")
+
     # Add nodes - cast to LangGraphNode to work around type stub limitations
     workflow.add_node("planner", cast(LangGraphNode, cast(object, planner)))
     workflow.add_node("coder", cast(LangGraphNode, cast(object, coder)))
@@ -218,9 +232,9 @@ def create_workflow(
                 max_iterations=MAX_REVIEW_ITERATIONS,
             )
             state["status"] = "complete"  # Mark as complete despite revision feedback
-            state["review_feedback"] += (
-                f"\n\n[Note: Maximum revisions ({MAX_REVIEW_ITERATIONS}) reached]"
-            )
+            state[
+                "review_feedback"
+            ] += f"\n\n[Note: Maximum revisions ({MAX_REVIEW_ITERATIONS}) reached]"
 
         logger.info(
             "Workflow completing",
@@ -239,6 +253,7 @@ def create_workflow(
         "Created workflow graph",
         nodes=["planner", "coder", "tester", "reviewer"],
         reviewer_type=reviewer_type,
+        speculative_review=use_speculative_review,
         edges=["START->planner->coder->tester->reviewer", "reviewer->(conditional)->coder/END"],
     )
 
@@ -295,10 +310,6 @@ def create_supervised_workflow(
 
     workflow = StateGraph(WorkflowState)
 
-    # Reset error handler for clean state
-    if use_error_recovery:
-        reset_workflow_error_handler()
-
     # Prepare node functions
     if use_error_recovery:
         planner = create_resilient_node(planner_node, "planner", "sonnet")
@@ -2,6 +2,12 @@
 
 Provides:
 - models: LLM factory and model configuration
+- artifacts: Content-addressed store for code files and large state text
+- circuit_breaker: Per-backend circuit breakers with tier fallback
+- load_balancer: Load balancing and request hedging over vLLM replicas
+- context_window: ReAct history compaction within the context window
+- prompt_cache: Prompt prefix caching and cache token accounting
+- response_cache: Content-addressed cache of deterministic LLM responses
 - tracking: Agent run persistence and metrics
 - tracing: LangSmith integration
 - error_handler: Error classification and recovery
@@ -9,6 +15,14 @@ Provides:
 - checkpointer: Workflow state persistence
 """
 
+from src.agents.infrastructure.artifacts import (
+    ArtifactNotFoundError,
+    ArtifactStore,
+    get_artifact_store,
+    persistent_ref,
+    reset_artifact_store,
+    snapshot_code_files,
+)
 from src.agents.infrastructure.checkpointer import (
     check_checkpointer_health,
     close_checkpointer,
@@ -16,19 +30,42 @@ from src.agents.infrastructure.checkpointer import (
     get_checkpointer,
     list_checkpoints,
 )
+from src.agents.infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    get_circuit_breakers,
+    reset_circuit_breakers,
+)
+from src.agents.infrastructure.context_window import ContextWindowManager
 from src.agents.infrastructure.error_handler import ErrorHandler, ErrorType
+from src.agents.infrastructure.load_balancer import LoadBalancingTransport
 from src.agents.infrastructure.models import (
     ChatModel,
     ModelFactory,
+    ModelPool,
     ModelRateLimiter,
+    close_model_pool,
     get_coder_model,
     get_model_for_task,
+    get_model_pool,
     get_planner_model,
     get_rate_limiter,
     get_reviewer_model,
     get_tester_model,
     reset_rate_limiter,
 )
+from src.agents.infrastructure.prompt_cache import (
+    PromptCachingChatAnthropic,
+    apply_cache_breakpoints,
+    extract_cache_usage,
+)
+from src.agents.infrastructure.response_cache import (
+    LLMResponseCache,
+    extract_response_cache_usage,
+    get_response_cache,
+    reset_response_cache,
+)
 from src.agents.infrastructure.streaming import StreamingMetrics, stream_with_metrics
 from src.agents.infrastructure.tracing import configure_tracing, is_tracing_enabled
 from src.agents.infrastructure.tracking import AgentRunTracker
@@ -42,10 +79,40 @@ __all__ = [
     "get_coder_model",
     "get_tester_model",
     "get_reviewer_model",
+    # Model pool
+    "ModelPool",
+    "get_model_pool",
+    "close_model_pool",
     # Rate limiting
     "ModelRateLimiter",
     "get_rate_limiter",
     "reset_rate_limiter",
+    # Circuit breakers
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "get_circuit_breakers",
+    "reset_circuit_breakers",
+    # Local replica load balancing
+    "LoadBalancingTransport",
+    # Context window
+    "ContextWindowManager",
+    # Prompt caching
+    "PromptCachingChatAnthropic",
+    "apply_cache_breakpoints",
+    "extract_cache_usage",
+    # Response caching
+    "LLMResponseCache",
+    "get_response_cache",
+    "reset_response_cache",
+    "extract_response_cache_usage",
+    # Artifacts
+    "ArtifactNotFoundError",
+    "ArtifactStore",
+    "get_artifact_store",
+    "reset_artifact_store",
+    "persistent_ref",
+    "snapshot_code_files",
     # Error handling
     "ErrorHandler",
     "ErrorType",
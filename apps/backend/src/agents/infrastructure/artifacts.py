@@ -0,0 +1,327 @@
+"""Content-addressed artifact store for code files and large workflow text.
+
+Workflow metadata is merged and re-serialized into a checkpoint by every
+node, so full texts kept there (plan versions, generated files) were
+copied on every step of every iteration. Instead, the state holds an
+artifact reference (a hash of the content) and the text lives here once,
+however many iterations or checkpoints refer to it:
+
+- ArtifactStore: byte-bounded in-process LRU, optionally backed by a
+  directory (artifact_store_dir) so references in persisted checkpoints
+  stay resolvable after a restart
+- persistent_ref: a reference for records that outlive the process, only
+  when the store is backed by a directory
+- snapshot_code_files: the coder's code_files with a content reference per
+  file and a unified diff against the previous iteration's version, when
+  the store is backed by a directory
+
+Without artifact_store_dir, references resolve only in the process that
+created them and until they are evicted, so checkpoints and run records
+keep their text inline and code_files carries no references.
+
+Usage:
+    ref = get_artifact_store().put(plan)
+    plan = get_artifact_store().get(ref)
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Prefix of artifact references (the rest is the content's sha256)
+ARTIFACT_REF_PREFIX = "sha256:"
+
+
+class ArtifactNotFoundError(KeyError):
+    """Raised when an artifact reference cannot be resolved."""
+
+    def __init__(self, ref: str) -> None:
+        """Initialize the error.
+
+        Args:
+            ref: The unresolved reference
+        """
+        super().__init__(ref)
+        self.ref = ref
+
+    def __str__(self) -> str:
+        return f"Artifact not found: {self.ref}"
+
+
+def artifact_ref(text: str) -> str:
+    """Get the reference a text is stored under.
+
+    Args:
+        text: Artifact content
+
+    Returns:
+        "sha256:" followed by the hex digest of the UTF-8 content
+    """
+    digest = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+    return f"{ARTIFACT_REF_PREFIX}{digest}"
+
+
+def text_diff(old: str, new: str, filepath: str = "") -> str:
+    """Unified diff between two versions of a text.
+
+    Args:
+        old: Previous version
+        new: Current version
+        filepath: Name shown in the diff headers
+
+    Returns:
+        The diff, empty if the versions are equal
+    """
+    return "".join(
+        difflib.unified_diff(
+            old.splitlines(keepends=True),
+            new.splitlines(keepends=True),
+            fromfile=f"a/{filepath}",
+            tofile=f"b/{filepath}",
+        )
+    )
+
+
+class ArtifactStore:
+    """Texts stored once under their content hash."""
+
+    def __init__(self, max_bytes: int | None = None, directory: str | Path | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            max_bytes: Maximum UTF-8 bytes kept in memory, least recently used
+                evicted first (defaults to settings.artifact_store_max_bytes)
+            directory: Directory persisting every artifact (defaults to
+                settings.artifact_store_dir; None keeps artifacts in memory only)
+        """
+        self.max_bytes = settings.artifact_store_max_bytes if max_bytes is None else max_bytes
+        if directory is None:
+            directory = settings.artifact_store_dir
+        self.directory = Path(directory) if directory else None
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def persistent(self) -> bool:
+        """Whether references resolve after a restart and in other processes."""
+        return self.directory is not None
+
+    def __contains__(self, ref: object) -> bool:
+        if not isinstance(ref, str):
+            return False
+        if ref in self._entries:
+            return True
+        path = self._path(ref)
+        return path is not None and path.exists()
+
+    def _path(self, ref: str) -> Path | None:
+        if self.directory is None or not ref.startswith(ARTIFACT_REF_PREFIX):
+            return None
+        digest = ref.removeprefix(ARTIFACT_REF_PREFIX)
+        return self.directory / digest[:2] / digest
+
+    def _remember(self, ref: str, text: str) -> None:
+        size = len(text.encode("utf-8", "surrogatepass"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if ref in self._entries:
+                self._entries.move_to_end(ref)
+                return
+            self._entries[ref] = text
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.encode("utf-8", "surrogatepass"))
+
+    def put(self, text: str) -> str:
+        """Store a text.
+
+        Args:
+            text: Content to store
+
+        Returns:
+            The artifact reference
+        """
+        ref = artifact_ref(text)
+        self._remember(ref, text)
+
+        path = self._path(ref)
+        if path is not None and not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix(".tmp")
+            temporary.write_text(text, encoding="utf-8")
+            temporary.replace(path)
+
+        return ref
+
+    def get(self, ref: str) -> str:
+        """Get a stored text.
+
+        Args:
+            ref: Artifact reference returned by put
+
+        Returns:
+            The content
+
+        Raises:
+            ArtifactNotFoundError: If the artifact was evicted and not persisted
+        """
+        with self._lock:
+            text = self._entries.get(ref)
+            if text is not None:
+                self._entries.move_to_end(ref)
+                return text
+
+        path = self._path(ref)
+        if path is None:
+            raise ArtifactNotFoundError(ref)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise ArtifactNotFoundError(ref) from None
+
+        self._remember(ref, text)
+        return text
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "directory": str(self.directory) if self.directory else None,
+        }
+
+
+# Global artifact store
+_artifact_store: ArtifactStore | None = None
+_artifact_store_lock = Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get the global artifact store (singleton).
+
+    Returns:
+        The global ArtifactStore instance
+    """
+    global _artifact_store
+
+    if _artifact_store is None:
+        with _artifact_store_lock:
+            if _artifact_store is None:
+                _artifact_store = ArtifactStore()
+
+    return _artifact_store
+
+
+def reset_artifact_store() -> None:
+    """Drop the global artifact store.
+
+    Useful for testing.
+    """
+    global _artifact_store
+
+    with _artifact_store_lock:
+        _artifact_store = None
+
+
+def persistent_ref(text: str) -> str | None:
+    """Store a text referenced from a record that outlives this process.
+
+    Args:
+        text: Content to store
+
+    Returns:
+        The artifact reference, or None if the store keeps artifacts in
+        memory only (the record should keep the text itself)
+    """
+    store = get_artifact_store()
+    if not store.persistent:
+        return None
+    return store.put(text)
+
+
+def snapshot_code_files(
+    code_files: dict[str, Any],
+    contents: Sequence[str],
+    previous: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Store file contents and record what changed since the last iteration.
+
+    Only done when the artifact store is persistent; otherwise the
+    references could not be resolved after a restart, and code_files is
+    returned as is (file metadata only, the content being in state["code"]).
+
+    Each file entry gains:
+    - content_ref: reference of the file's content
+    - changed: whether the content differs from the previous iteration
+    - previous_ref: reference of the previous content (changed files only)
+    - diff: unified diff against the previous content, when it is smaller
+      than the new content and the previous content is still available
+
+    Args:
+        code_files: MultiFileResult.to_dict() of this iteration
+        contents: Content of each file, in the same order as code_files["files"]
+        previous: The previous iteration's snapshot, if any
+
+    Returns:
+        The snapshot, with removed_files listing paths that no longer exist
+    """
+    store = get_artifact_store()
+    if not store.persistent:
+        return code_files
+
+    previous_refs = {
+        entry["filepath"]: entry["content_ref"]
+        for entry in (previous or {}).get("files", [])
+        if entry.get("content_ref")
+    }
+
+    files: list[dict[str, Any]] = []
+    for entry, content in zip(code_files.get("files", []), contents, strict=True):
+        filepath = entry["filepath"]
+        ref = store.put(content)
+        previous_ref = previous_refs.get(filepath)
+        changed = previous_ref != ref
+        diff = None
+
+        if changed and previous_ref is not None:
+            try:
+                diff = text_diff(store.get(previous_ref), content, filepath)
+            except ArtifactNotFoundError:
+                logger.debug("Previous file version unavailable", filepath=filepath)
+            if diff is not None and len(diff) >= len(content):
+                diff = None  # The full content is the more compact record
+
+        files.append(
+            {
+                **entry,
+                "content_ref": ref,
+                "changed": changed,
+                "previous_ref": previous_ref if changed else None,
+                "diff": diff,
+            }
+        )
+
+    current_paths = {entry["filepath"] for entry in files}
+    return {
+        **code_files,
+        "files": files,
+        "removed_files": [path for path in previous_refs if path not in current_paths],
+    }
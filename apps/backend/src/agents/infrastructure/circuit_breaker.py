@@ -0,0 +1,401 @@
+"""Circuit breakers for model backends.
+
+When a backend is down, every workflow would otherwise keep sending
+requests and retrying them with exponential backoff on its own, piling
+up timeouts (a retry storm). A circuit breaker per backend endpoint is
+shared by all workflows in the process: one per tier for the cloud API,
+and one for every tier of the local vLLM server, which serves them all
+from the same endpoint (falling back to another tier would call the same
+dead server, so local models do not fall back):
+
+- CLOSED: calls pass; consecutive backend failures are counted
+- OPEN: after ``failure_threshold`` consecutive failures calls fail
+  immediately with CircuitOpenError, and ModelPool hands out the next
+  fallback tier instead
+- HALF_OPEN: after ``recovery_timeout`` a limited number of probe calls
+  pass; a success closes the circuit, a failure opens it again
+
+Only backend health errors (timeouts, connection and server errors) trip
+a breaker. Rate limiting is handled by ModelRateLimiter, and request
+errors such as context length or validation failures say nothing about
+the backend.
+
+Every model created by ModelFactory carries a CircuitBreakerCallbackHandler,
+so callers do not use the breakers directly.
+"""
+
+import enum
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Tiers tried in order when a tier's circuit is open (most to least capable)
+FALLBACK_CHAIN: tuple[str, ...] = ("opus", "sonnet", "haiku")
+
+# Backends serving every tier from one endpoint, behind a single breaker
+SHARED_ENDPOINT_BACKENDS: frozenset[str] = frozenset({"local"})
+
+# Tier name of the breaker shared by all tiers of such a backend
+ALL_TIERS = "all"
+
+
+class CircuitState(str, enum.Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a backend whose circuit is open."""
+
+    def __init__(self, backend: str, tier: str, retry_after: float) -> None:
+        """Initialize the error.
+
+        Args:
+            backend: Backend name ("local" or "cloud")
+            tier: Model tier
+            retry_after: Seconds until the circuit lets a probe through
+        """
+        super().__init__(
+            f"Circuit open for {backend}/{tier} model backend; " f"next probe in {retry_after:.1f}s"
+        )
+        self.backend = backend
+        self.tier = tier
+        self.retry_after = retry_after
+
+
+@dataclass
+class CircuitBreaker:
+    """Failure-counting circuit breaker for one backend and tier.
+
+    Attributes:
+        backend: Backend name
+        tier: Model tier
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds the circuit stays open before probing
+        half_open_max_calls: Concurrent probe calls allowed when half-open
+    """
+
+    backend: str
+    tier: str
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    clock: Callable[[], float] = time.monotonic
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    times_opened: int = 0
+    rejected_calls: int = 0
+    _probes_in_flight: int = 0
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def _refresh(self) -> None:
+        """Move from OPEN to HALF_OPEN once the recovery timeout elapsed."""
+        if (
+            self.state == CircuitState.OPEN
+            and self.clock() - self.opened_at >= self.recovery_timeout
+        ):
+            self.state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+            logger.info("circuit_breaker_half_open", backend=self.backend, tier=self.tier)
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(self.recovery_timeout - (self.clock() - self.opened_at), 0.0)
+
+    def is_available(self) -> bool:
+        """Whether a call would currently be admitted (without admitting it)."""
+        with self._lock:
+            self._refresh()
+            if self.state == CircuitState.HALF_OPEN:
+                return self._probes_in_flight < self.half_open_max_calls
+            return self.state == CircuitState.CLOSED
+
+    def before_call(self) -> bool:
+        """Admit a call or fail fast.
+
+        Returns:
+            True if the call is a half-open probe
+
+        Raises:
+            CircuitOpenError: If the circuit is open or all probe slots are taken
+        """
+        with self._lock:
+            self._refresh()
+            if self.state == CircuitState.CLOSED:
+                return False
+            if (
+                self.state == CircuitState.HALF_OPEN
+                and self._probes_in_flight < self.half_open_max_calls
+            ):
+                self._probes_in_flight += 1
+                return True
+            self.rejected_calls += 1
+            retry_after = self.retry_after
+        raise CircuitOpenError(self.backend, self.tier, retry_after)
+
+    def record_success(self, probe: bool = False) -> None:
+        """Record a successful call; closes a half-open circuit."""
+        with self._lock:
+            if probe:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+            self.consecutive_failures = 0
+            if self.state == CircuitState.HALF_OPEN:
+                self.state = CircuitState.CLOSED
+                logger.info("circuit_breaker_closed", backend=self.backend, tier=self.tier)
+
+    def record_failure(self, probe: bool = False) -> None:
+        """Record a backend failure; may open the circuit."""
+        with self._lock:
+            if probe:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+            self.consecutive_failures += 1
+            if self.state == CircuitState.HALF_OPEN or (
+                self.state == CircuitState.CLOSED
+                and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = CircuitState.OPEN
+                self.opened_at = self.clock()
+                self.times_opened += 1
+                logger.warning(
+                    "circuit_breaker_opened",
+                    backend=self.backend,
+                    tier=self.tier,
+                    consecutive_failures=self.consecutive_failures,
+                    recovery_timeout=self.recovery_timeout,
+                )
+
+    def release(self, probe: bool = False) -> None:
+        """End a call that says nothing about backend health (e.g. cancelled)."""
+        if probe:
+            with self._lock:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get breaker statistics for monitoring."""
+        with self._lock:
+            self._refresh()
+            return {
+                "state": self.state.value,
+                "consecutive_failures": self.consecutive_failures,
+                "times_opened": self.times_opened,
+                "rejected_calls": self.rejected_calls,
+                "retry_after_seconds": round(self.retry_after, 1),
+            }
+
+
+class CircuitBreakerRegistry:
+    """The shared circuit breakers, one per backend endpoint."""
+
+    def __init__(
+        self,
+        failure_threshold: int | None = None,
+        recovery_timeout: float | None = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            failure_threshold: Failures that open a circuit
+                (default: settings.circuit_breaker_failure_threshold)
+            recovery_timeout: Seconds before probing an open circuit
+                (default: settings.circuit_breaker_recovery_seconds)
+        """
+        self.failure_threshold = (
+            settings.circuit_breaker_failure_threshold
+            if failure_threshold is None
+            else failure_threshold
+        )
+        self.recovery_timeout = (
+            settings.circuit_breaker_recovery_seconds
+            if recovery_timeout is None
+            else recovery_timeout
+        )
+        self._breakers: dict[tuple[str, str], CircuitBreaker] = {}
+        self._lock = Lock()
+
+    def get(self, backend: str, tier: str) -> CircuitBreaker:
+        """Get the breaker for a backend and tier, creating it on first use.
+
+        All tiers of a shared-endpoint backend get the same breaker.
+        """
+        if backend in SHARED_ENDPOINT_BACKENDS:
+            tier = ALL_TIERS
+        key = (backend, tier)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        backend=backend,
+                        tier=tier,
+                        failure_threshold=self.failure_threshold,
+                        recovery_timeout=self.recovery_timeout,
+                    )
+                    self._breakers[key] = breaker
+        return breaker
+
+    def route(self, backend: str, tier: str, chain: Sequence[str] = FALLBACK_CHAIN) -> str:
+        """Pick the tier to use, skipping tiers whose circuit is open.
+
+        Falls back along the chain starting at ``tier``. If every candidate
+        is open, ``tier`` is returned and its calls fail fast. Shared-endpoint
+        backends never fall back: every tier would reach the same server.
+
+        Args:
+            backend: Backend name
+            tier: Requested tier
+            chain: Fallback order
+
+        Returns:
+            The requested tier or the first available fallback tier
+        """
+        candidates = [tier]
+        if backend in SHARED_ENDPOINT_BACKENDS:
+            return tier
+        if tier in chain:
+            candidates += list(chain[chain.index(tier) + 1 :])
+
+        for candidate in candidates:
+            if self.get(backend, candidate).is_available():
+                if candidate != tier:
+                    logger.warning(
+                        "circuit_breaker_fallback",
+                        backend=backend,
+                        requested_tier=tier,
+                        fallback_tier=candidate,
+                    )
+                return candidate
+        return tier
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get statistics for every breaker, keyed by "backend/tier"."""
+        return {
+            f"{backend}/{tier}": breaker.get_stats()
+            for (backend, tier), breaker in list(self._breakers.items())
+        }
+
+    def reset(self) -> None:
+        """Drop all breakers (closing every circuit)."""
+        with self._lock:
+            self._breakers.clear()
+
+
+def _is_backend_failure(error: BaseException) -> bool:
+    """Whether an error indicates an unhealthy backend."""
+    from src.agents.infrastructure.error_handler import ErrorClassifier, ErrorType
+
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500
+    return ErrorClassifier.classify(error) in (
+        ErrorType.LLM_TIMEOUT,
+        ErrorType.CONNECTION_ERROR,
+        ErrorType.API_ERROR,
+    )
+
+
+class CircuitBreakerCallbackHandler(AsyncCallbackHandler):
+    """Callback that puts a model behind its backend's circuit breaker.
+
+    Raises CircuitOpenError from on_chat_model_start, which aborts the call
+    before the request is sent (raise_error is set for this reason). The
+    handler runs inline: LangChain gathers the start events of other
+    handlers concurrently, and raise_error does not stop them. With rate
+    limiting, the limiter's handler runs this one before admitting a call
+    (see RateLimitCallbackHandler).
+    """
+
+    raise_error = True
+    run_inline = True
+
+    def __init__(self, tier: str, backend: str) -> None:
+        """Initialize the handler.
+
+        Args:
+            tier: Model tier of the wrapped model
+            backend: Backend of the wrapped model ("local" or "cloud")
+        """
+        self.tier = tier
+        self.backend = backend
+        self._probes: set[UUID] = set()
+
+    def _breaker(self) -> CircuitBreaker:
+        return get_circuit_breakers().get(self.backend, self.tier)
+
+    async def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Fail fast if the circuit is open."""
+        if self._breaker().before_call():
+            self._probes.add(run_id)
+
+    async def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Record a healthy response."""
+        probe = run_id in self._probes
+        self._probes.discard(run_id)
+        self._breaker().record_success(probe)
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Count backend failures; other errors only free the probe slot."""
+        probe = run_id in self._probes
+        self._probes.discard(run_id)
+        if isinstance(error, Exception) and _is_backend_failure(error):
+            self._breaker().record_failure(probe)
+        else:
+            self._breaker().release(probe)
+
+
+# Global registry instance
+_circuit_breakers: CircuitBreakerRegistry | None = None
+_circuit_breakers_lock = Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get the global circuit breaker registry (singleton).
+
+    Returns:
+        The global CircuitBreakerRegistry instance
+    """
+    global _circuit_breakers
+
+    if _circuit_breakers is None:
+        with _circuit_breakers_lock:
+            if _circuit_breakers is None:
+                _circuit_breakers = CircuitBreakerRegistry()
+
+    return _circuit_breakers
+
+
+def reset_circuit_breakers() -> None:
+    """Close every circuit by dropping all breakers.
+
+    Useful for testing.
+    """
+    global _circuit_breakers
+
+    with _circuit_breakers_lock:
+        _circuit_breakers = None
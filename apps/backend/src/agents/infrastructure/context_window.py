@@ -0,0 +1,356 @@
+"""Context-window management for ReAct tool loops.
+
+A ReAct loop resends its whole history on every iteration, so large tool
+outputs (``read_file``, ``grep_content``) would otherwise be paid for on
+every later call and eventually overflow the model's context window.
+ContextWindowManager keeps the full history for the caller but sends the
+model a compacted view:
+
+1. Outputs of a tool call that was repeated later with identical
+   arguments are replaced by a pointer to the newer result.
+2. Outputs older than the most recent turns are elided to a short stub
+   with their first lines.
+3. If the request still exceeds the token budget, older outputs are
+   elided oldest first, then the latest outputs are truncated to fit.
+
+Compaction is monotonic: once a message is compacted it is never restored,
+so the compacted prefix stays byte-identical across iterations and keeps
+hitting the prompt cache. Token counts are estimated per message once and
+calibrated against the input tokens the provider reports.
+"""
+
+import json
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.runnables import RunnableBinding
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from src.agents.infrastructure.models import CHARS_PER_TOKEN, estimate_message_tokens
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Context window assumed for the Claude API models
+CLOUD_CONTEXT_WINDOW_TOKENS = 200_000
+
+# Smallest message budget handed to a loop, whatever the model reserves
+MIN_CONTEXT_BUDGET_TOKENS = 1024
+
+# Tool outputs at or below this size are never elided
+MIN_ELIDE_TOKENS = 200
+
+# Lines of an elided output kept in its stub
+ELIDED_PREVIEW_LINES = 5
+ELIDED_PREVIEW_LINE_CHARS = 160
+
+# Allowance for the marker inserted into a truncated output
+TRUNCATION_MARKER_TOKENS = 32
+
+# Bounds for calibrating estimates against reported input tokens
+MIN_ESTIMATE_SCALE = 1.0
+MAX_ESTIMATE_SCALE = 2.0
+
+
+def context_budget_for(model: Any) -> int:
+    """Derive the prompt token budget for a (possibly tool-bound) model.
+
+    The budget is the serving context window minus the completion tokens
+    the model reserves via max_tokens.
+
+    Args:
+        model: Chat model or runnable binding around one
+
+    Returns:
+        Token budget for the request's messages and tool schemas
+    """
+    if settings.use_local_llm:
+        window = settings.llm_context_window_tokens
+    else:
+        window = CLOUD_CONTEXT_WINDOW_TOKENS
+
+    # Unwrap RunnableBinding (bind_tools) to reach the chat model
+    inner = model
+    while isinstance(inner, RunnableBinding):
+        inner = inner.bound
+    reserve = getattr(inner, "max_tokens", None)
+    if not isinstance(reserve, int):
+        reserve = 0
+
+    return max(window - reserve, MIN_CONTEXT_BUDGET_TOKENS)
+
+
+def _tool_key(tool_name: str, tool_args: Any) -> str:
+    """Identity of a tool call used for deduplication."""
+    return f"{tool_name}:{json.dumps(tool_args, sort_keys=True, default=str)}"
+
+
+def _content_text(message: BaseMessage) -> str:
+    content = message.content
+    return content if isinstance(content, str) else str(content)
+
+
+@dataclass
+class _Entry:
+    """A history message with its bookkeeping."""
+
+    message: BaseMessage
+    tokens: int
+    turn: int
+    tool_name: str | None = None
+    tool_args: Any = None
+    tool_key: str | None = None
+    compacted: ToolMessage | None = None
+    compacted_tokens: int = 0
+
+    @property
+    def effective_tokens(self) -> int:
+        return self.compacted_tokens if self.compacted is not None else self.tokens
+
+
+@dataclass
+class ContextStats:
+    """Counters describing what the manager compacted.
+
+    Attributes:
+        deduplicated: Outputs superseded by a repeated identical call
+        elided: Outputs replaced by a stub
+        truncated: Latest-turn outputs cut to fit the budget
+        tokens_saved: Estimated tokens removed from the last request
+        last_request_tokens: Estimated tokens of the last request
+    """
+
+    deduplicated: int = 0
+    elided: int = 0
+    truncated: int = 0
+    tokens_saved: int = 0
+    last_request_tokens: int = 0
+
+
+class ContextWindowManager:
+    """Builds budget-bounded model inputs from a growing ReAct history.
+
+    Usage:
+        manager = ContextWindowManager(budget_tokens=6000, tools=tools)
+        manager.extend(initial_messages)
+        response = await model.ainvoke(manager.build())
+        manager.add(response)
+        manager.add(tool_message, tool_name="read_file", tool_args={...})
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int,
+        tools: Sequence[Any] | None = None,
+        keep_recent_turns: int | None = None,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            budget_tokens: Maximum estimated tokens per request
+            tools: Tools bound to the model (their schemas count toward the budget)
+            keep_recent_turns: Turns whose tool outputs are always sent in full.
+                Defaults to settings.react_context_keep_recent_turns.
+        """
+        self.budget_tokens = budget_tokens
+        self.keep_recent_turns = (
+            settings.react_context_keep_recent_turns
+            if keep_recent_turns is None
+            else keep_recent_turns
+        )
+        self.stats = ContextStats()
+        self._entries: list[_Entry] = []
+        self._turn = 0
+        self._scale = MIN_ESTIMATE_SCALE
+        self._last_raw_tokens = 0
+        self._tool_tokens = (
+            estimate_message_tokens([], tools=[convert_to_openai_tool(t) for t in tools])
+            if tools
+            else 0
+        )
+
+    @property
+    def messages(self) -> list[BaseMessage]:
+        """The full, uncompacted history."""
+        return [entry.message for entry in self._entries]
+
+    @property
+    def history(self) -> list[tuple[BaseMessage, str | None, Any]]:
+        """The full history with the tool call behind each tool result.
+
+        Replaying it through add() rebuilds an equivalent manager.
+        """
+        return [(entry.message, entry.tool_name, entry.tool_args) for entry in self._entries]
+
+    def add(
+        self,
+        message: BaseMessage,
+        tool_name: str | None = None,
+        tool_args: Any = None,
+    ) -> None:
+        """Append a message to the history.
+
+        Args:
+            message: Message to append
+            tool_name: Tool that produced a ToolMessage
+            tool_args: Arguments of that tool call
+        """
+        if isinstance(message, AIMessage):
+            self._turn += 1
+        entry = _Entry(
+            message=message,
+            tokens=estimate_message_tokens([message]),
+            turn=self._turn,
+        )
+        if isinstance(message, ToolMessage) and tool_name is not None:
+            entry.tool_name = tool_name
+            entry.tool_args = tool_args
+            entry.tool_key = _tool_key(tool_name, tool_args)
+        self._entries.append(entry)
+
+    def extend(self, messages: Sequence[BaseMessage]) -> None:
+        """Append several messages (e.g. the initial prompt)."""
+        for message in messages:
+            self.add(message)
+
+    def record_usage(self, input_tokens: int) -> None:
+        """Calibrate estimates against the provider's reported input tokens.
+
+        Args:
+            input_tokens: Input tokens reported for the last built request
+        """
+        if self._last_raw_tokens <= 0 or input_tokens <= 0:
+            return
+        ratio = input_tokens / self._last_raw_tokens
+        self._scale = min(max(ratio, MIN_ESTIMATE_SCALE), MAX_ESTIMATE_SCALE)
+
+    def _estimate(self, tokens: int) -> int:
+        return int(tokens * self._scale)
+
+    def _raw_request_tokens(self) -> int:
+        return self._tool_tokens + sum(entry.effective_tokens for entry in self._entries)
+
+    def _request_tokens(self) -> int:
+        return self._estimate(self._raw_request_tokens())
+
+    def _compact(self, entry: _Entry, content: str) -> None:
+        message = entry.message
+        assert isinstance(message, ToolMessage)
+        entry.compacted = ToolMessage(content=content, tool_call_id=message.tool_call_id)
+        entry.compacted_tokens = estimate_message_tokens([entry.compacted])
+
+    def _elide(self, entry: _Entry) -> None:
+        text = _content_text(entry.message)
+        lines = text.splitlines()
+        preview = "\n".join(
+            line[:ELIDED_PREVIEW_LINE_CHARS] for line in lines[:ELIDED_PREVIEW_LINES]
+        )
+        self._compact(
+            entry,
+            f"[Elided {entry.tool_name or 'tool'} output from an earlier step "
+            f"({len(lines)} lines, ~{entry.tokens} tokens). First lines:\n{preview}\n"
+            "Call the tool again if you need the full output.]",
+        )
+        self.stats.elided += 1
+
+    def _truncate(self, entry: _Entry, max_tokens: int) -> None:
+        text = _content_text(entry.message)
+        keep_chars = max_tokens * CHARS_PER_TOKEN
+        head = text[: keep_chars * 2 // 3]
+        tail = text[len(text) - keep_chars // 3 :]
+        self._compact(
+            entry,
+            f"{head}\n[... {len(text) - len(head) - len(tail)} characters truncated "
+            f"to fit the context window ...]\n{tail}",
+        )
+        self.stats.truncated += 1
+
+    def _tool_entries(self) -> list[_Entry]:
+        return [e for e in self._entries if isinstance(e.message, ToolMessage)]
+
+    def build(self) -> list[BaseMessage]:
+        """Compact the history as needed and return the messages to send.
+
+        Returns:
+            Messages whose estimated size fits the budget where possible
+        """
+        tool_entries = self._tool_entries()
+        full_tokens = self._estimate(
+            self._tool_tokens + sum(entry.tokens for entry in self._entries)
+        )
+
+        # 1. Outputs superseded by a later identical call
+        latest_by_key: dict[str, _Entry] = {}
+        for entry in tool_entries:
+            if entry.tool_key is not None:
+                latest_by_key[entry.tool_key] = entry
+        for entry in tool_entries:
+            if (
+                entry.compacted is None
+                and entry.tool_key is not None
+                and latest_by_key[entry.tool_key] is not entry
+            ):
+                self._compact(
+                    entry,
+                    f"[Superseded: {entry.tool_name} was called again later with the "
+                    "same arguments; see the newer result.]",
+                )
+                self.stats.deduplicated += 1
+
+        # 2. Stale outputs from turns before the most recent ones
+        stale_turn = self._turn - self.keep_recent_turns
+        for entry in tool_entries:
+            if entry.compacted is None and entry.turn <= stale_turn:
+                if entry.tokens > MIN_ELIDE_TOKENS:
+                    self._elide(entry)
+
+        # 3. Over budget: elide older outputs oldest first, keeping the latest turn
+        if self._request_tokens() > self.budget_tokens:
+            for entry in tool_entries:
+                if entry.turn >= self._turn:
+                    break
+                if entry.compacted is None and entry.tokens > MIN_ELIDE_TOKENS:
+                    self._elide(entry)
+                    if self._request_tokens() <= self.budget_tokens:
+                        break
+
+        # 4. Still over: truncate the latest outputs, largest first
+        excess = self._request_tokens() - self.budget_tokens
+        if excess > 0:
+            latest = sorted(
+                (e for e in tool_entries if e.turn >= self._turn and e.compacted is None),
+                key=lambda e: e.tokens,
+                reverse=True,
+            )
+            for entry in latest:
+                if excess <= 0:
+                    break
+                target = max(
+                    entry.tokens - math.ceil(excess / self._scale) - TRUNCATION_MARKER_TOKENS,
+                    MIN_ELIDE_TOKENS,
+                )
+                if target >= entry.tokens:
+                    continue
+                self._truncate(entry, target)
+                excess = self._request_tokens() - self.budget_tokens
+
+        self._last_raw_tokens = self._raw_request_tokens()
+        request_tokens = self._estimate(self._last_raw_tokens)
+        self.stats.last_request_tokens = request_tokens
+        self.stats.tokens_saved = max(full_tokens - request_tokens, 0)
+
+        if request_tokens > self.budget_tokens:
+            logger.warning(
+                "react_context_over_budget",
+                request_tokens=request_tokens,
+                budget_tokens=self.budget_tokens,
+            )
+
+        return [
+            entry.compacted if entry.compacted is not None else entry.message
+            for entry in self._entries
+        ]
@@ -9,6 +9,7 @@ Features:
 - Recovery strategies per error type
 - Retry with exponential backoff
 - Fallback to simpler model on timeout
+- Fail-fast errors from open circuit breakers (see circuit_breaker.py)
 - Graceful degradation options
 
 Usage:
@@ -27,6 +28,7 @@ import enum
 from dataclasses import dataclass, field
 from typing import Any
 
+from src.agents.infrastructure.circuit_breaker import CircuitOpenError
 from src.agents.state import WorkflowState
 from src.core.config import settings
 from src.core.logging import get_logger
@@ -45,6 +47,7 @@ class ErrorType(str, enum.Enum):
     CONTEXT_LENGTH = "context_length"
     CONNECTION_ERROR = "connection_error"
     AUTHENTICATION_ERROR = "authentication_error"
+    CIRCUIT_OPEN = "circuit_open"
     UNKNOWN = "unknown"
 
 
@@ -120,6 +123,10 @@ class ErrorClassifier:
         Returns:
             The classified ErrorType
         """
+        # Rejected by an open circuit breaker before reaching the backend
+        if isinstance(error, CircuitOpenError):
+            return ErrorType.CIRCUIT_OPEN
+
         error_str = str(error).lower()
         error_type_name = type(error).__name__.lower()
 
@@ -208,6 +215,13 @@ class ErrorHandler:
             "base_delay": 0.0,
             "can_fallback": True,
         },
+        # One immediate rerun: the backend is known to be down, but ModelPool
+        # now routes the node to a fallback tier whose circuit is closed
+        ErrorType.CIRCUIT_OPEN: {
+            "max_retries": 1,
+            "base_delay": 0.0,
+            "can_fallback": False,
+        },
         ErrorType.UNKNOWN: {
             "max_retries": 1,
             "base_delay": 1.0,
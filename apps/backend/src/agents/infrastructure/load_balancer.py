@@ -0,0 +1,356 @@
+"""Load balancing and request hedging across local vLLM replicas.
+
+LoadBalancingTransport is an httpx transport for the shared local LLM
+client (see ModelPool.http_clients). Models keep talking to
+``settings.local_llm_base_url``; the transport rewrites every request to
+one of the configured replicas:
+
+- Least outstanding requests: each request goes to the available replica
+  with the fewest requests in flight (a streamed response counts until
+  its body is closed)
+- Health checks: replicas are probed at ``/health`` periodically, and a
+  replica that refuses connections is taken out of rotation immediately;
+  the request fails over to another replica
+- Hedging (optional): if a request has not been answered after the p95
+  latency of recent requests, a duplicate is sent to a second replica and
+  the slower of the two is cancelled
+
+Usage:
+    transport = LoadBalancingTransport(
+        ["http://gpu-1:8001/v1", "http://gpu-2:8001/v1"], hedge=True
+    )
+    client = httpx.AsyncClient(transport=transport)
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Recent per-request latencies kept for the hedging delay
+LATENCY_WINDOW = 200
+
+# Timeout of a single health probe (seconds)
+HEALTH_CHECK_TIMEOUT = 2.0
+
+
+@dataclass
+class Endpoint:
+    """One OpenAI-compatible replica.
+
+    Attributes:
+        base_url: Base URL of the OpenAI-compatible API (e.g. http://host:8001/v1)
+        outstanding: Requests currently in flight
+        healthy: Result of the last health check or connection attempt
+        down_until: Monotonic time until which an unhealthy replica is skipped
+        requests: Requests sent to this replica
+        failures: Connection failures and failed health checks
+    """
+
+    base_url: httpx.URL
+    outstanding: int = 0
+    healthy: bool = True
+    down_until: float = 0.0
+    requests: int = 0
+    failures: int = 0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    @property
+    def health_url(self) -> httpx.URL:
+        """vLLM's health endpoint, served next to (not under) ``/v1``."""
+        path = self.base_url.path.rstrip("/")
+        if path.endswith("/v1"):
+            path = path[: -len("/v1")]
+        return self.base_url.copy_with(path=f"{path}/health", query=None)
+
+    def is_available(self, now: float) -> bool:
+        """Whether the replica is in rotation."""
+        return self.healthy or now >= self.down_until
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body that frees its replica's slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class LoadBalancingTransport(httpx.AsyncBaseTransport):
+    """httpx transport spreading requests over several replicas.
+
+    Requests must target the first endpoint's base URL; the path below it
+    is kept and sent to the chosen replica.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[str],
+        transport: httpx.AsyncBaseTransport | None = None,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_min_delay: float = 1.0,
+        hedge_min_samples: int = 20,
+        health_check_interval: float = 15.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            endpoints: Replica base URLs; the first one is the URL clients use
+            transport: Transport that performs the actual requests
+            hedge: Whether to send hedged duplicate requests
+            hedge_quantile: Latency quantile after which a request is hedged
+            hedge_min_delay: Lower bound of the hedging delay (seconds)
+            hedge_min_samples: Latencies required before hedging starts
+            health_check_interval: Seconds between health checks, and how long
+                an unreachable replica is skipped (0 disables health checks)
+            clock: Monotonic clock
+
+        Raises:
+            ValueError: If no endpoints are given
+        """
+        if not endpoints:
+            raise ValueError("LoadBalancingTransport needs at least one endpoint")
+        self.endpoints = [Endpoint(base_url=httpx.URL(url)) for url in endpoints]
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+        self.health_check_interval = health_check_interval
+        self._clock = clock
+        self._base_path = self.endpoints[0].base_url.path.rstrip("/")
+        self._rotation = 0
+        self._last_health_check = -math.inf
+        self._health_task: asyncio.Task[None] | None = None
+        self.hedged_requests = 0
+        self.hedges_won = 0
+
+    @property
+    def primary_url(self) -> str:
+        """The base URL clients should be configured with."""
+        return str(self.endpoints[0].base_url)
+
+    def _pick(self, exclude: Sequence[Endpoint] = ()) -> Endpoint | None:
+        """Choose the replica with the fewest requests in flight.
+
+        Ties are broken round-robin. Unhealthy replicas are only used if no
+        healthy one is left.
+        """
+        now = self._clock()
+        start = self._rotation % len(self.endpoints)
+        self._rotation += 1
+        rotated = self.endpoints[start:] + self.endpoints[:start]
+        candidates = [e for e in rotated if e not in exclude]
+        available = [e for e in candidates if e.is_available(now)] or candidates
+        if not available:
+            return None
+        return min(available, key=lambda e: e.outstanding)
+
+    def hedge_delay(self) -> float | None:
+        """Seconds to wait before hedging, or None while too few latencies are known."""
+        samples = sorted(latency for e in self.endpoints for latency in e.latencies)
+        if len(samples) < max(self.hedge_min_samples, 1):
+            return None
+        index = min(math.ceil(self.hedge_quantile * len(samples)) - 1, len(samples) - 1)
+        return max(samples[max(index, 0)], self.hedge_min_delay)
+
+    def _mark_down(self, endpoint: Endpoint, reason: str) -> None:
+        endpoint.failures += 1
+        if endpoint.healthy:
+            logger.warning("llm_replica_unhealthy", endpoint=str(endpoint.base_url), reason=reason)
+        endpoint.healthy = False
+        endpoint.down_until = self._clock() + self.health_check_interval
+
+    def _rewrite(self, request: httpx.Request, endpoint: Endpoint) -> httpx.Request:
+        """Copy a request onto another replica's base URL."""
+        path = request.url.path
+        if path.startswith(self._base_path):
+            path = path[len(self._base_path) :]
+        url = endpoint.base_url.copy_with(
+            path=endpoint.base_url.path.rstrip("/") + path,
+            query=request.url.query or None,
+        )
+        headers = request.headers.copy()
+        headers["host"] = url.netloc.decode("ascii")
+        return httpx.Request(
+            request.method,
+            url,
+            headers=headers,
+            content=request.content,
+            extensions=request.extensions,
+        )
+
+    async def _send(self, endpoint: Endpoint, request: httpx.Request) -> httpx.Response:
+        """Send a request to one replica, tracking it as outstanding."""
+        endpoint.outstanding += 1
+        endpoint.requests += 1
+        start = self._clock()
+
+        def release() -> None:
+            endpoint.outstanding -= 1
+
+        try:
+            response = await self._transport.handle_async_request(self._rewrite(request, endpoint))
+        except BaseException:
+            release()
+            raise
+
+        endpoint.latencies.append(self._clock() - start)
+        if not endpoint.healthy:
+            endpoint.healthy = True
+            logger.info("llm_replica_recovered", endpoint=str(endpoint.base_url))
+        stream = response.stream
+        assert isinstance(stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_TrackedStream(stream, release),
+            extensions=response.extensions,
+        )
+
+    async def _send_with_failover(
+        self, request: httpx.Request, tried: list[Endpoint]
+    ) -> httpx.Response:
+        """Send to the best replica, moving on while replicas refuse connections."""
+        while True:
+            endpoint = self._pick(exclude=tried)
+            if endpoint is None:
+                raise httpx.ConnectError("No LLM replica accepted the connection", request=request)
+            tried.append(endpoint)
+            try:
+                return await self._send(endpoint, request)
+            except httpx.ConnectError as e:
+                self._mark_down(endpoint, str(e))
+                if len(tried) == len(self.endpoints):
+                    raise
+
+    async def _send_hedged(self, request: httpx.Request, delay: float) -> httpx.Response:
+        """Send a request and a delayed duplicate; return whichever answers first."""
+        tried: list[Endpoint] = []
+        pending = {asyncio.create_task(self._send_with_failover(request, tried))}
+        hedge: asyncio.Task[httpx.Response] | None = None
+        waiting_to_hedge = True
+        errors: list[BaseException] = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=delay if waiting_to_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is hedge:
+                            self.hedges_won += 1
+                        return task.result()
+                    errors.append(error)
+
+                if waiting_to_hedge and not done:
+                    waiting_to_hedge = False
+                    if self._pick(exclude=tried) is not None:
+                        self.hedged_requests += 1
+                        logger.debug("llm_request_hedged", delay_seconds=round(delay, 3))
+                        hedge = asyncio.create_task(self._send_with_failover(request, list(tried)))
+                        pending.add(hedge)
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                # A loser that completed meanwhile still holds a replica slot
+                try:
+                    response = await task
+                except BaseException:
+                    continue
+                await response.aclose()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Route a request to a replica (hedging it if enabled)."""
+        self._maybe_check_health()
+        await request.aread()
+
+        delay = self.hedge_delay() if self.hedge and len(self.endpoints) > 1 else None
+        if delay is None:
+            return await self._send_with_failover(request, [])
+        return await self._send_hedged(request, delay)
+
+    def _maybe_check_health(self) -> None:
+        """Start a background health check when one is due."""
+        if self.health_check_interval <= 0:
+            return
+        now = self._clock()
+        if now - self._last_health_check < self.health_check_interval:
+            return
+        if self._health_task is not None and not self._health_task.done():
+            return
+        self._last_health_check = now
+        self._health_task = asyncio.create_task(self.check_health())
+
+    async def _probe(self, endpoint: Endpoint) -> None:
+        request = httpx.Request(
+            "GET",
+            endpoint.health_url,
+            extensions={"timeout": httpx.Timeout(HEALTH_CHECK_TIMEOUT).as_dict()},
+        )
+        try:
+            response = await self._transport.handle_async_request(request)
+            await response.aclose()
+        except httpx.HTTPError as e:
+            self._mark_down(endpoint, f"health check failed: {e}")
+            return
+        if response.status_code != 200:
+            self._mark_down(endpoint, f"health check returned {response.status_code}")
+        elif not endpoint.healthy:
+            endpoint.healthy = True
+            logger.info("llm_replica_recovered", endpoint=str(endpoint.base_url))
+
+    async def check_health(self) -> None:
+        """Probe every replica's health endpoint."""
+        await asyncio.gather(*(self._probe(endpoint) for endpoint in self.endpoints))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get routing statistics for monitoring."""
+        return {
+            "hedged_requests": self.hedged_requests,
+            "hedges_won": self.hedges_won,
+            "hedge_delay_seconds": self.hedge_delay(),
+            "endpoints": {
+                str(e.base_url): {
+                    "healthy": e.healthy,
+                    "outstanding": e.outstanding,
+                    "requests": e.requests,
+                    "failures": e.failures,
+                }
+                for e in self.endpoints
+            },
+        }
+
+    async def aclose(self) -> None:
+        """Stop health checks and close the underlying transport."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+        await self._transport.aclose()
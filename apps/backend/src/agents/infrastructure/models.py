@@ -14,21 +14,39 @@ Token usage tracking and cost estimation is implemented via:
 - src/services/metrics_service.py (metrics collection)
 - src/services/cost_calculator.py (cost estimation)
 
-Rate limiting is implemented via ModelRateLimiter to prevent API errors.
+Rate limiting is implemented via ModelRateLimiter, an admission controller
+attached to every model the factory creates, to prevent API errors.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
+import re
 import time
-from collections import defaultdict
+from collections import deque
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
-from threading import Lock
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from threading import Lock, RLock
 from typing import TYPE_CHECKING, Any, Literal
+from uuid import UUID
 
+import httpx
 from langchain_anthropic import ChatAnthropic
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
 from langchain_openai import ChatOpenAI
 
+from src.agents.analyzers.keyword_classifier import KeywordClassifier
+from src.agents.infrastructure.circuit_breaker import (
+    CircuitBreakerCallbackHandler,
+    get_circuit_breakers,
+)
+from src.agents.infrastructure.load_balancer import LoadBalancingTransport
+from src.agents.infrastructure.prompt_cache import PromptCachingChatAnthropic
 from src.core.config import settings
 from src.core.logging import get_logger
 
@@ -46,6 +64,17 @@ type ChatModel = ChatAnthropic | ChatOpenAI
 # Rate Limiting
 # =============================================================================
 
+# Sliding window length and resolution for RPM/TPM accounting
+RATE_LIMIT_WINDOW_SECONDS = 60.0
+RATE_LIMIT_WINDOW_BUCKETS = 60
+
+# Backoff applied after a 429 that carries no retry-after hint
+DEFAULT_RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+# Rough characters-per-token ratio and per-message overhead for estimates
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4
+
 
 @dataclass
 class RateLimitConfig:
@@ -62,35 +91,193 @@ class RateLimitConfig:
     min_request_interval_ms: int = 100  # 100ms minimum between requests
 
 
+class SlidingWindowCounter:
+    """Sliding-window sum backed by a ring of fixed-width time buckets.
+
+    Adding and reading the total are O(1): advancing the window only
+    clears the buckets that expired since the last call, bounded by the
+    number of buckets.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = RATE_LIMIT_WINDOW_SECONDS,
+        buckets: int = RATE_LIMIT_WINDOW_BUCKETS,
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            window_seconds: Length of the sliding window
+            buckets: Number of buckets the window is split into
+        """
+        self._width = window_seconds / buckets
+        self._counts = [0] * buckets
+        self._head = 0  # Absolute index of the current bucket
+        self._total = 0
+
+    def _advance(self, now: float) -> None:
+        current = int(now // self._width)
+        if current <= self._head:
+            return
+        size = len(self._counts)
+        for index in range(self._head + 1, self._head + 1 + min(current - self._head, size)):
+            slot = index % size
+            self._total -= self._counts[slot]
+            self._counts[slot] = 0
+        self._head = current
+
+    def add(self, now: float, amount: int) -> None:
+        """Add an amount at the given time (negative amounts correct earlier adds)."""
+        self._advance(now)
+        self._counts[self._head % len(self._counts)] += amount
+        self._total += amount
+
+    def total(self, now: float) -> int:
+        """Get the sum over the window ending at the given time."""
+        self._advance(now)
+        return max(0, self._total)
+
+    def time_until_freed(self, now: float, amount: int) -> float:
+        """Get the seconds until at least `amount` has left the window.
+
+        Args:
+            now: Current time
+            amount: Amount that must expire
+
+        Returns:
+            Seconds to wait (0.0 if nothing needs to expire)
+        """
+        self._advance(now)
+        if amount <= 0:
+            return 0.0
+        size = len(self._counts)
+        freed = 0
+        for index in range(self._head - size + 1, self._head + 1):
+            freed += self._counts[index % size]
+            if freed >= amount:
+                return max(0.0, (index + size) * self._width - now)
+        return max(0.0, (self._head + size) * self._width - now)
+
+
+@dataclass
+class _Waiter:
+    """A queued acquire() call."""
+
+    future: asyncio.Future[None]
+    tokens: int
+
+
 @dataclass
 class RateLimitState:
-    """Tracks rate limit state for a specific model/backend combination."""
+    """Tracks rate limit state for a specific model/backend combination.
 
-    request_timestamps: list[float] = field(default_factory=list)
-    token_counts: list[tuple[float, int]] = field(default_factory=list)
+    The effective limits start at the configured values, are cut when the
+    backend reports throttling and recover additively on success.
+    """
+
+    config: RateLimitConfig
+    requests: SlidingWindowCounter = field(default_factory=SlidingWindowCounter)
+    tokens: SlidingWindowCounter = field(default_factory=SlidingWindowCounter)
     last_request_time: float = 0.0
+    blocked_until: float = 0.0
+    max_rpm: float = 0.0
+    rpm_limit: float = 0.0
+    max_tpm: float | None = None
+    tpm_limit: float | None = None
+    waiters: deque[_Waiter] = field(default_factory=deque)
+    wake_handle: asyncio.TimerHandle | None = None
+
+    # Metrics
+    admitted_requests: int = 0
+    queued_requests: int = 0
+    rate_limited_responses: int = 0
+    total_queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.max_rpm = self.rpm_limit = float(self.config.requests_per_minute)
+        if self.config.tokens_per_minute:
+            self.max_tpm = self.tpm_limit = float(self.config.tokens_per_minute)
+
+
+def estimate_message_tokens(messages: Sequence[Any], tools: Any = None) -> int:
+    """Estimate the prompt tokens of a model request before sending it.
+
+    Args:
+        messages: LangChain messages or (role, content) tuples
+        tools: Optional tool schemas bound to the request
+
+    Returns:
+        Approximate token count
+    """
+    chars = 0
+    for message in messages:
+        content = getattr(message, "content", None)
+        if content is None and isinstance(message, tuple) and len(message) == 2:
+            content = message[1]
+        chars += len(content) if isinstance(content, str) else len(str(content or ""))
+        tool_calls = getattr(message, "tool_calls", None)
+        if tool_calls:
+            chars += len(str(tool_calls))
+    if tools:
+        chars += len(json.dumps(tools, default=str))
+    return chars // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS * len(messages)
+
+
+# Go-style durations used by OpenAI-compatible reset headers, e.g. "6m0s"
+_DURATION_PART_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_PATTERN = re.compile(r"(?:\d+(?:\.\d+)?(?:ms|h|m|s))+")
+
+
+def _parse_reset_seconds(value: str, now_wall: float) -> float | None:
+    """Parse a rate limit reset header into seconds from now.
+
+    Accepts plain seconds ("1.5"), Go-style durations ("6m0s", "20ms")
+    and RFC 3339 timestamps ("2025-01-01T00:00:00Z").
+    """
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    if _DURATION_PATTERN.fullmatch(value):
+        units = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+        return sum(float(n) * units[u] for n, u in _DURATION_PART_PATTERN.findall(value))
+
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return max(0.0, reset_at.timestamp() - now_wall)
 
 
 class ModelRateLimiter:
-    """Rate limiter for model API calls.
+    """Adaptive, token-aware admission controller for model API calls.
 
-    Implements a sliding window rate limiter that:
-    - Tracks requests per minute per model tier and backend
-    - Adds delays when approaching rate limits
-    - Provides async-friendly waiting
+    - Tracks requests and tokens per minute per model tier and backend
+      with O(1) sliding-window counters
+    - Admits callers in FIFO order; waiters are woken by a timer when the
+      window frees up instead of polling
+    - Cuts its effective limits when the backend throttles (429,
+      retry-after) and learns limits from rate limit response headers
+    - Records queue wait time per tier/backend
 
     Rate limits are configurable per backend:
     - Local vLLM: Higher limits (local resource only)
     - Claude API: Conservative limits matching Anthropic's rate limits
 
-    Usage:
+    Every model created by ModelFactory is wrapped by a
+    RateLimitCallbackHandler, so callers do not use this class directly.
+    Manual usage:
         limiter = ModelRateLimiter()
-        await limiter.acquire("sonnet", "cloud")  # Wait if needed
+        await limiter.acquire("sonnet", "cloud", tokens=1200)  # Wait if needed
         response = await model.ainvoke(...)
-        limiter.record_tokens("sonnet", "cloud", 1500)  # Track token usage
+        limiter.record_response("sonnet", "cloud", estimated_tokens=1200, actual_tokens=1500)
 
-    Thread Safety:
-        This class is thread-safe and can be used from multiple coroutines.
+    Concurrency:
+        State is only mutated from the event loop; acquire() must be
+        awaited from a coroutine.
     """
 
     # Default rate limit configs per backend
@@ -122,10 +309,23 @@ class ModelRateLimiter:
         },
     }
 
+    # Header names carrying limits, remaining capacity and reset times
+    _REQUEST_LIMIT_HEADERS = ("anthropic-ratelimit-requests-limit", "x-ratelimit-limit-requests")
+    _TOKEN_LIMIT_HEADERS = ("anthropic-ratelimit-tokens-limit", "x-ratelimit-limit-tokens")
+    _REQUEST_REMAINING_HEADERS = (
+        "anthropic-ratelimit-requests-remaining",
+        "x-ratelimit-remaining-requests",
+    )
+    _TOKEN_REMAINING_HEADERS = (
+        "anthropic-ratelimit-tokens-remaining",
+        "x-ratelimit-remaining-tokens",
+    )
+    _REQUEST_RESET_HEADERS = ("anthropic-ratelimit-requests-reset", "x-ratelimit-reset-requests")
+    _TOKEN_RESET_HEADERS = ("anthropic-ratelimit-tokens-reset", "x-ratelimit-reset-tokens")
+
     def __init__(self) -> None:
         """Initialize the rate limiter."""
-        self._states: dict[str, RateLimitState] = defaultdict(RateLimitState)
-        self._lock = Lock()
+        self._states: dict[str, RateLimitState] = {}
         self._configs = self.DEFAULT_CONFIGS.copy()
 
     def _get_key(self, tier: ModelTier, backend: str) -> str:
@@ -137,160 +337,464 @@ class ModelRateLimiter:
         backend_configs = self._configs.get(backend, self._configs["local"])
         return backend_configs.get(tier, RateLimitConfig())
 
-    def _cleanup_old_entries(self, state: RateLimitState, window_seconds: float = 60.0) -> None:
-        """Remove entries older than the sliding window."""
-        now = time.time()
-        cutoff = now - window_seconds
-
-        # Clean up request timestamps
-        state.request_timestamps = [ts for ts in state.request_timestamps if ts > cutoff]
-
-        # Clean up token counts
-        state.token_counts = [(ts, tokens) for ts, tokens in state.token_counts if ts > cutoff]
+    def _get_state(self, tier: ModelTier, backend: str) -> RateLimitState:
+        """Get (or create) the state for tier/backend."""
+        key = self._get_key(tier, backend)
+        state = self._states.get(key)
+        if state is None:
+            state = RateLimitState(config=self._get_config(tier, backend))
+            self._states[key] = state
+        return state
 
-    def _calculate_wait_time(
-        self,
-        state: RateLimitState,
-        config: RateLimitConfig,
-    ) -> float:
-        """Calculate how long to wait before the next request.
+    def _calculate_wait_time(self, state: RateLimitState, tokens: int, now: float) -> float:
+        """Calculate how long a request of `tokens` must wait to be admitted.
 
         Returns:
-            Wait time in seconds (0.0 if no wait needed)
+            Wait time in seconds (0.0 if the request can go now)
         """
-        now = time.time()
-
-        # Check minimum interval since last request
-        time_since_last = (now - state.last_request_time) * 1000  # Convert to ms
-        if time_since_last < config.min_request_interval_ms:
-            interval_wait = (config.min_request_interval_ms - time_since_last) / 1000
-        else:
-            interval_wait = 0.0
-
-        # Check requests per minute
-        self._cleanup_old_entries(state)
-        current_rpm = len(state.request_timestamps)
-
-        if current_rpm >= config.requests_per_minute:
-            # Find when the oldest request will fall outside the window
-            oldest_ts = min(state.request_timestamps)
-            rpm_wait = (oldest_ts + 60.0) - now + 0.1  # Add 100ms buffer
-        else:
-            rpm_wait = 0.0
+        interval = state.config.min_request_interval_ms / 1000
+        wait = max(state.blocked_until - now, state.last_request_time + interval - now)
+
+        excess_requests = state.requests.total(now) + 1 - int(state.rpm_limit)
+        if excess_requests > 0:
+            wait = max(wait, state.requests.time_until_freed(now, excess_requests))
+
+        if state.tpm_limit is not None and tokens > 0:
+            used = state.tokens.total(now)
+            # A request larger than the whole budget only waits for an empty window
+            excess_tokens = min(used + tokens - int(state.tpm_limit), used)
+            if excess_tokens > 0:
+                wait = max(wait, state.tokens.time_until_freed(now, excess_tokens))
+
+        return max(0.0, wait)
+
+    def _admit(self, state: RateLimitState, tokens: int, now: float) -> None:
+        """Record an admitted request against the windows."""
+        state.requests.add(now, 1)
+        if tokens:
+            state.tokens.add(now, tokens)
+        state.last_request_time = now
+        state.admitted_requests += 1
+
+    def _wake(self, state: RateLimitState) -> None:
+        """Admit queued waiters in FIFO order and re-arm the wake timer."""
+        if state.wake_handle is not None:
+            state.wake_handle.cancel()
+            state.wake_handle = None
+
+        while state.waiters:
+            head = state.waiters[0]
+            if head.future.done():  # Cancelled while queued
+                state.waiters.popleft()
+                continue
 
-        # Check tokens per minute if configured
-        tpm_wait = 0.0
-        if config.tokens_per_minute:
-            total_tokens = sum(tokens for _, tokens in state.token_counts)
-            if total_tokens >= config.tokens_per_minute:
-                oldest_ts = min(ts for ts, _ in state.token_counts)
-                tpm_wait = (oldest_ts + 60.0) - now + 0.1
+            now = time.monotonic()
+            wait = self._calculate_wait_time(state, head.tokens, now)
+            if wait > 0:
+                state.wake_handle = head.future.get_loop().call_later(wait, self._wake, state)
+                return
 
-        return max(interval_wait, rpm_wait, tpm_wait)
+            state.waiters.popleft()
+            self._admit(state, head.tokens, now)
+            head.future.set_result(None)
 
-    async def acquire(self, tier: ModelTier, backend: str = "local") -> None:
+    async def acquire(self, tier: ModelTier, backend: str = "local", tokens: int = 0) -> float:
         """Acquire permission to make a request, waiting if necessary.
 
-        This should be called before making a model API call. It will
-        block (asynchronously) if the rate limit would be exceeded.
+        This should be called before making a model API call. Requests
+        are admitted in arrival order; later callers never overtake a
+        queued one.
 
         Args:
             tier: The model tier being used
             backend: The backend ("local" or "cloud")
+            tokens: Estimated prompt tokens of the request
+
+        Returns:
+            Seconds spent waiting in the queue
         """
-        key = self._get_key(tier, backend)
-        config = self._get_config(tier, backend)
+        state = self._get_state(tier, backend)
+        start = time.monotonic()
+
+        if not state.waiters and self._calculate_wait_time(state, tokens, start) <= 0:
+            self._admit(state, tokens, start)
+            return 0.0
+
+        waiter = _Waiter(future=asyncio.get_running_loop().create_future(), tokens=tokens)
+        state.waiters.append(waiter)
+        state.queued_requests += 1
+        if len(state.waiters) == 1:
+            self._wake(state)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in state.waiters:
+                was_head = state.waiters[0] is waiter
+                state.waiters.remove(waiter)
+                if was_head:
+                    self._wake(state)
+            raise
+
+        waited = time.monotonic() - start
+        state.total_queue_wait += waited
+        state.max_queue_wait = max(state.max_queue_wait, waited)
 
-        while True:
-            with self._lock:
-                state = self._states[key]
-                wait_time = self._calculate_wait_time(state, config)
-
-                if wait_time <= 0:
-                    # Record the request
-                    now = time.time()
-                    state.request_timestamps.append(now)
-                    state.last_request_time = now
-                    return
-
-            # Wait outside the lock
-            if wait_time > 0:
-                logger.debug(
-                    "Rate limit delay",
-                    tier=tier,
-                    backend=backend,
-                    wait_seconds=round(wait_time, 2),
-                )
-                await asyncio.sleep(wait_time)
+        logger.debug(
+            "model_rate_limit_wait",
+            tier=tier,
+            backend=backend,
+            wait_ms=int(waited * 1000),
+            queue_depth=len(state.waiters),
+        )
+        return waited
 
     def record_tokens(self, tier: ModelTier, backend: str, tokens: int) -> None:
         """Record token usage for TPM tracking.
 
-        Call this after a successful request to track token consumption.
+        Negative values correct an earlier over-estimate.
 
         Args:
             tier: The model tier used
             backend: The backend ("local" or "cloud")
             tokens: Number of tokens used (input + output)
         """
-        key = self._get_key(tier, backend)
+        self._get_state(tier, backend).tokens.add(time.monotonic(), tokens)
 
-        with self._lock:
-            state = self._states[key]
-            state.token_counts.append((time.time(), tokens))
+    def record_response(
+        self,
+        tier: ModelTier,
+        backend: str,
+        estimated_tokens: int = 0,
+        actual_tokens: int | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record a successful response.
+
+        Replaces the admission-time token estimate with the actual usage,
+        recovers throttled limits additively and applies any rate limit
+        headers returned by the backend.
+
+        Args:
+            tier: The model tier used
+            backend: The backend ("local" or "cloud")
+            estimated_tokens: Tokens reserved by acquire()
+            actual_tokens: Tokens reported by the response, if known
+            headers: Response headers, if available
+        """
+        state = self._get_state(tier, backend)
+        if actual_tokens is not None and actual_tokens != estimated_tokens:
+            state.tokens.add(time.monotonic(), actual_tokens - estimated_tokens)
+
+        state.rpm_limit = min(state.max_rpm, state.rpm_limit + 1)
+        if state.tpm_limit is not None and state.max_tpm is not None:
+            step = state.max_tpm / max(state.max_rpm, 1.0)
+            state.tpm_limit = min(state.max_tpm, state.tpm_limit + step)
+
+        if headers:
+            self._apply_headers(state, headers)
+
+        # A lower-than-estimated usage may have freed budget for the queue
+        if state.waiters:
+            self._wake(state)
+
+    def record_rate_limited(
+        self,
+        tier: ModelTier,
+        backend: str,
+        retry_after: float | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record a throttled (429) response.
+
+        Blocks admissions until the retry-after deadline and halves the
+        effective limits.
+
+        Args:
+            tier: The model tier used
+            backend: The backend ("local" or "cloud")
+            retry_after: Seconds the backend asked us to wait, if given
+            headers: Response headers, if available
+        """
+        state = self._get_state(tier, backend)
+        delay = DEFAULT_RATE_LIMIT_BACKOFF_SECONDS if retry_after is None else retry_after
+        state.blocked_until = max(state.blocked_until, time.monotonic() + delay)
+        state.rpm_limit = max(1.0, state.rpm_limit / 2)
+        if state.tpm_limit is not None:
+            state.tpm_limit = max(1.0, state.tpm_limit / 2)
+        state.rate_limited_responses += 1
+
+        if headers:
+            self._apply_headers(state, headers)
+
+        logger.warning(
+            "model_rate_limited",
+            tier=tier,
+            backend=backend,
+            retry_after=delay,
+            effective_rpm=int(state.rpm_limit),
+        )
+
+        if state.waiters:
+            self._wake(state)
+
+    def _apply_headers(self, state: RateLimitState, headers: Mapping[str, str]) -> None:
+        """Adapt limits to rate limit headers reported by the backend."""
+        lowered = {k.lower(): v for k, v in headers.items()}
+
+        def first(names: tuple[str, ...]) -> str | None:
+            return next((lowered[n] for n in names if n in lowered), None)
+
+        def as_number(value: str | None) -> float | None:
+            try:
+                return float(value) if value is not None else None
+            except ValueError:
+                return None
+
+        request_limit = as_number(first(self._REQUEST_LIMIT_HEADERS))
+        if request_limit:
+            state.max_rpm = min(float(state.config.requests_per_minute), request_limit)
+            state.rpm_limit = min(state.rpm_limit, state.max_rpm)
+
+        token_limit = as_number(first(self._TOKEN_LIMIT_HEADERS))
+        if token_limit:
+            configured = state.config.tokens_per_minute
+            state.max_tpm = min(float(configured), token_limit) if configured else token_limit
+            state.tpm_limit = min(state.tpm_limit or state.max_tpm, state.max_tpm)
+
+        now_wall = time.time()
+        for remaining_names, reset_names in (
+            (self._REQUEST_REMAINING_HEADERS, self._REQUEST_RESET_HEADERS),
+            (self._TOKEN_REMAINING_HEADERS, self._TOKEN_RESET_HEADERS),
+        ):
+            remaining = as_number(first(remaining_names))
+            reset = first(reset_names)
+            if remaining is not None and remaining <= 0 and reset is not None:
+                seconds = _parse_reset_seconds(reset, now_wall)
+                if seconds is not None:
+                    state.blocked_until = max(state.blocked_until, time.monotonic() + seconds)
 
     def get_status(self, tier: ModelTier, backend: str) -> dict[str, int | float]:
         """Get current rate limit status for a tier/backend.
 
         Returns:
-            Dictionary with current usage and limits
+            Dictionary with current usage, effective limits and queue metrics
         """
-        key = self._get_key(tier, backend)
-        config = self._get_config(tier, backend)
+        state = self._get_state(tier, backend)
+        now = time.monotonic()
+        current_rpm = state.requests.total(now)
+        waited_requests = state.queued_requests - len(state.waiters)
 
-        with self._lock:
-            state = self._states[key]
-            self._cleanup_old_entries(state)
+        return {
+            "current_rpm": current_rpm,
+            "max_rpm": state.config.requests_per_minute,
+            "effective_rpm": int(state.rpm_limit),
+            "current_tpm": state.tokens.total(now),
+            "max_tpm": state.config.tokens_per_minute or 0,
+            "effective_tpm": int(state.tpm_limit or 0),
+            "available_requests": max(0, int(state.rpm_limit) - current_rpm),
+            "queue_depth": len(state.waiters),
+            "admitted_requests": state.admitted_requests,
+            "queued_requests": state.queued_requests,
+            "rate_limited_responses": state.rate_limited_responses,
+            "avg_queue_wait_ms": (
+                round(state.total_queue_wait / waited_requests * 1000, 1)
+                if waited_requests > 0
+                else 0.0
+            ),
+            "max_queue_wait_ms": round(state.max_queue_wait * 1000, 1),
+        }
 
-            current_rpm = len(state.request_timestamps)
-            current_tpm = sum(tokens for _, tokens in state.token_counts)
+    def get_all_status(self) -> dict[str, dict[str, int | float]]:
+        """Get status for every tier/backend that has seen traffic.
 
-            return {
-                "current_rpm": current_rpm,
-                "max_rpm": config.requests_per_minute,
-                "current_tpm": current_tpm,
-                "max_tpm": config.tokens_per_minute or 0,
-                "available_requests": max(0, config.requests_per_minute - current_rpm),
-            }
+        Returns:
+            Mapping of "backend:tier" keys to get_status() dictionaries
+        """
+        result: dict[str, dict[str, int | float]] = {}
+        for key in list(self._states):
+            backend, tier = key.split(":")
+            result[key] = self.get_status(tier, backend)  # type: ignore[arg-type]
+        return result
 
     def reset(self, tier: ModelTier | None = None, backend: str | None = None) -> None:
         """Reset rate limit state.
 
+        Queued waiters of reset entries are released immediately.
+
         Args:
             tier: Specific tier to reset (None for all)
             backend: Specific backend to reset (None for all)
         """
-        with self._lock:
-            if tier is None and backend is None:
-                self._states.clear()
-            elif tier and backend:
-                key = self._get_key(tier, backend)
-                self._states.pop(key, None)
-            else:
-                # Reset matching entries
-                keys_to_remove = []
-                for key in self._states:
-                    key_backend, key_tier = key.split(":")
-                    if (backend is None or key_backend == backend) and (
-                        tier is None or key_tier == tier
-                    ):
-                        keys_to_remove.append(key)
-                for key in keys_to_remove:
-                    del self._states[key]
+        keys_to_remove = []
+        for key in self._states:
+            key_backend, key_tier = key.split(":")
+            if (backend is None or key_backend == backend) and (tier is None or key_tier == tier):
+                keys_to_remove.append(key)
+
+        for key in keys_to_remove:
+            state = self._states.pop(key)
+            if state.wake_handle is not None:
+                state.wake_handle.cancel()
+            for waiter in state.waiters:
+                if not waiter.future.done() and not waiter.future.get_loop().is_closed():
+                    waiter.future.set_result(None)
 
         logger.debug("Rate limiter reset", tier=tier, backend=backend)
 
 
+def _response_token_usage(response: LLMResult) -> int | None:
+    """Extract total token usage from a model result."""
+    for generations in response.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            usage = getattr(message, "usage_metadata", None)
+            if usage:
+                return int(usage.get("total_tokens", 0)) or None
+
+    llm_output = response.llm_output or {}
+    usage = llm_output.get("token_usage") or llm_output.get("usage") or {}
+    if isinstance(usage, dict):
+        total = usage.get("total_tokens")
+        if total is None and ("input_tokens" in usage or "output_tokens" in usage):
+            total = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+        if total:
+            return int(total)
+    return None
+
+
+def _response_headers(response: LLMResult) -> Mapping[str, str] | None:
+    """Extract HTTP headers from a model result, if the provider included them."""
+    for generations in response.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            metadata: Mapping[str, Any] = getattr(message, "response_metadata", None) or {}
+            headers: Mapping[str, str] | None = metadata.get("headers")
+            if headers:
+                return headers
+    return None
+
+
+def _error_headers(error: BaseException) -> Mapping[str, str] | None:
+    """Get HTTP response headers from an SDK error, if any."""
+    return getattr(getattr(error, "response", None), "headers", None)
+
+
+def _retry_after_seconds(headers: Mapping[str, str] | None) -> float | None:
+    """Parse retry-after hints from error headers."""
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class RateLimitCallbackHandler(AsyncCallbackHandler):
+    """Callback that puts a model behind the global ModelRateLimiter.
+
+    Attached to every model created by ModelFactory, so all calls
+    (ainvoke, astream, tool-bound and structured-output runnables) are
+    admitted by the limiter before the request is sent. Completion
+    reconciles the token estimate and errors feed throttling back into
+    the limiter.
+
+    With a circuit breaker handler, the breaker is consulted before the
+    call is admitted, so a call to a backend whose circuit is open uses
+    none of the limiter's budget, and the breaker's events are forwarded.
+    """
+
+    def __init__(
+        self,
+        tier: ModelTier,
+        backend: str,
+        circuit_breaker: CircuitBreakerCallbackHandler | None = None,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            tier: Model tier of the wrapped model
+            backend: Backend of the wrapped model ("local" or "cloud")
+            circuit_breaker: Breaker handler run before admission
+        """
+        self.tier = tier
+        self.backend = backend
+        self.circuit_breaker = circuit_breaker
+        self._estimates: dict[UUID, int] = {}
+        if circuit_breaker is not None:
+            self.raise_error = circuit_breaker.raise_error
+            self.run_inline = circuit_breaker.run_inline
+
+    async def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Wait for admission before the request is sent."""
+        if self.circuit_breaker is not None:
+            await self.circuit_breaker.on_chat_model_start(
+                serialized, messages, run_id=run_id, **kwargs
+            )
+
+        invocation_params = kwargs.get("invocation_params") or {}
+        estimated = sum(
+            estimate_message_tokens(batch, invocation_params.get("tools")) for batch in messages
+        )
+        self._estimates[run_id] = estimated
+        try:
+            await get_rate_limiter().acquire(self.tier, self.backend, estimated)
+        except BaseException:
+            # The call is aborted (e.g. cancelled while queued); no end event follows
+            self._estimates.pop(run_id, None)
+            raise
+
+    async def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Reconcile the token estimate with actual usage."""
+        if self.circuit_breaker is not None:
+            await self.circuit_breaker.on_llm_end(response, run_id=run_id, **kwargs)
+
+        get_rate_limiter().record_response(
+            self.tier,
+            self.backend,
+            estimated_tokens=self._estimates.pop(run_id, 0),
+            actual_tokens=_response_token_usage(response),
+            headers=_response_headers(response),
+        )
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Feed throttling responses back into the limiter."""
+        from src.agents.infrastructure.error_handler import ErrorClassifier, ErrorType
+
+        if self.circuit_breaker is not None:
+            await self.circuit_breaker.on_llm_error(error, run_id=run_id, **kwargs)
+
+        self._estimates.pop(run_id, None)
+        status_code = getattr(error, "status_code", None)
+        if status_code == 429 or ErrorClassifier.classify(error) == ErrorType.RATE_LIMIT:
+            headers = _error_headers(error)
+            get_rate_limiter().record_rate_limited(
+                self.tier,
+                self.backend,
+                retry_after=_retry_after_seconds(headers),
+                headers=headers,
+            )
+
+
 # Global rate limiter instance
 _rate_limiter: ModelRateLimiter | None = None
 _rate_limiter_lock = Lock()
@@ -377,6 +881,29 @@ class ModelFactory:
     - Fallback can be disabled via create(..., allow_fallback=False)
     """
 
+    @staticmethod
+    def _admission_callbacks(tier: ModelTier, backend: str) -> list[AsyncCallbackHandler]:
+        """Get the admission-control callbacks for a new model.
+
+        The rate limiter consults the circuit breaker first, so calls to a
+        failing backend are rejected before they take a rate limiter slot.
+
+        Args:
+            tier: Model tier
+            backend: Backend ("local" or "cloud")
+
+        Returns:
+            Callback list to attach to the model (empty if disabled)
+        """
+        breaker = (
+            CircuitBreakerCallbackHandler(tier, backend)
+            if settings.enable_circuit_breaker
+            else None
+        )
+        if settings.enable_model_rate_limiting:
+            return [RateLimitCallbackHandler(tier, backend, breaker)]
+        return [breaker] if breaker is not None else []
+
     @classmethod
     def _create_local_model(
         cls,
@@ -407,6 +934,8 @@ class ModelFactory:
             max_tokens=config["max_tokens"],
         )
 
+        http_client, http_async_client = get_model_pool().http_clients("local")
+
         return ChatOpenAI(
             model=settings.local_llm_model,
             base_url=settings.local_llm_base_url,
@@ -414,6 +943,10 @@ class ModelFactory:
             temperature=float(config["temperature"]),
             max_tokens=int(config["max_tokens"]),
             timeout=float(config["timeout"]),
+            stream_usage=True,  # Report token usage on streamed responses too
+            callbacks=cls._admission_callbacks(tier, "local"),
+            http_client=http_client,
+            http_async_client=http_async_client,
         )
 
     @classmethod
@@ -454,13 +987,19 @@ class ModelFactory:
             max_tokens=config["max_tokens"],
         )
 
-        return ChatAnthropic(
+        # Mark stable prompt prefixes (tools, system prompt, history) for caching
+        model_class = (
+            PromptCachingChatAnthropic if settings.enable_prompt_caching else ChatAnthropic
+        )
+
+        return model_class(
             model=model_name,
             api_key=settings.anthropic_api_key,
             temperature=float(config["temperature"]),
             max_tokens=int(config["max_tokens"]),
             timeout=float(config["timeout"]),
             max_retries=2,
+            callbacks=cls._admission_callbacks(tier, "cloud"),
         )
 
     @classmethod
@@ -639,6 +1178,201 @@ class ModelFactory:
         return cls.create(tier)
 
 
+# =============================================================================
+# Model Pool
+# =============================================================================
+
+
+class ModelPool:
+    """Long-lived model instances and tool-bound runnables.
+
+    Building a chat model creates a new SDK client, and binding tools
+    re-serializes every tool schema. The pool does both once:
+
+    - One shared keep-alive HTTP connection pool per backend, so TCP/TLS
+      handshakes are paid once per process instead of once per node
+    - One model per (backend, tier, temperature, max_tokens)
+    - One tool-bound runnable per (agent_type, tier, tool-set version);
+      the version changes whenever tools are (re)registered
+    - Tiers whose circuit breaker is open are replaced by the next
+      fallback tier (see circuit_breaker.py)
+    - With local_llm_replica_urls set, the local async client spreads
+      requests over all vLLM replicas (see load_balancer.py)
+
+    Usage:
+        pool = get_model_pool()
+        model = pool.get_model("sonnet")
+        coder = pool.get_model_with_tools(AgentType.CODER, "sonnet")
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._models: dict[tuple[bool, ModelTier, float | None, int | None], ChatModel] = {}
+        self._bound: dict[tuple[str, ModelTier, int], Any] = {}
+        self._http_clients: dict[str, tuple[httpx.Client, httpx.AsyncClient]] = {}
+        # Reentrant: creating a model fetches the backend's HTTP clients
+        self._lock = RLock()
+
+    def http_clients(self, backend: str) -> tuple[httpx.Client, httpx.AsyncClient]:
+        """Get the shared (sync, async) HTTP clients for a backend.
+
+        Args:
+            backend: Backend name ("local" or "cloud")
+
+        Returns:
+            Tuple of httpx clients with a tuned keep-alive pool
+        """
+        clients = self._http_clients.get(backend)
+        if clients is None:
+            with self._lock:
+                clients = self._http_clients.get(backend)
+                if clients is None:
+                    limits = httpx.Limits(
+                        max_connections=settings.llm_http_max_connections,
+                        max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+                        keepalive_expiry=settings.llm_http_keepalive_expiry,
+                    )
+                    async_client = (
+                        httpx.AsyncClient(transport=self._local_transport(limits))
+                        if backend == "local" and settings.local_llm_replica_urls
+                        else httpx.AsyncClient(limits=limits)
+                    )
+                    clients = (httpx.Client(limits=limits), async_client)
+                    self._http_clients[backend] = clients
+        return clients
+
+    @staticmethod
+    def _local_transport(limits: httpx.Limits) -> LoadBalancingTransport:
+        """Transport balancing async local requests over the vLLM replicas.
+
+        Only the async client is balanced; the sync client (unused by the
+        workflow nodes) keeps talking to local_llm_base_url.
+        """
+        return LoadBalancingTransport(
+            [settings.local_llm_base_url, *settings.local_llm_replica_urls],
+            transport=httpx.AsyncHTTPTransport(limits=limits),
+            hedge=settings.local_llm_hedging,
+            hedge_min_delay=settings.local_llm_hedge_min_delay,
+            health_check_interval=settings.local_llm_health_check_interval,
+        )
+
+    @staticmethod
+    def _route(tier: ModelTier) -> ModelTier:
+        """Replace a tier whose circuit is open with its fallback tier."""
+        if not settings.enable_circuit_breaker:
+            return tier
+        backend = "local" if settings.use_local_llm else "cloud"
+        return get_circuit_breakers().route(backend, tier)  # type: ignore[return-value]
+
+    def get_model(
+        self,
+        tier: ModelTier = "sonnet",
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> ChatModel:
+        """Get a shared model instance, creating it on first use.
+
+        Args:
+            tier: Model tier
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+
+        Returns:
+            Shared chat model (of a fallback tier if the tier's circuit is open)
+        """
+        tier = self._route(tier)
+        key = (settings.use_local_llm, tier, temperature, max_tokens)
+        model = self._models.get(key)
+        if model is None:
+            with self._lock:
+                model = self._models.get(key)
+                if model is None:
+                    model = ModelFactory.create(tier, temperature, max_tokens)
+                    self._models[key] = model
+                    logger.info("model_pool_model_created", tier=tier, use_local=key[0])
+        return model
+
+    def get_model_with_tools(self, agent_type: AgentType, tier: ModelTier = "sonnet") -> Any:
+        """Get a shared tool-bound runnable for an agent type.
+
+        Args:
+            agent_type: The type of agent (determines which tools are bound)
+            tier: Model tier
+
+        Returns:
+            Chat model with the agent's tools bound (of a fallback tier if
+            the tier's circuit is open)
+        """
+        from src.tools import bind_tools_to_model, get_registry, register_all_tools
+
+        tier = self._route(tier)
+        registry = get_registry()
+        key = (agent_type.value, tier, registry.version)
+        bound = self._bound.get(key)
+        if bound is not None:
+            return bound
+
+        # Ensure tools are registered (a no-op unless the registry was cleared)
+        register_all_tools()
+        key = (agent_type.value, tier, registry.version)
+        bound = self._bound.get(key)
+        if bound is None:
+            bound = bind_tools_to_model(self.get_model(tier), agent_type)
+            with self._lock:
+                # Drop runnables bound to an older tool set
+                self._bound = {k: v for k, v in self._bound.items() if k[2] == registry.version}
+                self._bound[key] = bound
+        return bound
+
+    def clear(self) -> None:
+        """Drop cached models and bound runnables (HTTP pools are kept)."""
+        with self._lock:
+            self._models.clear()
+            self._bound.clear()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients and drop all cached models."""
+        self.clear()
+        with self._lock:
+            clients = list(self._http_clients.values())
+            self._http_clients.clear()
+        for sync_client, async_client in clients:
+            sync_client.close()
+            await async_client.aclose()
+        logger.info("model_pool_closed", backends=len(clients))
+
+
+# Global model pool instance
+_model_pool: ModelPool | None = None
+_model_pool_lock = Lock()
+
+
+def get_model_pool() -> ModelPool:
+    """Get the global model pool instance (singleton).
+
+    Returns:
+        The global ModelPool instance
+    """
+    global _model_pool
+
+    if _model_pool is None:
+        with _model_pool_lock:
+            if _model_pool is None:
+                _model_pool = ModelPool()
+
+    return _model_pool
+
+
+async def close_model_pool() -> None:
+    """Close the global model pool's HTTP clients (call on shutdown)."""
+    global _model_pool
+
+    with _model_pool_lock:
+        pool, _model_pool = _model_pool, None
+    if pool is not None:
+        await pool.aclose()
+
+
 # Convenience functions for agent nodes
 
 
@@ -650,7 +1384,7 @@ def get_planner_model() -> ChatModel:
     Returns:
         Chat model for planning
     """
-    return ModelFactory.create("sonnet")
+    return get_model_pool().get_model("sonnet")
 
 
 def get_coder_model() -> ChatModel:
@@ -661,7 +1395,7 @@ def get_coder_model() -> ChatModel:
     Returns:
         Chat model for coding
     """
-    return ModelFactory.create("sonnet")
+    return get_model_pool().get_model("sonnet")
 
 
 def get_tester_model() -> ChatModel:
@@ -672,7 +1406,7 @@ def get_tester_model() -> ChatModel:
     Returns:
         Chat model for testing
     """
-    return ModelFactory.create("sonnet")
+    return get_model_pool().get_model("sonnet")
 
 
 def get_reviewer_model() -> ChatModel:
@@ -684,7 +1418,7 @@ def get_reviewer_model() -> ChatModel:
     Returns:
         Chat model for review
     """
-    return ModelFactory.create("sonnet")
+    return get_model_pool().get_model("sonnet")
 
 
 # =============================================================================
@@ -750,6 +1484,10 @@ class TaskComplexityAnalyzer:
         "trivial",
     ]
 
+    CLASSIFIER = KeywordClassifier(
+        {"high": HIGH_COMPLEXITY_KEYWORDS, "low": LOW_COMPLEXITY_KEYWORDS}
+    )
+
     @classmethod
     def analyze(cls, task_description: str) -> Literal["low", "medium", "high"]:
         """Analyze task description and return complexity level.
@@ -760,11 +1498,11 @@ class TaskComplexityAnalyzer:
         Returns:
             Complexity level: "low", "medium", or "high"
         """
-        desc_lower = task_description.lower()
+        features = cls.CLASSIFIER.classify(task_description)
 
         # Count keyword matches
-        high_matches = sum(1 for keyword in cls.HIGH_COMPLEXITY_KEYWORDS if keyword in desc_lower)
-        low_matches = sum(1 for keyword in cls.LOW_COMPLEXITY_KEYWORDS if keyword in desc_lower)
+        high_matches = features.count("high")
+        low_matches = features.count("low")
 
         # Determine complexity based on matches
         if high_matches >= 2:
@@ -818,7 +1556,7 @@ def get_council_judge_model(
         backend="local" if settings.use_local_llm else "cloud",
     )
 
-    return ModelFactory.create(model_tier)
+    return get_model_pool().get_model(model_tier)
 
 
 def get_council_models() -> dict[str, ChatModel]:
@@ -835,16 +1573,16 @@ def get_council_models() -> dict[str, ChatModel]:
     if settings.use_local_llm:
         # Local mode: same model, different prompts
         return {
-            "security_judge": ModelFactory.create("sonnet"),
-            "performance_judge": ModelFactory.create("sonnet"),
-            "maintainability_judge": ModelFactory.create("sonnet"),
+            "security_judge": get_model_pool().get_model("sonnet"),
+            "performance_judge": get_model_pool().get_model("sonnet"),
+            "maintainability_judge": get_model_pool().get_model("sonnet"),
         }
     else:
         # Cloud mode: different model tiers
         return {
-            "security_judge": ModelFactory.create("haiku"),  # Quick security scan
-            "performance_judge": ModelFactory.create("opus"),  # Deep performance analysis
-            "maintainability_judge": ModelFactory.create("sonnet"),  # Balanced review
+            "security_judge": get_model_pool().get_model("haiku"),  # Quick security scan
+            "performance_judge": get_model_pool().get_model("opus"),  # Deep performance analysis
+            "maintainability_judge": get_model_pool().get_model("sonnet"),  # Balanced review
         }
 
 
@@ -954,7 +1692,7 @@ class QualityBasedTierSelector:
         else:
             logger.debug("No quality info provided, using default sonnet tier")
 
-        return ModelFactory.create(tier)
+        return get_model_pool().get_model(tier)
 
 
 def get_reviewer_model_for_code(code: str) -> ChatModel:
@@ -996,6 +1734,7 @@ def get_model_with_tools(agent_type: AgentType, tier: ModelTier = "sonnet") -> A
 
     This is the generic function for creating tool-bound models.
     Use the specific getters (get_coder_model_with_tools, etc.) for convenience.
+    The bound runnable is shared via the ModelPool, so repeated calls are cheap.
 
     Args:
         agent_type: The type of agent (determines which tools are bound)
@@ -1009,16 +1748,7 @@ def get_model_with_tools(agent_type: AgentType, tier: ModelTier = "sonnet") -> A
         model = get_model_with_tools(AgentType.CODER, "sonnet")
         response = await model.ainvoke(messages)
     """
-    from src.tools import bind_tools_to_model, register_all_tools
-
-    # Ensure tools are registered
-    register_all_tools()
-
-    # Get base model
-    model = ModelFactory.create(tier)
-
-    # Bind tools for the agent type
-    return bind_tools_to_model(model, agent_type)
+    return get_model_pool().get_model_with_tools(agent_type, tier)
 
 
 def get_coder_model_with_tools() -> Any:
@@ -0,0 +1,153 @@
+"""Prompt prefix caching for repeated system prompts and conversation history.
+
+Agent nodes resend the same prefix on every call: the tool definitions, the
+node's system prompt and, inside a ReAct loop, the whole history so far.
+Council judges additionally share one review context per submission. Both
+backends can reuse that prefix instead of re-processing it:
+
+- Anthropic caches up to the last ``cache_control`` breakpoint in a request.
+  PromptCachingChatAnthropic marks the tool list, the system prompt and the
+  tail of the conversation, so each ReAct iteration reads the previous
+  iteration's prefix from cache.
+- vLLM automatic prefix caching needs no markers, only byte-identical
+  prefixes. Tools are bound in name order and shared context goes first in
+  the prompt so identical prefixes actually occur.
+
+Cache read and creation tokens are reported in ``usage_metadata`` and
+extracted with extract_cache_usage for metrics and cost accounting.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import LanguageModelInput
+
+# Anthropic rejects requests with more than four cache breakpoints
+MAX_CACHE_BREAKPOINTS = 4
+
+# Ephemeral (5 minute) cache entries, refreshed on every hit
+EPHEMERAL_CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
+
+# Content block types that cannot carry a cache breakpoint
+_UNCACHEABLE_BLOCK_TYPES = frozenset({"thinking", "redacted_thinking"})
+
+
+def _count_breakpoints(value: Any) -> int:
+    """Count cache_control markers already present in a payload fragment."""
+    if isinstance(value, Mapping):
+        own = 1 if value.get("cache_control") else 0
+        return own + sum(_count_breakpoints(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(_count_breakpoints(v) for v in value)
+    return 0
+
+
+def _mark_last_block(content: Any, cache_control: dict[str, str]) -> Any:
+    """Mark the last cacheable block of message or system content.
+
+    Returns:
+        The content with a breakpoint added, or None if it cannot carry one
+    """
+    if isinstance(content, str):
+        if not content:
+            return None
+        return [{"type": "text", "text": content, "cache_control": dict(cache_control)}]
+
+    if isinstance(content, list) and content:
+        last = content[-1]
+        if not isinstance(last, dict) or last.get("type") in _UNCACHEABLE_BLOCK_TYPES:
+            return None
+        if last.get("cache_control"):
+            return content
+        return [*content[:-1], {**last, "cache_control": dict(cache_control)}]
+
+    return None
+
+
+def apply_cache_breakpoints(
+    payload: dict[str, Any],
+    cache_control: dict[str, str] = EPHEMERAL_CACHE_CONTROL,
+) -> int:
+    """Add cache breakpoints to an Anthropic Messages API payload.
+
+    Breakpoints are placed, in prefix order, on the last tool definition,
+    the last system block and the last message. The message breakpoint is
+    only set for multi-turn or tool-using requests, where the next call is
+    expected to extend the same conversation. Breakpoints already present
+    count toward the limit and are never moved.
+
+    Args:
+        payload: Request payload (mutated in place)
+        cache_control: Cache control marker to apply
+
+    Returns:
+        Number of breakpoints added
+    """
+    budget = MAX_CACHE_BREAKPOINTS - _count_breakpoints(
+        [payload.get("tools"), payload.get("system"), payload.get("messages")]
+    )
+    added = 0
+
+    tools = payload.get("tools")
+    if budget > added and tools and isinstance(tools[-1], dict):
+        if not tools[-1].get("cache_control"):
+            tools[-1] = {**tools[-1], "cache_control": dict(cache_control)}
+            added += 1
+
+    system = payload.get("system")
+    if budget > added and system:
+        marked = _mark_last_block(system, cache_control)
+        if marked is not None and marked is not system:
+            payload["system"] = marked
+            added += 1
+
+    messages = payload.get("messages") or []
+    if budget > added and messages and (tools or len(messages) > 1):
+        last = messages[-1]
+        marked = _mark_last_block(last.get("content"), cache_control)
+        if marked is not None and marked is not last.get("content"):
+            messages[-1] = {**last, "content": marked}
+            added += 1
+
+    return added
+
+
+class PromptCachingChatAnthropic(ChatAnthropic):
+    """ChatAnthropic that marks stable prompt prefixes for caching.
+
+    Every request gets breakpoints from apply_cache_breakpoints, so callers
+    do not need to build content blocks themselves.
+    """
+
+    def _get_request_payload(
+        self,
+        input_: LanguageModelInput,
+        *,
+        stop: list[str] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        payload = super()._get_request_payload(input_, stop=stop, **kwargs)
+        apply_cache_breakpoints(payload)
+        return payload
+
+
+def extract_cache_usage(usage_metadata: Mapping[str, Any] | None) -> dict[str, int]:
+    """Extract prompt cache token counts from LangChain usage metadata.
+
+    Both Anthropic and OpenAI-compatible backends report cached tokens
+    under ``input_token_details``; they are included in ``input_tokens``.
+
+    Args:
+        usage_metadata: ``usage_metadata`` of an AIMessage (may be None)
+
+    Returns:
+        Dict with cache_read_tokens and cache_creation_tokens
+    """
+    details = (usage_metadata or {}).get("input_token_details") or {}
+    return {
+        "cache_read_tokens": int(details.get("cache_read") or 0),
+        "cache_creation_tokens": int(details.get("cache_creation") or 0),
+    }
@@ -0,0 +1,127 @@
+"""Intra-node checkpoints for resuming ReAct loops on retry.
+
+When a resilient node retries after a transient error, the node function
+runs again from the start. Without checkpoints its ReAct loop would redo
+every LLM turn and tool call that already succeeded. execute_react_loop
+saves a checkpoint after each completed iteration into the store of the
+current retry scope, and a retried loop with the same agent type and
+initial messages resumes from the last one.
+
+Checkpoints live in memory for the duration of one resilient node
+invocation; create_resilient_node opens the scope. Outside a scope no
+checkpoints are kept.
+
+Usage:
+    with react_checkpoint_scope() as store:
+        while True:
+            store.begin_attempt()
+            try:
+                return await node_fn(state, config)
+            except TransientError:
+                continue
+"""
+
+import hashlib
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.messages import BaseMessage
+
+# (message, tool name, tool args) as recorded by ContextWindowManager
+type HistoryEntry = tuple[BaseMessage, str | None, Any]
+
+
+@dataclass
+class ReactCheckpoint:
+    """Snapshot of a ReAct loop after a completed iteration.
+
+    Attributes:
+        history: Messages with the tool call that produced each tool result
+        tool_call_records: Tool call records so far
+        usage: Accumulated usage counters
+        iterations: Number of completed iterations
+        completed: Whether the loop finished (the model stopped calling tools)
+    """
+
+    history: list[HistoryEntry]
+    tool_call_records: list[dict[str, Any]]
+    usage: dict[str, int]
+    iterations: int
+    completed: bool = False
+
+
+@dataclass
+class ReactCheckpointStore:
+    """Checkpoints of the ReAct loops run by one node invocation.
+
+    Loops are keyed by agent type, a digest of their initial messages and
+    their position among identical loops in the current attempt, so a node
+    that runs several loops resumes each one separately.
+    """
+
+    _checkpoints: dict[str, ReactCheckpoint] = field(default_factory=dict)
+    _occurrences: dict[str, int] = field(default_factory=dict)
+
+    def begin_attempt(self) -> None:
+        """Start a new attempt of the node; loop positions restart at zero."""
+        self._occurrences.clear()
+
+    def next_key(self, agent_type: str, messages: Sequence[BaseMessage]) -> str:
+        """Reserve the checkpoint key for a loop starting in this attempt.
+
+        Args:
+            agent_type: Agent type running the loop
+            messages: The loop's initial messages
+
+        Returns:
+            Key that is identical for the same loop on every attempt
+        """
+        digest = hashlib.sha256()
+        for message in messages:
+            digest.update(message.type.encode())
+            digest.update(b"\0")
+            digest.update(str(message.content).encode())
+            digest.update(b"\0")
+        base = f"{agent_type}:{digest.hexdigest()}"
+        occurrence = self._occurrences.get(base, 0)
+        self._occurrences[base] = occurrence + 1
+        return f"{base}:{occurrence}"
+
+    def get(self, key: str) -> ReactCheckpoint | None:
+        """Get the latest checkpoint for a loop."""
+        return self._checkpoints.get(key)
+
+    def save(self, key: str, checkpoint: ReactCheckpoint) -> None:
+        """Replace the checkpoint for a loop."""
+        self._checkpoints[key] = checkpoint
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+
+_current_store: ContextVar[ReactCheckpointStore | None] = ContextVar(
+    "react_checkpoint_store", default=None
+)
+
+
+def get_checkpoint_store() -> ReactCheckpointStore | None:
+    """Get the checkpoint store of the current retry scope, if any."""
+    return _current_store.get()
+
+
+@contextmanager
+def react_checkpoint_scope() -> Iterator[ReactCheckpointStore]:
+    """Open a checkpoint scope for one node invocation.
+
+    Yields:
+        The store that ReAct loops inside the scope save to
+    """
+    store = ReactCheckpointStore()
+    token = _current_store.set(store)
+    try:
+        yield store
+    finally:
+        _current_store.reset(token)
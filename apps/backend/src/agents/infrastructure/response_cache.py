@@ -0,0 +1,415 @@
+"""Content-addressed cache for deterministic LLM responses.
+
+Some model calls are fully determined by their input: plan refinement,
+and council judges reviewing identical code at temperature 0. Repeating
+them (e.g. after a node retry) costs a full LLM call for the same answer.
+LLMResponseCache stores responses under a hash of everything that shapes
+the reply: model class and name, sampling parameters, bound tool schemas
+and the messages.
+
+Lookups go through the configured tiers in order and back-fill faster
+tiers on a hit:
+
+- LRUResponseStore: in-process, bounded
+- RedisResponseStore: shared by all workers (llm_response_cache_redis)
+- DirectoryResponseStore: one JSON file per response (llm_response_cache_dir)
+
+Caching is opt-in per call site. Requests with a non-zero (or unknown)
+temperature bypass the cache unless the caller allows it. Served responses
+carry ``response_metadata["response_cache"]`` ("hit" or "miss") and a hit
+reports zero token usage; extract_response_cache_usage turns this into
+usage counters.
+
+Usage:
+    cache = get_response_cache()
+    response = await cache.ainvoke(model, messages, config)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Protocol
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    convert_to_messages,
+    message_to_dict,
+    messages_from_dict,
+    messages_to_dict,
+)
+from langchain_core.runnables import RunnableConfig
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = get_logger(__name__)
+
+# Redis key prefix for cached responses
+RESPONSE_CACHE_PREFIX = "codegraph:llm_response:"
+
+# Bump when the key or entry format changes, so old entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+# Model attributes that affect the response
+_MODEL_PARAMS = ("model_name", "model", "temperature", "max_tokens", "top_p", "top_k", "stop")
+
+
+class ResponseStore(Protocol):
+    """A cache tier mapping keys to serialized responses."""
+
+    async def get(self, key: str) -> str | None:
+        """Get a serialized response, or None if missing."""
+        ...
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a serialized response."""
+        ...
+
+
+class LRUResponseStore:
+    """In-process store evicting the least recently used responses."""
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """Initialize the store.
+
+        Args:
+            max_entries: Maximum number of responses kept
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> str | None:
+        """Get a response and mark it as recently used."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the oldest if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class RedisResponseStore:
+    """Store shared by all workers through Redis."""
+
+    def __init__(self, redis: Redis, ttl: int | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            redis: Async Redis client
+            ttl: Entry TTL in seconds (defaults to settings.cache_ttl_seconds)
+        """
+        self.redis = redis
+        self.ttl = ttl or settings.cache_ttl_seconds
+
+    async def get(self, key: str) -> str | None:
+        """Get a response from Redis."""
+        value = await self.redis.get(f"{RESPONSE_CACHE_PREFIX}{key}")
+        if value is None:
+            return None
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response in Redis with the configured TTL."""
+        await self.redis.set(f"{RESPONSE_CACHE_PREFIX}{key}", value, ex=self.ttl)
+
+
+class DirectoryResponseStore:
+    """Store keeping one JSON file per response."""
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the response files (created on write)
+        """
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    async def get(self, key: str) -> str | None:
+        """Read a response file."""
+        path = self._path(key)
+        try:
+            return await asyncio.to_thread(path.read_text)
+        except FileNotFoundError:
+            return None
+
+    async def set(self, key: str, value: str) -> None:
+        """Write a response file."""
+        path = self._path(key)
+
+        def write() -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(value)
+
+        await asyncio.to_thread(write)
+
+
+def _describe_model(model: Any) -> tuple[dict[str, Any], float | None]:
+    """Get the response-shaping parameters of a (possibly tool-bound) model.
+
+    Returns:
+        Tuple of (parameters, temperature); temperature is None if unknown
+    """
+    bound_kwargs: dict[str, Any] = {}
+    # Unwrap bind_tools()/bind() wrappers, collecting their kwargs (tool schemas)
+    while hasattr(model, "bound") and isinstance(getattr(model, "kwargs", None), Mapping):
+        bound_kwargs = {**model.kwargs, **bound_kwargs}
+        model = model.bound
+
+    params: dict[str, Any] = {"class": type(model).__name__}
+    for name in _MODEL_PARAMS:
+        value = getattr(model, name, None)
+        if value is not None:
+            params[name] = value
+    params.update(bound_kwargs)
+
+    temperature = params.get("temperature")
+    return params, float(temperature) if isinstance(temperature, int | float) else None
+
+
+def _serialize(message: BaseMessage) -> str:
+    return json.dumps(message_to_dict(message))
+
+
+def _deserialize(value: str) -> BaseMessage:
+    return messages_from_dict([json.loads(value)])[0]
+
+
+def extract_response_cache_usage(response: Any) -> dict[str, int]:
+    """Get response cache counters for a model response.
+
+    Args:
+        response: Response returned by LLMResponseCache.ainvoke
+
+    Returns:
+        Dict with response_cache_hits and response_cache_misses (both 0 if the
+        call bypassed the cache)
+    """
+    status = (getattr(response, "response_metadata", None) or {}).get("response_cache")
+    return {
+        "response_cache_hits": int(status == "hit"),
+        "response_cache_misses": int(status == "miss"),
+    }
+
+
+class LLMResponseCache:
+    """Tiered, content-addressed cache of LLM responses."""
+
+    def __init__(
+        self,
+        stores: Sequence[ResponseStore] | None = None,
+        enabled: bool | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            stores: Tiers to consult, fastest first (default: an in-process LRU)
+            enabled: Whether caching is on (default: settings.enable_llm_response_cache)
+        """
+        self.stores: list[ResponseStore] = (
+            list(stores)
+            if stores is not None
+            else [LRUResponseStore(settings.llm_response_cache_max_entries)]
+        )
+        self.enabled = settings.enable_llm_response_cache if enabled is None else enabled
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def key_for(
+        self,
+        model: Any,
+        messages: LanguageModelInput,
+        allow_nondeterministic: bool = False,
+    ) -> str | None:
+        """Compute the cache key of a request.
+
+        Args:
+            model: Chat model or tool-bound runnable
+            messages: Messages as accepted by the model
+            allow_nondeterministic: Cache even if temperature is not zero
+
+        Returns:
+            Hex key, or None if the request must not be cached
+        """
+        if not self.enabled:
+            return None
+
+        params, temperature = _describe_model(model)
+        if temperature != 0.0 and not allow_nondeterministic:
+            self.bypassed += 1
+            return None
+
+        payload = {
+            "version": CACHE_FORMAT_VERSION,
+            "model": params,
+            "messages": messages_to_dict(convert_to_messages(messages)),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    async def lookup(self, key: str) -> BaseMessage | None:
+        """Get a cached response, back-filling faster tiers.
+
+        Store errors are logged and treated as misses.
+
+        Returns:
+            The cached response marked as a hit, or None
+        """
+        for index, store in enumerate(self.stores):
+            try:
+                value = await store.get(key)
+            except Exception as e:
+                logger.debug(
+                    "LLM response cache read failed", store=type(store).__name__, error=str(e)
+                )
+                continue
+            if value is None:
+                continue
+
+            for faster in self.stores[:index]:
+                try:
+                    await faster.set(key, value)
+                except Exception as e:
+                    logger.debug(
+                        "LLM response cache write failed", store=type(faster).__name__, error=str(e)
+                    )
+
+            self.hits += 1
+            cached = _deserialize(value)
+            logger.debug("LLM response cache hit", key=key[:16], store=type(store).__name__)
+            update: dict[str, Any] = {
+                "response_metadata": {**cached.response_metadata, "response_cache": "hit"}
+            }
+            if isinstance(cached, AIMessage):
+                # Nothing was spent on this response
+                update["usage_metadata"] = {
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "total_tokens": 0,
+                }
+            return cached.model_copy(update=update)
+
+        self.misses += 1
+        return None
+
+    async def store(self, key: str, response: BaseMessage) -> None:
+        """Store a response in every tier (errors are logged and ignored)."""
+        value = _serialize(response)
+        for store in self.stores:
+            try:
+                await store.set(key, value)
+            except Exception as e:
+                logger.debug(
+                    "LLM response cache write failed", store=type(store).__name__, error=str(e)
+                )
+
+    async def ainvoke(
+        self,
+        model: Any,
+        messages: LanguageModelInput,
+        config: RunnableConfig | None = None,
+        allow_nondeterministic: bool = False,
+    ) -> BaseMessage:
+        """Invoke a model, serving identical deterministic requests from cache.
+
+        Args:
+            model: Chat model or tool-bound runnable
+            messages: Messages as accepted by the model
+            config: Optional RunnableConfig for tracing
+            allow_nondeterministic: Cache even if temperature is not zero
+
+        Returns:
+            The model's (or the cached) response
+        """
+        key = self.key_for(model, messages, allow_nondeterministic)
+        if key is None:
+            response: BaseMessage = await model.ainvoke(messages, config)
+            return response
+
+        cached = await self.lookup(key)
+        if cached is not None:
+            return cached
+
+        response = await model.ainvoke(messages, config)
+        await self.store(key, response)
+        return response.model_copy(
+            update={"response_metadata": {**response.response_metadata, "response_cache": "miss"}}
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": [type(store).__name__ for store in self.stores],
+        }
+
+
+# Global cache instance
+_response_cache: LLMResponseCache | None = None
+_response_cache_lock = Lock()
+
+
+def _default_stores() -> list[ResponseStore]:
+    """Build the tiers configured in settings."""
+    stores: list[ResponseStore] = [LRUResponseStore(settings.llm_response_cache_max_entries)]
+    if settings.llm_response_cache_redis:
+        from redis.asyncio import Redis
+
+        stores.append(RedisResponseStore(Redis.from_url(str(settings.redis_url))))
+    if settings.llm_response_cache_dir:
+        stores.append(DirectoryResponseStore(settings.llm_response_cache_dir))
+    return stores
+
+
+def get_response_cache() -> LLMResponseCache:
+    """Get the global LLM response cache (singleton).
+
+    Returns:
+        The global LLMResponseCache instance
+    """
+    global _response_cache
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = LLMResponseCache(_default_stores())
+
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Drop the global cache (and its in-process entries).
+
+    Useful for testing.
+    """
+    global _response_cache
+
+    with _response_cache_lock:
+        _response_cache = None
@@ -17,6 +17,7 @@ from langchain_core.messages import AIMessageChunk, BaseMessage
 from langchain_core.runnables import RunnableConfig
 
 from src.agents.infrastructure.models import ChatModel
+from src.agents.infrastructure.prompt_cache import extract_cache_usage
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -30,6 +31,8 @@ class StreamingMetrics:
         input_tokens: Number of input tokens (if available)
         output_tokens: Number of output tokens (if available)
         total_tokens: Total tokens used
+        cache_read_tokens: Input tokens served from the prompt cache
+        cache_creation_tokens: Input tokens written to the prompt cache
         latency_ms: Total latency in milliseconds
         chunk_count: Number of chunks streamed
     """
@@ -37,6 +40,8 @@ class StreamingMetrics:
     input_tokens: int = 0
     output_tokens: int = 0
     total_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
     latency_ms: int = 0
     chunk_count: int = 0
 
@@ -122,6 +127,9 @@ async def stream_with_metrics(
         response.metrics.total_tokens = usage_metadata.get(
             "total_tokens", response.metrics.input_tokens + response.metrics.output_tokens
         )
+        cache_usage = extract_cache_usage(usage_metadata)
+        response.metrics.cache_read_tokens = cache_usage["cache_read_tokens"]
+        response.metrics.cache_creation_tokens = cache_usage["cache_creation_tokens"]
 
         # Also check response_metadata for some providers
         response_metadata = getattr(last_chunk, "response_metadata", None) or {}
@@ -187,6 +195,8 @@ def format_usage_dict(metrics: StreamingMetrics) -> dict[str, Any]:
         "input_tokens": metrics.input_tokens,
         "output_tokens": metrics.output_tokens,
         "total_tokens": metrics.total_tokens,
+        "cache_read_tokens": metrics.cache_read_tokens,
+        "cache_creation_tokens": metrics.cache_creation_tokens,
         "latency_ms": metrics.latency_ms,
         "chunk_count": metrics.chunk_count,
         "streaming": True,
@@ -2,9 +2,10 @@
 
 This module provides a callback handler that tracks agent node executions
 by persisting AgentRun records to the database. It integrates with
-LangGraph's callback system to capture node start/end events.
+LangGraph's callback system to capture node start/end events, matching
+each end or error to its start by LangChain run ID.
 
-It also records token usage metrics via MetricsService for analytics
+It also records token usage metrics (UsageMetrics rows) for analytics
 and dashboard display.
 
 Features:
@@ -18,14 +19,17 @@ Usage:
     result = await graph.ainvoke(state, config)
 """
 
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 from langchain_core.callbacks import AsyncCallbackHandler
+from sqlalchemy import Update, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agents.infrastructure.artifacts import persistent_ref
 from src.core.logging import get_logger
-from src.models.agent_run import AgentRun, AgentType
+from src.models.agent_run import AgentRun, AgentRunStatus, AgentType
 from src.models.council_review import (
     ConsensusType,
     CouncilReview,
@@ -34,8 +38,7 @@ from src.models.council_review import (
     ReviewVerdict,
 )
 from src.models.task import Task, TaskStatus
-from src.services.agent_run_service import AgentRunService
-from src.services.metrics_service import MetricsService
+from src.models.usage_metrics import UsageMetrics
 
 logger = get_logger(__name__)
 
@@ -56,6 +59,21 @@ NODE_TO_TASK_STATUS: dict[str, TaskStatus] = {
 }
 
 
+@dataclass(frozen=True)
+class ActiveRun:
+    """A node execution being tracked.
+
+    Attributes:
+        node_name: Name of the graph node
+        agent_run_id: ID of the node's AgentRun record
+        started_at: When the node started
+    """
+
+    node_name: str
+    agent_run_id: int
+    started_at: datetime
+
+
 class AgentRunTracker(AsyncCallbackHandler):
     """Callback handler that tracks agent node executions.
 
@@ -67,11 +85,17 @@ class AgentRunTracker(AsyncCallbackHandler):
     - Errors and timeouts
     - Task status updates (real-time)
 
+    Each node transition is written in one transaction with no reads: the
+    start inserts the run as running (RETURNING its ID) together with the
+    task status update, and the end updates the run by ID together with
+    its usage metrics row. On PostgreSQL the two statements are sent as
+    one, the first as a data-modifying CTE of the second.
+
     Attributes:
         db: Database session for persistence
         task_id: ID of the task being executed
         iteration: Current iteration of the review loop
-        active_runs: Map of node names to active AgentRun IDs
+        active_runs: Map of LangChain run IDs to the node runs they track
         update_task_status: Whether to update task status as nodes execute
     """
 
@@ -98,46 +122,56 @@ class AgentRunTracker(AsyncCallbackHandler):
         self.iteration = iteration
         self.model_used = model_used
         self.update_task_status = update_task_status
-        self.service = AgentRunService(db)
-        self.metrics_service = MetricsService(db)
-        self.active_runs: dict[str, int] = {}  # node_name -> run_id
+        self.active_runs: dict[Any, ActiveRun] = {}
+        dialect = getattr(db.bind, "dialect", None)
+        self._combine_statements = getattr(dialect, "name", None) == "postgresql"
 
-    async def _update_task_status(self, node_name: str) -> None:
-        """Update task status based on current node.
+    def _task_status_update(self, node_name: str) -> Update | None:
+        """Build the task status update for a starting node.
 
         Args:
-            node_name: Name of the currently executing node
+            node_name: Name of the node that is starting
+
+        Returns:
+            The update, or None if the status is not tracked for this node
         """
         if not self.update_task_status:
-            return
+            return None
 
         new_status = NODE_TO_TASK_STATUS.get(node_name)
         if not new_status:
-            return
+            return None
 
-        try:
-            from sqlalchemy import select
+        return (
+            update(Task)
+            .where(Task.id == self.task_id, Task.status != new_status)
+            .values(status=new_status)
+        )
 
-            result = await self.db.execute(select(Task).where(Task.id == self.task_id))
-            task = result.scalar_one_or_none()
+    async def _execute_after(self, statement: Any, preceding: Update | None, name: str) -> Any:
+        """Execute a statement, preceded by another in the same round trip if possible.
 
-            if task and task.status != new_status:
-                task.status = new_status
-                await self.db.commit()
-                logger.debug(
-                    "task_status_updated_by_tracker",
-                    task_id=self.task_id,
-                    node=node_name,
-                    status=new_status.value,
-                )
+        Args:
+            statement: Statement whose result is returned
+            preceding: Statement to run first, if any
+            name: CTE name for the preceding statement
+
+        Returns:
+            The statement's result
+        """
+        if preceding is not None:
+            if self._combine_statements:
+                statement = statement.add_cte(preceding.cte(name))
+            else:
+                await self.db.execute(preceding)
+        return await self.db.execute(statement)
+
+    async def _rollback(self) -> None:
+        """Roll back a failed tracking transaction."""
+        try:
+            await self.db.rollback()
         except Exception as e:
-            # Log but don't fail the workflow for status update errors
-            logger.warning(
-                "failed_to_update_task_status",
-                task_id=self.task_id,
-                node=node_name,
-                error=str(e),
-            )
+            logger.warning("Failed to roll back tracking transaction", error=str(e))
 
     async def on_chain_start(
         self,
@@ -152,7 +186,7 @@ class AgentRunTracker(AsyncCallbackHandler):
     ) -> None:
         """Called when a chain (node) starts execution.
 
-        Creates an AgentRun record and marks it as running.
+        Creates a running AgentRun record and updates the task status.
 
         Args:
             serialized: Serialized chain info
@@ -163,17 +197,12 @@ class AgentRunTracker(AsyncCallbackHandler):
             metadata: Additional metadata
         """
         # Extract node name from serialized data
-        node_name = serialized.get("name", "")
+        node_name = (serialized or {}).get("name", "")
 
         # Only track our agent nodes
         if node_name not in NODE_TO_AGENT_TYPE:
             return
 
-        agent_type = NODE_TO_AGENT_TYPE[node_name]
-
-        # Update task status to reflect current node
-        await self._update_task_status(node_name)
-
         # Prepare input data (avoid storing large content)
         input_summary = {
             "task_id": inputs.get("task_id"),
@@ -183,32 +212,44 @@ class AgentRunTracker(AsyncCallbackHandler):
             "has_tests": bool(inputs.get("test_results")),
             "iteration": inputs.get("iterations", 0),
         }
+        started_at = datetime.now(UTC)
 
         try:
-            # Create and start the run
-            run = await self.service.create_run(
-                task_id=self.task_id,
-                agent_type=agent_type,
-                iteration=self.iteration,
-                model_used=self.model_used,
-                input_data=input_summary,
+            create_run = (
+                insert(AgentRun)
+                .values(
+                    task_id=self.task_id,
+                    agent_type=NODE_TO_AGENT_TYPE[node_name],
+                    status=AgentRunStatus.RUNNING,
+                    iteration=self.iteration,
+                    model_used=self.model_used,
+                    input_data=input_summary,
+                    started_at=started_at,
+                )
+                .returning(AgentRun.id)
             )
-            await self.service.start_run(run.id)
-            self.active_runs[node_name] = run.id
-
-            logger.info(
-                "Tracking node start",
-                node=node_name,
-                run_id=run.id,
-                task_id=self.task_id,
+            result = await self._execute_after(
+                create_run, self._task_status_update(node_name), "task_status"
             )
+            agent_run_id = result.scalar_one()
+            await self.db.commit()
         except Exception as e:
+            await self._rollback()
             logger.error(
                 "Failed to track node start",
                 node=node_name,
                 task_id=self.task_id,
                 error=str(e),
             )
+            return
+
+        self.active_runs[run_id] = ActiveRun(node_name, agent_run_id, started_at)
+        logger.info(
+            "Tracking node start",
+            node=node_name,
+            run_id=agent_run_id,
+            task_id=self.task_id,
+        )
 
     async def on_chain_end(
         self,
@@ -230,86 +271,83 @@ class AgentRunTracker(AsyncCallbackHandler):
             parent_run_id: Parent run ID (if nested)
             tags: Tags for the run
         """
-        # We need to find which node completed
-        # Check if any of our tracked nodes match
-        for node_name, agent_run_id in list(self.active_runs.items()):
-            try:
-                # Prepare output summary
-                output_summary = self._extract_output_summary(node_name, outputs)
-
-                # Extract verdict for reviewer
-                verdict = None
-                if node_name == "reviewer":
-                    feedback = outputs.get("review_feedback", "")
-                    if "APPROVE" in feedback.upper():
-                        verdict = "APPROVE"
-                    elif "REJECT" in feedback.upper():
-                        verdict = "REJECT"
-                    elif "REVISE" in feedback.upper():
-                        verdict = "REVISE"
-
-                # Extract usage metrics from metadata
-                metadata = outputs.get("metadata", {})
-                usage_key = f"{node_name}_usage"
-                usage_data = metadata.get(usage_key, {})
-
-                # Calculate tokens used for AgentRun
-                tokens_used = usage_data.get("total_tokens", 0)
-
-                await self.service.complete_run(
-                    run_id=agent_run_id,
+        active = self.active_runs.pop(run_id, None)
+        if active is None:
+            return  # Not a tracked node (e.g. a chain nested inside one)
+
+        node_name, agent_run_id = active.node_name, active.agent_run_id
+        try:
+            # Prepare output summary
+            output_summary = self._extract_output_summary(node_name, outputs)
+
+            # Extract verdict for reviewer
+            verdict = None
+            if node_name == "reviewer":
+                feedback = outputs.get("review_feedback", "").upper()
+                for candidate in ("APPROVE", "REJECT", "REVISE"):
+                    if candidate in feedback:
+                        verdict = candidate
+                        break
+
+            # Extract usage metrics from metadata
+            metadata = outputs.get("metadata") or {}
+            usage_data = metadata.get(f"{node_name}_usage") or {}
+
+            # Calculate tokens used for AgentRun
+            tokens_used = usage_data.get("total_tokens", 0)
+            completed_at = datetime.now(UTC)
+
+            complete_run = (
+                update(AgentRun)
+                .where(AgentRun.id == agent_run_id)
+                .values(
+                    status=AgentRunStatus.COMPLETED,
+                    completed_at=completed_at,
                     output_data=output_summary,
                     tokens_used=tokens_used if tokens_used > 0 else None,
                     verdict=verdict,
                     run_metadata={"node_name": node_name},
                 )
+            )
 
-                # Record usage metrics if available
-                if usage_data and node_name in NODE_TO_AGENT_TYPE:
-                    try:
-                        await self.metrics_service.record_usage(
-                            task_id=self.task_id,
-                            agent_type=NODE_TO_AGENT_TYPE[node_name],
-                            input_tokens=usage_data.get("input_tokens", 0),
-                            output_tokens=usage_data.get("output_tokens", 0),
-                            model_used=self.model_used or "unknown",
-                            latency_ms=usage_data.get("latency_ms", 0),
-                            agent_run_id=agent_run_id,
-                        )
-                        logger.debug(
-                            "Recorded usage metrics",
-                            node=node_name,
-                            task_id=self.task_id,
-                            tokens=usage_data.get("total_tokens", 0),
-                        )
-                    except Exception as metrics_error:
-                        logger.warning(
-                            "Failed to record usage metrics",
-                            node=node_name,
-                            error=str(metrics_error),
-                        )
-
-                # Remove from active runs
-                del self.active_runs[node_name]
-
-                logger.info(
-                    "Tracking node end",
-                    node=node_name,
-                    run_id=agent_run_id,
-                    verdict=verdict,
-                    tokens_used=tokens_used,
+            if usage_data:
+                input_tokens = usage_data.get("input_tokens", 0)
+                output_tokens = usage_data.get("output_tokens", 0)
+                record_usage = insert(UsageMetrics).values(
+                    task_id=self.task_id,
+                    agent_run_id=agent_run_id,
+                    agent_type=NODE_TO_AGENT_TYPE[node_name],
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    total_tokens=input_tokens + output_tokens,
+                    cache_read_tokens=usage_data.get("cache_read_tokens", 0),
+                    cache_creation_tokens=usage_data.get("cache_creation_tokens", 0),
+                    model_used=self.model_used or "unknown",
+                    latency_ms=usage_data.get("latency_ms", 0),
+                    recorded_at=completed_at,
                 )
+                await self._execute_after(record_usage, complete_run, "completed_run")
+            else:
+                await self.db.execute(complete_run)
+            await self.db.commit()
 
-                # Only process one node per callback
-                break
+            logger.info(
+                "Tracking node end",
+                node=node_name,
+                run_id=agent_run_id,
+                verdict=verdict,
+                tokens_used=tokens_used,
+                duration_seconds=(completed_at - active.started_at).total_seconds(),
+            )
 
-            except Exception as e:
-                logger.error(
-                    "Failed to track node end",
-                    node=node_name,
-                    run_id=agent_run_id,
-                    error=str(e),
-                )
+        except Exception as e:
+            await self._rollback()
+            logger.error(
+                "Failed to track node end",
+                node=node_name,
+                run_id=agent_run_id,
+                error=str(e),
+            )
 
     async def on_chain_error(
         self,
@@ -330,29 +368,40 @@ class AgentRunTracker(AsyncCallbackHandler):
             parent_run_id: Parent run ID (if nested)
             tags: Tags for the run
         """
-        # Mark all active runs as failed
-        for node_name, agent_run_id in list(self.active_runs.items()):
-            try:
-                await self.service.fail_run(
-                    run_id=agent_run_id,
+        active = self.active_runs.pop(run_id, None)
+        if active is None:
+            return
+
+        try:
+            await self.db.execute(
+                update(AgentRun)
+                .where(AgentRun.id == active.agent_run_id)
+                .values(
+                    status=AgentRunStatus.FAILED,
+                    completed_at=datetime.now(UTC),
                     error_message=str(error)[:1000],
-                    run_metadata={"node_name": node_name, "error_type": type(error).__name__},
+                    run_metadata={
+                        "node_name": active.node_name,
+                        "error_type": type(error).__name__,
+                    },
                 )
-                del self.active_runs[node_name]
+            )
+            await self.db.commit()
 
-                logger.error(
-                    "Tracking node error",
-                    node=node_name,
-                    run_id=agent_run_id,
-                    error=str(error)[:200],
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to track node error",
-                    node=node_name,
-                    run_id=agent_run_id,
-                    tracking_error=str(e),
-                )
+            logger.error(
+                "Tracking node error",
+                node=active.node_name,
+                run_id=active.agent_run_id,
+                error=str(error)[:200],
+            )
+        except Exception as e:
+            await self._rollback()
+            logger.error(
+                "Failed to track node error",
+                node=active.node_name,
+                run_id=active.agent_run_id,
+                tracking_error=str(e),
+            )
 
     def _extract_output_summary(
         self,
@@ -361,7 +410,9 @@ class AgentRunTracker(AsyncCallbackHandler):
     ) -> dict[str, Any]:
         """Extract a summary of the output data.
 
-        Avoids storing large content while preserving useful metadata.
+        Avoids storing large content while preserving useful metadata; the
+        full plan, code and tests are referenced by artifact reference when
+        artifacts are persisted.
 
         Args:
             node_name: Name of the node
@@ -376,16 +427,19 @@ class AgentRunTracker(AsyncCallbackHandler):
             plan = outputs.get("plan", "")
             summary["plan_length"] = len(plan)
             summary["plan_preview"] = plan[:500] if plan else None
+            summary["plan_ref"] = persistent_ref(plan) if plan else None
 
         elif node_name == "coder":
             code = outputs.get("code", "")
             summary["code_length"] = len(code)
             summary["code_preview"] = code[:500] if code else None
+            summary["code_ref"] = persistent_ref(code) if code else None
 
         elif node_name == "tester":
             tests = outputs.get("test_results", "")
             summary["tests_length"] = len(tests)
             summary["tests_preview"] = tests[:500] if tests else None
+            summary["tests_ref"] = persistent_ref(tests) if tests else None
 
         elif node_name == "reviewer":
             feedback = outputs.get("review_feedback", "")
@@ -400,25 +454,40 @@ class AgentRunTracker(AsyncCallbackHandler):
     async def cleanup(self) -> None:
         """Clean up any active runs that didn't complete normally.
 
-        Called when workflow is cancelled or times out.
+        Called when workflow is cancelled or times out. All remaining runs
+        are marked as timed out in one statement.
         """
-        for node_name, agent_run_id in list(self.active_runs.items()):
-            try:
-                await self.service.timeout_run(agent_run_id)
-                logger.warning(
-                    "Cleaned up incomplete run",
-                    node=node_name,
-                    run_id=agent_run_id,
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to cleanup run",
-                    node=node_name,
-                    run_id=agent_run_id,
-                    error=str(e),
-                )
+        if not self.active_runs:
+            return
 
+        active_runs = list(self.active_runs.values())
         self.active_runs.clear()
+        try:
+            await self.db.execute(
+                update(AgentRun)
+                .where(AgentRun.id.in_([active.agent_run_id for active in active_runs]))
+                .values(
+                    status=AgentRunStatus.TIMEOUT,
+                    completed_at=datetime.now(UTC),
+                    error_message="Agent execution timed out",
+                )
+            )
+            await self.db.commit()
+        except Exception as e:
+            await self._rollback()
+            logger.error(
+                "Failed to cleanup runs",
+                run_ids=[active.agent_run_id for active in active_runs],
+                error=str(e),
+            )
+            return
+
+        for active in active_runs:
+            logger.warning(
+                "Cleaned up incomplete run",
+                node=active.node_name,
+                run_id=active.agent_run_id,
+            )
 
     async def track_council_review(
         self,
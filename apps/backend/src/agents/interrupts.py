@@ -283,7 +283,10 @@ async def resume_workflow(
     )
 
     # Continue execution with None to resume from interrupt
-    result: WorkflowState = await graph.ainvoke(None, config)
+    from src.agents.resilience import workflow_error_scope
+
+    with workflow_error_scope():
+        result: WorkflowState = await graph.ainvoke(None, config)
 
     return result
 
@@ -18,6 +18,7 @@ from typing import Any
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 
+from src.agents.infrastructure.artifacts import snapshot_code_files
 from src.agents.infrastructure.models import get_coder_model, get_coder_model_with_tools
 from src.agents.infrastructure.streaming import StreamingMetrics, stream_with_metrics
 from src.agents.nodes.react_executor import (
@@ -26,11 +27,11 @@ from src.agents.nodes.react_executor import (
     extract_final_response,
 )
 from src.agents.processing.formatter import (
-    create_multi_file_result,
+    acreate_multi_file_result,
     format_python_code,
     infer_filepath,
 )
-from src.agents.processing.parser import parse_code_blocks
+from src.agents.processing.parser import CodeBlockStreamParser, parse_code_blocks
 from src.agents.state import WorkflowState
 from src.core.logging import get_logger
 from src.tools.registry import AgentType
@@ -184,7 +185,7 @@ Please address all the feedback above in your revised code."""
         code_blocks_tuples.append((filepath, block.content, block.language.value))
 
     # Create multi-file result with formatting and validation
-    multi_file_result = create_multi_file_result(code_blocks_tuples, format_code=True)
+    multi_file_result = await acreate_multi_file_result(code_blocks_tuples, format_code=True)
 
     # Use primary file content, or fall back to final response
     if multi_file_result.primary_file:
@@ -250,9 +251,16 @@ Please address all the feedback above in your revised code."""
     existing_tool_calls = list(state.get("tool_calls", []))
     existing_tool_calls.extend(tool_call_records)
 
+    # Store file contents once; state keeps references and per-iteration diffs
+    code_files = snapshot_code_files(
+        multi_file_result.to_dict(),
+        [f.content for f in multi_file_result.files],
+        previous=state.get("code_files"),
+    )
+
     return {
         "code": code_content,
-        "code_files": multi_file_result.to_dict(),
+        "code_files": code_files,
         "status": "testing",
         "messages": all_messages[len(initial_messages) :],  # Only new messages
         "tool_calls": existing_tool_calls,
@@ -271,6 +279,8 @@ Please address all the feedback above in your revised code."""
                 "input_tokens": usage.get("input_tokens", 0),
                 "output_tokens": usage.get("output_tokens", 0),
                 "total_tokens": usage.get("total_tokens", 0),
+                "cache_read_tokens": usage.get("cache_read_tokens", 0),
+                "cache_creation_tokens": usage.get("cache_creation_tokens", 0),
                 "latency_ms": usage.get("latency_ms", 0),
                 "iterations": usage.get("iterations", 0),
             },
@@ -333,14 +343,26 @@ Please address all the feedback above in your revised code."""
         ("human", code_prompt),
     ]
 
+    # Files become available as soon as their closing fence streams in
+    block_parser = CodeBlockStreamParser()
+
     async for chunk, metrics in stream_with_metrics(model, messages, config):
         if metrics is None:
             logger.debug("Streaming code chunk", task_id=task_id, chunk_length=len(chunk))
+            for block in block_parser.feed(chunk):
+                logger.debug(
+                    "Streamed code block complete",
+                    task_id=task_id,
+                    filepath=block.filepath,
+                    language=block.language.value,
+                    start_line=block.start_line,
+                )
             yield chunk, None
         else:
             logger.info(
                 "Finished stream code generation",
                 task_id=task_id,
+                code_blocks=len(block_parser.finish().code_blocks),
                 input_tokens=metrics.input_tokens,
                 output_tokens=metrics.output_tokens,
                 latency_ms=metrics.latency_ms,
@@ -28,7 +28,13 @@ from src.agents.analyzers.plan_validator import (
     needs_refinement,
     validate_plan,
 )
+from src.agents.infrastructure.artifacts import persistent_ref
 from src.agents.infrastructure.models import get_planner_model, get_planner_model_with_tools
+from src.agents.infrastructure.prompt_cache import extract_cache_usage
+from src.agents.infrastructure.response_cache import (
+    extract_response_cache_usage,
+    get_response_cache,
+)
 from src.agents.infrastructure.streaming import StreamingMetrics, stream_with_metrics
 from src.agents.nodes.react_executor import (
     count_tool_calls_by_type,
@@ -121,10 +127,17 @@ def _format_validation_issues(validation: PlanValidation) -> str:
     return "\n".join(lines)
 
 
+def _plan_version_content(plan: str) -> dict[str, str]:
+    """Plan content for a plan_history entry: a reference if persisted, else inline."""
+    ref = persistent_ref(plan)
+    return {"plan_ref": ref} if ref else {"plan_content": plan}
+
+
 async def _invoke_planner(
     model: Any,
     messages: list[tuple[str, str]],
     config: RunnableConfig | None,
+    cache: bool = False,
 ) -> tuple[str, dict[str, int], int]:
     """Invoke the planner model and return the response with metrics.
 
@@ -132,12 +145,17 @@ async def _invoke_planner(
         model: The LangChain model to invoke
         messages: List of (role, content) tuples
         config: Optional RunnableConfig for tracing
+        cache: Whether to serve an identical earlier request from the LLM
+            response cache
 
     Returns:
         Tuple of (plan_content, usage_dict, latency_ms)
     """
     start_time = time.time()
-    response = await model.ainvoke(messages, config)
+    if cache:
+        response = await get_response_cache().ainvoke(model, messages, config)
+    else:
+        response = await model.ainvoke(messages, config)
     latency_ms = int((time.time() - start_time) * 1000)
 
     # Extract content - BaseMessage.content can be str or list, ensure we get str
@@ -153,6 +171,8 @@ async def _invoke_planner(
         "input_tokens": input_tokens,
         "output_tokens": output_tokens,
         "total_tokens": total_tokens,
+        **extract_cache_usage(usage_metadata),
+        **extract_response_cache_usage(response),
     }
 
     return plan_content, usage, latency_ms
@@ -193,7 +213,8 @@ async def _refine_plan(
         ("human", refinement_prompt),
     ]
 
-    return await _invoke_planner(model, messages, config)
+    # Refinement is deterministic given the plan and its validation issues
+    return await _invoke_planner(model, messages, config, cache=True)
 
 
 async def _get_cached_plan(task_description: str) -> dict[str, Any] | None:
@@ -399,6 +420,10 @@ First, explore the codebase to understand the existing structure and patterns, t
         "input_tokens": usage.get("input_tokens", 0),
         "output_tokens": usage.get("output_tokens", 0),
         "total_tokens": usage.get("total_tokens", 0),
+        "cache_read_tokens": usage.get("cache_read_tokens", 0),
+        "cache_creation_tokens": usage.get("cache_creation_tokens", 0),
+        "response_cache_hits": 0,
+        "response_cache_misses": 0,
     }
     total_latency_ms = usage.get("latency_ms", 0)
 
@@ -408,7 +433,7 @@ First, explore the codebase to understand the existing structure and patterns, t
         {
             "version": 1,
             "created_at": datetime.utcnow().isoformat(),
-            "plan_content": str(plan_content),
+            **_plan_version_content(str(plan_content)),
             "validation": validation.to_dict(),
             "is_refinement": False,
             "refinement_reason": None,
@@ -448,6 +473,10 @@ First, explore the codebase to understand the existing structure and patterns, t
         total_usage["input_tokens"] += refinement_usage["input_tokens"]
         total_usage["output_tokens"] += refinement_usage["output_tokens"]
         total_usage["total_tokens"] += refinement_usage["total_tokens"]
+        total_usage["cache_read_tokens"] += refinement_usage["cache_read_tokens"]
+        total_usage["cache_creation_tokens"] += refinement_usage["cache_creation_tokens"]
+        total_usage["response_cache_hits"] += refinement_usage["response_cache_hits"]
+        total_usage["response_cache_misses"] += refinement_usage["response_cache_misses"]
         total_latency_ms += refinement_latency
 
         # Re-validate
@@ -459,7 +488,7 @@ First, explore the codebase to understand the existing structure and patterns, t
             {
                 "version": plan_version,
                 "created_at": datetime.utcnow().isoformat(),
-                "plan_content": str(plan_content),
+                **_plan_version_content(str(plan_content)),
                 "validation": validation.to_dict(),
                 "is_refinement": True,
                 "refinement_reason": refinement_reason,
@@ -508,6 +537,10 @@ First, explore the codebase to understand the existing structure and patterns, t
             "input_tokens": total_usage["input_tokens"],
             "output_tokens": total_usage["output_tokens"],
             "total_tokens": total_usage["total_tokens"],
+            "cache_read_tokens": total_usage["cache_read_tokens"],
+            "cache_creation_tokens": total_usage["cache_creation_tokens"],
+            "response_cache_hits": total_usage["response_cache_hits"],
+            "response_cache_misses": total_usage["response_cache_misses"],
             "latency_ms": total_latency_ms,
             "iterations": usage.get("iterations", 0),
         },
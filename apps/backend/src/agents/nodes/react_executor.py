@@ -33,8 +33,11 @@ from typing import Any
 from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
 
+from src.agents.infrastructure.context_window import ContextWindowManager, context_budget_for
+from src.agents.infrastructure.prompt_cache import extract_cache_usage
+from src.agents.infrastructure.react_checkpoint import ReactCheckpoint, get_checkpoint_store
 from src.core.config import settings
-from src.core.logging import get_logger
+from src.core.logging import get_logger, lazy
 from src.tools.base import execute_tool
 from src.tools.registry import AgentType, get_tools_for_agent
 
@@ -51,11 +54,17 @@ async def execute_react_loop(
     agent_type: AgentType,
     config: RunnableConfig | None = None,
     max_iterations: int | None = None,
+    max_context_tokens: int | None = None,
 ) -> tuple[list[BaseMessage], list[dict[str, Any]], dict[str, int]]:
     """Execute a ReAct loop with tool calling.
 
     The agent reasons about what to do, calls tools, observes results,
-    and iterates until done or max iterations reached.
+    and iterates until done or max iterations reached. Each request is
+    built by a ContextWindowManager, which elides stale and repeated tool
+    outputs so the prompt stays within the model's context window.
+
+    Inside a resilient node (see react_checkpoint_scope), the loop is
+    checkpointed after every iteration and a retry resumes from there.
 
     Args:
         model: LangChain model with tools bound via bind_tools()
@@ -64,12 +73,16 @@ async def execute_react_loop(
         agent_type: Type of agent (determines tool permissions)
         config: Optional RunnableConfig for tracing callbacks
         max_iterations: Maximum iterations (defaults to settings.max_tool_iterations)
+        max_context_tokens: Prompt token budget (defaults to the model's context
+            window minus its completion reservation)
 
     Returns:
         Tuple of:
-            - List of all messages (including tool calls and results)
+            - List of all messages, uncompacted (including tool calls and results)
             - List of tool call records for state tracking
-            - Usage metrics dict (input_tokens, output_tokens, total_tokens, latency_ms)
+            - Usage metrics dict (input_tokens, output_tokens, total_tokens,
+              cache_read_tokens, cache_creation_tokens, context_tokens_saved,
+              latency_ms)
 
     Example:
         >>> model = get_coder_model_with_tools()
@@ -98,16 +111,65 @@ async def execute_react_loop(
     # Build tool context with appropriate permissions
     context = build_tool_context(state, agent_type)
 
-    # Track state
-    all_messages = list(messages)  # Copy to avoid mutating input
+    # Track state; the manager holds the full history and builds each request
+    context_window = ContextWindowManager(
+        budget_tokens=max_context_tokens or context_budget_for(model),
+        tools=tools,
+    )
+    context_window.extend(messages)
     tool_call_records: list[dict[str, Any]] = []
     total_usage = {
         "input_tokens": 0,
         "output_tokens": 0,
         "total_tokens": 0,
+        "cache_read_tokens": 0,
+        "cache_creation_tokens": 0,
+        "context_tokens_saved": 0,
     }
     start_time = time.time()
 
+    # Inside a resilient node, resume from the last completed iteration of a
+    # previous attempt instead of repeating its LLM turns and tool calls
+    checkpoint_store = get_checkpoint_store()
+    checkpoint = None
+    checkpoint_key = ""
+    if checkpoint_store is not None:
+        checkpoint_key = checkpoint_store.next_key(agent_type.value, messages)
+        checkpoint = checkpoint_store.get(checkpoint_key)
+
+    def save_checkpoint(iterations: int, completed: bool = False) -> None:
+        if checkpoint_store is not None:
+            checkpoint_store.save(
+                checkpoint_key,
+                ReactCheckpoint(
+                    history=context_window.history,
+                    tool_call_records=list(tool_call_records),
+                    usage=dict(total_usage),
+                    iterations=iterations,
+                    completed=completed,
+                ),
+            )
+
+    start_iteration = 0
+    if checkpoint is not None:
+        for message, tool_name, tool_args in checkpoint.history[len(messages) :]:
+            context_window.add(message, tool_name=tool_name, tool_args=tool_args)
+        tool_call_records = list(checkpoint.tool_call_records)
+        total_usage = dict(checkpoint.usage)
+        start_iteration = checkpoint.iterations
+
+        logger.info(
+            "react_loop_resumed",
+            agent_type=agent_type.value,
+            task_id=state.get("task_id"),
+            completed_iterations=checkpoint.iterations,
+            tool_calls_made=len(tool_call_records),
+            completed=checkpoint.completed,
+        )
+
+        if checkpoint.completed:
+            return context_window.messages, tool_call_records, total_usage
+
     logger.info(
         "react_loop_started",
         agent_type=agent_type.value,
@@ -116,11 +178,11 @@ async def execute_react_loop(
         max_iterations=max_iter,
     )
 
-    iteration = 0
-    for iteration in range(max_iter):
+    iteration = max(start_iteration - 1, 0)
+    for iteration in range(start_iteration, max_iter):
         # Call the model
         try:
-            response = await model.ainvoke(all_messages, config)
+            response = await model.ainvoke(context_window.build(), config)
         except Exception as e:
             logger.error(
                 "react_loop_model_error",
@@ -131,14 +193,18 @@ async def execute_react_loop(
             )
             raise
 
-        all_messages.append(response)
+        context_window.add(response)
+        total_usage["context_tokens_saved"] += context_window.stats.tokens_saved
 
         # Track token usage if available
         usage_metadata = getattr(response, "usage_metadata", None)
         if usage_metadata:
+            context_window.record_usage(usage_metadata.get("input_tokens", 0))
             total_usage["input_tokens"] += usage_metadata.get("input_tokens", 0)
             total_usage["output_tokens"] += usage_metadata.get("output_tokens", 0)
             total_usage["total_tokens"] += usage_metadata.get("total_tokens", 0)
+            for key, value in extract_cache_usage(usage_metadata).items():
+                total_usage[key] += value
 
         # Check if model wants to call tools
         tool_calls = getattr(response, "tool_calls", None) or []
@@ -166,12 +232,12 @@ async def execute_react_loop(
                 tool_name=tool_name,
                 task_id=state.get("task_id"),
                 iteration=iteration + 1,
-                args_preview=str(tool_args)[:100],
+                args_preview=lazy(lambda args: str(args)[:100], tool_args),
             )
 
             # Execute the tool
             tool_message = await execute_tool(tool_call, tools, context)
-            all_messages.append(tool_message)
+            context_window.add(tool_message, tool_name=tool_name, tool_args=tool_args)
 
             # Determine if tool call was successful
             # Handle content being either string or list of content blocks
@@ -205,8 +271,10 @@ async def execute_react_loop(
                 tool_name=tool_name,
                 task_id=state.get("task_id"),
                 success=is_success,
-                result_length=len(str(tool_message.content)),
+                result_length=lazy(lambda content: len(str(content)), tool_message.content),
             )
+
+        save_checkpoint(iterations=iteration + 1)
     else:
         # Max iterations reached without completion
         logger.warning(
@@ -220,8 +288,9 @@ async def execute_react_loop(
     # Calculate total latency
     total_usage["latency_ms"] = int((time.time() - start_time) * 1000)
     total_usage["iterations"] = iteration + 1
+    save_checkpoint(iterations=iteration + 1, completed=True)
 
-    return all_messages, tool_call_records, total_usage
+    return context_window.messages, tool_call_records, total_usage
 
 
 def extract_final_response(messages: list[BaseMessage]) -> str:
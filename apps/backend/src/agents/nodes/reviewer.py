@@ -16,10 +16,13 @@ import re
 from collections.abc import AsyncGenerator
 from datetime import UTC
 from enum import Enum
-from typing import Any, Literal
+from threading import Lock
+from typing import Any, Literal, get_args
 
+from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
+from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
 from src.agents.infrastructure.models import get_reviewer_model, get_reviewer_model_with_tools
@@ -29,7 +32,9 @@ from src.agents.nodes.react_executor import (
     execute_react_loop,
     extract_final_response,
 )
+from src.agents.processing.json_extract import JsonObjectScanner
 from src.agents.state import WorkflowState
+from src.core.config import settings
 from src.core.logging import get_logger
 from src.tools.registry import AgentType
 
@@ -300,49 +305,201 @@ def extract_verdict_from_text(feedback: str) -> str:
     return ReviewVerdict.REVISE
 
 
-def parse_structured_verdict(response_text: str) -> StructuredReviewVerdict | None:
+# =============================================================================
+# Verdict Parsing
+# =============================================================================
+
+# How a verdict was obtained from a response:
+# - structured: the backend's native structured output (forced tool call or
+#   JSON-schema guided decoding)
+# - json: the response was a verdict JSON object
+# - extracted: a verdict JSON object embedded in prose or a code fence
+# - fallback: no valid verdict object, verdict guessed from plain text
+VerdictSource = Literal["structured", "json", "extracted", "fallback"]
+
+# Name of the tool / JSON schema carrying a native structured verdict
+VERDICT_OUTPUT_NAME = "StructuredReviewVerdict"
+
+
+def bind_verdict_output(model: Any) -> Any:
+    """Request the verdict through the model's native structured output.
+
+    Claude is forced to call a tool whose arguments are the verdict;
+    OpenAI-compatible backends (vLLM) get a JSON-schema response format,
+    enforced with guided decoding. Other models (and all models when
+    settings.structured_verdict_output is off) are returned unchanged and
+    their verdicts are parsed from text.
+
+    Args:
+        model: Chat model the verdict is requested from
+
+    Returns:
+        The model, bound to produce a StructuredReviewVerdict where supported
+    """
+    if not settings.structured_verdict_output:
+        return model
+    if isinstance(model, ChatAnthropic):
+        return model.bind_tools([StructuredReviewVerdict], tool_choice=VERDICT_OUTPUT_NAME)
+    if isinstance(model, ChatOpenAI):
+        return model.bind(
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": VERDICT_OUTPUT_NAME,
+                    "schema": StructuredReviewVerdict.model_json_schema(),
+                },
+            }
+        )
+    return model
+
+
+class VerdictParseStats:
+    """Counts of how verdicts were obtained, to track the fallback rate."""
+
+    def __init__(self) -> None:
+        """Initialize empty counts."""
+        self._counts: dict[str, int] = dict.fromkeys(get_args(VerdictSource), 0)
+        self._lock = Lock()
+
+    def record(self, source: VerdictSource) -> None:
+        """Count a parsed verdict.
+
+        Args:
+            source: How the verdict was obtained
+        """
+        with self._lock:
+            self._counts[source] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get verdict counts per source and the fallback rate."""
+        with self._lock:
+            counts = dict(self._counts)
+        total = sum(counts.values())
+        return {
+            **counts,
+            "total": total,
+            "fallback_rate": counts["fallback"] / total if total else 0.0,
+        }
+
+
+# Global verdict parse statistics
+_verdict_parse_stats: VerdictParseStats | None = None
+_verdict_parse_stats_lock = Lock()
+
+
+def get_verdict_parse_stats() -> VerdictParseStats:
+    """Get the global verdict parse statistics (singleton).
+
+    Returns:
+        The global VerdictParseStats instance
+    """
+    global _verdict_parse_stats
+
+    if _verdict_parse_stats is None:
+        with _verdict_parse_stats_lock:
+            if _verdict_parse_stats is None:
+                _verdict_parse_stats = VerdictParseStats()
+
+    return _verdict_parse_stats
+
+
+def reset_verdict_parse_stats() -> None:
+    """Drop the global verdict parse statistics.
+
+    Useful for testing.
+    """
+    global _verdict_parse_stats
+
+    with _verdict_parse_stats_lock:
+        _verdict_parse_stats = None
+
+
+def _validate_verdict(data: Any) -> StructuredReviewVerdict | None:
+    """Validate a decoded object as a verdict, None if it is not one."""
+    if not isinstance(data, dict) or "verdict" not in data:
+        return None
+    try:
+        return StructuredReviewVerdict.model_validate(data)
+    except ValueError:
+        return None
+
+
+def _parse_verdict(
+    response_text: str,
+    scanner: JsonObjectScanner | None = None,
+) -> tuple[StructuredReviewVerdict | None, VerdictSource]:
+    """Parse a verdict and report whether it was the whole response or embedded."""
+    try:
+        verdict = _validate_verdict(json.loads(response_text))
+    except json.JSONDecodeError:
+        verdict = None
+    if verdict is not None:
+        return verdict, "json"
+
+    if scanner is None:
+        scanner = JsonObjectScanner()
+        scanner.feed(response_text)
+    for data in scanner.objects():
+        verdict = _validate_verdict(data)
+        if verdict is not None:
+            return verdict, "extracted"
+
+    return None, "fallback"
+
+
+def parse_structured_verdict(
+    response_text: str,
+    scanner: JsonObjectScanner | None = None,
+) -> StructuredReviewVerdict | None:
     """Parse structured JSON verdict from model response.
 
-    Attempts to extract and parse JSON from the response. Handles cases where
-    the model includes extra text around the JSON.
+    Tries the whole response as JSON first, then every JSON object embedded
+    in it (in prose or code fences), located in one linear pass.
 
     Args:
         response_text: Raw response text from the model
+        scanner: Scanner already fed with the response while it streamed,
+            if any (avoids scanning the text again)
 
     Returns:
         StructuredReviewVerdict if parsing succeeds, None otherwise
     """
-    try:
-        # Try direct JSON parse first
-        data = json.loads(response_text.strip())
-        return StructuredReviewVerdict.model_validate(data)
-    except (json.JSONDecodeError, Exception):
-        pass
-
-    # Try to extract JSON from markdown code blocks
-    json_pattern = r"```(?:json)?\s*(\{[\s\S]*?\})\s*```"
-    matches = re.findall(json_pattern, response_text)
-    for match in matches:
-        try:
-            data = json.loads(match)
-            return StructuredReviewVerdict.model_validate(data)
-        except (json.JSONDecodeError, Exception):
-            continue
-
-    # Try to find raw JSON object in the response
-    brace_pattern = r"\{[\s\S]*\}"
-    matches = re.findall(brace_pattern, response_text)
-    for match in matches:
-        try:
-            data = json.loads(match)
-            # Validate it has the required fields
-            if "verdict" in data and "summary" in data:
-                return StructuredReviewVerdict.model_validate(data)
-        except (json.JSONDecodeError, Exception):
-            continue
-
-    logger.warning("Could not parse structured verdict from response")
-    return None
+    verdict, _ = _parse_verdict(response_text, scanner)
+    if verdict is None:
+        logger.warning("Could not parse structured verdict from response")
+    return verdict
+
+
+def parse_verdict(
+    response_text: str,
+    scanner: JsonObjectScanner | None = None,
+    structured_output: bool = False,
+) -> tuple[StructuredReviewVerdict, VerdictSource]:
+    """Get the verdict of a response, falling back to text extraction.
+
+    Every call is counted in the global VerdictParseStats.
+
+    Args:
+        response_text: Raw response text (or native structured output)
+        scanner: Scanner already fed with the response, if any
+        structured_output: Whether the response was requested through
+            bind_verdict_output
+
+    Returns:
+        The verdict and how it was obtained
+    """
+    verdict, source = _parse_verdict(response_text, scanner)
+    if verdict is None:
+        logger.info(
+            "Falling back to text-based verdict extraction",
+            response_length=len(response_text),
+        )
+        verdict = create_fallback_verdict(response_text)
+    elif source == "json" and structured_output:
+        source = "structured"
+
+    get_verdict_parse_stats().record(source)
+    return verdict, source
 
 
 def create_fallback_verdict(feedback: str) -> StructuredReviewVerdict:
@@ -482,13 +639,7 @@ When done, respond with a JSON object containing your review verdict."""
     response_text = extract_final_response(all_messages)
 
     # Try to parse structured verdict, fall back to text extraction
-    structured_verdict = parse_structured_verdict(response_text)
-    if structured_verdict is None:
-        logger.info(
-            "Falling back to text-based verdict extraction",
-            task_id=state.get("task_id"),
-        )
-        structured_verdict = create_fallback_verdict(response_text)
+    structured_verdict, verdict_source = parse_verdict(response_text)
 
     verdict = structured_verdict.verdict
     confidence = structured_verdict.confidence
@@ -503,6 +654,7 @@ When done, respond with a JSON object containing your review verdict."""
         "Reviewer completed with tools",
         task_id=state.get("task_id"),
         verdict=verdict,
+        verdict_source=verdict_source,
         confidence=confidence,
         issue_count=len(structured_verdict.issues),
         critical_issues=structured_verdict.critical_issue_count,
@@ -539,11 +691,14 @@ When done, respond with a JSON object containing your review verdict."""
             "review_completed_at": datetime.now(UTC).isoformat(),
             "reviewer_model": "sonnet",
             "verdict": verdict,
+            "verdict_source": verdict_source,
             "confidence_score": confidence,
             "reviewer_usage": {
                 "input_tokens": usage.get("input_tokens", 0),
                 "output_tokens": usage.get("output_tokens", 0),
                 "total_tokens": usage.get("total_tokens", 0),
+                "cache_read_tokens": usage.get("cache_read_tokens", 0),
+                "cache_creation_tokens": usage.get("cache_creation_tokens", 0),
                 "latency_ms": usage.get("latency_ms", 0),
                 "iterations": usage.get("iterations", 0),
             },
@@ -24,6 +24,7 @@ from typing import Any, Final, Literal
 
 from langchain_core.runnables import RunnableConfig
 
+from src.agents.analyzers.keyword_classifier import KeywordClassifier
 from src.agents.state import WorkflowState
 from src.core.logging import get_logger
 
@@ -73,11 +74,15 @@ class SupervisorConfig:
         "csrf",
     ]
 
+    CLASSIFIER = KeywordClassifier({"security": SECURITY_KEYWORDS})
+
     @classmethod
     def has_security_concerns(cls, task_description: str, code: str) -> bool:
         """Check if the code has security-related concerns."""
-        text = (task_description + " " + code).lower()
-        return any(keyword in text for keyword in cls.SECURITY_KEYWORDS)
+        # Keywords contain no spaces, so none can span the two texts; keeping
+        # them apart lets the classifier cache the code across routing steps
+        classify = cls.CLASSIFIER.classify
+        return classify(task_description).has("security") or classify(code).has("security")
 
 
 def get_next_node(state: WorkflowState, config: SupervisorConfig | None = None) -> RoutingDecision:
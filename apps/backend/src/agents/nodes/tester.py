@@ -11,7 +11,6 @@ Features:
 - Enhanced test metadata with mock analysis
 """
 
-import ast
 import re
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
@@ -20,6 +19,7 @@ from typing import Any
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 
+from src.agents.analyzers.ast_cache import analyze_source
 from src.agents.analyzers.test_analyzer import create_test_analysis
 from src.agents.infrastructure.models import get_tester_model, get_tester_model_with_tools
 from src.agents.infrastructure.streaming import StreamingMetrics, stream_with_metrics
@@ -229,25 +229,21 @@ def detect_external_dependencies(source_code: str) -> list[ExternalDependency]:
     dependencies: list[ExternalDependency] = []
 
     # Try AST parsing for accurate analysis
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
+    analysis = analyze_source(source_code)
+    if analysis.syntax_error is not None:
         # Fall back to regex for malformed code
         return _detect_dependencies_regex(source_code)
 
     # Track imports
     imports: dict[str, tuple[str, int]] = {}  # name -> (import_statement, line)
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                name = alias.asname or alias.name
-                imports[name] = (f"import {alias.name}", node.lineno)
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module or ""
-            for alias in node.names:
-                name = alias.asname or alias.name
-                imports[name] = (f"from {module} import {alias.name}", node.lineno)
+    for statement in analysis.imports:
+        for alias, asname in statement.names:
+            if statement.is_from:
+                import_stmt = f"from {statement.module} import {alias}"
+            else:
+                import_stmt = f"import {alias}"
+            imports[asname or alias] = (import_stmt, statement.lineno)
 
     # Categorize imports
     for name, (import_stmt, _line) in imports.items():
@@ -259,7 +255,7 @@ def detect_external_dependencies(source_code: str) -> list[ExternalDependency]:
                 category=category,
             )
             # Find usage locations
-            dep.usage_locations = _find_usage_locations(tree, name)
+            dep.usage_locations = list(analysis.name_references.get(name, ()))
             dependencies.append(dep)
 
     return dependencies
@@ -282,19 +278,6 @@ def _categorize_import(name: str, import_stmt: str) -> str:
     return "internal"
 
 
-def _find_usage_locations(tree: ast.AST, name: str) -> list[int]:
-    """Find line numbers where a name is used."""
-    locations = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Name) and node.id == name:
-            locations.append(node.lineno)
-        elif isinstance(node, ast.Attribute):
-            # Check for attribute access like "requests.get"
-            if isinstance(node.value, ast.Name) and node.value.id == name:
-                locations.append(node.lineno)
-    return locations
-
-
 def _detect_dependencies_regex(source_code: str) -> list[ExternalDependency]:
     """Fallback regex detection for dependencies."""
     dependencies = []
@@ -689,6 +672,8 @@ After writing the tests, run them with run_pytest to verify they pass."""
                 "input_tokens": usage.get("input_tokens", 0),
                 "output_tokens": usage.get("output_tokens", 0),
                 "total_tokens": usage.get("total_tokens", 0),
+                "cache_read_tokens": usage.get("cache_read_tokens", 0),
+                "cache_creation_tokens": usage.get("cache_creation_tokens", 0),
                 "latency_ms": usage.get("latency_ms", 0),
                 "iterations": usage.get("iterations", 0),
             },
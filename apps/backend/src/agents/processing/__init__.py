@@ -3,23 +3,28 @@
 Handles extraction and formatting of code from LLM responses:
 - parser: Extract code blocks from markdown/text
 - formatter: Format and validate code structure
+- json_extract: Locate JSON objects in model output in one pass
 """
 
 from src.agents.processing.formatter import (
     CodeFile,
+    FormatCache,
     FormatResult,
     LintCategory,
     LintIssue,
     LintSeverity,
     MultiFileResult,
     SyntaxError_,
+    acreate_multi_file_result,
     create_multi_file_result,
     format_python_code,
     infer_filepath,
     validate_python_syntax,
 )
+from src.agents.processing.json_extract import JsonObjectScanner, iter_json_objects
 from src.agents.processing.parser import (
     CodeBlock,
+    CodeBlockStreamParser,
     Language,
     ParsedResponse,
     combine_code_blocks,
@@ -32,18 +37,24 @@ from src.agents.processing.parser import (
 __all__ = [
     # Formatter
     "CodeFile",
+    "FormatCache",
     "FormatResult",
     "LintCategory",
     "LintIssue",
     "LintSeverity",
     "MultiFileResult",
     "SyntaxError_",
+    "acreate_multi_file_result",
     "create_multi_file_result",
     "format_python_code",
     "infer_filepath",
     "validate_python_syntax",
+    # JSON extraction
+    "JsonObjectScanner",
+    "iter_json_objects",
     # Parser
     "CodeBlock",
+    "CodeBlockStreamParser",
     "Language",
     "ParsedResponse",
     "combine_code_blocks",
@@ -4,7 +4,8 @@ This module provides utilities for ensuring generated code meets quality standar
 - Syntax validation using Python's AST parser
 - Basic code formatting (indentation, line length)
 - Linting for common issues (unused imports, undefined names)
-- Multi-file code organization
+- Multi-file code organization, formatting files in parallel worker
+  processes and skipping content already formatted in an earlier iteration
 
 Example:
     >>> code = "def hello( ):\\n  return 'world'"
@@ -15,13 +16,23 @@ Example:
     True
 """
 
-import ast
+import asyncio
+import hashlib
+import multiprocessing
 import re
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from enum import Enum
+from threading import Lock
 from typing import Any
 
-from src.core.logging import get_logger
+from src.agents.analyzers.ast_cache import FunctionInfo, analyze_source
+from src.agents.analyzers.rule_scanner import RuleScanner, ScanRule
+from src.core.config import settings
+from src.core.logging import configure_logging, get_logger
 
 logger = get_logger(__name__)
 
@@ -186,16 +197,15 @@ def validate_python_syntax(code: str) -> tuple[bool, SyntaxError_ | None]:
     Returns:
         Tuple of (is_valid, syntax_error or None)
     """
-    try:
-        ast.parse(code)
+    e = analyze_source(code).syntax_error
+    if e is None:
         return True, None
-    except SyntaxError as e:
-        return False, SyntaxError_(
-            message=str(e.msg) if e.msg else "Syntax error",
-            line=e.lineno or 0,
-            column=e.offset or 0,
-            text=e.text,
-        )
+    return False, SyntaxError_(
+        message=str(e.msg) if e.msg else "Syntax error",
+        line=e.lineno or 0,
+        column=e.offset or 0,
+        text=e.text,
+    )
 
 
 def _fix_indentation(code: str, indent_size: int = 4) -> str:
@@ -302,6 +312,26 @@ def _fix_spacing(code: str) -> str:
     return "\n".join(fixed_lines)
 
 
+# Security checks of the basic linter, compiled once
+_LINT_SECURITY_SCANNER = RuleScanner(
+    ScanRule(
+        rule_id,
+        pattern,
+        message,
+        severity=LintSeverity.WARNING,
+        category=LintCategory.SECURITY,
+        ignore_case=True,
+    )
+    for pattern, message, rule_id in [
+        (r"\beval\s*\(", "Use of eval() is a security risk", "S307"),
+        (r"\bexec\s*\(", "Use of exec() is a security risk", "S102"),
+        (r"\b__import__\s*\(", "Use of __import__() is discouraged", "S403"),
+        (r"password\s*=\s*['\"][^'\"]+['\"]", "Hardcoded password detected", "S105"),
+        (r"secret\s*=\s*['\"][^'\"]+['\"]", "Hardcoded secret detected", "S105"),
+    ]
+)
+
+
 def _lint_python_code(code: str) -> list[LintIssue]:
     """Run basic linting checks on Python code.
 
@@ -313,57 +343,25 @@ def _lint_python_code(code: str) -> list[LintIssue]:
     """
     issues: list[LintIssue] = []
 
-    try:
-        tree = ast.parse(code)
-    except SyntaxError:
+    analysis = analyze_source(code)
+    if analysis.syntax_error is not None:
         return issues  # Syntax issues are handled separately
 
     lines = code.splitlines()
 
-    # Track defined names and used names
-    defined_names: set[str] = set()
-    used_names: set[str] = set()
     imported_names: set[str] = set()
-
-    class NameVisitor(ast.NodeVisitor):
-        def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-            defined_names.add(node.name)
-            self.generic_visit(node)
-
-        def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-            defined_names.add(node.name)
-            self.generic_visit(node)
-
-        def visit_ClassDef(self, node: ast.ClassDef) -> None:
-            defined_names.add(node.name)
-            self.generic_visit(node)
-
-        def visit_Name(self, node: ast.Name) -> None:
-            if isinstance(node.ctx, ast.Store):
-                defined_names.add(node.id)
-            elif isinstance(node.ctx, ast.Load):
-                used_names.add(node.id)
-            self.generic_visit(node)
-
-        def visit_Import(self, node: ast.Import) -> None:
-            for alias in node.names:
-                name = alias.asname if alias.asname else alias.name.split(".")[0]
-                imported_names.add(name)
-            self.generic_visit(node)
-
-        def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-            for alias in node.names:
-                name = alias.asname if alias.asname else alias.name
-                if name != "*":
-                    imported_names.add(name)
-            self.generic_visit(node)
-
-    visitor = NameVisitor()
-    visitor.visit(tree)
+    for statement in analysis.imports:
+        for alias, asname in statement.names:
+            if asname:
+                imported_names.add(asname)
+            elif not statement.is_from:
+                imported_names.add(alias.split(".")[0])
+            elif alias != "*":
+                imported_names.add(alias)
 
     # Check for unused imports (simple check)
     for name in imported_names:
-        if name not in used_names and name not in defined_names:
+        if name not in analysis.used_names and name not in analysis.defined_names:
             # Find the line number
             for i, line in enumerate(lines, 1):
                 if f"import {name}" in line or f"import {name}," in line or f" {name}" in line:
@@ -392,53 +390,41 @@ def _lint_python_code(code: str) -> list[LintIssue]:
             )
 
     # Check for common security issues
-    security_patterns = [
-        (r"\beval\s*\(", "Use of eval() is a security risk", "S307"),
-        (r"\bexec\s*\(", "Use of exec() is a security risk", "S102"),
-        (r"\b__import__\s*\(", "Use of __import__() is discouraged", "S403"),
-        (r"password\s*=\s*['\"][^'\"]+['\"]", "Hardcoded password detected", "S105"),
-        (r"secret\s*=\s*['\"][^'\"]+['\"]", "Hardcoded secret detected", "S105"),
-    ]
-
-    for pattern, message, rule in security_patterns:
-        for i, line in enumerate(lines, 1):
-            if re.search(pattern, line, re.IGNORECASE):
-                issues.append(
-                    LintIssue(
-                        message=message,
-                        severity=LintSeverity.WARNING,
-                        category=LintCategory.SECURITY,
-                        line=i,
-                        rule=rule,
-                    )
-                )
+    for match in _LINT_SECURITY_SCANNER.scan(code):
+        issues.append(
+            LintIssue(
+                message=match.rule.message,
+                severity=LintSeverity(match.rule.severity),
+                category=LintCategory(match.rule.category),
+                line=match.line_number,
+                rule=match.rule.rule_id,
+            )
+        )
 
     # Check for missing docstrings on public functions/classes
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if not node.name.startswith("_"):
-                if not ast.get_docstring(node):
-                    issues.append(
-                        LintIssue(
-                            message=f"Missing docstring in public function '{node.name}'",
-                            severity=LintSeverity.INFO,
-                            category=LintCategory.STYLE,
-                            line=node.lineno,
-                            rule="D103",
-                        )
-                    )
-        elif isinstance(node, ast.ClassDef):
-            if not node.name.startswith("_"):
-                if not ast.get_docstring(node):
-                    issues.append(
-                        LintIssue(
-                            message=f"Missing docstring in public class '{node.name}'",
-                            severity=LintSeverity.INFO,
-                            category=LintCategory.STYLE,
-                            line=node.lineno,
-                            rule="D101",
-                        )
-                    )
+    for definition in analysis.definitions():
+        if definition.name.startswith("_") or definition.docstring:
+            continue
+        if isinstance(definition, FunctionInfo):
+            issues.append(
+                LintIssue(
+                    message=f"Missing docstring in public function '{definition.name}'",
+                    severity=LintSeverity.INFO,
+                    category=LintCategory.STYLE,
+                    line=definition.lineno,
+                    rule="D103",
+                )
+            )
+        else:
+            issues.append(
+                LintIssue(
+                    message=f"Missing docstring in public class '{definition.name}'",
+                    severity=LintSeverity.INFO,
+                    category=LintCategory.STYLE,
+                    line=definition.lineno,
+                    rule="D101",
+                )
+            )
 
     return issues
 
@@ -514,39 +500,242 @@ def format_python_code(
     return result
 
 
-def create_multi_file_result(
-    code_blocks: list[tuple[str, str, str]],
-    format_code: bool = True,
-) -> MultiFileResult:
-    """Create a multi-file result from code blocks.
+class FormatCache:
+    """Bounded LRU of format results keyed by a hash of the source.
+
+    Between workflow iterations most files of the coder's output are
+    unchanged; their cached FormatResult is reused instead of formatting
+    and linting them again. Results are shared between lookups and must
+    not be mutated.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached results, 0 disables caching
+                (defaults to settings.format_cache_max_entries)
+        """
+        self.max_entries = settings.format_cache_max_entries if max_entries is None else max_entries
+        self._entries: OrderedDict[str, FormatResult] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get(self, code: str) -> FormatResult | None:
+        """Get the cached result for a source, if any."""
+        key = self._key(code)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, code: str, result: FormatResult) -> None:
+        """Cache the result for a source, evicting the least recently used."""
+        if self.max_entries <= 0:
+            return
+        key = self._key(code)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
 
-    Args:
-        code_blocks: List of (filepath, content, language) tuples
-        format_code: Whether to format Python files
+
+# Global format cache and worker pool
+_format_cache: FormatCache | None = None
+_format_cache_lock = Lock()
+_format_pool: ProcessPoolExecutor | None = None
+_format_pool_lock = Lock()
+
+
+def get_format_cache() -> FormatCache:
+    """Get the global format cache (singleton).
 
     Returns:
-        MultiFileResult with organized files
+        The global FormatCache instance
+    """
+    global _format_cache
 
-    Example:
-        >>> blocks = [
-        ...     ("src/main.py", "def main(): pass", "python"),
-        ...     ("tests/test_main.py", "def test_main(): pass", "python"),
-        ... ]
-        >>> result = create_multi_file_result(blocks)
-        >>> len(result.files)
-        2
+    if _format_cache is None:
+        with _format_cache_lock:
+            if _format_cache is None:
+                _format_cache = FormatCache()
+
+    return _format_cache
+
+
+def reset_format_cache() -> None:
+    """Drop the global format cache.
+
+    Useful for testing.
     """
+    global _format_cache
+
+    with _format_cache_lock:
+        _format_cache = None
+
+
+def get_format_pool() -> ProcessPoolExecutor | None:
+    """Get the worker process pool for formatting (singleton).
+
+    Workers are spawned rather than forked, since the server process runs
+    threads (event loop executors, database drivers) that must not be
+    copied mid-operation.
+
+    Returns:
+        The pool, or None if settings.format_process_workers is 0
+    """
+    global _format_pool
+
+    if settings.format_process_workers <= 0:
+        return None
+
+    if _format_pool is None:
+        with _format_pool_lock:
+            if _format_pool is None:
+                _format_pool = ProcessPoolExecutor(
+                    max_workers=settings.format_process_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=configure_logging,
+                )
+
+    return _format_pool
+
+
+def shutdown_format_pool() -> None:
+    """Stop the worker processes, cancelling queued work.
+
+    A later get_format_pool call starts a new pool.
+    """
+    global _format_pool
+
+    with _format_pool_lock:
+        pool, _format_pool = _format_pool, None
+
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _format_all(sources: Sequence[str]) -> list[FormatResult]:
+    """Format sources one after another."""
+    return [format_python_code(source) for source in sources]
+
+
+async def _format_in_workers(sources: list[str]) -> list[FormatResult]:
+    """Format sources off the event loop, in order.
+
+    Small batches are formatted on a worker thread, where the process
+    round trip would cost more than it saves; larger ones are spread over
+    the worker processes, one file per task.
+    """
+    pool = None
+    if len(sources) > 1 and sum(map(len, sources)) >= settings.format_parallel_min_chars:
+        pool = get_format_pool()
+
+    if pool is None:
+        return await asyncio.to_thread(_format_all, sources)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(pool, format_python_code, source) for source in sources)
+            )
+        )
+    except BrokenProcessPool:
+        logger.warning("Format worker pool broke, formatting on a thread", file_count=len(sources))
+        shutdown_format_pool()
+        return await asyncio.to_thread(_format_all, sources)
+
+
+def _cached_format_results(
+    code_blocks: list[tuple[str, str, str]],
+    format_code: bool,
+) -> tuple[list[FormatResult | None], dict[str, list[int]]]:
+    """Look up each Python file in the format cache.
+
+    Returns:
+        Cached result per block (None if not formatted or not cached) and
+        the indexes of each uncached source, identical sources merged
+    """
+    results: list[FormatResult | None] = [None] * len(code_blocks)
+    pending: dict[str, list[int]] = {}
+    if not format_code:
+        return results, pending
+
+    cache = get_format_cache()
+    for index, (_, content, language) in enumerate(code_blocks):
+        if language != "python":
+            continue
+        if content in pending:
+            pending[content].append(index)
+        elif (cached := cache.get(content)) is not None:
+            results[index] = cached
+        else:
+            pending[content] = [index]
+
+    return results, pending
+
+
+def _store_format_results(
+    results: list[FormatResult | None],
+    pending: dict[str, list[int]],
+    formatted: list[FormatResult],
+) -> None:
+    """Cache newly formatted sources and fill in their blocks' results."""
+    cache = get_format_cache()
+    for (source, indexes), format_result in zip(pending.items(), formatted, strict=True):
+        cache.put(source, format_result)
+        for index in indexes:
+            results[index] = format_result
+
+
+def _build_multi_file_result(
+    code_blocks: list[tuple[str, str, str]],
+    format_results: list[FormatResult | None],
+    formatted_count: int,
+) -> MultiFileResult:
+    """Assemble files in input order from their format results."""
     files: list[CodeFile] = []
     all_valid = True
 
-    for filepath, content, language in code_blocks:
+    for (filepath, content, language), format_result in zip(
+        code_blocks, format_results, strict=True
+    ):
         # Determine if this is a test file
         is_test = "test" in filepath.lower() or content.strip().startswith("def test_")
 
-        # Format Python files if requested
-        format_result = None
-        if format_code and language == "python":
-            format_result = format_python_code(content)
+        if format_result is not None:
             content = format_result.formatted_code
             if not format_result.is_valid:
                 all_valid = False
@@ -566,12 +755,70 @@ def create_multi_file_result(
         "Created multi-file result",
         file_count=len(files),
         test_count=len(result.test_files),
+        formatted_count=formatted_count,
         all_valid=all_valid,
     )
 
     return result
 
 
+def create_multi_file_result(
+    code_blocks: list[tuple[str, str, str]],
+    format_code: bool = True,
+) -> MultiFileResult:
+    """Create a multi-file result from code blocks.
+
+    Python files whose content was formatted before are taken from the
+    format cache; the rest are formatted in the calling thread. Async
+    callers should use acreate_multi_file_result.
+
+    Args:
+        code_blocks: List of (filepath, content, language) tuples
+        format_code: Whether to format Python files
+
+    Returns:
+        MultiFileResult with organized files
+
+    Example:
+        >>> blocks = [
+        ...     ("src/main.py", "def main(): pass", "python"),
+        ...     ("tests/test_main.py", "def test_main(): pass", "python"),
+        ... ]
+        >>> result = create_multi_file_result(blocks)
+        >>> len(result.files)
+        2
+    """
+    results, pending = _cached_format_results(code_blocks, format_code)
+    if pending:
+        _store_format_results(results, pending, _format_all(list(pending)))
+
+    return _build_multi_file_result(code_blocks, results, formatted_count=len(pending))
+
+
+async def acreate_multi_file_result(
+    code_blocks: list[tuple[str, str, str]],
+    format_code: bool = True,
+) -> MultiFileResult:
+    """Create a multi-file result without blocking the event loop.
+
+    Same result as create_multi_file_result, with uncached Python files
+    formatted in parallel worker processes (or on a worker thread for
+    small batches). Files keep their input order.
+
+    Args:
+        code_blocks: List of (filepath, content, language) tuples
+        format_code: Whether to format Python files
+
+    Returns:
+        MultiFileResult with organized files
+    """
+    results, pending = _cached_format_results(code_blocks, format_code)
+    if pending:
+        _store_format_results(results, pending, await _format_in_workers(list(pending)))
+
+    return _build_multi_file_result(code_blocks, results, formatted_count=len(pending))
+
+
 def infer_filepath(content: str, index: int = 0) -> str:
     """Infer a filepath for code without an explicit path.
 
@@ -0,0 +1,197 @@
+"""Linear extraction of JSON objects from model output.
+
+Models asked for JSON often wrap it in prose or a fenced block, or emit
+more than one object (an example, then the answer). Scraping such output
+with a greedy ``\\{[\\s\\S]*\\}`` regex yields one blob from the first brace
+to the last, which fails to parse whenever anything but a single object
+sits between them, and the fenced-block regex rescans the whole response
+before that.
+
+JsonObjectScanner instead tracks brace depth and string state while the
+text is fed, so each complete object is found once, in a single pass over
+the text, whether it arrives in one piece or as streamed chunks:
+
+- Only the characters that can change the state are visited: opening
+  braces in prose, quotes and backslashes inside strings, braces and quotes
+  elsewhere in objects (each found with ``str.find`` or a compiled class)
+- Quotes and escapes are honoured inside objects only; apostrophes and
+  stray quotes in surrounding prose do not matter
+- A brace in prose opens an object only when followed by a quote or a
+  closing brace (``{x}`` and ``f"{name}"`` are skipped), and every closed
+  object is recorded, with only the outermost ones reported
+- An opener that looked like JSON but never closes (the quote in
+  ``"{"`` starts a string that swallows what follows) is dropped when the
+  objects are read: the text after it is scanned again without it
+
+Usage:
+    for data in iter_json_objects(response_text):
+        if "verdict" in data:
+            ...
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterator
+from typing import Any
+
+# Characters that change the scanner's state, outside and inside strings
+_OBJECT_STRUCTURE = re.compile(r'[{}"]')
+_STRING_STRUCTURE = re.compile(r'["\\]')
+
+# How every JSON object starts (its first key, or the end of an empty object)
+_OBJECT_START = re.compile(r'\{\s*["}]')
+
+
+class JsonObjectScanner:
+    """Finds complete JSON objects in text fed chunk by chunk."""
+
+    def __init__(self) -> None:
+        """Initialize an empty scanner."""
+        self._parts: list[str] = []
+        self._length = 0
+        self._text: str | None = ""
+        # Start offsets of the objects still open
+        self._open: list[int] = []
+        # Offset of a brace in prose followed only by whitespace so far
+        self._pending_start: int | None = None
+        self._in_string = False
+        # Offset before which structural characters are escaped
+        self._escaped_until = 0
+        # (start, end) of the outermost complete objects, in text order
+        self._spans: list[tuple[int, int]] = []
+
+    @property
+    def text(self) -> str:
+        """The full text received so far."""
+        if self._text is None:
+            self._text = "".join(self._parts)
+            self._parts = [self._text]
+        return self._text
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def spans(self) -> list[tuple[int, int]]:
+        """Offsets (start, end) of the outermost complete objects."""
+        return list(self._spans)
+
+    def feed(self, chunk: str) -> None:
+        """Scan the next piece of text.
+
+        Args:
+            chunk: Text following what was fed before
+        """
+        if not chunk:
+            return
+        offset = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        self._text = None
+
+        open_starts = self._open
+        # Skip a character escaped at the end of the previous chunk
+        index = max(self._escaped_until - offset, 0)
+        if self._pending_start is not None:
+            following = chunk.lstrip()
+            if not following:
+                return
+            if following[0] in '"}':
+                open_starts.append(self._pending_start)
+            self._pending_start = None
+
+        while index < len(chunk):
+            if not open_starts:
+                # Prose between objects: only a brace starting a JSON object matters
+                index = chunk.find("{", index)
+                if index < 0:
+                    break
+                if _OBJECT_START.match(chunk, index):
+                    open_starts.append(offset + index)
+                elif not chunk[index + 1 :].strip():
+                    # Decided by the next chunk
+                    self._pending_start = offset + index
+                    break
+            elif self._in_string:
+                match = _STRING_STRUCTURE.search(chunk, index)
+                if match is None:
+                    break
+                index = match.start()
+                if match.group() == "\\":
+                    self._escaped_until = offset + index + 2
+                    index += 1
+                else:
+                    self._in_string = False
+            else:
+                match = _OBJECT_STRUCTURE.search(chunk, index)
+                if match is None:
+                    break
+                index = match.start()
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char == "{":
+                    open_starts.append(offset + index)
+                else:
+                    self._close(open_starts.pop(), offset + index + 1)
+            index += 1
+
+    def _close(self, start: int, end: int) -> None:
+        # Objects closed earlier inside this one are no longer outermost
+        spans = self._spans
+        while spans and spans[-1][0] > start:
+            spans.pop()
+        spans.append((start, end))
+
+    def _resolved_spans(self) -> list[tuple[int, int]]:
+        """Outermost spans, dropping openers that never closed.
+
+        Each object still open at the end may have swallowed the text after
+        it, so that text is scanned again from just past its opening brace.
+        """
+        text = self.text
+        spans: list[tuple[int, int]] = []
+        scanner, shift = self, 0
+        while True:
+            unclosed = scanner._open[0] if scanner._open else None
+            spans.extend(
+                (start + shift, end + shift)
+                for start, end in scanner._spans
+                if unclosed is None or start < unclosed
+            )
+            if unclosed is None:
+                return spans
+            shift += unclosed + 1
+            scanner = JsonObjectScanner()
+            scanner.feed(text[shift:])
+
+    def objects(self) -> Iterator[dict[str, Any]]:
+        """Yield the outermost complete objects that are valid JSON.
+
+        Yields:
+            Each decoded object, in text order
+        """
+        text = self.text
+        for start, end in self._resolved_spans():
+            try:
+                data = json.loads(text[start:end])
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                yield data
+
+
+def iter_json_objects(text: str) -> Iterator[dict[str, Any]]:
+    """Yield the JSON objects embedded in a text.
+
+    Args:
+        text: Model output, possibly with prose or code fences around JSON
+
+    Yields:
+        Each outermost valid JSON object, in text order
+    """
+    scanner = JsonObjectScanner()
+    scanner.feed(text)
+    yield from scanner.objects()
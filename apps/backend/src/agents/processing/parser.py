@@ -6,6 +6,7 @@ responses into structured data. It handles:
 - Language detection from fence markers
 - File path extraction from comments or headers
 - Code validation and cleaning
+- Incremental parsing of streamed responses (CodeBlockStreamParser)
 
 Example LLM response:
     Here's the implementation:
@@ -36,7 +37,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from src.core.logging import get_logger
+from src.core.logging import get_logger, lazy
 
 logger = get_logger(__name__)
 
@@ -174,12 +175,19 @@ class ParsedResponse:
         return len(self.code_blocks) > 0
 
 
-# Regex patterns for parsing
+# Regex patterns for parsing (reference grammar; CodeBlockStreamParser
+# implements the same matching incrementally)
 CODE_BLOCK_PATTERN = re.compile(
     r"```(\w*)\n(.*?)```",
     re.DOTALL,
 )
 
+# Code fence marker
+FENCE = "```"
+
+# Language tag after an opening fence
+_FENCE_INFO_PATTERN = re.compile(r"\w*")
+
 # Pattern to extract filepath from first comment line
 FILEPATH_PATTERNS = [
     re.compile(r"^#\s*(?:file:|filepath:)?\s*([^\n]+\.py)\s*$", re.MULTILINE | re.IGNORECASE),
@@ -187,6 +195,17 @@ FILEPATH_PATTERNS = [
     re.compile(r"^//\s*(?:file:|filepath:)?\s*([^\n]+\.[a-z]+)\s*$", re.MULTILINE | re.IGNORECASE),
 ]
 
+# Comment marker each filepath pattern needs (skips patterns that cannot match)
+_FILEPATH_MARKERS = ("#", "#", "//")
+
+# Python definitions, classes and imports in one pass
+_PYTHON_METADATA_PATTERN = re.compile(
+    r"^(?:(?:async\s+)?def\s+(?P<function>\w+)\s*\("
+    r"|class\s+(?P<class>\w+)\s*[:\(]"
+    r"|(?P<import>(?:from\s+[\w.]+\s+)?import\s+.+$))",
+    re.MULTILINE,
+)
+
 
 def extract_filepath(content: str) -> tuple[str | None, str]:
     """Extract filepath from code content if present.
@@ -202,22 +221,170 @@ def extract_filepath(content: str) -> tuple[str | None, str]:
     Returns:
         Tuple of (filepath or None, content with filepath comment removed)
     """
-    for pattern in FILEPATH_PATTERNS:
+    for pattern, marker in zip(FILEPATH_PATTERNS, _FILEPATH_MARKERS, strict=True):
+        if marker not in content:
+            continue
         match = pattern.search(content)
         if match:
             filepath = match.group(1).strip()
             # Remove the filepath line from content
-            cleaned = pattern.sub("", content, count=1).lstrip("\n")
+            cleaned = (content[: match.start()] + content[match.end() :]).lstrip("\n")
             return filepath, cleaned
 
     return None, content
 
 
+class CodeBlockStreamParser:
+    """Incremental code fence parser.
+
+    Extracts the same blocks as matching CODE_BLOCK_PATTERN against the
+    whole response, in a single pass: text is scanned once as it arrives
+    (only a fence split across two chunks is looked at again) and line
+    numbers are counted as text is consumed. Each block is returned as
+    soon as its closing fence arrives, e.g. to write files while the
+    response is still streaming.
+
+    Example:
+        parser = CodeBlockStreamParser()
+        async for chunk in stream:
+            for block in parser.feed(chunk):
+                write_file(block.filepath, block.content)
+        parsed = parser.finish()
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self.result = ParsedResponse()
+        self._chunks: list[str] = []
+        # Unscanned tail that may be the start of a fence
+        self._pending = ""
+        # Text since the last block (explanation), or the open block's content
+        self._text: list[str] = []
+        self._content: list[str] = []
+        # Open fence: (fence line, language, opening fence)
+        self._open: tuple[int, str, str] | None = None
+        # Newlines in all consumed text
+        self._lines = 0
+
+    def _consume(self, text: str, into: list[str]) -> None:
+        if text:
+            into.append(text)
+            self._lines += text.count("\n")
+
+    def feed(self, text: str) -> list[CodeBlock]:
+        """Add response text.
+
+        Args:
+            text: Next part of the response
+
+        Returns:
+            Blocks whose closing fence arrived with this text
+        """
+        self._chunks.append(text)
+        return self._scan(self._pending + text, final=False)
+
+    def finish(self) -> ParsedResponse:
+        """End the response.
+
+        An unclosed fence is left as explanation text, like the regex grammar.
+
+        Returns:
+            ParsedResponse with all blocks and explanations
+        """
+        self._scan(self._pending, final=True)
+        self.result.raw_response = "".join(self._chunks)
+
+        remaining = "".join(self._text)
+        if self._open is not None:
+            remaining += self._open[2] + "".join(self._content)
+        remaining = remaining.strip()
+        if remaining:
+            self.result.explanations.append(remaining)
+        return self.result
+
+    def _scan(self, data: str, final: bool) -> list[CodeBlock]:
+        completed: list[CodeBlock] = []
+        # Characters that could start a fence split across chunks
+        keep = 0 if final else len(FENCE) - 1
+        position = 0
+
+        while True:
+            fence = data.find(FENCE, position)
+
+            if self._open is None:
+                if fence < 0:
+                    tail = max(position, len(data) - keep)
+                    self._consume(data[position:tail], self._text)
+                    self._pending = data[tail:]
+                    break
+                info = _FENCE_INFO_PATTERN.match(data, fence + len(FENCE))
+                assert info is not None  # nosec B101 - \w* always matches
+                if info.end() == len(data) and not final:
+                    # The language tag may continue in the next chunk
+                    self._consume(data[position:fence], self._text)
+                    self._pending = data[fence:]
+                    break
+                if not data.startswith("\n", info.end()):
+                    # Not an opening fence; the next one may start inside it
+                    self._consume(data[position : fence + 1], self._text)
+                    position = fence + 1
+                    continue
+
+                self._consume(data[position:fence], self._text)
+                opening = data[fence : info.end() + 1]
+                self._open = (self._lines + 1, info.group(), opening)
+                self._lines += 1
+                position = info.end() + 1
+                continue
+
+            if fence < 0:
+                tail = max(position, len(data) - keep)
+                self._consume(data[position:tail], self._content)
+                self._pending = data[tail:]
+                break
+
+            self._consume(data[position:fence], self._content)
+            position = fence + len(FENCE)
+            completed.append(self._complete())
+
+        return completed
+
+    def _complete(self) -> CodeBlock:
+        """Build the open block and record the explanation before it."""
+        assert self._open is not None  # nosec B101
+        start_line, language, opening = self._open
+        content = "".join(self._content)
+
+        explanation = "".join(self._text).strip()
+        if explanation:
+            self.result.explanations.append(explanation)
+        self._open = None
+        self._text = []
+        self._content = []
+
+        filepath, cleaned_content = extract_filepath(content.strip())
+        block = CodeBlock(
+            content=cleaned_content,
+            language=Language.from_string(language),
+            filepath=filepath,
+            start_line=start_line,
+            raw_block=f"{opening}{content}{FENCE}",
+        )
+
+        # Extract metadata for Python files
+        if block.is_python:
+            block.metadata = extract_python_metadata(cleaned_content)
+
+        self.result.code_blocks.append(block)
+        return block
+
+
 def parse_code_blocks(response: str) -> ParsedResponse:
     """Parse code blocks from an LLM response.
 
     Extracts all markdown code blocks, detects languages, and extracts
-    file paths from comments.
+    file paths from comments. Runs in time linear in the response length
+    (see CodeBlockStreamParser for streamed responses).
 
     Args:
         response: Raw LLM response text
@@ -237,48 +404,15 @@ def parse_code_blocks(response: str) -> ParsedResponse:
         >>> parsed.code_blocks[0].filepath
         'src/main.py'
     """
-    result = ParsedResponse(raw_response=response)
-
-    # Find all code blocks
-    last_end = 0
-    for match in CODE_BLOCK_PATTERN.finditer(response):
-        # Capture explanation text before this code block
-        explanation = response[last_end : match.start()].strip()
-        if explanation:
-            result.explanations.append(explanation)
-
-        language_str = match.group(1) or ""
-        content = match.group(2).strip()
-
-        # Extract filepath from content
-        filepath, cleaned_content = extract_filepath(content)
-
-        # Create code block
-        block = CodeBlock(
-            content=cleaned_content,
-            language=Language.from_string(language_str),
-            filepath=filepath,
-            start_line=response[: match.start()].count("\n") + 1,
-            raw_block=match.group(0),
-        )
-
-        # Extract metadata for Python files
-        if block.is_python:
-            block.metadata = extract_python_metadata(cleaned_content)
-
-        result.code_blocks.append(block)
-        last_end = match.end()
-
-    # Capture any remaining explanation
-    remaining = response[last_end:].strip()
-    if remaining:
-        result.explanations.append(remaining)
+    parser = CodeBlockStreamParser()
+    parser.feed(response)
+    result = parser.finish()
 
     logger.debug(
         "Parsed code blocks",
         block_count=len(result.code_blocks),
-        languages=[b.language.value for b in result.code_blocks],
-        has_filepaths=any(b.filepath for b in result.code_blocks),
+        languages=lazy(lambda: [b.language.value for b in result.code_blocks]),
+        has_filepaths=lazy(lambda: any(b.filepath for b in result.code_blocks)),
     )
 
     return result
@@ -300,17 +434,15 @@ def extract_python_metadata(content: str) -> dict[str, Any]:
         "has_main": False,
     }
 
-    # Extract function names
-    func_pattern = re.compile(r"^(?:async\s+)?def\s+(\w+)\s*\(", re.MULTILINE)
-    metadata["functions"] = func_pattern.findall(content)
-
-    # Extract class names
-    class_pattern = re.compile(r"^class\s+(\w+)\s*[:\(]", re.MULTILINE)
-    metadata["classes"] = class_pattern.findall(content)
-
-    # Extract imports
-    import_pattern = re.compile(r"^(?:from\s+[\w.]+\s+)?import\s+.+$", re.MULTILINE)
-    metadata["imports"] = import_pattern.findall(content)
+    # Function and class names and import lines, in one pass
+    for match in _PYTHON_METADATA_PATTERN.finditer(content):
+        kind = match.lastgroup
+        if kind == "function":
+            metadata["functions"].append(match.group("function"))
+        elif kind == "class":
+            metadata["classes"].append(match.group("class"))
+        elif kind == "import":
+            metadata["imports"].append(match.group("import"))
 
     # Check for main block
     metadata["has_main"] = 'if __name__ == "__main__"' in content
@@ -8,22 +8,34 @@ Features:
 - Error classification (rate limit, timeout, API error, etc.)
 - State truncation for context length errors
 - Graceful degradation with fallback to simpler models
-- Per-node retry tracking
+- Per-node retry tracking, scoped to one workflow run
+- Retries resume ReAct loops from their last completed iteration
+
+Retry budgets belong to a workflow run, not to the process: each
+execution enters workflow_error_scope(), so concurrent workflows never
+share or reset each other's retry counts. Backend health, which is shared,
+is tracked by the circuit breakers in circuit_breaker.py instead.
 
 Example:
     # Wrap a node with error recovery
     resilient_planner = create_resilient_node(planner_node, "planner")
     workflow.add_node("planner", resilient_planner)
+
+    with workflow_error_scope():
+        await graph.ainvoke(initial_state)
 """
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 from typing import Any
 
 from langchain_core.runnables import RunnableConfig
 
 from src.agents.infrastructure.error_handler import ErrorHandler
+from src.agents.infrastructure.react_checkpoint import react_checkpoint_scope
 from src.agents.state import WorkflowState
 from src.core.logging import get_logger
 
@@ -32,8 +44,28 @@ logger = get_logger(__name__)
 # Type alias for node functions - matches LangGraph's expected signature
 NodeFunction = Callable[[WorkflowState, RunnableConfig], Awaitable[dict[str, Any]]]
 
-# Global error handler instance for the workflow
-_workflow_error_handler = ErrorHandler()
+# Error handler of the workflow run executing in the current context
+_workflow_error_handler: ContextVar[ErrorHandler | None] = ContextVar(
+    "workflow_error_handler", default=None
+)
+
+
+@contextmanager
+def workflow_error_scope() -> Iterator[ErrorHandler]:
+    """Give the nodes run inside this block their own retry state.
+
+    Enter once per workflow execution. Tasks spawned inside the block
+    (e.g. by LangGraph) inherit the scope.
+
+    Yields:
+        The ErrorHandler shared by the run's resilient nodes
+    """
+    handler = ErrorHandler()
+    token = _workflow_error_handler.set(handler)
+    try:
+        yield handler
+    finally:
+        _workflow_error_handler.reset(token)
 
 
 def create_resilient_node(
@@ -48,6 +80,8 @@ def create_resilient_node(
     - Error classification and appropriate recovery strategies
     - State truncation for context length errors
     - Graceful degradation with fallback to simpler models
+    - Resumption of ReAct loops from their last completed iteration, so a
+      retry does not repeat LLM turns and tool calls that already succeeded
 
     Args:
         node_fn: The original node async function
@@ -67,101 +101,107 @@ def create_resilient_node(
         state: WorkflowState,
         config: RunnableConfig = {},  # noqa: B006
     ) -> dict[str, Any]:
-        handler = _workflow_error_handler
+        # Outside a workflow scope, retries are tracked per invocation
+        handler = _workflow_error_handler.get() or ErrorHandler()
         current_state = state
         last_error: Exception | None = None
 
-        while True:
-            try:
-                result = await node_fn(current_state, config)
-
-                # Reset retry counts on success
-                handler.reset_retries(node_name)
-
-                # Add error recovery metadata if we recovered from errors
-                if last_error is not None:
-                    result.setdefault("metadata", {})
-                    result["metadata"]["recovered_from_error"] = True
-                    result["metadata"]["recovery_error_type"] = str(type(last_error).__name__)
-
-                return result
-
-            except Exception as e:
-                last_error = e
-                recovery = handler.handle_error(e, node_name, current_state, model_tier)
-
-                if recovery.should_retry:
-                    logger.info(
-                        "Node error - retrying",
-                        node=node_name,
-                        error_type=recovery.error_type.value,
-                        delay=recovery.retry_delay_seconds,
-                        attempt=recovery.current_retry,
-                        max_retries=recovery.max_retries,
-                    )
-
-                    if recovery.retry_delay_seconds > 0:
-                        await asyncio.sleep(recovery.retry_delay_seconds)
-
-                    # Use modified state if provided (e.g., truncated for context length)
-                    if recovery.modified_state:
-                        current_state = recovery.modified_state  # type: ignore[assignment]
-                    continue
-
-                elif recovery.should_fallback:
-                    logger.warning(
-                        "Node error - fallback required",
-                        node=node_name,
-                        error_type=recovery.error_type.value,
-                        fallback_tier=recovery.fallback_model_tier,
-                    )
-                    # For now, re-raise with context - future: implement model tier switching
-                    raise RuntimeError(
-                        f"Fallback to {recovery.fallback_model_tier} required: {e}"
-                    ) from e
-
-                else:
-                    # No recovery possible - add error to state and return
-                    logger.error(
-                        "Node error - recovery exhausted",
-                        node=node_name,
-                        error_type=recovery.error_type.value,
-                        error=str(e),
-                    )
-
-                    return {
-                        "error": f"Node '{node_name}' failed: {e}",
-                        "status": "error",
-                        "metadata": {
-                            **(state.get("metadata", {})),
-                            "error_node": node_name,
-                            "error_type": recovery.error_type.value,
-                            "error_message": str(e),
-                            "recovery_exhausted": True,
-                        },
-                    }
+        # ReAct loops checkpoint into this scope, so retries resume them
+        with react_checkpoint_scope() as checkpoints:
+            while True:
+                checkpoints.begin_attempt()
+                try:
+                    result = await node_fn(current_state, config)
+
+                    # Reset retry counts on success
+                    handler.reset_retries(node_name)
+
+                    # Add error recovery metadata if we recovered from errors
+                    if last_error is not None:
+                        result.setdefault("metadata", {})
+                        result["metadata"]["recovered_from_error"] = True
+                        result["metadata"]["recovery_error_type"] = str(type(last_error).__name__)
+
+                    return result
+
+                except Exception as e:
+                    last_error = e
+                    recovery = handler.handle_error(e, node_name, current_state, model_tier)
+
+                    if recovery.should_retry:
+                        logger.info(
+                            "Node error - retrying",
+                            node=node_name,
+                            error_type=recovery.error_type.value,
+                            delay=recovery.retry_delay_seconds,
+                            attempt=recovery.current_retry,
+                            max_retries=recovery.max_retries,
+                        )
+
+                        if recovery.retry_delay_seconds > 0:
+                            await asyncio.sleep(recovery.retry_delay_seconds)
+
+                        # Use modified state if provided (e.g., truncated for context length)
+                        if recovery.modified_state:
+                            current_state = recovery.modified_state  # type: ignore[assignment]
+                        continue
+
+                    elif recovery.should_fallback:
+                        logger.warning(
+                            "Node error - fallback required",
+                            node=node_name,
+                            error_type=recovery.error_type.value,
+                            fallback_tier=recovery.fallback_model_tier,
+                        )
+                        # For now, re-raise with context - future: implement model tier switching
+                        raise RuntimeError(
+                            f"Fallback to {recovery.fallback_model_tier} required: {e}"
+                        ) from e
+
+                    else:
+                        # No recovery possible - add error to state and return
+                        logger.error(
+                            "Node error - recovery exhausted",
+                            node=node_name,
+                            error_type=recovery.error_type.value,
+                            error=str(e),
+                        )
+
+                        return {
+                            "error": f"Node '{node_name}' failed: {e}",
+                            "status": "error",
+                            "metadata": {
+                                **(state.get("metadata", {})),
+                                "error_node": node_name,
+                                "error_type": recovery.error_type.value,
+                                "error_message": str(e),
+                                "recovery_exhausted": True,
+                            },
+                        }
 
     return resilient_wrapper
 
 
 def reset_workflow_error_handler() -> None:
-    """Reset the workflow error handler retry counts.
+    """Reset the retry counts of the current workflow run.
 
-    Call this at the start of a new workflow execution to ensure
-    clean retry state.
+    Does nothing outside workflow_error_scope(), where every node
+    invocation already starts with clean retry state.
     """
-    _workflow_error_handler.reset_retries()
+    handler = _workflow_error_handler.get()
+    if handler is not None:
+        handler.reset_retries()
 
 
-def get_error_handler() -> ErrorHandler:
-    """Get the global workflow error handler.
+def get_error_handler() -> ErrorHandler | None:
+    """Get the error handler of the current workflow run.
 
     Useful for inspection or manual error handling.
 
     Returns:
-        The global ErrorHandler instance
+        The run's ErrorHandler, or None outside workflow_error_scope()
     """
-    return _workflow_error_handler
+    return _workflow_error_handler.get()
 
 
 def get_node_retry_counts() -> dict[str, int]:
@@ -170,6 +210,8 @@ def get_node_retry_counts() -> dict[str, int]:
     Useful for debugging and monitoring.
 
     Returns:
-        Dictionary mapping node names to retry counts
+        Dictionary mapping node names to retry counts of the current
+        workflow run (empty outside workflow_error_scope())
     """
-    return _workflow_error_handler.retry_counts.copy()
+    handler = _workflow_error_handler.get()
+    return handler.retry_counts.copy() if handler is not None else {}
@@ -12,7 +12,7 @@ Features:
 - State persistence via AsyncPostgresSaver checkpointer
 """
 
-from typing import Annotated, Any, Literal, TypedDict
+from typing import Annotated, Any, Literal, NotRequired, TypedDict
 
 from langgraph.graph.message import add_messages
 
@@ -28,6 +28,10 @@ class LLMUsageMetadata(TypedDict, total=False):
         input_tokens: Number of input/prompt tokens
         output_tokens: Number of output/completion tokens
         total_tokens: Total tokens used (input + output)
+        cache_read_tokens: Input tokens served from the prompt cache
+        cache_creation_tokens: Input tokens written to the prompt cache
+        response_cache_hits: LLM calls served from the response cache
+        response_cache_misses: Cacheable LLM calls that were not cached yet
         latency_ms: Response time in milliseconds
         model: Model name used (e.g., "claude-3-5-sonnet-latest")
     """
@@ -35,6 +39,10 @@ class LLMUsageMetadata(TypedDict, total=False):
     input_tokens: int
     output_tokens: int
     total_tokens: int
+    cache_read_tokens: int
+    cache_creation_tokens: int
+    response_cache_hits: int
+    response_cache_misses: int
     latency_ms: int
     model: str
 
@@ -63,7 +71,10 @@ class PlanVersionMetadata(TypedDict, total=False):
     Attributes:
         version: Version number (1-based)
         created_at: ISO timestamp when this version was created
-        plan_content: The plan content for this version
+        plan_ref: Artifact reference of the plan content for this version,
+            when artifacts are persisted (see infrastructure.artifacts)
+        plan_content: Plan content for this version, when artifacts are
+            kept in memory only
         validation: Validation result for this version
         is_refinement: Whether this was a refinement of a previous version
         refinement_reason: Why refinement was needed (if applicable)
@@ -71,6 +82,7 @@ class PlanVersionMetadata(TypedDict, total=False):
 
     version: int
     created_at: str
+    plan_ref: str
     plan_content: str
     validation: PlanValidationMetadata
     is_refinement: bool
@@ -301,7 +313,10 @@ class WorkflowState(TypedDict):
         task_description: User-provided description of the coding task
         plan: Step-by-step plan created by the planner
         code: Generated code from the coder (primary file content)
-        code_files: Multi-file code generation result with all files
+        code_files: Multi-file code generation result; with a persistent
+            artifact store, each file holds an artifact reference to its
+            content and its diff against the previous iteration (see
+            infrastructure.artifacts.snapshot_code_files)
         test_results: Generated test code from the tester
         test_analysis: Structured test analysis with coverage and quality metrics
         review_feedback: Feedback from the reviewer
@@ -311,6 +326,10 @@ class WorkflowState(TypedDict):
         metadata: Additional context - see WorkflowMetadata for typed structure
         workspace_path: Path to the workspace directory for file operations (optional)
         tool_calls: List of tool calls made during workflow execution (optional)
+        speculative_review: Council verdicts computed while the tester ran,
+            keyed by the code they reviewed (see council.speculation)
+        review_memory: Unit fingerprints and open findings of the last council
+            review, for incremental re-review (see council.incremental)
 
     Note:
         The metadata field uses dict[str, Any] for flexibility, but follows
@@ -354,6 +373,8 @@ class WorkflowState(TypedDict):
     metadata: dict[str, Any]  # See WorkflowMetadata for typed structure
     workspace_path: str | None  # Path to workspace for file operations
     tool_calls: list[dict[str, Any]]  # Tool calls made during execution
+    speculative_review: dict[str, Any] | None  # Code-only judge verdicts
+    review_memory: dict[str, Any] | None  # Last council review's units and findings
 
 
 # =============================================================================
@@ -381,6 +402,9 @@ class JudgeVerdictState(TypedDict):
         tokens_used: Total tokens consumed by this judge
         latency_ms: Time taken for this judge's review
         cost_usd: Estimated cost for this judge's review (0.0 for local)
+        response_cached: Whether the verdict came from the LLM response cache
+        verdict_source: How the verdict was obtained from the response
+            (structured, json, extracted or fallback)
     """
 
     judge_name: str
@@ -395,6 +419,8 @@ class JudgeVerdictState(TypedDict):
     tokens_used: int
     latency_ms: int
     cost_usd: float
+    response_cached: NotRequired[bool]
+    verdict_source: NotRequired[str]
 
 
 class CouncilState(TypedDict):
@@ -425,6 +451,9 @@ class CouncilState(TypedDict):
         deliberation_time_ms: Total time for all judges
         total_cost_usd: Sum of costs across all judges
         llm_mode: Whether using "local" (vLLM) or "cloud" (Claude API)
+        cancelled_judges: Judges cancelled by quorum mode before voting
+        latency_saved_ms: Estimated latency saved by cancelling judges
+        cost_saved_usd: Estimated cost saved by cancelling judges
 
     Example:
         council_state = {
@@ -450,6 +479,9 @@ class CouncilState(TypedDict):
     deliberation_time_ms: int
     total_cost_usd: float
     llm_mode: Literal["local", "cloud"]
+    cancelled_judges: list[str]
+    latency_saved_ms: int
+    cost_saved_usd: float
 
 
 class CouncilWorkflowState(TypedDict):
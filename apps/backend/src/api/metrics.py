@@ -10,6 +10,7 @@ Endpoints:
 - GET /metrics/agent/{agent_type}: Agent-specific metrics
 - GET /metrics/pricing: Current LLM pricing info
 - POST /metrics/estimate: Monthly cost estimate
+- GET /metrics/rate-limits: Model rate limiter status and queue wait
 
 All endpoints require authentication.
 """
@@ -19,6 +20,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agents.infrastructure.models import get_rate_limiter
 from src.api.deps import get_current_user
 from src.core.database import get_db
 from src.core.logging import get_logger
@@ -33,6 +35,8 @@ from src.schemas.metrics import (
     MonthlyEstimateResponse,
     PeriodMetricsResponse,
     PricingInfoResponse,
+    PromptCacheResponse,
+    RateLimitStatusResponse,
     SavingsResponse,
     TaskMetricsResponse,
     TimeseriesDataPoint,
@@ -96,6 +100,7 @@ async def get_metrics_summary(
         total_latency_ms=metrics.total_latency_ms,
         costs=CostBreakdownResponse(**cost_data["costs"]),
         savings=SavingsResponse(**cost_data["savings"]),
+        prompt_cache=PromptCacheResponse(**cost_data["prompt_cache"]),
         by_agent=by_agent,
         models_used=metrics.models_used,
     )
@@ -154,6 +159,7 @@ async def get_task_metrics(
         by_agent=by_agent,
         costs=CostBreakdownResponse(**cost_data["costs"]),
         savings=SavingsResponse(**cost_data["savings"]),
+        prompt_cache=PromptCacheResponse(**cost_data["prompt_cache"]),
     )
 
 
@@ -270,6 +276,32 @@ async def get_pricing_info(
     )
 
 
+@router.get("/rate-limits", response_model=list[RateLimitStatusResponse])
+async def get_rate_limit_status(
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> list[RateLimitStatusResponse]:
+    """Get model rate limiter status.
+
+    Returns current usage, adaptive limits and queue wait time for each
+    model tier/backend that has received traffic since startup.
+
+    Returns:
+        List of RateLimitStatusResponse, one per tier/backend
+    """
+    logger.info("Fetching rate limit status", user_id=current_user.id)
+
+    statuses = get_rate_limiter().get_all_status()
+
+    return [
+        RateLimitStatusResponse(
+            backend=key.split(":")[0],
+            tier=key.split(":")[1],
+            **status,
+        )
+        for key, status in sorted(statuses.items())
+    ]
+
+
 @router.post("/estimate", response_model=MonthlyEstimateResponse)
 async def estimate_monthly_cost(
     request: MonthlyEstimateRequest,
@@ -362,4 +394,5 @@ async def get_global_metrics(
         models_used=metrics.models_used,
         costs=CostBreakdownResponse(**cost_data["costs"]),
         savings=SavingsResponse(**cost_data["savings"]),
+        prompt_cache=PromptCacheResponse(**cost_data["prompt_cache"]),
     )
@@ -97,6 +97,21 @@ class Settings(BaseSettings):
     local_llm_base_url: str = "http://localhost:8001/v1"
     local_llm_model: str = "Qwen/Qwen2.5-Coder-14B-Instruct-AWQ"
 
+    # Additional vLLM replicas serving the same model (OpenAI-compatible base URLs).
+    # When set, local requests are balanced over local_llm_base_url and these
+    # replicas, routing each to the replica with the fewest requests in flight
+    local_llm_replica_urls: list[str] = []
+    # When True, a request not answered within the p95 latency is duplicated on
+    # a second replica and the slower one is cancelled (trades GPU time for tail latency)
+    local_llm_hedging: bool = False
+    local_llm_hedge_min_delay: float = 1.0  # seconds, lower bound of the hedging delay
+    local_llm_health_check_interval: float = 15.0  # seconds between replica health checks
+
+    # Shared HTTP connection pool for LLM clients (one per backend)
+    llm_http_max_connections: int = 100
+    llm_http_max_keepalive_connections: int = 20
+    llm_http_keepalive_expiry: float = 120.0  # seconds an idle connection is kept
+
     # GitHub Integration (for code operations)
     github_token: str | None = None
 
@@ -132,6 +147,11 @@ class Settings(BaseSettings):
 
     # Tool Execution Configuration
     max_tool_iterations: int = 10  # Max ReAct loop iterations per agent node
+    # Context window of the local model (must match vLLM --max-model-len).
+    # ReAct loops compact tool history to fit it minus the completion reservation.
+    llm_context_window_tokens: int = 8192
+    # Turns whose tool outputs are always resent in full; older ones are elided
+    react_context_keep_recent_turns: int = 2
     enable_tool_execution: bool = True  # Whether agents can execute tools
 
     # Council Review
@@ -143,11 +163,73 @@ class Settings(BaseSettings):
     # Options: security, performance, maintainability
     council_judges: list[str] = ["security", "performance", "maintainability"]
 
+    # Stop waiting for judges once their votes can no longer change the
+    # council verdict (the deciding judges still finish their reviews)
+    council_early_quorum: bool = False
+
+    # Run the judges that only need the code (e.g. security) while the tester
+    # is still generating tests; the reviewer reuses their verdicts if the
+    # code has not changed since
+    enable_speculative_review: bool = False
+
+    # Re-review only the functions, classes and tests that changed since the
+    # previous council round, carrying forward open findings in unchanged code
+    council_incremental_review: bool = False
+    # Share of the reviewed source that may change before a full review is used
+    council_incremental_max_changed_ratio: float = 0.6
+
+    # Request judge verdicts through the backend's native structured output
+    # (a forced tool call on Claude, JSON-schema guided decoding on vLLM);
+    # verdicts are still parsed from text when a backend ignores it
+    structured_verdict_output: bool = True
+
     # Caching Configuration
     enable_result_caching: bool = False
     enable_plan_caching: bool = False
     cache_ttl_seconds: int = 3600
 
+    # LLM Response Cache
+    # When True, call sites that opt in (plan refinement, council judges) reuse
+    # the response of an identical earlier temperature-0 request
+    enable_llm_response_cache: bool = False
+    llm_response_cache_max_entries: int = 512  # in-process LRU size
+    llm_response_cache_redis: bool = False  # share cached responses between workers
+    # Directory of cached responses (one JSON file each), survives restarts
+    llm_response_cache_dir: str | None = None
+
+    # Code Analysis
+    # Parsed-code artifacts shared by the analyzers, keyed by source hash (0 disables)
+    ast_cache_max_entries: int = 128
+    # Format results of coder output files, keyed by content hash (0 disables)
+    format_cache_max_entries: int = 256
+    # Worker processes formatting multi-file output (0 formats on a thread)
+    format_process_workers: int = 4
+    # Minimum uncached source size (chars) before files go to worker processes
+    format_parallel_min_chars: int = 50_000
+
+    # Artifact Store
+    # Code files and plan versions referenced from workflow state by content hash
+    artifact_store_max_bytes: int = 256 * 1024 * 1024  # in-process LRU size
+    # Directory persisting artifacts so checkpoints resume after a restart
+    # (unset: checkpoints and run records keep plan text inline, no references)
+    artifact_store_dir: str | None = None
+
+    # Model Rate Limiting
+    # When True, every model call waits for admission by ModelRateLimiter
+    enable_model_rate_limiting: bool = True
+
+    # Model Circuit Breakers
+    # When True, a backend tier failing this many times in a row is skipped
+    # (calls fail fast, ModelPool hands out the next fallback tier) until a
+    # probe call succeeds after the recovery period
+    enable_circuit_breaker: bool = True
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_recovery_seconds: float = 30.0
+
+    # Prompt Prefix Caching
+    # When True, Claude requests mark tools, system prompt and history as cacheable
+    enable_prompt_caching: bool = True
+
     # Workflow Error Recovery
     enable_error_recovery: bool = True
     max_retry_attempts: int = 3
@@ -156,6 +238,48 @@ class Settings(BaseSettings):
     # When True, workflow state is persisted to PostgreSQL for resumption
     enable_checkpointing: bool = False
 
+    # Workspace Provisioning
+    # Ordered strategies for populating task workspaces from a source repository.
+    # Options: reflink, git_clone, hardlink, copy (copy is always the final fallback).
+    # hardlink shares inodes with the source; only enable it for read-only sources.
+    workspace_provisioning_strategies: list[str] = [
+        "reflink",
+        "git_clone",
+        "copy",
+    ]
+
+    # Workspace Disk Quota
+    # Maximum bytes a task may add to its workspace (0 disables the limit)
+    workspace_quota_bytes: int = 1024 * 1024 * 1024  # 1 GiB
+    # Full rescans that correct the running totals kept by the filesystem tools
+    workspace_reconcile_interval_ops: int = 200
+    workspace_reconcile_interval_seconds: int = 300
+
+    # Git Sessions
+    # Seconds cached `git status` and `git diff` output is reused; changes made
+    # by other processes (builds, test runs) are picked up once it expires
+    git_status_cache_ttl_seconds: float = 5.0
+
+    # Filesystem Ignore Rules
+    # Gitignore-syntax patterns applied by all filesystem tools, in addition to
+    # each workspace's .gitignore and .ignore files (which take precedence)
+    filesystem_ignore_patterns: list[str] = [
+        ".git/",
+        ".hg/",
+        ".svn/",
+        "__pycache__/",
+        ".mypy_cache/",
+        ".pytest_cache/",
+        ".ruff_cache/",
+        ".tox/",
+        ".venv/",
+        "venv/",
+        "node_modules/",
+        "bower_components/",
+        "site-packages/",
+        "*.pyc",
+    ]
+
     # Test Execution
     # When True, actually runs pytest in isolated temp directories
     # When False (default), uses simulated test execution
@@ -165,6 +289,12 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"
+    # Render and write log lines on a background thread instead of the caller's
+    log_async: bool = True
+    # Queued log events at which debug events are dropped (sampled from half of it)
+    log_queue_size: int = 10000
+    # Under backpressure, keep one debug event in this many
+    log_debug_sample_rate: int = 10
 
     @property
     def is_development(self) -> bool:
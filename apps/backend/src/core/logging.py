@@ -12,16 +12,550 @@ Usage Guidelines:
     - Use logger.error() for: caught exceptions, failed operations, invalid states
     - Use logger.warning() for: deprecations, unusual but valid conditions
     - Always include context: logger.info("event_name", user_id=123, action="login")
+    - Wrap fields that are costly to compute in lazy(), so they are only
+      computed when the event is logged:
+      logger.debug("tools_loaded", names=lazy(lambda: [t.name for t in tools]))
+
+Pipeline:
+    Tool calls, nodes and ReAct iterations each emit several events, so the
+    work done per event on the event loop is kept small:
+
+    1. Calls below the configured level return at once, before any
+       processor runs (a filtering bound logger)
+    2. Enabled events resolve their lazy fields, capture exception info and
+       snapshot mutable values (containers are copied, other objects
+       replaced by their repr), then are queued with the time they were logged at; they
+       do not go through the standard library's record creation and handlers
+    3. A background thread (LogWriter) adds the timestamp, level and logger
+       name, renders the event (JSON through orjson when available) and
+       writes whatever is queued in one write
+
+    Records of standard library loggers (uvicorn, httpx, ...) are queued to
+    the same writer and rendered the same way.
+
+    When the queue backs up, debug events are sampled and then dropped;
+    events at INFO and above are always kept. get_logging_stats() reports
+    how many were lost. With log_async disabled, and after
+    shutdown_logging(), events are rendered and written in the caller.
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
-from typing import Any
+import time
+from collections.abc import Callable, MutableMapping
+from datetime import date, datetime, timedelta
+from datetime import time as time_of_day
+from decimal import Decimal
+from enum import Enum
+from functools import cache
+from pathlib import PurePath
+from threading import Lock, Thread
+from typing import Any, TextIO
+from uuid import UUID
 
 import structlog
 
 from src.core.config import settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with langsmith
+    orjson = None  # type: ignore[assignment]
+
+# Level of each logger method, for backpressure decisions
+METHOD_LEVELS: dict[str, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "msg": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+
+# Level names rendered for logger method aliases
+LEVEL_NAMES: dict[str, str] = {
+    "msg": "info",
+    "warn": "warning",
+    "exception": "error",
+    "fatal": "critical",
+}
+
+# Sentinel asking the writer thread to stop
+_STOP = object()
+
+# Immutable values queued as they are; the renderer formats them natively
+_IMMUTABLE_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    bytes,
+    Decimal,
+    UUID,
+    datetime,
+    date,
+    time_of_day,
+    timedelta,
+    Enum,
+    PurePath,
+)
+
+# Fields holding data the writer formats itself
+_UNSNAPSHOTTED_FIELDS = frozenset({"exc_info", "_record"})
+
+
+class Lazy:
+    """A log field computed only when its event is logged."""
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        """Initialize the field.
+
+        Args:
+            func: Function computing the value
+            *args: Arguments passed to func
+        """
+        self.func = func
+        self.args = args
+
+    def __call__(self) -> Any:
+        return self.func(*self.args)
+
+    def resolve(self) -> Any:
+        """Compute the value, describing the error if computing it fails."""
+        try:
+            return self.func(*self.args)
+        except Exception as e:
+            return f"<lazy field failed: {e!r}>"
+
+    def __repr__(self) -> str:
+        # Renderers outside the configured pipeline (structlog's defaults)
+        # format fields with repr() or str()
+        return repr(self.resolve())
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+
+def lazy(func: Callable[..., Any], *args: Any) -> Lazy:
+    """Defer computing a log field until the event passes the level check.
+
+    Pass loop variables as args rather than closing over them.
+
+    Args:
+        func: Function computing the value
+        *args: Arguments passed to func
+
+    Returns:
+        A field resolved by the logging pipeline
+
+    Example:
+        logger.debug("tools_loaded", tool_names=lazy(lambda: [t.name for t in tools]))
+    """
+    return Lazy(func, *args)
+
+
+def resolve_lazy_fields(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """Replace lazy fields with their values."""
+    for key, value in event_dict.items():
+        if type(value) is Lazy:
+            event_dict[key] = value.resolve()
+    return event_dict
+
+
+def snapshot_value(value: Any) -> Any:
+    """Copy a value as it is now, so later changes do not reach the log line.
+
+    Lists, tuples and dicts are copied recursively, sets shallowly; other
+    mutable objects are replaced by their repr(), which is how both
+    renderers write objects they have no format for.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if type(value) is list:
+        return [snapshot_value(item) for item in value]
+    if type(value) is dict:
+        return {key: snapshot_value(item) for key, item in value.items()}
+    if type(value) is tuple:
+        return tuple(snapshot_value(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return value.copy()
+    try:
+        return repr(value)
+    except Exception as e:
+        return f"<unprintable {type(value).__name__}: {e!r}>"
+
+
+def snapshot_values(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """Snapshot mutable field values before the event is queued."""
+    for key, value in event_dict.items():
+        if not isinstance(value, _IMMUTABLE_TYPES) and key not in _UNSNAPSHOTTED_FIELDS:
+            event_dict[key] = snapshot_value(value)
+    return event_dict
+
+
+def capture_exc_info(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """Capture the exception being handled, before the event changes thread."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+# The last second formatted by format_timestamp, and its text
+_timestamp_second: tuple[int, str] = (-1, "")
+
+
+def format_timestamp(created: float) -> str:
+    """Format a time.time() value as an ISO UTC timestamp.
+
+    The date and time up to the second are formatted once per second;
+    strftime was the largest cost of rendering an event.
+    """
+    global _timestamp_second
+
+    second = int(created)
+    cached_second, prefix = _timestamp_second
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _timestamp_second = (second, prefix)
+    return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+
+
+def add_record_timestamp(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """Add the time a standard library record was logged at."""
+    record = event_dict.get("_record")
+    event_dict["timestamp"] = format_timestamp(record.created if record else time.time())
+    return event_dict
+
+
+def dumps_json(obj: Any, default: Callable[[Any], Any] | None = None, **kwargs: Any) -> str:
+    """Serialize an event to JSON, with orjson when it is installed.
+
+    Args:
+        obj: Event dict
+        default: Fallback for values that are not JSON types
+        **kwargs: json.dumps options, used only without orjson
+
+    Returns:
+        The JSON text
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=default or str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(obj, default=default or str, **kwargs)
+
+
+class EventRenderer:
+    """Renders queued events and standard library records as log lines."""
+
+    def __init__(self, use_json: bool, use_colors: bool = False) -> None:
+        """Initialize the renderer.
+
+        Args:
+            use_json: Render JSON lines (otherwise console lines)
+            use_colors: Color console lines
+        """
+        self.renderer: Any
+        if use_json:
+            self.renderer = structlog.processors.JSONRenderer(serializer=dumps_json)
+        else:
+            self.renderer = structlog.dev.ConsoleRenderer(colors=use_colors)
+        self.processors: list[Any] = [
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+        ]
+        self.record_formatter = structlog.stdlib.ProcessorFormatter(
+            processors=[
+                structlog.stdlib.add_logger_name,
+                structlog.stdlib.add_log_level,
+                add_record_timestamp,
+                *self.processors,
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                self.renderer,
+            ],
+        )
+
+    def __call__(self, item: Any) -> str:
+        """Render a queued item.
+
+        Args:
+            item: A (logger name, method name, event dict, time) tuple, or a
+                standard library LogRecord
+
+        Returns:
+            The log line, without a trailing newline
+        """
+        if isinstance(item, logging.LogRecord):
+            return self.record_formatter.format(item)
+
+        name, method_name, event_dict, created = item
+        event_dict["logger"] = name
+        event_dict["level"] = LEVEL_NAMES.get(method_name, method_name)
+        event_dict["timestamp"] = format_timestamp(created)
+        for processor in self.processors:
+            event_dict = processor(None, method_name, event_dict)
+        return str(self.renderer(None, method_name, event_dict))
+
+
+class LogWriter:
+    """Renders and writes log events, on a background thread when started.
+
+    Debug events are kept one in debug_sample_rate once the queue holds half
+    of capacity, and dropped once it holds capacity; events at INFO and
+    above are always queued.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[Any], str],
+        stream: TextIO,
+        capacity: int = 10000,
+        debug_sample_rate: int = 10,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            render: Function rendering a queued item as a line
+            stream: Stream the lines are written to
+            capacity: Queue depth at which debug events are dropped
+            debug_sample_rate: Debug events kept under backpressure, one in N
+        """
+        self.render = render
+        self.stream = stream
+        self.capacity = capacity
+        self.debug_sample_rate = max(debug_sample_rate, 1)
+        self.queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self.dropped = 0
+        self.sampled_out = 0
+        self._debug_seen = 0
+        self._thread: Thread | None = None
+        self._write_lock = Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether events are written by the background thread."""
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start writing on a background thread."""
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Write out the queued events and stop the background thread."""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self.queue.put(_STOP)
+            thread.join()
+
+    def submit(self, level: int, item: Any) -> None:
+        """Write an event, or queue it when running in the background.
+
+        Args:
+            level: The event's logging level
+            item: Item to render (see EventRenderer)
+        """
+        if self._thread is None:
+            self._write([self._render(item)])
+            return
+
+        if level <= logging.DEBUG:
+            depth = self.queue.qsize()
+            if depth >= self.capacity:
+                self.dropped += 1
+                return
+            if depth >= self.capacity // 2:
+                self._debug_seen += 1
+                if self._debug_seen % self.debug_sample_rate:
+                    self.sampled_out += 1
+                    return
+        self.queue.put(item)
+
+    def _render(self, item: Any) -> str:
+        try:
+            return self.render(item)
+        except Exception as e:
+            return f"<unrenderable log event {item!r}: {e!r}>"
+
+    def _write(self, lines: list[str]) -> None:
+        with self._write_lock:
+            try:
+                self.stream.write("\n".join(lines) + "\n")
+                self.stream.flush()
+            except (OSError, ValueError):
+                pass  # Closed or broken stream; logging must not fail callers
+
+    def _run(self) -> None:
+        """Render and write queued events, a batch per write, until stopped."""
+        while True:
+            items = [self.queue.get()]
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is _STOP for item in items)
+            lines = [self._render(item) for item in items if item is not _STOP]
+            if lines:
+                self._write(lines)
+            if stop:
+                return
+
+
+class QueueLogger:
+    """Final structlog logger handing events to the installed LogWriter.
+
+    The writer is looked up per event, so loggers cached on first use keep
+    working after logging is configured again.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str = "", *args: Any) -> None:
+        """Initialize the logger.
+
+        Args:
+            name: Logger name
+            *args: Further structlog.get_logger arguments (ignored)
+        """
+        self.name = name
+
+    def _submit(self, method_name: str, event_dict: dict[str, Any]) -> None:
+        writer = _writer or _fallback_writer()
+        writer.submit(
+            METHOD_LEVELS.get(method_name, logging.INFO),
+            (self.name, method_name, event_dict, time.time()),
+        )
+
+    def debug(self, event_dict: dict[str, Any]) -> None:
+        self._submit("debug", event_dict)
+
+    def info(self, event_dict: dict[str, Any]) -> None:
+        self._submit("info", event_dict)
+
+    def warning(self, event_dict: dict[str, Any]) -> None:
+        self._submit("warning", event_dict)
+
+    def error(self, event_dict: dict[str, Any]) -> None:
+        self._submit("error", event_dict)
+
+    def critical(self, event_dict: dict[str, Any]) -> None:
+        self._submit("critical", event_dict)
+
+    msg = info
+    warn = warning
+    exception = error
+    fatal = critical
+
+
+def to_writer(logger: Any, method_name: str, event_dict: MutableMapping[str, Any]) -> Any:
+    """Final processor: pass the event dict on to the QueueLogger as is."""
+    return (event_dict,), {}
+
+
+class WriterHandler(logging.Handler):
+    """Standard library handler sending records to the LogWriter."""
+
+    def __init__(self, writer: LogWriter) -> None:
+        """Initialize the handler.
+
+        Args:
+            writer: Writer receiving the records
+        """
+        super().__init__()
+        self.writer = writer
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a record, its message formatted with the arguments of now."""
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+            self.writer.submit(record.levelno, record)
+        except Exception:
+            self.handleError(record)
+
+
+# Writer and handler installed by configure_logging
+_writer: LogWriter | None = None
+_handler: WriterHandler | None = None
+_logging_lock = Lock()
+
+
+@cache
+def _fallback_writer() -> LogWriter:
+    """Writer for cached loggers that outlive the installed writer.
+
+    Writes console lines to stderr in the caller.
+    """
+    return LogWriter(EventRenderer(use_json=False), sys.stderr)
+
+
+def shutdown_logging() -> None:
+    """Write out queued log events and stop the background thread.
+
+    The writer stays installed: events logged afterwards (e.g. by other
+    atexit handlers) are rendered and written in the caller.
+    """
+    with _logging_lock:
+        if _writer is not None:
+            _writer.close()
+
+
+def reset_logging() -> None:
+    """Shut down logging and uninstall the writer and its handler.
+
+    Useful for testing.
+    """
+    global _writer, _handler
+
+    with _logging_lock:
+        if _handler is not None:
+            logging.getLogger().removeHandler(_handler)
+            _handler = None
+        if _writer is not None:
+            _writer.close()
+            _writer = None
+
+
+def get_logging_stats() -> dict[str, Any]:
+    """Get background logging statistics.
+
+    Returns:
+        Whether logging is asynchronous, the queue depth, and the debug
+        events dropped or sampled out under backpressure
+    """
+    writer = _writer
+    if writer is None:
+        return {"async": False, "queued": 0, "dropped": 0, "sampled_out": 0}
+    return {
+        "async": writer.running,
+        "queued": writer.queue.qsize(),
+        "dropped": writer.dropped,
+        "sampled_out": writer.sampled_out,
+    }
+
 
 def configure_logging() -> None:
     """
@@ -30,9 +564,15 @@ def configure_logging() -> None:
     Sets up structlog with appropriate processors for development and production.
     Development: colored console output, DEBUG level by default
     Production: JSON format, INFO level by default
+
+    May be called again (e.g. after changing settings); the previous
+    writer is flushed and replaced.
     """
+    global _writer, _handler
+
     # Determine effective log level based on environment
     effective_log_level = settings.log_level.upper()
+    level = getattr(logging, effective_log_level)
 
     # Determine if we should use colored output
     use_colors = settings.is_development and sys.stderr.isatty()
@@ -42,38 +582,43 @@ def configure_logging() -> None:
         settings.is_production and settings.log_format != "console"
     )
 
-    # Configure processors based on environment
+    reset_logging()
+    writer = LogWriter(
+        EventRenderer(use_json, use_colors),
+        sys.stdout,
+        capacity=settings.log_queue_size,
+        debug_sample_rate=settings.log_debug_sample_rate,
+    )
+    if settings.log_async:
+        writer.start()
+
+    # Processors run in the caller, only for enabled events; timestamps,
+    # levels and rendering are added by the writer
     processors: list[Any] = [
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
+        resolve_lazy_fields,
         structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
+        capture_exc_info,
+        snapshot_values,
+        to_writer,
     ]
 
-    if use_json:
-        processors.append(structlog.processors.JSONRenderer())
-    else:
-        processors.append(structlog.dev.ConsoleRenderer(colors=use_colors))
-
     # Configure structlog
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=QueueLogger,
         cache_logger_on_first_use=True,
     )
 
     # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, effective_log_level),
-    )
+    with _logging_lock:
+        _writer = writer
+        _handler = WriterHandler(writer)
+        root = logging.getLogger()
+        root.addHandler(_handler)
+        root.setLevel(level)
 
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -81,7 +626,11 @@ def configure_logging() -> None:
     logging.getLogger("uvicorn.access").setLevel(logging.INFO)
 
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+# Queued events are written out when the interpreter exits
+atexit.register(shutdown_logging)
+
+
+def get_logger(name: str) -> structlog.typing.FilteringBoundLogger:
     """
     Get a logger instance.
 
@@ -9,7 +9,9 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from src.agents.infrastructure.models import close_model_pool
 from src.agents.infrastructure.tracing import configure_tracing, get_tracing_status
+from src.agents.processing.formatter import shutdown_format_pool
 from src.api import (
     admin,
     agents,
@@ -30,6 +32,7 @@ from src.core.exception_handlers import (
 )
 from src.core.exceptions import CodeGraphException
 from src.core.logging import configure_logging, get_logger
+from src.tools.git import close_git_sessions
 
 # Configure logging
 configure_logging()
@@ -65,6 +68,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("application_shutdown")
+    await close_model_pool()
+    shutdown_format_pool()
+    await close_git_sessions()
     await close_db()
 
 
@@ -51,6 +51,8 @@ class UsageMetrics(Base):
         input_tokens: Number of input/prompt tokens consumed.
         output_tokens: Number of output/completion tokens generated.
         total_tokens: Sum of input and output tokens.
+        cache_read_tokens: Input tokens served from the prompt cache.
+        cache_creation_tokens: Input tokens written to the prompt cache.
         model_used: Name of the model used (e.g., "Qwen/Qwen2.5-Coder-14B").
         latency_ms: Time taken for the LLM call in milliseconds.
         recorded_at: Timestamp when the metrics were recorded.
@@ -80,6 +82,14 @@ class UsageMetrics(Base):
     output_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     total_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
+    # Prompt cache metrics (both are included in input_tokens)
+    cache_read_tokens: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    cache_creation_tokens: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Model and performance
     model_used: Mapped[str] = mapped_column(String(200), nullable=False)
     latency_ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
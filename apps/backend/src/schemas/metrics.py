@@ -46,6 +46,18 @@ class SavingsResponse(BaseModel):
     vs_o3: float = Field(ge=0)
 
 
+class PromptCacheResponse(BaseModel):
+    """Prompt cache usage, hit rate and savings versus uncached input."""
+
+    cache_read_tokens: int = Field(default=0, ge=0, description="Input tokens read from cache")
+    cache_creation_tokens: int = Field(default=0, ge=0, description="Input tokens written to cache")
+    hit_rate: float = Field(default=0.0, ge=0, le=1, description="Share of input read from cache")
+    savings: dict[str, float] = Field(
+        default_factory=dict,
+        description="Input cost saved per model (negative if writes were not reused)",
+    )
+
+
 class TaskMetricsResponse(BaseModel):
     """Aggregated metrics for a single task."""
 
@@ -58,6 +70,7 @@ class TaskMetricsResponse(BaseModel):
     by_agent: dict[str, AgentMetricsResponse]
     costs: CostBreakdownResponse
     savings: SavingsResponse
+    prompt_cache: PromptCacheResponse = Field(default_factory=PromptCacheResponse)
 
 
 class PeriodMetricsResponse(BaseModel):
@@ -75,6 +88,7 @@ class PeriodMetricsResponse(BaseModel):
     models_used: dict[str, int] = Field(description="Token count by model name")
     costs: CostBreakdownResponse
     savings: SavingsResponse
+    prompt_cache: PromptCacheResponse = Field(default_factory=PromptCacheResponse)
 
 
 class MetricsSummaryResponse(BaseModel):
@@ -87,6 +101,7 @@ class MetricsSummaryResponse(BaseModel):
     total_latency_ms: int = Field(ge=0)
     costs: CostBreakdownResponse
     savings: SavingsResponse
+    prompt_cache: PromptCacheResponse = Field(default_factory=PromptCacheResponse)
     by_agent: dict[str, AgentMetricsResponse]
     models_used: dict[str, int]
 
@@ -145,6 +160,8 @@ class UsageMetricsResponse(BaseModel):
     input_tokens: int
     output_tokens: int
     total_tokens: int
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
     model_used: str
     latency_ms: int
     recorded_at: datetime
@@ -179,3 +196,22 @@ class MonthlyEstimateResponse(BaseModel):
     input_tokens: int = Field(ge=0)
     output_tokens: int = Field(ge=0)
     costs: CostBreakdownResponse
+
+
+class RateLimitStatusResponse(BaseModel):
+    """Admission-control status of one model tier/backend."""
+
+    backend: str
+    tier: str
+    current_rpm: int = Field(ge=0)
+    max_rpm: int = Field(ge=0)
+    effective_rpm: int = Field(ge=0, description="Limit after throttling adaptation")
+    current_tpm: int = Field(ge=0)
+    max_tpm: int = Field(ge=0)
+    effective_tpm: int = Field(ge=0)
+    queue_depth: int = Field(ge=0, description="Requests currently waiting")
+    admitted_requests: int = Field(ge=0)
+    queued_requests: int = Field(ge=0, description="Requests that had to wait")
+    rate_limited_responses: int = Field(ge=0, description="429 responses seen")
+    avg_queue_wait_ms: float = Field(ge=0)
+    max_queue_wait_ms: float = Field(ge=0)
@@ -63,67 +63,122 @@ class CostCalculator:
     - o4-mini:  $0.15 input, $0.60 output (Haiku tier - fast/cheap)
     - GPT-5.2:  $3.00 input, $12.00 output (Sonnet tier - workhorse)
     - o3:       $20.00 input, $80.00 output (Opus tier - complex reasoning)
+
+    Prompt caching: Anthropic bills cache reads at 10% and cache writes
+    at 125% of the input price. OpenAI discounts cached input and does
+    not charge extra for writes.
     """
 
     # Pricing per 1M tokens
     PRICING = {
         # Anthropic (December 2025)
-        "claude_haiku": {"input": 0.80, "output": 4.00},
-        "claude_sonnet": {"input": 3.00, "output": 15.00},
-        "claude_opus": {"input": 15.00, "output": 75.00},
+        "claude_haiku": {"input": 0.80, "output": 4.00, "cache_read": 0.08, "cache_write": 1.00},
+        "claude_sonnet": {"input": 3.00, "output": 15.00, "cache_read": 0.30, "cache_write": 3.75},
+        "claude_opus": {"input": 15.00, "output": 75.00, "cache_read": 1.50, "cache_write": 18.75},
         # OpenAI (December 2025) - tier equivalents
-        "o4_mini": {"input": 0.15, "output": 0.60},  # Haiku tier
-        "gpt52": {"input": 3.00, "output": 12.00},  # Sonnet tier
-        "o3": {"input": 20.00, "output": 80.00},  # Opus tier
+        "o4_mini": {
+            "input": 0.15,
+            "output": 0.60,
+            "cache_read": 0.0375,
+            "cache_write": 0.15,
+        },  # Haiku tier
+        "gpt52": {"input": 3.00, "output": 12.00, "cache_read": 0.30, "cache_write": 3.00},
+        "o3": {"input": 20.00, "output": 80.00, "cache_read": 5.00, "cache_write": 20.00},
     }
 
+    @classmethod
+    def _model_cost(
+        cls,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
+    ) -> float:
+        """Cost of a token mix for one priced model.
+
+        Cached tokens are part of input_tokens; only the remainder is
+        billed at the full input price.
+        """
+        pricing = cls.PRICING[model]
+        uncached_tokens = max(input_tokens - cache_read_tokens - cache_creation_tokens, 0)
+        return (
+            uncached_tokens * pricing["input"]
+            + cache_read_tokens * pricing["cache_read"]
+            + cache_creation_tokens * pricing["cache_write"]
+            + output_tokens * pricing["output"]
+        ) / 1_000_000
+
     @classmethod
     def calculate(
         cls,
         input_tokens: int,
         output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
     ) -> CostBreakdown:
         """Calculate cost for given token counts.
 
         Args:
-            input_tokens: Number of input/prompt tokens
+            input_tokens: Number of input/prompt tokens (including cached tokens)
             output_tokens: Number of output/completion tokens
+            cache_read_tokens: Input tokens served from the prompt cache
+            cache_creation_tokens: Input tokens written to the prompt cache
 
         Returns:
             CostBreakdown with costs for each provider/model
         """
-        # Convert to millions for pricing calculation
-        input_millions = input_tokens / 1_000_000
-        output_millions = output_tokens / 1_000_000
+        costs = {
+            model: cls._model_cost(
+                model, input_tokens, output_tokens, cache_read_tokens, cache_creation_tokens
+            )
+            for model in cls.PRICING
+        }
 
         return CostBreakdown(
             local_cost=0.0,  # Local inference is free
-            claude_haiku=(
-                input_millions * cls.PRICING["claude_haiku"]["input"]
-                + output_millions * cls.PRICING["claude_haiku"]["output"]
-            ),
-            claude_sonnet=(
-                input_millions * cls.PRICING["claude_sonnet"]["input"]
-                + output_millions * cls.PRICING["claude_sonnet"]["output"]
-            ),
-            claude_opus=(
-                input_millions * cls.PRICING["claude_opus"]["input"]
-                + output_millions * cls.PRICING["claude_opus"]["output"]
-            ),
-            o4_mini=(
-                input_millions * cls.PRICING["o4_mini"]["input"]
-                + output_millions * cls.PRICING["o4_mini"]["output"]
-            ),
-            gpt52=(
-                input_millions * cls.PRICING["gpt52"]["input"]
-                + output_millions * cls.PRICING["gpt52"]["output"]
-            ),
-            o3=(
-                input_millions * cls.PRICING["o3"]["input"]
-                + output_millions * cls.PRICING["o3"]["output"]
-            ),
+            claude_haiku=costs["claude_haiku"],
+            claude_sonnet=costs["claude_sonnet"],
+            claude_opus=costs["claude_opus"],
+            o4_mini=costs["o4_mini"],
+            gpt52=costs["gpt52"],
+            o3=costs["o3"],
         )
 
+    @classmethod
+    def calculate_cache_savings(
+        cls,
+        input_tokens: int,
+        cache_read_tokens: int,
+        cache_creation_tokens: int = 0,
+    ) -> dict[str, Any]:
+        """Calculate prompt cache hit rate and what caching saved per model.
+
+        Savings compare the input cost with caching against billing every
+        input token at the full price; output tokens are unaffected.
+        Savings can be negative when cache writes were never read back.
+
+        Args:
+            input_tokens: Number of input/prompt tokens (including cached tokens)
+            cache_read_tokens: Input tokens served from the prompt cache
+            cache_creation_tokens: Input tokens written to the prompt cache
+
+        Returns:
+            Dictionary with token counts, hit rate and savings per model
+        """
+        savings = {
+            f"vs_{model}": cls._model_cost(model, input_tokens, 0)
+            - cls._model_cost(model, input_tokens, 0, cache_read_tokens, cache_creation_tokens)
+            for model in cls.PRICING
+        }
+
+        return {
+            "cache_read_tokens": cache_read_tokens,
+            "cache_creation_tokens": cache_creation_tokens,
+            "hit_rate": cache_read_tokens / input_tokens if input_tokens > 0 else 0.0,
+            "savings": savings,
+        }
+
     @classmethod
     def calculate_total(
         cls,
@@ -155,11 +210,15 @@ class CostCalculator:
             metrics_summary: TaskMetricsSummary or PeriodMetricsSummary
 
         Returns:
-            Dictionary with tokens and cost breakdown
+            Dictionary with tokens, cost breakdown and prompt cache savings
         """
+        cache_read_tokens = getattr(metrics_summary, "cache_read_tokens", 0)
+        cache_creation_tokens = getattr(metrics_summary, "cache_creation_tokens", 0)
         breakdown = cls.calculate(
             input_tokens=metrics_summary.input_tokens,
             output_tokens=metrics_summary.output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_creation_tokens=cache_creation_tokens,
         )
 
         return {
@@ -175,6 +234,11 @@ class CostCalculator:
                 "vs_gpt52": breakdown.gpt52,
                 "vs_o3": breakdown.o3,
             },
+            "prompt_cache": cls.calculate_cache_savings(
+                input_tokens=metrics_summary.input_tokens,
+                cache_read_tokens=cache_read_tokens,
+                cache_creation_tokens=cache_creation_tokens,
+            ),
         }
 
     @classmethod
@@ -58,6 +58,8 @@ class TaskMetricsSummary:
     total_runs: int
     total_latency_ms: int
     by_agent: dict[str, AgentMetricsSummary]
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
 
 
 @dataclass
@@ -74,6 +76,8 @@ class PeriodMetricsSummary:
     total_latency_ms: int
     by_agent: dict[str, AgentMetricsSummary]
     models_used: dict[str, int]
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
 
 
 class MetricsService:
@@ -96,6 +100,8 @@ class MetricsService:
         model_used: str,
         latency_ms: int,
         agent_run_id: int | None = None,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
     ) -> UsageMetrics:
         """Record usage metrics for an LLM call.
 
@@ -107,6 +113,8 @@ class MetricsService:
             model_used: Name of the model used
             latency_ms: Time taken for the LLM call in milliseconds
             agent_run_id: Optional ID of the associated AgentRun
+            cache_read_tokens: Input tokens served from the prompt cache
+            cache_creation_tokens: Input tokens written to the prompt cache
 
         Returns:
             Created UsageMetrics record
@@ -120,6 +128,8 @@ class MetricsService:
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             total_tokens=total_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_creation_tokens=cache_creation_tokens,
             model_used=model_used,
             latency_ms=latency_ms,
             recorded_at=datetime.now(UTC),
@@ -133,6 +143,7 @@ class MetricsService:
             task_id=task_id,
             agent_type=agent_type.value,
             total_tokens=total_tokens,
+            cache_read_tokens=cache_read_tokens,
             latency_ms=latency_ms,
         )
 
@@ -168,6 +179,8 @@ class MetricsService:
         input_tokens = 0
         output_tokens = 0
         total_latency = 0
+        cache_read_tokens = 0
+        cache_creation_tokens = 0
 
         for m in metrics:
             agent_key = m.agent_type.value
@@ -190,6 +203,8 @@ class MetricsService:
             input_tokens += m.input_tokens
             output_tokens += m.output_tokens
             total_latency += m.latency_ms
+            cache_read_tokens += m.cache_read_tokens
+            cache_creation_tokens += m.cache_creation_tokens
 
         # Convert to AgentMetricsSummary
         agent_summaries = {}
@@ -213,6 +228,8 @@ class MetricsService:
             total_runs=len(metrics),
             total_latency_ms=total_latency,
             by_agent=agent_summaries,
+            cache_read_tokens=cache_read_tokens,
+            cache_creation_tokens=cache_creation_tokens,
         )
 
     async def get_metrics_for_period(
@@ -280,6 +297,8 @@ class MetricsService:
         input_tokens = 0
         output_tokens = 0
         total_latency = 0
+        cache_read_tokens = 0
+        cache_creation_tokens = 0
 
         for m in metrics:
             agent_key = m.agent_type.value
@@ -302,6 +321,8 @@ class MetricsService:
             input_tokens += m.input_tokens
             output_tokens += m.output_tokens
             total_latency += m.latency_ms
+            cache_read_tokens += m.cache_read_tokens
+            cache_creation_tokens += m.cache_creation_tokens
 
             # Track model usage
             if m.model_used not in models_used:
@@ -333,6 +354,8 @@ class MetricsService:
             total_latency_ms=total_latency,
             by_agent=agent_summaries,
             models_used=models_used,
+            cache_read_tokens=cache_read_tokens,
+            cache_creation_tokens=cache_creation_tokens,
         )
 
     async def get_agent_metrics(
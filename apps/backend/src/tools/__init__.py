@@ -39,6 +39,7 @@ from src.tools.exceptions import (
     ToolError,
     ToolExecutionError,
     WorkspaceNotFoundError,
+    WorkspaceQuotaExceededError,
 )
 from src.tools.execution import (
     SandboxManager,
@@ -183,6 +184,7 @@ __all__ = [
     "PathValidationError",
     "PermissionDeniedError",
     "WorkspaceNotFoundError",
+    "WorkspaceQuotaExceededError",
     "FileNotFoundInWorkspaceError",
     "GitOperationError",
     "DatabaseToolError",
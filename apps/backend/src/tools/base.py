@@ -186,6 +186,41 @@ class ToolResult:
 _current_context: ToolContext | None = None
 
 
+# Listeners notified when a tool modifies files in a workspace
+_workspace_write_listeners: list[Callable[[str, str], None]] = []
+
+
+def on_workspace_write(listener: Callable[[str, str], None]) -> None:
+    """Register a listener for workspace write events.
+
+    Listeners are called with (workspace_path, relative_path) after a
+    tool creates, modifies or deletes something in the workspace. They
+    are used to invalidate caches derived from workspace contents.
+
+    Args:
+        listener: Callback to register
+    """
+    _workspace_write_listeners.append(listener)
+
+
+def notify_workspace_write(workspace_path: str, path: str) -> None:
+    """Notify listeners that a tool modified the workspace.
+
+    Args:
+        workspace_path: Root of the modified workspace
+        path: Path relative to the workspace root that changed
+    """
+    for listener in _workspace_write_listeners:
+        try:
+            listener(workspace_path, path)
+        except Exception as e:
+            logger.warning(
+                "workspace_write_listener_failed",
+                path=path,
+                error=str(e),
+            )
+
+
 def get_current_context() -> ToolContext | None:
     """Get the current tool execution context.
 
@@ -82,6 +82,30 @@ class WorkspaceNotFoundError(ToolError):
         self.workspace_path = workspace_path
 
 
+class WorkspaceQuotaExceededError(ToolError):
+    """Raised when a write would exceed the workspace disk quota."""
+
+    def __init__(self, task_id: int, quota_bytes: int, requested_bytes: int) -> None:
+        """Initialize workspace quota exceeded error.
+
+        Args:
+            task_id: The task whose quota was exceeded
+            quota_bytes: The configured quota
+            requested_bytes: Bytes the rejected write would have added
+        """
+        super().__init__(
+            f"Workspace disk quota of {quota_bytes} bytes exceeded for task {task_id}",
+            {
+                "task_id": task_id,
+                "quota_bytes": quota_bytes,
+                "requested_bytes": requested_bytes,
+            },
+        )
+        self.task_id = task_id
+        self.quota_bytes = quota_bytes
+        self.requested_bytes = requested_bytes
+
+
 class FileNotFoundInWorkspaceError(ToolError):
     """Raised when a file doesn't exist in the workspace."""
 
@@ -14,6 +14,7 @@ from langchain_core.tools import tool
 from src.core.logging import get_logger
 from src.tools.exceptions import ExecutionTimeoutError, ToolExecutionError
 from src.tools.schemas import LintResult
+from src.tools.security.provisioning import break_workspace_hardlinks_async
 
 logger = get_logger(__name__)
 
@@ -121,6 +122,7 @@ async def run_ruff(
 
     if fix:
         cmd.append("--fix")
+        await break_workspace_hardlinks_async(lint_path)
 
     # Add format for better parsing
     cmd.extend(["--output-format", "text"])
@@ -13,8 +13,10 @@ from pathlib import Path
 from langchain_core.tools import tool
 
 from src.core.logging import get_logger
+from src.tools.base import get_current_context, notify_workspace_write
 from src.tools.exceptions import ExecutionTimeoutError, ToolExecutionError
 from src.tools.schemas import ExecutionResult, ResourceLimits
+from src.tools.security.provisioning import break_workspace_hardlinks_async
 
 logger = get_logger(__name__)
 
@@ -169,6 +171,12 @@ async def run_python(
         timeout=timeout,
     )
 
+    # The code may write files
+    context = get_current_context()
+    changed_dir = working_dir or (context.workspace_path if context else None)
+    if changed_dir:
+        await break_workspace_hardlinks_async(changed_dir)
+
     try:
         result = await _run_python_subprocess(
             code=code,
@@ -176,6 +184,9 @@ async def run_python(
             timeout=timeout,
         )
 
+        if changed_dir:
+            notify_workspace_write(changed_dir, ".")
+
         # Format output
         lines = []
 
@@ -267,6 +278,8 @@ async def run_python_file(
         args=args,
     )
 
+    await break_workspace_hardlinks_async(path)
+
     start_time = time.time()
 
     try:
@@ -298,6 +311,9 @@ async def run_python_file(
 
         duration_ms = (time.time() - start_time) * 1000
 
+        # The script may have written files next to it
+        notify_workspace_write(str(path.parent), ".")
+
         # Format output
         lines = [f"File: {file_path}"]
         if args:
@@ -377,6 +393,7 @@ async def run_python_sandboxed(
     from src.tools.execution.sandbox import execute_with_sandbox
 
     # Write code to a temp file in the workspace
+    await break_workspace_hardlinks_async(workspace_path)
     code_file = Path(workspace_path) / "_temp_code.py"
     code_file.write_text(code)
 
@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from src.core.logging import get_logger
+from src.tools.base import notify_workspace_write
 from src.tools.exceptions import ExecutionTimeoutError, SandboxError
 from src.tools.schemas import (
     ExecutionResult,
@@ -19,6 +20,7 @@ from src.tools.schemas import (
     SandboxInfo,
     SandboxStatus,
 )
+from src.tools.security.provisioning import break_workspace_hardlinks_async
 
 logger = get_logger(__name__)
 
@@ -267,6 +269,9 @@ class SandboxManager:
                 sandbox_id=sandbox_id,
             )
 
+        # The workspace is mounted read-write
+        await break_workspace_hardlinks_async(sandbox.config.workspace_path)
+
         timeout_seconds = timeout or sandbox.config.limits.timeout_seconds
         sandbox.status = SandboxStatus.RUNNING
         sandbox.last_used = datetime.now()
@@ -314,6 +319,9 @@ class SandboxManager:
 
             duration_ms = (time.time() - start_time) * 1000
 
+            # The workspace is mounted read-write into the container
+            notify_workspace_write(sandbox.config.workspace_path, ".")
+
             sandbox.status = SandboxStatus.READY
 
             result = ExecutionResult(
@@ -12,7 +12,9 @@ from pathlib import Path
 from langchain_core.tools import tool
 
 from src.core.logging import get_logger
+from src.tools.base import get_current_context, notify_workspace_write
 from src.tools.exceptions import ExecutionTimeoutError, PermissionDeniedError, ToolExecutionError
+from src.tools.security.provisioning import break_workspace_hardlinks_async
 
 logger = get_logger(__name__)
 
@@ -265,6 +267,12 @@ async def run_shell(
         timeout=timeout,
     )
 
+    # Commands like git, make or pip may change the workspace
+    context = get_current_context()
+    changed_dir = cwd or (context.workspace_path if context else None)
+    if changed_dir:
+        await break_workspace_hardlinks_async(changed_dir)
+
     start_time = time.time()
 
     try:
@@ -292,6 +300,9 @@ async def run_shell(
 
         duration_ms = (time.time() - start_time) * 1000
 
+        if changed_dir:
+            notify_workspace_write(changed_dir, ".")
+
         # Format output
         lines = [f"$ {command}"]
         lines.append("")
@@ -14,6 +14,7 @@ from langchain_core.tools import tool
 from src.core.logging import get_logger
 from src.tools.exceptions import ExecutionTimeoutError, ToolExecutionError
 from src.tools.schemas import TestResult
+from src.tools.security.provisioning import break_workspace_hardlinks_async
 
 logger = get_logger(__name__)
 
@@ -165,6 +166,9 @@ async def run_pytest(
         timeout=timeout,
     )
 
+    # Tests and fixtures may write to the workspace
+    await break_workspace_hardlinks_async(test_path)
+
     start_time = time.time()
 
     try:
@@ -315,6 +319,9 @@ async def run_pytest_json(
     if pattern:
         cmd.extend(["-k", pattern])
 
+    # Tests and fixtures may write to the workspace
+    await break_workspace_hardlinks_async(test_path)
+
     start_time = time.time()
 
     try:
@@ -1,9 +1,12 @@
 """Content search tools for agents.
 
 Provides tools for searching files by pattern and searching
-content within files using regex patterns.
+content within files using regex patterns. Both walk the workspace
+with the shared scandir walker and ignore matcher, so hidden and
+ignored directories are pruned instead of filtered file by file.
 """
 
+import asyncio
 import fnmatch
 import re
 from pathlib import Path
@@ -15,10 +18,147 @@ from langchain_core.tools import tool
 from src.core.logging import get_logger
 from src.tools.base import get_current_context
 from src.tools.exceptions import ToolExecutionError
+from src.tools.filesystem.ignore import IgnoreMatcher, translate_glob
+from src.tools.filesystem.walker import walk_directory
 from src.tools.security.path_validator import validate_path
 
 logger = get_logger(__name__)
 
+# File extensions grep_content never opens
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".pyc",
+        ".pyo",
+        ".so",
+        ".o",
+        ".a",
+        ".exe",
+        ".dll",
+        ".bin",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".ico",
+        ".pdf",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".eot",
+    }
+)
+
+
+def _find_matching_files(
+    full_path: Path,
+    workspace: Path,
+    pattern: str,
+    max_results: int,
+) -> tuple[list[str], bool]:
+    """Walk a directory collecting files that match a glob pattern.
+
+    Patterns containing "**" search the whole subtree and match either
+    the workspace-relative path or the file name. Other patterns are
+    matched against the path relative to the search root, and the walk
+    is bounded to the depth the pattern can reach. Runs in a worker
+    thread and stops as soon as max_results is exceeded.
+
+    Args:
+        full_path: Directory to search
+        workspace: Workspace root
+        pattern: Glob pattern
+        max_results: Maximum number of matches
+
+    Returns:
+        Tuple of (workspace-relative matches, whether results were truncated)
+    """
+    root_prefix = full_path.relative_to(workspace).as_posix()
+    root_prefix = "" if root_prefix == "." else root_prefix + "/"
+
+    if "**" in pattern:
+        name_pattern = pattern.split("/")[-1]
+        max_depth = None
+
+        def is_match(rel_path: str, name: str) -> bool:
+            return fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(name, name_pattern)
+
+    else:
+        relative_pattern = pattern.strip("/")
+        regex = re.compile(translate_glob(relative_pattern) + r"\Z")
+        max_depth = relative_pattern.count("/")
+
+        def is_match(rel_path: str, name: str) -> bool:
+            return regex.match(rel_path[len(root_prefix) :]) is not None
+
+    entries = walk_directory(
+        full_path,
+        workspace,
+        recursive=True,
+        max_depth=max_depth,
+        is_ignored=IgnoreMatcher(workspace).is_ignored,
+    )
+
+    matches: list[str] = []
+    for entry in entries:
+        if entry.is_dir or not is_match(entry.path, entry.name):
+            continue
+        if len(matches) >= max_results:
+            return matches, True
+        matches.append(entry.path)
+
+    return matches, False
+
+
+def _find_grep_candidates(
+    full_path: Path,
+    workspace: Path,
+    file_pattern: str,
+) -> list[tuple[Path, str]]:
+    """Collect the files grep_content should read.
+
+    Patterns without "/" match file names at any depth; patterns with
+    "/" match the path relative to the search root (at any depth, like
+    rglob). Binary files are skipped. Runs in a worker thread.
+
+    Args:
+        full_path: Directory to search
+        workspace: Workspace root
+        file_pattern: Glob pattern for files to search in
+
+    Returns:
+        List of (absolute path, workspace-relative path) tuples
+    """
+    name_pattern = file_pattern.replace("**", "*")
+    root_prefix = full_path.relative_to(workspace).as_posix()
+    root_prefix = "" if root_prefix == "." else root_prefix + "/"
+
+    def is_candidate(rel_path: str, name: str) -> bool:
+        if "/" not in name_pattern:
+            return fnmatch.fnmatch(name, name_pattern)
+        sub_path = rel_path[len(root_prefix) :]
+        return fnmatch.fnmatch(sub_path, name_pattern) or fnmatch.fnmatch(
+            sub_path, "*/" + name_pattern
+        )
+
+    entries = walk_directory(
+        full_path,
+        workspace,
+        recursive=True,
+        max_depth=None,
+        is_ignored=IgnoreMatcher(workspace).is_ignored,
+    )
+
+    return [
+        (workspace / entry.path, entry.path)
+        for entry in entries
+        if not entry.is_dir
+        and Path(entry.name).suffix.lower() not in BINARY_EXTENSIONS
+        and is_candidate(entry.path, entry.name)
+    ]
+
 
 @tool
 async def search_files(
@@ -70,49 +210,9 @@ async def search_files(
     )
 
     try:
-        matches: list[str] = []
-        truncated = False
-
-        # Handle recursive patterns
-        if "**" in pattern:
-            # Use rglob for recursive patterns
-            glob_pattern = pattern
-            for item in full_path.rglob("*"):
-                if len(matches) >= max_results:
-                    truncated = True
-                    break
-
-                if item.is_file():
-                    rel_path = str(item.relative_to(workspace))
-                    if fnmatch.fnmatch(rel_path, glob_pattern) or fnmatch.fnmatch(
-                        item.name, pattern.split("/")[-1]
-                    ):
-                        # Skip hidden files and common ignore patterns
-                        if not any(
-                            part.startswith(".")
-                            for part in rel_path.split("/")
-                            if part not in (".", "..")
-                        ):
-                            matches.append(rel_path)
-        else:
-            # Use glob for non-recursive patterns
-            for item in full_path.glob(pattern):
-                if len(matches) >= max_results:
-                    truncated = True
-                    break
-
-                if item.is_file():
-                    rel_path = str(item.relative_to(workspace))
-                    # Skip hidden files
-                    if not any(
-                        part.startswith(".")
-                        for part in rel_path.split("/")
-                        if part not in (".", "..")
-                    ):
-                        matches.append(rel_path)
-
-        # Sort matches
-        matches.sort()
+        matches, truncated = await asyncio.to_thread(
+            _find_matching_files, full_path, workspace, pattern, max_results
+        )
 
         logger.info(
             "file_search_completed",
@@ -218,54 +318,15 @@ async def grep_content(
         files_searched = 0
         truncated = False
 
-        # Determine file extensions to skip
-        skip_extensions = {
-            ".pyc",
-            ".pyo",
-            ".so",
-            ".o",
-            ".a",
-            ".exe",
-            ".dll",
-            ".bin",
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            ".ico",
-            ".pdf",
-            ".zip",
-            ".tar",
-            ".gz",
-            ".woff",
-            ".woff2",
-            ".ttf",
-            ".eot",
-        }
-
-        # Get files to search
-        if "**" in file_pattern:
-            files_to_search = list(full_path.rglob(file_pattern.replace("**", "*")))
-        else:
-            files_to_search = list(full_path.rglob(file_pattern))
-
-        for file_path in files_to_search:
+        files_to_search = await asyncio.to_thread(
+            _find_grep_candidates, full_path, workspace, file_pattern
+        )
+
+        for file_path, rel_path in files_to_search:
             if len(matches) >= max_results:
                 truncated = True
                 break
 
-            if not file_path.is_file():
-                continue
-
-            # Skip binary files
-            if file_path.suffix.lower() in skip_extensions:
-                continue
-
-            # Skip hidden files and directories
-            rel_path = str(file_path.relative_to(workspace))
-            if any(part.startswith(".") for part in rel_path.split("/") if part not in (".", "..")):
-                continue
-
             files_searched += 1
 
             try:
@@ -4,50 +4,93 @@ Provides tools for listing and creating directories
 within the workspace context.
 """
 
-from datetime import datetime
+import asyncio
 from pathlib import Path
 
 from langchain_core.tools import tool
 
 from src.core.logging import get_logger
-from src.tools.base import ToolPermission, get_current_context
+from src.tools.base import ToolPermission, get_current_context, notify_workspace_write
 from src.tools.exceptions import (
     PermissionDeniedError,
     ToolExecutionError,
 )
-from src.tools.schemas import FileInfo
+from src.tools.filesystem.ignore import IgnoreMatcher
+from src.tools.filesystem.walker import estimate_tokens, walk_directory
 from src.tools.security.path_validator import validate_path
+from src.tools.security.workspace import count_missing_directories, get_workspace_manager
 
 logger = get_logger(__name__)
 
 
-def _get_file_info(path: Path, workspace: Path) -> FileInfo:
-    """Get FileInfo for a path.
+# Default page size and output budget for list_directory
+DEFAULT_MAX_ENTRIES = 200
+DEFAULT_MAX_TOKENS = 2000
+
+
+def _collect_listing_page(
+    full_path: Path,
+    workspace: Path,
+    recursive: bool,
+    include_hidden: bool,
+    max_depth: int,
+    cursor: str | None,
+    max_entries: int,
+    max_tokens: int,
+) -> tuple[list[str], int, int, str | None]:
+    """Walk a directory until the page size or token budget is reached.
+
+    Runs in a worker thread; the walk stops as soon as the page is full,
+    so large trees are never fully enumerated.
 
     Args:
-        path: Absolute path to file/directory
-        workspace: Workspace root path
+        full_path: Directory to list
+        workspace: Workspace root
+        recursive: Whether to descend into subdirectories
+        include_hidden: Whether to include hidden entries
+        max_depth: Maximum depth for recursive listing
+        cursor: Path of the last entry from the previous page, if any
+        max_entries: Maximum entries on this page
+        max_tokens: Approximate token budget for the entry lines
 
     Returns:
-        FileInfo object
+        Tuple of (entry lines, directory count, file count, next cursor or None)
     """
-    try:
-        stat = path.stat()
-        return FileInfo(
-            name=path.name,
-            path=str(path.relative_to(workspace)),
-            is_dir=path.is_dir(),
-            size=stat.st_size if path.is_file() else 0,
-            modified=datetime.fromtimestamp(stat.st_mtime),
-        )
-    except (OSError, ValueError):
-        return FileInfo(
-            name=path.name,
-            path=str(path.relative_to(workspace)) if workspace in path.parents else path.name,
-            is_dir=path.is_dir(),
-            size=0,
-            modified=None,
-        )
+    entries = walk_directory(
+        full_path,
+        workspace,
+        recursive=recursive,
+        max_depth=max_depth,
+        include_hidden=include_hidden,
+        is_ignored=IgnoreMatcher(workspace).is_ignored,
+        after=cursor,
+    )
+
+    lines: list[str] = []
+    dir_count = 0
+    file_count = 0
+    tokens_used = 0
+    last_path: str | None = None
+
+    for entry in entries:
+        if entry.is_dir:
+            line = f"  {entry.path}/"
+        else:
+            line = f"  {entry.path} ({_format_size(entry.size)})"
+
+        line_tokens = estimate_tokens(line)
+        if len(lines) >= max_entries or (lines and tokens_used + line_tokens > max_tokens):
+            return lines, dir_count, file_count, last_path
+
+        lines.append(line)
+        tokens_used += line_tokens
+        last_path = entry.path
+        if entry.is_dir:
+            dir_count += 1
+        else:
+            file_count += 1
+
+    return lines, dir_count, file_count, None
 
 
 @tool
@@ -56,17 +99,29 @@ async def list_directory(
     recursive: bool = False,
     include_hidden: bool = False,
     max_depth: int = 3,
+    cursor: str | None = None,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
 ) -> str:
     """List the contents of a directory.
 
+    Entries are listed in path order. Vendored directories (node_modules,
+    virtualenvs, caches) and paths matched by .gitignore are skipped.
+    Large listings are split into pages; pass the returned cursor to
+    continue where the previous page stopped.
+
     Args:
         path: Path to directory relative to workspace root. Defaults to "." (root).
         recursive: Whether to list contents recursively. Defaults to False.
         include_hidden: Whether to include hidden files (starting with .). Defaults to False.
         max_depth: Maximum depth for recursive listing (1-10). Defaults to 3.
+        cursor: Cursor from a previous truncated listing. Defaults to None (first page).
+        max_entries: Maximum entries per page (1-1000). Defaults to 200.
+        max_tokens: Approximate token budget for the listing (100-20000). Defaults to 2000.
 
     Returns:
-        A formatted string listing the directory contents with file sizes.
+        A formatted string listing the directory contents with file sizes,
+        and a cursor for the next page if the listing was truncated.
 
     Raises:
         PathValidationError: If the path is invalid or outside workspace
@@ -99,61 +154,42 @@ async def list_directory(
         task_id=context.task_id,
     )
 
-    try:
-        files: list[FileInfo] = []
-        directories: list[FileInfo] = []
-
-        def should_include(item_path: Path) -> bool:
-            """Check if an item should be included."""
-            if not include_hidden and item_path.name.startswith("."):
-                return False
-            return True
-
-        def list_items(dir_path: Path, current_depth: int = 0) -> None:
-            """Recursively list items."""
-            if current_depth > max_depth:
-                return
-
-            try:
-                for item in sorted(dir_path.iterdir()):
-                    if not should_include(item):
-                        continue
-
-                    info = _get_file_info(item, workspace)
+    max_depth = max(1, min(10, max_depth))
+    max_entries = max(1, min(1000, max_entries))
+    max_tokens = max(100, min(20000, max_tokens))
 
-                    if item.is_dir():
-                        directories.append(info)
-                        if recursive and current_depth < max_depth:
-                            list_items(item, current_depth + 1)
-                    else:
-                        files.append(info)
-
-            except PermissionError:
-                pass  # Skip directories we can't access
-
-        list_items(full_path)
+    try:
+        entry_lines, dir_count, file_count, next_cursor = await asyncio.to_thread(
+            _collect_listing_page,
+            full_path,
+            workspace,
+            recursive,
+            include_hidden,
+            max_depth,
+            cursor,
+            max_entries,
+            max_tokens,
+        )
 
         # Format output
         lines = [f"Directory: {path}"]
-        lines.append(f"Total: {len(directories)} directories, {len(files)} files")
+        lines.append(f"Listed: {dir_count} directories, {file_count} files")
         lines.append("")
+        lines.extend(entry_lines)
 
-        if directories:
-            lines.append("Directories:")
-            for d in directories:
-                lines.append(f"  {d.path}/")
-
-        if files:
-            lines.append("\nFiles:")
-            for f in files:
-                size_str = _format_size(f.size)
-                lines.append(f"  {f.path} ({size_str})")
+        if next_cursor is not None:
+            lines.append("")
+            lines.append(
+                f"Listing truncated. Call list_directory again with cursor='{next_cursor}' "
+                "to see more entries."
+            )
 
         logger.info(
             "directory_list_completed",
             path=path,
-            file_count=len(files),
-            dir_count=len(directories),
+            file_count=file_count,
+            dir_count=dir_count,
+            truncated=next_cursor is not None,
         )
 
         return "\n".join(lines)
@@ -239,7 +275,13 @@ async def create_directory(path: str, parents: bool = True) -> str:
                 )
 
         # Create the directory
+        new_directories = count_missing_directories(full_path)
         full_path.mkdir(parents=parents, exist_ok=True)
+        notify_workspace_write(context.workspace_path, path)
+
+        workspace_manager = get_workspace_manager()
+        workspace_manager.record_directories_created(context.task_id, new_directories)
+        await workspace_manager.maybe_reconcile(context.task_id)
 
         logger.info(
             "directory_create_completed",
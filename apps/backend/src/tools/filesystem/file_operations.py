@@ -8,13 +8,16 @@ import aiofiles
 from langchain_core.tools import tool
 
 from src.core.logging import get_logger
-from src.tools.base import ToolPermission, get_current_context
+from src.tools.base import ToolPermission, get_current_context, notify_workspace_write
 from src.tools.exceptions import (
     FileNotFoundInWorkspaceError,
     PermissionDeniedError,
     ToolExecutionError,
+    WorkspaceQuotaExceededError,
 )
 from src.tools.security.path_validator import validate_path
+from src.tools.security.provisioning import break_hardlink
+from src.tools.security.workspace import count_missing_directories, get_workspace_manager
 
 logger = get_logger(__name__)
 
@@ -140,27 +143,47 @@ async def write_file(path: str, content: str, create_dirs: bool = True) -> str:
         task_id=context.task_id,
     )
 
+    workspace_manager = get_workspace_manager()
+    encoded_size = len(content.encode("utf-8"))
+
     try:
+        # Check if file exists (for logging and usage accounting)
+        existed = full_path.exists()
+        previous_size = full_path.stat().st_size if existed else None
+
+        workspace_manager.check_quota(context.task_id, encoded_size - (previous_size or 0))
+
         # Create parent directories if needed
+        new_directories = 0
         if create_dirs:
+            new_directories = count_missing_directories(full_path.parent)
             full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if file exists (for logging)
-        existed = full_path.exists()
+        # Never write through an inode shared with the source repository
+        break_hardlink(full_path)
 
         # Write the file
         async with aiofiles.open(full_path, mode="w", encoding="utf-8") as f:
             await f.write(content)
 
+        notify_workspace_write(context.workspace_path, path)
+        workspace_manager.record_file_write(
+            context.task_id, previous_size, encoded_size, new_directories
+        )
+        await workspace_manager.maybe_reconcile(context.task_id)
+
         action = "Updated" if existed else "Created"
         logger.info(
             "file_write_completed",
             path=path,
-            bytes_written=len(content.encode("utf-8")),
+            bytes_written=encoded_size,
             created=not existed,
         )
 
-        return f"{action} file: {path} ({len(content.encode('utf-8'))} bytes)"
+        return f"{action} file: {path} ({encoded_size} bytes)"
+
+    except WorkspaceQuotaExceededError:
+        raise
 
     except Exception as e:
         logger.error(
@@ -248,10 +271,20 @@ async def edit_file(path: str, old_content: str, new_content: str) -> str:
         # Perform the replacement
         new_file_content = current_content.replace(old_content, new_content, 1)
 
+        workspace_manager = get_workspace_manager()
+        previous_bytes = full_path.stat().st_size
+        new_bytes = len(new_file_content.encode("utf-8"))
+        workspace_manager.check_quota(context.task_id, new_bytes - previous_bytes)
+
         # Write the modified content
+        break_hardlink(full_path)
         async with aiofiles.open(full_path, mode="w", encoding="utf-8") as f:
             await f.write(new_file_content)
 
+        notify_workspace_write(context.workspace_path, path)
+        workspace_manager.record_file_write(context.task_id, previous_bytes, new_bytes)
+        await workspace_manager.maybe_reconcile(context.task_id)
+
         old_size = len(current_content)
         new_size = len(new_file_content)
 
@@ -267,7 +300,7 @@ async def edit_file(path: str, old_content: str, new_content: str) -> str:
             f"Edited file: {path} (replaced {len(old_content)} chars with {len(new_content)} chars)"
         )
 
-    except ToolExecutionError:
+    except (ToolExecutionError, WorkspaceQuotaExceededError):
         raise
 
     except Exception as e:
@@ -331,6 +364,11 @@ async def delete_file(path: str) -> str:
         # Delete the file
         full_path.unlink()
 
+        notify_workspace_write(context.workspace_path, path)
+        workspace_manager = get_workspace_manager()
+        workspace_manager.record_file_delete(context.task_id, size)
+        await workspace_manager.maybe_reconcile(context.task_id)
+
         logger.info(
             "file_delete_completed",
             path=path,
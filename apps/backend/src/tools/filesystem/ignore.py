@@ -0,0 +1,289 @@
+"""Gitignore-aware path filtering for filesystem tools.
+
+Parses ``.gitignore`` and ``.ignore`` files plus the CodeGraph-level
+ignore list (``settings.filesystem_ignore_patterns``) into compiled
+matchers. Rule files are compiled once and cached by path, size and
+modification time. An IgnoreMatcher loads the rules for each directory
+lazily and answers per-entry queries, so walkers can prune whole
+ignored subtrees instead of filtering leaves afterwards.
+
+Precedence follows git: rules in deeper directories win over shallower
+ones, the last matching rule within a file wins, and the global list
+has the lowest priority. ``.ignore`` overrides ``.gitignore`` in the
+same directory.
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.core.config import settings
+
+# Per-directory rule files, lowest precedence first
+IGNORE_FILENAMES = (".gitignore", ".ignore")
+
+
+def translate_glob(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regular expression body.
+
+    ``*`` and ``?`` never match "/", ``**`` matches across directories
+    when it forms a whole path component, and ``[...]`` classes and
+    backslash escapes are supported.
+
+    Args:
+        pattern: Glob pattern without leading/trailing slashes
+
+    Returns:
+        Regex source (without anchors)
+    """
+    out: list[str] = []
+    i = 0
+    n = len(pattern)
+
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                j = i + 2
+                whole_component = (i == 0 or pattern[i - 1] == "/") and (
+                    j == n or pattern[j] == "/"
+                )
+                if whole_component and j == n:
+                    out.append(".*")
+                elif whole_component:
+                    out.append("(?:.*/)?")
+                    j += 1
+                else:
+                    out.append("[^/]*")
+                i = j
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2 if pattern[i + 1 : i + 2] in ("!", "^") else i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : end].replace("\\", "\\\\")
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """A single parsed ignore pattern."""
+
+    regex: str
+    negate: bool
+    dir_only: bool
+
+
+def parse_ignore_line(line: str) -> IgnoreRule | None:
+    """Parse one line of an ignore file.
+
+    Args:
+        line: Raw line from the file
+
+    Returns:
+        Parsed rule, or None for blank lines and comments
+    """
+    line = line.rstrip("\n")
+    # Trailing spaces are ignored unless escaped
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    line = stripped
+
+    if not line or line.startswith("#"):
+        return None
+
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith(("\\#", "\\!")):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    anchored = "/" in line
+    body = translate_glob(line.lstrip("/"))
+    regex = f"^{body}$" if anchored else f"^(?:.*/)?{body}$"
+    return IgnoreRule(regex=regex, negate=negate, dir_only=dir_only)
+
+
+class IgnoreRules:
+    """Compiled rules from one ignore file (or the global list).
+
+    Rule sets without negations are combined into a single alternation
+    so a query is one regex match. Sets with negations are evaluated
+    last-rule-first to preserve gitignore semantics.
+    """
+
+    def __init__(self, rules: Iterable[IgnoreRule]) -> None:
+        """Compile a sequence of rules.
+
+        Args:
+            rules: Parsed rules in file order
+        """
+        self._rules = list(rules)
+        self._has_negations = any(rule.negate for rule in self._rules)
+
+        if self._has_negations:
+            self._ordered = [
+                (re.compile(rule.regex), rule.negate, rule.dir_only)
+                for rule in reversed(self._rules)
+            ]
+        else:
+            self._any = self._combine(rule for rule in self._rules if not rule.dir_only)
+            self._dirs = self._combine(rule for rule in self._rules if rule.dir_only)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "IgnoreRules":
+        """Build rules from ignore-file lines.
+
+        Args:
+            lines: Raw lines
+
+        Returns:
+            Compiled rules
+        """
+        parsed = (parse_ignore_line(line) for line in lines)
+        return cls(rule for rule in parsed if rule is not None)
+
+    @staticmethod
+    def _combine(rules: Iterable[IgnoreRule]) -> re.Pattern[str] | None:
+        sources = [rule.regex for rule in rules]
+        if not sources:
+            return None
+        return re.compile("|".join(f"(?:{source})" for source in sources))
+
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+
+    def match(self, path: str, is_dir: bool) -> bool | None:
+        """Match a path relative to the rules' base directory.
+
+        Args:
+            path: Relative path with forward slashes
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if ignored, False if explicitly re-included, None if no rule matches
+        """
+        if self._has_negations:
+            for regex, negate, dir_only in self._ordered:
+                if dir_only and not is_dir:
+                    continue
+                if regex.match(path):
+                    return not negate
+            return None
+
+        if self._any is not None and self._any.match(path):
+            return True
+        if is_dir and self._dirs is not None and self._dirs.match(path):
+            return True
+        return None
+
+
+# Compiled rule files keyed by path, validated by (mtime_ns, size)
+_compiled_files: dict[str, tuple[tuple[int, int], IgnoreRules]] = {}
+_EMPTY_RULES = IgnoreRules(())
+
+
+def _load_rules_file(path: Path) -> IgnoreRules:
+    """Load and compile an ignore file, reusing a cached compilation."""
+    try:
+        stat = path.stat()
+    except OSError:
+        _compiled_files.pop(str(path), None)
+        return _EMPTY_RULES
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _compiled_files.get(str(path))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return _EMPTY_RULES
+
+    rules = IgnoreRules.from_lines(lines)
+    _compiled_files[str(path)] = (key, rules)
+    return rules
+
+
+class IgnoreMatcher:
+    """Answers "is this path ignored?" for one workspace.
+
+    Rules for each directory are loaded on first use and cached for the
+    lifetime of the matcher, which is typically one tool invocation.
+    """
+
+    def __init__(self, root: Path, global_patterns: Iterable[str] | None = None) -> None:
+        """Initialize the matcher.
+
+        Args:
+            root: Workspace root that queried paths are relative to
+            global_patterns: CodeGraph-level patterns applied to every path.
+                            Defaults to settings.filesystem_ignore_patterns.
+        """
+        self._root = root
+        patterns = (
+            settings.filesystem_ignore_patterns if global_patterns is None else global_patterns
+        )
+        self._global = IgnoreRules.from_lines(patterns)
+        self._directory_rules: dict[str, list[IgnoreRules]] = {}
+
+    def _rules_for(self, rel_dir: str) -> list[IgnoreRules]:
+        """Get the compiled rule files of a directory, highest precedence first."""
+        rules = self._directory_rules.get(rel_dir)
+        if rules is None:
+            directory = self._root / rel_dir if rel_dir else self._root
+            loaded = [_load_rules_file(directory / name) for name in IGNORE_FILENAMES]
+            rules = [r for r in reversed(loaded) if r]
+            self._directory_rules[rel_dir] = rules
+        return rules
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Check whether a path should be skipped.
+
+        Only the entry itself is matched; callers are expected to prune
+        ignored directories rather than query their contents.
+
+        Args:
+            rel_path: Path relative to the workspace root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path is ignored
+        """
+        parts = rel_path.split("/")
+
+        # Deepest directory first: its rules take precedence
+        for depth in range(len(parts) - 1, -1, -1):
+            rule_sets = self._rules_for("/".join(parts[:depth]))
+            if not rule_sets:
+                continue
+            sub_path = "/".join(parts[depth:])
+            for rules in rule_sets:
+                decision = rules.match(sub_path, is_dir)
+                if decision is not None:
+                    return decision
+
+        return bool(self._global.match(rel_path, is_dir))
@@ -0,0 +1,126 @@
+"""Depth-bounded, resumable directory walker.
+
+Walks a directory tree with os.scandir so entry types come from the
+directory read and each file is stat'ed at most once. Entries are
+yielded lazily in pre-order with siblings sorted by name, which makes
+the order lexicographic by path. That lets a walk resume after any
+previously returned path (a cursor) by pruning whole subtrees that
+sort before it instead of re-listing them. Ignore rules (see
+src.tools.filesystem.ignore) are applied per entry, so ignored
+directories are pruned without being read.
+"""
+
+import os
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+# Rough characters-per-token ratio used for output budgets
+CHARS_PER_TOKEN = 4
+
+IgnorePredicate = Callable[[str, bool], bool]
+"""Called with (path relative to workspace, is_dir); True excludes the entry."""
+
+
+@dataclass(frozen=True)
+class WalkEntry:
+    """A single entry produced by the walker."""
+
+    path: str
+    """Path relative to the workspace root, using forward slashes."""
+
+    name: str
+    is_dir: bool
+    size: int
+    """File size in bytes (0 for directories)."""
+
+    depth: int
+    """Depth below the walk root (0 for direct children)."""
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a piece of text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count (at least 1)
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def walk_directory(
+    root: Path,
+    workspace: Path,
+    *,
+    recursive: bool = True,
+    max_depth: int | None = 3,
+    include_hidden: bool = False,
+    is_ignored: IgnorePredicate | None = None,
+    after: str | None = None,
+) -> Iterator[WalkEntry]:
+    """Lazily walk a directory tree.
+
+    Args:
+        root: Directory to walk (inside the workspace)
+        workspace: Workspace root that entry paths are relative to
+        recursive: Whether to descend into subdirectories
+        max_depth: Deepest level to yield (0 = direct children only,
+                   None = unbounded)
+        include_hidden: Whether to include entries starting with "."
+        is_ignored: Optional predicate excluding entries and pruning
+                   ignored directories entirely
+        after: Resume cursor; only entries sorting after this path are yielded
+
+    Yields:
+        WalkEntry for each visible entry, in lexicographic path order
+    """
+    cursor = tuple(after.split("/")) if after else None
+    root_parts = root.relative_to(workspace).parts
+    depth_limit = float("inf") if max_depth is None else max_depth
+
+    def visit(directory: str, parts: tuple[str, ...], depth: int) -> Iterator[WalkEntry]:
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda e: e.name)
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            return  # Skip directories we can't access
+
+        for entry in entries:
+            name = entry.name
+            if not include_hidden and name.startswith("."):
+                continue
+
+            try:
+                is_dir = entry.is_dir()
+                descend = is_dir and not entry.is_symlink()
+            except OSError:
+                continue
+
+            entry_parts = (*parts, name)
+            rel_path = "/".join(entry_parts)
+            if is_ignored is not None and is_ignored(rel_path, is_dir):
+                continue
+
+            # Resume: skip entries at or before the cursor, pruning subtrees
+            # that sort entirely before it
+            if cursor is not None and entry_parts <= cursor:
+                inside = cursor[: len(entry_parts)] == entry_parts
+                if descend and inside and recursive and depth < depth_limit:
+                    yield from visit(entry.path, entry_parts, depth + 1)
+                continue
+
+            size = 0
+            if not is_dir:
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0
+
+            yield WalkEntry(path=rel_path, name=name, is_dir=is_dir, size=size, depth=depth)
+
+            if descend and recursive and depth < depth_limit:
+                yield from visit(entry.path, entry_parts, depth + 1)
+
+    yield from visit(str(root), root_parts, 0)
@@ -5,6 +5,7 @@ This module provides git operations including:
 - Staging and unstaging files
 - Committing changes
 - Branch management
+- Cached per-workspace git sessions
 """
 
 from src.tools.git.branching import (
@@ -13,10 +14,23 @@ from src.tools.git.branching import (
     git_checkout,
 )
 from src.tools.git.commits import git_commit, git_log
+from src.tools.git.session import (
+    GitSession,
+    close_git_session,
+    close_git_sessions,
+    discard_git_session,
+    get_git_session,
+)
 from src.tools.git.staging import git_add, git_reset
 from src.tools.git.status import git_diff, git_status
 
 __all__ = [
+    # Session
+    "GitSession",
+    "get_git_session",
+    "close_git_session",
+    "close_git_sessions",
+    "discard_git_session",
     # Status
     "git_status",
     "git_diff",
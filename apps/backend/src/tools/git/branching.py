@@ -8,7 +8,7 @@ from langchain_core.tools import tool
 from src.core.logging import get_logger
 from src.tools.base import ToolPermission, get_current_context
 from src.tools.exceptions import GitOperationError, PermissionDeniedError, ToolExecutionError
-from src.tools.git.status import _is_git_repo, _run_git_command
+from src.tools.git.session import require_git_session
 
 logger = get_logger(__name__)
 
@@ -27,13 +27,7 @@ async def git_branch_list() -> str:
     if context is None:
         raise ToolExecutionError("No execution context available")
 
-    workspace = context.workspace_path
-
-    if not _is_git_repo(workspace):
-        raise GitOperationError(
-            "Not a git repository",
-            operation="branch",
-        )
+    session = require_git_session(context.workspace_path, "branch")
 
     logger.info(
         "git_branch_list_started",
@@ -41,17 +35,14 @@ async def git_branch_list() -> str:
     )
 
     try:
-        # Get current branch
-        returncode, current, _ = await _run_git_command(
-            ["rev-parse", "--abbrev-ref", "HEAD"],
-            workspace,
-        )
-        current_branch = current.strip() if returncode == 0 else ""
-
-        # Get local branches
-        returncode, local_output, stderr = await _run_git_command(
-            ["branch", "--list"],
-            workspace,
+        # Local and remote branches plus the current-branch marker in one call
+        returncode, output, stderr = await session.run(
+            [
+                "for-each-ref",
+                "--format=%(HEAD)%00%(refname)%00%(refname:short)",
+                "refs/heads",
+                "refs/remotes",
+            ]
         )
 
         if returncode != 0:
@@ -62,25 +53,19 @@ async def git_branch_list() -> str:
                 stderr=stderr,
             )
 
+        current_branch = "HEAD"
         local_branches = []
-        for line in local_output.strip().split("\n"):
-            if line.strip():
-                # Remove leading * and whitespace
-                branch = line.strip().lstrip("* ").strip()
-                local_branches.append(branch)
-
-        # Get remote branches
-        returncode, remote_output, _ = await _run_git_command(
-            ["branch", "-r", "--list"],
-            workspace,
-        )
-
         remote_branches = []
-        if returncode == 0 and remote_output.strip():
-            for line in remote_output.strip().split("\n"):
-                if line.strip() and "->" not in line:  # Skip HEAD pointers
-                    branch = line.strip()
-                    remote_branches.append(branch)
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            head_marker, refname, short_name = line.split("\0")
+            if refname.startswith("refs/heads/"):
+                local_branches.append(short_name)
+                if head_marker == "*":
+                    current_branch = short_name
+            elif not refname.endswith("/HEAD"):  # Skip HEAD pointers
+                remote_branches.append(short_name)
 
         # Format output
         lines = [f"Current branch: {current_branch}"]
@@ -148,13 +133,7 @@ async def git_branch_create(name: str, checkout: bool = True) -> str:
             operation="git_branch_create",
         )
 
-    workspace = context.workspace_path
-
-    if not _is_git_repo(workspace):
-        raise GitOperationError(
-            "Not a git repository",
-            operation="branch",
-        )
+    session = require_git_session(context.workspace_path, "branch")
 
     if not name or not name.strip():
         raise GitOperationError(
@@ -183,7 +162,8 @@ async def git_branch_create(name: str, checkout: bool = True) -> str:
         else:
             cmd = ["branch", name]
 
-        returncode, stdout, stderr = await _run_git_command(cmd, workspace)
+        returncode, stdout, stderr = await session.run(cmd)
+        session.invalidate()
 
         if returncode != 0:
             if "already exists" in stderr:
@@ -250,13 +230,7 @@ async def git_checkout(branch: str) -> str:
             operation="git_checkout",
         )
 
-    workspace = context.workspace_path
-
-    if not _is_git_repo(workspace):
-        raise GitOperationError(
-            "Not a git repository",
-            operation="checkout",
-        )
+    session = require_git_session(context.workspace_path, "checkout")
 
     if not branch or not branch.strip():
         raise GitOperationError(
@@ -271,19 +245,16 @@ async def git_checkout(branch: str) -> str:
     )
 
     try:
-        # Get current branch
-        returncode, current, _ = await _run_git_command(
-            ["rev-parse", "--abbrev-ref", "HEAD"],
-            workspace,
-        )
-        previous_branch = current.strip() if returncode == 0 else "unknown"
+        # Get current branch (from the cached status snapshot)
+        previous_branch = await session.current_branch()
 
         if previous_branch == branch:
             return f"Already on branch: {branch}"
 
         # Checkout branch
         cmd = ["checkout", branch]
-        returncode, stdout, stderr = await _run_git_command(cmd, workspace)
+        returncode, stdout, stderr = await session.run(cmd)
+        session.invalidate()
 
         if returncode != 0:
             if "did not match any file" in stderr or "not a git repository" in stderr:
@@ -3,6 +3,7 @@
 Provides tools for creating commits and viewing commit history.
 """
 
+import re
 from datetime import datetime
 
 from langchain_core.tools import tool
@@ -10,10 +11,14 @@ from langchain_core.tools import tool
 from src.core.logging import get_logger
 from src.tools.base import ToolPermission, get_current_context
 from src.tools.exceptions import GitOperationError, PermissionDeniedError, ToolExecutionError
-from src.tools.git.status import _is_git_repo, _run_git_command
+from src.tools.git.session import require_git_session
 
 logger = get_logger(__name__)
 
+# "[main 1a2b3c4] message" header printed by git commit
+_COMMIT_HEADER_PATTERN = re.compile(r"^\[[^\]]*?\s([0-9a-f]{7,40})\]", re.MULTILINE)
+_FILES_CHANGED_PATTERN = re.compile(r"(\d+) files? changed")
+
 
 @tool
 async def git_commit(message: str, amend: bool = False) -> str:
@@ -43,13 +48,7 @@ async def git_commit(message: str, amend: bool = False) -> str:
             operation="git_commit",
         )
 
-    workspace = context.workspace_path
-
-    if not _is_git_repo(workspace):
-        raise GitOperationError(
-            "Not a git repository",
-            operation="commit",
-        )
+    session = require_git_session(context.workspace_path, "commit")
 
     if not message or not message.strip():
         raise GitOperationError(
@@ -67,11 +66,8 @@ async def git_commit(message: str, amend: bool = False) -> str:
     try:
         # Check if there are staged changes (unless amending)
         if not amend:
-            returncode, staged, _ = await _run_git_command(
-                ["diff", "--cached", "--name-only"],
-                workspace,
-            )
-            if not staged.strip():
+            snapshot = await session.status()
+            if not snapshot.staged_paths:
                 raise GitOperationError(
                     "Nothing to commit - no changes staged. Use git_add first.",
                     operation="commit",
@@ -82,7 +78,8 @@ async def git_commit(message: str, amend: bool = False) -> str:
         if amend:
             cmd.append("--amend")
 
-        returncode, stdout, stderr = await _run_git_command(cmd, workspace)
+        returncode, stdout, stderr = await session.run(cmd)
+        session.invalidate()
 
         if returncode != 0:
             raise GitOperationError(
@@ -92,30 +89,16 @@ async def git_commit(message: str, amend: bool = False) -> str:
                 stderr=stderr,
             )
 
-        # Get commit info
-        returncode, commit_hash, _ = await _run_git_command(
-            ["rev-parse", "--short", "HEAD"],
-            workspace,
-        )
-        commit_hash = commit_hash.strip() if returncode == 0 else "unknown"
-
-        # Get files changed count
-        returncode, stat_output, _ = await _run_git_command(
-            ["diff", "--stat", "HEAD~1..HEAD"],
-            workspace,
-        )
+        # Hash and file count come from git commit's own summary output
+        header_match = _COMMIT_HEADER_PATTERN.search(stdout)
+        if header_match:
+            commit_hash = header_match.group(1)
+        else:
+            head_oid = await session.resolve("HEAD")
+            commit_hash = head_oid[:7] if head_oid else "unknown"
 
-        files_changed = 0
-        if stat_output.strip():
-            lines = stat_output.strip().split("\n")
-            if lines:
-                last_line = lines[-1]
-                if "file changed" in last_line or "files changed" in last_line:
-                    parts = last_line.split(",")
-                    for part in parts:
-                        if "file" in part:
-                            files_changed = int(part.strip().split()[0])
-                            break
+        files_match = _FILES_CHANGED_PATTERN.search(stdout)
+        files_changed = int(files_match.group(1)) if files_match else 0
 
         logger.info(
             "git_commit_completed",
@@ -163,13 +146,7 @@ async def git_log(count: int = 10, oneline: bool = True) -> str:
     if context is None:
         raise ToolExecutionError("No execution context available")
 
-    workspace = context.workspace_path
-
-    if not _is_git_repo(workspace):
-        raise GitOperationError(
-            "Not a git repository",
-            operation="log",
-        )
+    session = require_git_session(context.workspace_path, "log")
 
     # Clamp count
     count = max(1, min(100, count))
@@ -193,7 +170,7 @@ async def git_log(count: int = 10, oneline: bool = True) -> str:
                 "--format=%H|%h|%s|%an|%ai",
             ]
 
-        returncode, output, stderr = await _run_git_command(cmd, workspace)
+        returncode, output, stderr = await session.run(cmd)
 
         if returncode != 0:
             # Check if it's an empty repo
@@ -0,0 +1,446 @@
+"""Per-workspace git sessions with cached, batched plumbing.
+
+Git tools used to rediscover the repository and spawn several git
+processes for every call. A GitSession is created once per workspace
+and keeps:
+
+- the discovered repository root
+- a snapshot from a single ``git status --porcelain=v2 -z --branch``
+  call, covering branch, upstream, ahead/behind and file state
+- cached diff output per (staged, path) pair
+- a long-running ``git cat-file --batch`` process for object reads
+
+Cached state is invalidated by the tools' write events and by git tools
+that change the working tree, index or refs, and expires after
+git_status_cache_ttl_seconds so changes made by other processes are
+picked up. Sessions are closed when their workspace is cleaned up and at
+shutdown.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.tools.base import on_workspace_write
+from src.tools.exceptions import GitOperationError
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class GitStatusEntry:
+    """A single file entry from porcelain v2 status output."""
+
+    index_status: str
+    """Status in the index ('.' when unchanged, '?' for untracked)."""
+
+    worktree_status: str
+    """Status in the working tree ('.' when unchanged, '?' for untracked)."""
+
+    path: str
+    original_path: str | None = None
+    """Source path for renames and copies."""
+
+
+@dataclass
+class GitStatusSnapshot:
+    """Branch and file state from one porcelain v2 status call."""
+
+    branch: str = "unknown"
+    head_oid: str | None = None
+    upstream: str | None = None
+    ahead: int = 0
+    behind: int = 0
+    entries: list[GitStatusEntry] = field(default_factory=list)
+
+    @property
+    def staged_paths(self) -> list[str]:
+        """Paths with changes in the index."""
+        return [e.path for e in self.entries if e.index_status not in (".", "?", "!")]
+
+
+def parse_porcelain_v2(output: str) -> GitStatusSnapshot:
+    """Parse ``git status --porcelain=v2 -z --branch`` output.
+
+    Args:
+        output: NUL-separated status output
+
+    Returns:
+        Parsed status snapshot
+    """
+    snapshot = GitStatusSnapshot()
+    records = output.split("\0")
+    i = 0
+
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+
+        if record.startswith("# "):
+            key, _, value = record[2:].partition(" ")
+            if key == "branch.oid":
+                snapshot.head_oid = None if value == "(initial)" else value
+            elif key == "branch.head":
+                snapshot.branch = "HEAD" if value == "(detached)" else value
+            elif key == "branch.upstream":
+                snapshot.upstream = value
+            elif key == "branch.ab":
+                ahead, _, behind = value.partition(" ")
+                snapshot.ahead = int(ahead.lstrip("+") or 0)
+                snapshot.behind = int(behind.lstrip("-") or 0)
+            continue
+
+        kind = record[0]
+        if kind == "1":
+            parts = record.split(" ", 8)
+            snapshot.entries.append(GitStatusEntry(parts[1][0], parts[1][1], parts[8]))
+        elif kind == "2":
+            parts = record.split(" ", 9)
+            # With -z the original path follows as its own record
+            original = records[i] if i < len(records) else None
+            i += 1
+            snapshot.entries.append(
+                GitStatusEntry(parts[1][0], parts[1][1], parts[9], original_path=original)
+            )
+        elif kind == "u":
+            parts = record.split(" ", 10)
+            snapshot.entries.append(GitStatusEntry(parts[1][0], parts[1][1], parts[10]))
+        elif kind == "?":
+            snapshot.entries.append(GitStatusEntry("?", "?", record[2:]))
+
+    return snapshot
+
+
+class GitSession:
+    """Cached git access for a single workspace."""
+
+    def __init__(self, workspace: str, repo_root: Path) -> None:
+        """Initialize the session.
+
+        Args:
+            workspace: Workspace directory git commands run in
+            repo_root: Discovered repository root
+        """
+        self.workspace = workspace
+        self.repo_root = repo_root
+        self.subprocess_count = 0
+
+        # Cached values with the monotonic time they were computed at
+        self._status: tuple[float, GitStatusSnapshot] | None = None
+        self._diffs: dict[tuple[bool, str | None], tuple[float, str]] = {}
+        self._cat_file: asyncio.subprocess.Process | None = None
+        self._cat_file_lock = asyncio.Lock()
+
+    async def run(self, args: list[str]) -> tuple[int, str, str]:
+        """Run a one-off git command in the workspace.
+
+        Args:
+            args: Git command arguments (without 'git' prefix)
+
+        Returns:
+            Tuple of (return_code, stdout, stderr)
+        """
+        self.subprocess_count += 1
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=self.workspace,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+
+        return (
+            process.returncode or 0,
+            stdout.decode("utf-8", errors="replace") if stdout else "",
+            stderr.decode("utf-8", errors="replace") if stderr else "",
+        )
+
+    @staticmethod
+    def _is_fresh(cached_at: float) -> bool:
+        """Whether a cached value is within git_status_cache_ttl_seconds."""
+        return time.monotonic() - cached_at < settings.git_status_cache_ttl_seconds
+
+    async def status(self) -> GitStatusSnapshot:
+        """Get branch and file state, reusing a fresh cached snapshot.
+
+        Returns:
+            Current status snapshot
+
+        Raises:
+            GitOperationError: If git status fails
+        """
+        if self._status is None or not self._is_fresh(self._status[0]):
+            returncode, output, stderr = await self.run(
+                ["status", "--porcelain=v2", "-z", "--branch"]
+            )
+            if returncode != 0:
+                raise GitOperationError(
+                    f"Git status failed: {stderr}",
+                    operation="status",
+                    return_code=returncode,
+                    stderr=stderr,
+                )
+            self._status = (time.monotonic(), parse_porcelain_v2(output))
+        return self._status[1]
+
+    async def current_branch(self) -> str:
+        """Get the current branch name ('HEAD' when detached).
+
+        Returns:
+            Branch name, or "unknown" if status is unavailable
+        """
+        try:
+            return (await self.status()).branch
+        except GitOperationError:
+            return "unknown"
+
+    async def diff(self, staged: bool, path: str | None) -> str:
+        """Get ``git diff --stat --patch`` output, reusing fresh cached results.
+
+        Args:
+            staged: Whether to diff the index instead of the working tree
+            path: Optional pathspec to limit the diff
+
+        Returns:
+            Stat summary followed by the patch
+
+        Raises:
+            GitOperationError: If git diff fails
+        """
+        key = (staged, path)
+        cached = self._diffs.get(key)
+        if cached is None or not self._is_fresh(cached[0]):
+            cmd = ["diff", "--stat", "--patch"]
+            if staged:
+                cmd.append("--cached")
+            if path:
+                cmd.extend(["--", path])
+
+            returncode, output, stderr = await self.run(cmd)
+            if returncode != 0:
+                raise GitOperationError(
+                    f"Git diff failed: {stderr}",
+                    operation="diff",
+                    return_code=returncode,
+                    stderr=stderr,
+                )
+            cached = self._diffs[key] = (time.monotonic(), output)
+        return cached[1]
+
+    async def read_object(self, name: str) -> tuple[str, str, bytes] | None:
+        """Read an object through the long-running cat-file process.
+
+        Args:
+            name: Any revision or object name (e.g. "HEAD", "HEAD:src/main.py")
+
+        Returns:
+            Tuple of (oid, object_type, content), or None if the object is missing
+
+        Raises:
+            GitOperationError: If the cat-file process cannot be used
+        """
+        async with self._cat_file_lock:
+            process = await self._ensure_cat_file()
+            assert process.stdin is not None and process.stdout is not None
+
+            process.stdin.write(name.encode("utf-8") + b"\n")
+            await process.stdin.drain()
+
+            header = (await process.stdout.readline()).decode("utf-8").rstrip("\n")
+            if not header:
+                await self._stop_cat_file()
+                raise GitOperationError("git cat-file exited unexpectedly", operation="cat-file")
+            if header.endswith(" missing") or header.endswith(" ambiguous"):
+                return None
+
+            oid, object_type, size = header.split(" ")
+            content = await process.stdout.readexactly(int(size) + 1)
+            return oid, object_type, content[:-1]
+
+    async def resolve(self, name: str) -> str | None:
+        """Resolve a revision to its object id without spawning a process.
+
+        Args:
+            name: Revision to resolve
+
+        Returns:
+            Full object id, or None if it doesn't exist
+        """
+        obj = await self.read_object(name)
+        return obj[0] if obj else None
+
+    def invalidate(self) -> None:
+        """Drop cached status and diffs after the workspace changed.
+
+        The cat-file process is kept: it resolves refs on every request
+        and finds objects written after it started.
+        """
+        self._status = None
+        self._diffs.clear()
+
+    async def close(self) -> None:
+        """Stop the cat-file process and drop cached state."""
+        self.invalidate()
+        async with self._cat_file_lock:
+            await self._stop_cat_file()
+
+    def kill(self) -> None:
+        """Kill the cat-file process without waiting for it (for sync cleanup)."""
+        self.invalidate()
+        process, self._cat_file = self._cat_file, None
+        if process is not None and process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+
+    async def _ensure_cat_file(self) -> asyncio.subprocess.Process:
+        """Start the cat-file process if it isn't running."""
+        if self._cat_file is None or self._cat_file.returncode is not None:
+            self.subprocess_count += 1
+            self._cat_file = await asyncio.create_subprocess_exec(
+                "git",
+                "cat-file",
+                "--batch",
+                cwd=self.workspace,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        return self._cat_file
+
+    async def _stop_cat_file(self) -> None:
+        """Terminate the cat-file process."""
+        process, self._cat_file = self._cat_file, None
+        if process is None or process.returncode is not None:
+            return
+        if process.stdin is not None:
+            process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=2)
+        except TimeoutError:
+            process.kill()
+
+
+# Sessions keyed by resolved workspace path
+_sessions: dict[str, GitSession] = {}
+
+
+def find_repo_root(path: str) -> Path | None:
+    """Find the repository root containing a path.
+
+    Args:
+        path: Path to start from
+
+    Returns:
+        Repository root, or None if the path isn't inside a git repository
+    """
+    current = Path(path).resolve()
+    while True:
+        if (current / ".git").exists():
+            return current
+        if current == current.parent:
+            return None
+        current = current.parent
+
+
+def get_git_session(workspace: str) -> GitSession | None:
+    """Get or create the git session for a workspace.
+
+    Repository discovery runs once per workspace. Negative results are
+    not cached so a later ``git init`` is picked up.
+
+    Args:
+        workspace: Workspace directory
+
+    Returns:
+        The workspace's GitSession, or None if it isn't a git repository
+    """
+    key = str(Path(workspace).resolve())
+    session = _sessions.get(key)
+    if session is None:
+        repo_root = find_repo_root(key)
+        if repo_root is None:
+            return None
+        session = GitSession(workspace, repo_root)
+        _sessions[key] = session
+    return session
+
+
+def require_git_session(workspace: str, operation: str) -> GitSession:
+    """Get the git session for a workspace, failing if it isn't a repository.
+
+    Args:
+        workspace: Workspace directory
+        operation: Git operation name for the error
+
+    Returns:
+        The workspace's GitSession
+
+    Raises:
+        GitOperationError: If the workspace isn't a git repository
+    """
+    session = get_git_session(workspace)
+    if session is None:
+        raise GitOperationError("Not a git repository", operation=operation)
+    return session
+
+
+def invalidate_git_session(workspace: str) -> None:
+    """Invalidate cached git state for sessions covering a path.
+
+    Args:
+        workspace: Workspace directory, or any directory inside it
+    """
+    changed = Path(workspace).resolve()
+    for key, session in _sessions.items():
+        root = Path(key)
+        if changed == root or root in changed.parents:
+            session.invalidate()
+
+
+def _pop_sessions(workspace: str) -> list[GitSession]:
+    """Remove and return the sessions of a directory and the ones inside it."""
+    removed = Path(workspace).resolve()
+    keys = [key for key in _sessions if Path(key) == removed or removed in Path(key).parents]
+    return [_sessions.pop(key) for key in keys]
+
+
+async def close_git_session(workspace: str) -> None:
+    """Close the sessions of a workspace that is being removed.
+
+    Args:
+        workspace: Workspace directory
+    """
+    for session in _pop_sessions(workspace):
+        await session.close()
+
+
+def discard_git_session(workspace: str) -> None:
+    """Drop the sessions of a removed workspace without awaiting them.
+
+    Their cat-file processes are killed. Prefer close_git_session() when
+    running on the event loop.
+
+    Args:
+        workspace: Workspace directory
+    """
+    for session in _pop_sessions(workspace):
+        session.kill()
+
+
+async def close_git_sessions() -> None:
+    """Close every git session and its cat-file process."""
+    sessions = list(_sessions.values())
+    _sessions.clear()
+    for session in sessions:
+        await session.close()
+
+
+on_workspace_write(lambda workspace, _path: invalidate_git_session(workspace))
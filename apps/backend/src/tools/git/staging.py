@@ -8,7 +8,7 @@ from langchain_core.tools import tool
 from src.core.logging import get_logger
 from src.tools.base import ToolPermission, get_current_context
 from src.tools.exceptions import GitOperationError, PermissionDeniedError, ToolExecutionError
-from src.tools.git.status import _is_git_repo, _run_git_command
+from src.tools.git.session import require_git_session
 
 logger = get_logger(__name__)
 
@@ -39,13 +39,7 @@ async def git_add(paths: list[str]) -> str:
             operation="git_add",
         )
 
-    workspace = context.workspace_path
-
-    if not _is_git_repo(workspace):
-        raise GitOperationError(
-            "Not a git repository",
-            operation="add",
-        )
+    session = require_git_session(context.workspace_path, "add")
 
     if not paths:
         raise GitOperationError(
@@ -62,7 +56,8 @@ async def git_add(paths: list[str]) -> str:
     try:
         # Run git add
         cmd = ["add"] + paths
-        returncode, stdout, stderr = await _run_git_command(cmd, workspace)
+        returncode, stdout, stderr = await session.run(cmd)
+        session.invalidate()
 
         if returncode != 0:
             raise GitOperationError(
@@ -72,13 +67,8 @@ async def git_add(paths: list[str]) -> str:
                 stderr=stderr,
             )
 
-        # Get list of what was staged
-        returncode, status_output, _ = await _run_git_command(
-            ["diff", "--cached", "--name-only"],
-            workspace,
-        )
-
-        staged_files = status_output.strip().split("\n") if status_output.strip() else []
+        # Get list of what was staged (this status also serves later git_status calls)
+        staged_files = (await session.status()).staged_paths
 
         logger.info(
             "git_add_completed",
@@ -136,13 +126,7 @@ async def git_reset(paths: list[str]) -> str:
             operation="git_reset",
         )
 
-    workspace = context.workspace_path
-
-    if not _is_git_repo(workspace):
-        raise GitOperationError(
-            "Not a git repository",
-            operation="reset",
-        )
+    session = require_git_session(context.workspace_path, "reset")
 
     if not paths:
         raise GitOperationError(
@@ -158,22 +142,20 @@ async def git_reset(paths: list[str]) -> str:
 
     try:
         # Get list of currently staged files (before reset)
-        returncode, before_output, _ = await _run_git_command(
-            ["diff", "--cached", "--name-only"],
-            workspace,
-        )
-        staged_before = set(before_output.strip().split("\n")) if before_output.strip() else set()
+        staged_before = set((await session.status()).staged_paths)
 
         # Run git reset
         cmd = ["reset", "HEAD", "--"] + paths
-        returncode, stdout, stderr = await _run_git_command(cmd, workspace)
+        returncode, stdout, stderr = await session.run(cmd)
+        session.invalidate()
 
         if returncode != 0:
             # git reset returns non-zero for some valid cases, check stderr
             if "does not have any commits yet" in stderr:
                 # For initial commit, use rm --cached
                 cmd = ["rm", "--cached", "-r"] + paths
-                returncode, stdout, stderr = await _run_git_command(cmd, workspace)
+                returncode, stdout, stderr = await session.run(cmd)
+                session.invalidate()
                 if returncode != 0:
                     raise GitOperationError(
                         f"Git reset failed: {stderr}",
@@ -183,11 +165,7 @@ async def git_reset(paths: list[str]) -> str:
                     )
 
         # Get list of currently staged files (after reset)
-        returncode, after_output, _ = await _run_git_command(
-            ["diff", "--cached", "--name-only"],
-            workspace,
-        )
-        staged_after = set(after_output.strip().split("\n")) if after_output.strip() else set()
+        staged_after = set((await session.status()).staged_paths)
 
         # Calculate what was unstaged
         unstaged_files = list(staged_before - staged_after)
@@ -3,67 +3,16 @@
 Provides tools for checking repository status and viewing diffs.
 """
 
-import asyncio
-from pathlib import Path
-
 from langchain_core.tools import tool
 
 from src.core.logging import get_logger
 from src.tools.base import get_current_context
 from src.tools.exceptions import GitOperationError, ToolExecutionError
+from src.tools.git.session import require_git_session
 
 logger = get_logger(__name__)
 
 
-async def _run_git_command(
-    args: list[str],
-    cwd: str,
-    capture_output: bool = True,
-) -> tuple[int, str, str]:
-    """Run a git command asynchronously.
-
-    Args:
-        args: Git command arguments (without 'git' prefix)
-        cwd: Working directory
-        capture_output: Whether to capture stdout/stderr
-
-    Returns:
-        Tuple of (return_code, stdout, stderr)
-    """
-    process = await asyncio.create_subprocess_exec(
-        "git",
-        *args,
-        cwd=cwd,
-        stdout=asyncio.subprocess.PIPE if capture_output else None,
-        stderr=asyncio.subprocess.PIPE if capture_output else None,
-    )
-
-    stdout, stderr = await process.communicate()
-
-    return (
-        process.returncode or 0,
-        stdout.decode("utf-8") if stdout else "",
-        stderr.decode("utf-8") if stderr else "",
-    )
-
-
-def _is_git_repo(path: str) -> bool:
-    """Check if a path is inside a git repository.
-
-    Args:
-        path: Path to check
-
-    Returns:
-        True if path is in a git repo
-    """
-    current = Path(path).resolve()
-    while current != current.parent:
-        if (current / ".git").exists():
-            return True
-        current = current.parent
-    return False
-
-
 @tool
 async def git_status() -> str:
     """Get the current git repository status.
@@ -86,13 +35,7 @@ async def git_status() -> str:
         raise ToolExecutionError("No execution context available")
 
     workspace = context.workspace_path
-
-    # Check if workspace is a git repo
-    if not _is_git_repo(workspace):
-        raise GitOperationError(
-            "Not a git repository",
-            operation="status",
-        )
+    session = require_git_session(workspace, "status")
 
     logger.info(
         "git_status_started",
@@ -101,56 +44,28 @@ async def git_status() -> str:
     )
 
     try:
-        # Get branch name
-        returncode, branch, stderr = await _run_git_command(
-            ["rev-parse", "--abbrev-ref", "HEAD"],
-            workspace,
-        )
-        if returncode != 0:
-            branch = "unknown"
-        else:
-            branch = branch.strip()
-
-        # Get status
-        returncode, output, stderr = await _run_git_command(
-            ["status", "--porcelain", "-b"],
-            workspace,
-        )
-
-        if returncode != 0:
-            raise GitOperationError(
-                f"Git status failed: {stderr}",
-                operation="status",
-                return_code=returncode,
-                stderr=stderr,
-            )
-
-        # Parse status output
-        lines = output.strip().split("\n") if output.strip() else []
+        # Branch, ahead/behind and file state from a single (cached) status call
+        snapshot = await session.status()
+        branch = snapshot.branch
+        ahead = snapshot.ahead
+        behind = snapshot.behind
 
         staged: list[str] = []
         modified: list[str] = []
         untracked: list[str] = []
         deleted: list[str] = []
 
-        for line in lines:
-            if line.startswith("##"):
-                # Branch info line - extract ahead/behind
-                continue
-
-            if len(line) < 2:
-                continue
-
-            index_status = line[0]
-            work_tree_status = line[1]
-            file_path = line[3:].strip()
+        for entry in snapshot.entries:
+            index_status = entry.index_status
+            work_tree_status = entry.worktree_status
+            file_path = entry.path
 
             # Staged changes (index has changes)
             if index_status in ("A", "M", "D", "R", "C"):
                 if index_status == "D":
                     staged.append(f"{file_path} (deleted)")
                 elif index_status == "R":
-                    staged.append(f"{file_path} (renamed)")
+                    staged.append(f"{entry.original_path} -> {file_path} (renamed)")
                 else:
                     staged.append(file_path)
 
@@ -164,19 +79,6 @@ async def git_status() -> str:
             if index_status == "?" and work_tree_status == "?":
                 untracked.append(file_path)
 
-        # Check for ahead/behind
-        returncode, ahead_behind, _ = await _run_git_command(
-            ["rev-list", "--left-right", "--count", f"{branch}...origin/{branch}"],
-            workspace,
-        )
-        ahead = 0
-        behind = 0
-        if returncode == 0 and ahead_behind.strip():
-            parts = ahead_behind.strip().split()
-            if len(parts) == 2:
-                ahead = int(parts[0])
-                behind = int(parts[1])
-
         is_clean = not (staged or modified or untracked or deleted)
 
         # Format output
@@ -254,13 +156,7 @@ async def git_diff(staged: bool = False, path: str | None = None) -> str:
     if context is None:
         raise ToolExecutionError("No execution context available")
 
-    workspace = context.workspace_path
-
-    if not _is_git_repo(workspace):
-        raise GitOperationError(
-            "Not a git repository",
-            operation="diff",
-        )
+    session = require_git_session(context.workspace_path, "diff")
 
     logger.info(
         "git_diff_started",
@@ -270,42 +166,10 @@ async def git_diff(staged: bool = False, path: str | None = None) -> str:
     )
 
     try:
-        # Build command
-        cmd = ["diff"]
-        if staged:
-            cmd.append("--cached")
-        cmd.append("--stat")  # Add stat summary
-        if path:
-            cmd.append("--")
-            cmd.append(path)
-
-        returncode, stat_output, stderr = await _run_git_command(cmd, workspace)
-
-        if returncode != 0:
-            raise GitOperationError(
-                f"Git diff failed: {stderr}",
-                operation="diff",
-                return_code=returncode,
-                stderr=stderr,
-            )
-
-        # Get full diff
-        cmd = ["diff"]
-        if staged:
-            cmd.append("--cached")
-        if path:
-            cmd.append("--")
-            cmd.append(path)
-
-        returncode, diff_output, stderr = await _run_git_command(cmd, workspace)
-
-        if returncode != 0:
-            raise GitOperationError(
-                f"Git diff failed: {stderr}",
-                operation="diff",
-                return_code=returncode,
-                stderr=stderr,
-            )
+        # Stat summary and patch in one call: the patch starts at the first "diff --git"
+        output = await session.diff(staged, path)
+        stat_output, separator, patch = output.partition("\ndiff --git")
+        diff_output = f"diff --git{patch}" if separator else ""
 
         # Parse stats
         lines = stat_output.strip().split("\n") if stat_output.strip() else []
@@ -12,7 +12,7 @@ from typing import Any
 from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
 
-from src.core.logging import get_logger
+from src.core.logging import get_logger, lazy
 
 logger = get_logger(__name__)
 
@@ -94,6 +94,7 @@ class ToolRegistry:
             category: [] for category in ToolCategory
         }
         self._all_tools: list[BaseTool] = []
+        self._version = 0
 
         ToolRegistry._initialized = True
         logger.info("tool_registry_initialized")
@@ -113,6 +114,7 @@ class ToolRegistry:
             self._tools[category].append(tool)
             if tool not in self._all_tools:
                 self._all_tools.append(tool)
+            self._version += 1
 
             logger.debug(
                 "tool_registered",
@@ -120,6 +122,14 @@ class ToolRegistry:
                 category=category.value,
             )
 
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the registered tool set changes.
+
+        Used to key caches of models with tools bound.
+        """
+        return self._version
+
     def register_many(
         self,
         tools: list[BaseTool],
@@ -175,7 +185,7 @@ class ToolRegistry:
             "tools_retrieved_for_agent",
             agent_type=agent_type.value,
             tool_count=len(tools),
-            tool_names=[t.name for t in tools],
+            tool_names=lazy(lambda: [t.name for t in tools]),
         )
 
         return tools
@@ -206,6 +216,7 @@ class ToolRegistry:
         """Clear all registered tools (mainly for testing)."""
         self._tools = {category: [] for category in ToolCategory}
         self._all_tools = []
+        self._version += 1
         logger.debug("tool_registry_cleared")
 
 
@@ -252,7 +263,9 @@ def bind_tools_to_model(
     Returns:
         Model with tools bound
     """
-    tools = get_tools_for_agent(agent_type)
+    # Bind in name order so the tool definitions form a stable prompt prefix
+    # across processes (required for vLLM prefix and Anthropic prompt caching)
+    tools = sorted(get_tools_for_agent(agent_type), key=lambda t: t.name)
 
     if not tools:
         logger.warning(
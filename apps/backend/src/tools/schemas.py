@@ -126,6 +126,22 @@ class ListDirectoryInput(BaseModel):
         ge=1,
         le=10,
     )
+    cursor: str | None = Field(
+        default=None,
+        description="Cursor returned by a previous truncated listing",
+    )
+    max_entries: int = Field(
+        default=200,
+        description="Maximum entries per page",
+        ge=1,
+        le=1000,
+    )
+    max_tokens: int = Field(
+        default=2000,
+        description="Approximate token budget for the listing",
+        ge=100,
+        le=20000,
+    )
 
 
 class FileInfo(BaseModel):
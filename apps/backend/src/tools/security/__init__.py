@@ -3,6 +3,7 @@
 This module provides security features including:
 - Path validation to prevent traversal attacks
 - Workspace isolation for task execution
+- Copy-on-write workspace provisioning strategies
 """
 
 from src.tools.security.path_validator import (
@@ -10,6 +11,11 @@ from src.tools.security.path_validator import (
     normalize_path,
     validate_path,
 )
+from src.tools.security.provisioning import (
+    WorkspaceProvisioner,
+    break_hardlink,
+    break_workspace_hardlinks_async,
+)
 from src.tools.security.workspace import (
     WorkspaceManager,
     get_workspace_manager,
@@ -17,6 +23,9 @@ from src.tools.security.workspace import (
 
 __all__ = [
     "WorkspaceManager",
+    "WorkspaceProvisioner",
+    "break_hardlink",
+    "break_workspace_hardlinks_async",
     "get_workspace_manager",
     "is_safe_path",
     "normalize_path",
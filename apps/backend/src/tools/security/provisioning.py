@@ -0,0 +1,549 @@
+"""Workspace provisioning strategies.
+
+Copying a full repository into every task workspace is slow for large
+repositories and doubles disk usage per concurrent task. This module
+provides a layer of provisioning backends that share data with the
+source repository instead of duplicating it:
+
+- ``reflink``: copy-on-write clones of every file (Btrfs, XFS, ...)
+- ``git_clone``: a ``git clone --shared`` borrowing the source's objects
+  but with its own refs, plus the gitignored files (``.env``, ...)
+- ``hardlink``: a hardlink farm sharing inodes with the source (opt-in)
+- ``copy``: plain ``shutil.copytree`` (always available, last resort)
+
+Strategies are tried in order and fall back cleanly to the next one.
+All of them are blocking and are meant to run off the event loop.
+
+Only ``reflink`` and ``copy`` (and ``git_clone`` for its checkout) give the
+workspace its own file data. A hardlinked file written in place changes
+the source too, so the hardlink strategy is not in the default chain and
+every write path breaks the links first: file tools call
+:func:`break_hardlink`, and subprocess tools (shell, Python, pytest,
+fixers) call :func:`break_workspace_hardlinks_async` before running.
+"""
+
+import asyncio
+import errno
+import fnmatch
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import ClassVar
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Entries never provisioned into a workspace
+DEFAULT_IGNORE_PATTERNS: tuple[str, ...] = (
+    ".git",
+    "__pycache__",
+    "*.pyc",
+    "node_modules",
+    ".venv",
+    "venv",
+)
+
+# Strategies tried when none are configured (hardlink farms are opt-in)
+DEFAULT_STRATEGY_NAMES: tuple[str, ...] = ("reflink", "git_clone", "copy")
+
+# Linux ioctl request number for FICLONE (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+# Errors meaning the filesystem cannot clone between the two files at all
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY})
+
+# Failed paths named in a tree copy error
+_FAILED_PATHS_SAMPLE = 3
+
+# Timeout for git plumbing used by the clone strategy
+_GIT_TIMEOUT_SECONDS = 60
+
+# Hardlink farm workspaces whose files may still share inodes with the source
+_linked_workspaces: set[Path] = set()
+_linked_workspaces_lock = Lock()
+
+
+class ProvisioningStrategy(ABC):
+    """Base class for workspace provisioning backends."""
+
+    name: str = "base"
+
+    @abstractmethod
+    def is_supported(self, source: Path, target: Path) -> bool:
+        """Check whether this strategy can provision from a source.
+
+        Args:
+            source: Source repository directory
+            target: Workspace directory to create
+
+        Returns:
+            True if the strategy should be attempted
+        """
+
+    @abstractmethod
+    def provision(self, source: Path, target: Path) -> None:
+        """Materialise the source directory at the target path.
+
+        Args:
+            source: Source repository directory
+            target: Workspace directory to create (must not exist)
+
+        Raises:
+            OSError: If provisioning fails
+        """
+
+    def release(self, source: Path, target: Path) -> None:
+        """Remove a workspace created by this strategy.
+
+        Args:
+            source: Source repository directory
+            target: Workspace directory to remove
+        """
+        shutil.rmtree(target)
+
+
+class _TreeCopyStrategy(ProvisioningStrategy):
+    """Strategy that walks the tree with a custom per-file copy function."""
+
+    def __init__(self, ignore_patterns: Sequence[str] = DEFAULT_IGNORE_PATTERNS) -> None:
+        """Initialize the strategy.
+
+        Args:
+            ignore_patterns: Glob patterns excluded from the workspace
+        """
+        self._ignore = shutil.ignore_patterns(*ignore_patterns)
+
+    def _copy_function(self) -> Callable[[str, str], object]:
+        """Return the function used to materialise a single file."""
+        return shutil.copy2
+
+    def is_supported(self, source: Path, target: Path) -> bool:
+        """Tree copies work for any readable directory."""
+        return source.is_dir()
+
+    def provision(self, source: Path, target: Path) -> None:
+        """Recreate the directory structure using the copy function.
+
+        Raises:
+            OSError: If any file could not be copied (with a count and a
+                sample of the failed paths)
+        """
+        try:
+            shutil.copytree(
+                source,
+                target,
+                symlinks=True,
+                ignore=self._ignore,
+                copy_function=self._copy_function(),
+            )
+        except shutil.Error as e:
+            failures: list[tuple[str, str, str]] = e.args[0]
+            sample = ", ".join(str(src) for src, _, _ in failures[:_FAILED_PATHS_SAMPLE])
+            raise OSError(
+                f"{len(failures)} entries failed to copy ({failures[0][2]}); e.g. {sample}"
+            ) from None
+
+
+class CopyStrategy(_TreeCopyStrategy):
+    """Full byte-for-byte copy of the source tree."""
+
+    name = "copy"
+
+
+class HardlinkStrategy(_TreeCopyStrategy):
+    """Hardlink farm sharing file data with the source repository.
+
+    Opt-in, and meant for read-only sources: any in-place write or chmod
+    through a shared inode changes the source file too. File tools call
+    :func:`break_hardlink` before writing, and subprocess tools call
+    :func:`break_workspace_hardlinks_async`, which gives every file of
+    the workspace its own inode before the first command runs.
+    """
+
+    name = "hardlink"
+
+    def _copy_function(self) -> Callable[[str, str], object]:
+        """Link files instead of copying them."""
+        return os.link
+
+    def provision(self, source: Path, target: Path) -> None:
+        """Link the tree and remember the workspace shares inodes."""
+        super().provision(source, target)
+        with _linked_workspaces_lock:
+            _linked_workspaces.add(target.resolve())
+
+    def release(self, source: Path, target: Path) -> None:
+        """Remove the workspace (the source keeps its links)."""
+        with _linked_workspaces_lock:
+            _linked_workspaces.discard(target.resolve())
+        super().release(source, target)
+
+
+class ReflinkStrategy(_TreeCopyStrategy):
+    """Copy-on-write clones using the Linux FICLONE ioctl.
+
+    Cloned files share extents with the source until either side
+    writes, so no special handling is needed by writers.
+
+    Support is probed once per target filesystem by cloning a temporary
+    file, and the first file that cannot be cloned at all (e.g. the source
+    is on another filesystem) stops the tree walk.
+    """
+
+    name = "reflink"
+
+    # Probe results by device of the directory the workspaces are created in
+    _supported_devices: ClassVar[dict[int, bool]] = {}
+
+    def is_supported(self, source: Path, target: Path) -> bool:
+        """Check the target filesystem clones files (Linux only)."""
+        if not sys.platform.startswith("linux") or not source.is_dir():
+            return False
+
+        directory = target.parent
+        while not directory.exists():
+            directory = directory.parent
+        device = directory.stat().st_dev
+
+        supported = self._supported_devices.get(device)
+        if supported is None:
+            supported = _probe_reflink(directory)
+            self._supported_devices[device] = supported
+            logger.info("reflink_probe", directory=str(directory), supported=supported)
+        return supported
+
+    def provision(self, source: Path, target: Path) -> None:
+        """Clone the tree, giving up on the first file that cannot be cloned."""
+        try:
+            super().provision(source, target)
+        except _ReflinkUnsupportedError as e:
+            raise OSError(f"Reflink not supported for {e.path}: {e.__cause__}") from e
+
+    def _copy_function(self) -> Callable[[str, str], object]:
+        """Clone files instead of copying them."""
+        return _clone_or_stop
+
+
+class GitCloneStrategy(ProvisioningStrategy):
+    """``git clone --shared`` of the source repository.
+
+    The clone borrows the source's object store through alternates, so
+    only the checkout is written, but it has its own refs: branches and
+    commits made by the git tools stay in the workspace. The ``origin``
+    remote is removed so nothing can be pushed back to the source.
+    Gitignored files (``.env``, local settings, ...) are copied over,
+    except those matching the ignore patterns.
+
+    Only used when the source working tree is clean, since a clone
+    checks out ``HEAD`` and would silently drop uncommitted changes.
+    """
+
+    name = "git_clone"
+
+    def __init__(self, ignore_patterns: Sequence[str] = DEFAULT_IGNORE_PATTERNS) -> None:
+        """Initialize the strategy.
+
+        Args:
+            ignore_patterns: Glob patterns of ignored files not copied over
+        """
+        self._ignore_patterns = tuple(ignore_patterns)
+
+    def is_supported(self, source: Path, target: Path) -> bool:
+        """Check for a git binary and a clean repository at the source root."""
+        if shutil.which("git") is None or not (source / ".git").exists():
+            return False
+
+        result = _run_git(["status", "--porcelain"], source)
+        return result.returncode == 0 and not result.stdout.strip()
+
+    def provision(self, source: Path, target: Path) -> None:
+        """Clone the source and copy its ignored files."""
+        result = _run_git(["clone", "--shared", "--quiet", str(source), str(target)], source)
+        if result.returncode != 0:
+            raise OSError(f"git clone failed: {result.stderr.strip()}")
+
+        result = _run_git(["remote", "remove", "origin"], target)
+        if result.returncode != 0:
+            raise OSError(f"git remote remove failed: {result.stderr.strip()}")
+
+        self._copy_ignored_files(source, target)
+
+    def _copy_ignored_files(self, source: Path, target: Path) -> None:
+        """Copy the files git does not track (ignored by .gitignore)."""
+        result = _run_git(
+            ["ls-files", "--others", "--ignored", "--exclude-standard", "--directory", "-z"],
+            source,
+        )
+        if result.returncode != 0:
+            raise OSError(f"git ls-files failed: {result.stderr.strip()}")
+
+        ignore = shutil.ignore_patterns(*self._ignore_patterns)
+        for entry in filter(None, result.stdout.split("\0")):
+            relative = Path(entry.rstrip("/"))
+            if any(
+                fnmatch.fnmatch(part, pattern)
+                for part in relative.parts
+                for pattern in self._ignore_patterns
+            ):
+                continue
+
+            path, destination = source / relative, target / relative
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            if path.is_dir() and not path.is_symlink():
+                shutil.copytree(path, destination, symlinks=True, ignore=ignore)
+            else:
+                shutil.copy2(path, destination, follow_symlinks=False)
+
+
+STRATEGIES: dict[str, type[ProvisioningStrategy]] = {
+    ReflinkStrategy.name: ReflinkStrategy,
+    GitCloneStrategy.name: GitCloneStrategy,
+    HardlinkStrategy.name: HardlinkStrategy,
+    CopyStrategy.name: CopyStrategy,
+}
+
+
+@dataclass
+class ProvisionedWorkspace:
+    """A workspace together with the strategy that created it."""
+
+    path: Path
+    source: Path | None
+    strategy: ProvisioningStrategy
+
+
+class WorkspaceProvisioner:
+    """Provisions workspaces using an ordered chain of strategies.
+
+    Each strategy is attempted in turn; a failed attempt removes any
+    partially created target before falling back to the next one.
+    A plain copy is always appended as the final fallback.
+    """
+
+    def __init__(self, strategy_names: Sequence[str] | None = None) -> None:
+        """Initialize the provisioner.
+
+        Args:
+            strategy_names: Ordered strategy names to try.
+                           Defaults to DEFAULT_STRATEGY_NAMES.
+
+        Raises:
+            ValueError: If an unknown strategy name is given
+        """
+        names = list(strategy_names or DEFAULT_STRATEGY_NAMES)
+        unknown = [name for name in names if name not in STRATEGIES]
+        if unknown:
+            raise ValueError(f"Unknown provisioning strategies: {', '.join(unknown)}")
+
+        if CopyStrategy.name not in names:
+            names.append(CopyStrategy.name)
+
+        self._strategies = [STRATEGIES[name]() for name in names]
+
+    @property
+    def strategies(self) -> list[ProvisioningStrategy]:
+        """Get the ordered strategy chain."""
+        return list(self._strategies)
+
+    def provision(self, source: Path, target: Path) -> ProvisionedWorkspace:
+        """Provision a workspace from a source directory.
+
+        Args:
+            source: Source repository directory
+            target: Workspace directory to create
+
+        Returns:
+            The provisioned workspace
+
+        Raises:
+            OSError: If every strategy fails
+        """
+        last_error: Exception | None = None
+
+        for strategy in self._strategies:
+            try:
+                if not strategy.is_supported(source, target):
+                    continue
+                strategy.provision(source, target)
+                return ProvisionedWorkspace(path=target, source=source, strategy=strategy)
+            except (OSError, subprocess.SubprocessError) as e:
+                last_error = e
+                logger.warning(
+                    "workspace_provisioning_fallback",
+                    strategy=strategy.name,
+                    source=str(source),
+                    error=str(e),
+                )
+                _remove_partial(target)
+
+        raise OSError(f"All provisioning strategies failed for {source}") from last_error
+
+
+def break_hardlink(path: Path) -> bool:
+    """Give a hardlinked file its own inode before it is modified.
+
+    Workspaces provisioned with :class:`HardlinkStrategy` share inodes
+    with the source repository. Replacing the file with a private copy
+    keeps in-place writes from leaking back into the source.
+
+    Args:
+        path: File about to be written
+
+    Returns:
+        True if the file was linked and now has its own inode
+    """
+    try:
+        if path.is_symlink() or path.stat().st_nlink <= 1:
+            return False
+    except FileNotFoundError:
+        return False
+
+    private_copy = path.with_name(f".{path.name}.cow")
+    shutil.copy2(path, private_copy)
+    os.replace(private_copy, path)
+    return True
+
+
+def break_workspace_hardlinks(path: str | Path) -> int:
+    """Give every file of a hardlinked workspace its own inode.
+
+    Subprocesses can write to any file in the workspace, so a hardlink
+    farm is turned into a private copy before the first one runs. Paths
+    outside hardlink farm workspaces are left untouched.
+
+    Args:
+        path: Workspace root, or a file or directory inside it
+
+    Returns:
+        Number of files whose link was broken
+    """
+    resolved = Path(path).resolve()
+
+    with _linked_workspaces_lock:
+        root = next(
+            (root for root in _linked_workspaces if resolved.is_relative_to(root)),
+            None,
+        )
+        if root is None:
+            return 0
+
+        broken = 0
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                broken += break_hardlink(Path(directory) / filename)
+        _linked_workspaces.discard(root)
+
+    logger.info("workspace_hardlinks_broken", workspace=str(root), files=broken)
+    return broken
+
+
+async def break_workspace_hardlinks_async(path: str | Path) -> int:
+    """Async version of :func:`break_workspace_hardlinks`, run off the event loop.
+
+    Args:
+        path: Workspace root, or a file or directory inside it
+
+    Returns:
+        Number of files whose link was broken
+    """
+    if not _linked_workspaces:
+        return 0
+    return await asyncio.to_thread(break_workspace_hardlinks, path)
+
+
+class _ReflinkUnsupportedError(Exception):
+    """Raised to stop a tree clone (not an OSError, which copytree collects)."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.path = path
+
+
+def _reflink_file(src: str, dst: str) -> str:
+    """Clone a single file with FICLONE, preserving metadata.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        The destination path
+
+    Raises:
+        OSError: If the filesystem does not support reflinks
+    """
+    import fcntl
+
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    except OSError:
+        Path(dst).unlink(missing_ok=True)
+        raise
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _clone_or_stop(src: str, dst: str) -> str:
+    """Clone a file, aborting the tree walk if reflinks are unsupported."""
+    try:
+        return _reflink_file(src, dst)
+    except OSError as e:
+        if e.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+            raise _ReflinkUnsupportedError(src) from e
+        raise
+
+
+def _probe_reflink(directory: Path) -> bool:
+    """Check whether files in a directory can be cloned with FICLONE.
+
+    Args:
+        directory: Existing directory on the filesystem to probe
+
+    Returns:
+        True if a temporary file could be cloned
+    """
+    try:
+        with tempfile.TemporaryDirectory(prefix=".reflink-probe-", dir=directory) as probe:
+            original = Path(probe) / "original"
+            original.write_bytes(b"reflink probe")
+            _reflink_file(str(original), str(Path(probe) / "clone"))
+    except OSError:
+        return False
+    return True
+
+
+def _run_git(args: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
+    """Run a blocking git command for provisioning.
+
+    Args:
+        args: Git command arguments (without 'git' prefix)
+        cwd: Working directory
+
+    Returns:
+        Completed process with captured text output
+    """
+    return subprocess.run(  # noqa: S603
+        ["git", *args],  # noqa: S607
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=_GIT_TIMEOUT_SECONDS,
+        check=False,
+    )
+
+
+def _remove_partial(target: Path) -> None:
+    """Remove a partially provisioned target directory."""
+    if target.is_symlink() or target.is_file():
+        target.unlink()
+    elif target.exists():
+        shutil.rmtree(target, ignore_errors=True)
@@ -4,19 +4,104 @@ This module provides workspace isolation, ensuring each task
 executes within its own sandboxed directory structure.
 """
 
+import asyncio
+import os
 import shutil
 import tempfile
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from src.core.config import settings
 from src.core.logging import get_logger
-from src.tools.exceptions import WorkspaceNotFoundError
+from src.tools.exceptions import WorkspaceNotFoundError, WorkspaceQuotaExceededError
+from src.tools.git.session import close_git_session, discard_git_session
+from src.tools.security.provisioning import ProvisionedWorkspace, WorkspaceProvisioner
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class WorkspaceUsage:
+    """Running disk usage totals for a workspace.
+
+    Totals are maintained incrementally by the filesystem tools and
+    periodically corrected by a full reconciliation scan.
+    """
+
+    file_count: int = 0
+    directory_count: int = 0
+    total_bytes: int = 0
+    baseline_bytes: int = 0
+    """Size of the workspace when it was provisioned; excluded from the quota."""
+
+    quota_bytes: int | None = None
+    """Maximum bytes the task may add on top of the baseline (None = unlimited)."""
+
+    operations_since_reconcile: int = 0
+    last_reconciled: float = field(default_factory=time.monotonic)
+
+    @property
+    def bytes_written(self) -> int:
+        """Bytes added by the task since provisioning."""
+        return self.total_bytes - self.baseline_bytes
+
+
+def scan_workspace_usage(root: Path) -> tuple[int, int, int]:
+    """Count files, directories and bytes below a directory.
+
+    Uses os.scandir so each entry's stat comes from the directory read
+    where the platform supports it. Symlinks are counted but not followed.
+
+    Args:
+        root: Directory to scan
+
+    Returns:
+        Tuple of (file_count, directory_count, total_bytes)
+    """
+    file_count = 0
+    dir_count = 0
+    total_bytes = 0
+    pending = [root]
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dir_count += 1
+                            pending.append(Path(entry.path))
+                        else:
+                            file_count += 1
+                            total_bytes += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    return file_count, dir_count, total_bytes
+
+
+def count_missing_directories(path: Path) -> int:
+    """Count how many directories mkdir(parents=True) would create.
+
+    Args:
+        path: Directory path about to be created
+
+    Returns:
+        Number of path components that don't exist yet
+    """
+    missing = 0
+    current = path
+    while not current.exists() and current != current.parent:
+        missing += 1
+        current = current.parent
+    return missing
+
+
 class WorkspaceManager:
     """Manages isolated workspaces for task execution.
 
@@ -24,12 +109,18 @@ class WorkspaceManager:
     operations are sandboxed.
     """
 
-    def __init__(self, base_path: str | None = None) -> None:
+    def __init__(
+        self,
+        base_path: str | None = None,
+        provisioner: WorkspaceProvisioner | None = None,
+    ) -> None:
         """Initialize the workspace manager.
 
         Args:
             base_path: Base directory for workspaces.
                       Defaults to system temp directory.
+            provisioner: Strategy chain used to populate workspaces from a
+                        source repository. Defaults to the configured chain.
         """
         if base_path:
             self._base_path = Path(base_path)
@@ -40,8 +131,14 @@ class WorkspaceManager:
         # Ensure base path exists
         self._base_path.mkdir(parents=True, exist_ok=True)
 
+        self._provisioner = provisioner or WorkspaceProvisioner(
+            settings.workspace_provisioning_strategies
+        )
+
         # Track active workspaces
         self._workspaces: dict[int, Path] = {}
+        self._provisioned: dict[int, ProvisionedWorkspace] = {}
+        self._usage: dict[int, WorkspaceUsage] = {}
 
         logger.info(
             "workspace_manager_initialized",
@@ -60,12 +157,15 @@ class WorkspaceManager:
     ) -> Path:
         """Create a new workspace for a task.
 
-        If source_path is provided, the contents will be copied
-        to the new workspace.
+        If source_path is provided, the contents are provisioned into
+        the new workspace using the first strategy that succeeds
+        (by default reflink, git clone, then a full copy).
+
+        This call blocks; use create_workspace_async from coroutines.
 
         Args:
             task_id: ID of the task
-            source_path: Optional path to copy contents from
+            source_path: Optional path to provision contents from
 
         Returns:
             Path to the created workspace
@@ -78,26 +178,18 @@ class WorkspaceManager:
         workspace_name = f"task_{task_id}_{timestamp}"
         workspace_path = self._base_path / workspace_name
 
+        strategy_name: str | None = None
+
         try:
             if source_path:
-                # Copy source to workspace
                 source = Path(source_path)
                 if not source.exists():
                     raise WorkspaceNotFoundError(source_path)
 
                 if source.is_dir():
-                    shutil.copytree(
-                        source,
-                        workspace_path,
-                        ignore=shutil.ignore_patterns(
-                            ".git",
-                            "__pycache__",
-                            "*.pyc",
-                            "node_modules",
-                            ".venv",
-                            "venv",
-                        ),
-                    )
+                    provisioned = self._provisioner.provision(source.resolve(), workspace_path)
+                    self._provisioned[task_id] = provisioned
+                    strategy_name = provisioned.strategy.name
                 else:
                     workspace_path.mkdir(parents=True)
                     shutil.copy2(source, workspace_path / source.name)
@@ -106,12 +198,14 @@ class WorkspaceManager:
 
             # Track the workspace
             self._workspaces[task_id] = workspace_path
+            self._start_usage_tracking(task_id, workspace_path)
 
             logger.info(
                 "workspace_created",
                 task_id=task_id,
                 workspace_path=str(workspace_path),
                 copied_from=source_path,
+                strategy=strategy_name,
             )
 
             return workspace_path
@@ -125,6 +219,22 @@ class WorkspaceManager:
             )
             raise
 
+    async def create_workspace_async(
+        self,
+        task_id: int,
+        source_path: str | None = None,
+    ) -> Path:
+        """Create a workspace without blocking the event loop.
+
+        Args:
+            task_id: ID of the task
+            source_path: Optional path to provision contents from
+
+        Returns:
+            Path to the created workspace
+        """
+        return await asyncio.to_thread(self.create_workspace, task_id, source_path)
+
     def get_workspace(self, task_id: int) -> Path:
         """Get the workspace path for a task.
 
@@ -163,10 +273,17 @@ class WorkspaceManager:
             task_id: ID of the task
         """
         workspace_path = self._workspaces.pop(task_id, None)
+        provisioned = self._provisioned.pop(task_id, None)
+        self._usage.pop(task_id, None)
+        if workspace_path:
+            discard_git_session(str(workspace_path))
 
         if workspace_path and workspace_path.exists():
             try:
-                shutil.rmtree(workspace_path)
+                if provisioned and provisioned.source is not None:
+                    provisioned.strategy.release(provisioned.source, workspace_path)
+                else:
+                    shutil.rmtree(workspace_path)
                 logger.info(
                     "workspace_cleaned_up",
                     task_id=task_id,
@@ -180,6 +297,17 @@ class WorkspaceManager:
                     exc_info=True,
                 )
 
+    async def cleanup_workspace_async(self, task_id: int) -> None:
+        """Remove a workspace without blocking the event loop.
+
+        Args:
+            task_id: ID of the task
+        """
+        workspace_path = self._workspaces.get(task_id)
+        if workspace_path:
+            await close_git_session(str(workspace_path))
+        await asyncio.to_thread(self.cleanup_workspace, task_id)
+
     def cleanup_all(self) -> None:
         """Remove all workspaces."""
         task_ids = list(self._workspaces.keys())
@@ -189,6 +317,9 @@ class WorkspaceManager:
     def get_workspace_stats(self, task_id: int) -> dict[str, Any]:
         """Get statistics about a workspace.
 
+        Reads the running totals kept by the filesystem tools, so this
+        does not touch the disk.
+
         Args:
             task_id: ID of the task
 
@@ -196,26 +327,197 @@ class WorkspaceManager:
             Dictionary with workspace statistics
         """
         workspace_path = self.get_workspace(task_id)
-
-        file_count = 0
-        dir_count = 0
-        total_size = 0
-
-        for item in workspace_path.rglob("*"):
-            if item.is_file():
-                file_count += 1
-                total_size += item.stat().st_size
-            elif item.is_dir():
-                dir_count += 1
+        usage = self._usage.get(task_id)
+        if usage is None:
+            usage = self._start_usage_tracking(task_id, workspace_path)
 
         return {
             "path": str(workspace_path),
-            "file_count": file_count,
-            "directory_count": dir_count,
-            "total_size_bytes": total_size,
-            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "file_count": usage.file_count,
+            "directory_count": usage.directory_count,
+            "total_size_bytes": usage.total_bytes,
+            "total_size_mb": round(usage.total_bytes / (1024 * 1024), 2),
+            "bytes_written": usage.bytes_written,
+            "quota_bytes": usage.quota_bytes,
         }
 
+    def set_quota(self, task_id: int, quota_bytes: int | None) -> None:
+        """Set the disk quota for a task's workspace.
+
+        Args:
+            task_id: ID of the task
+            quota_bytes: Maximum bytes the task may add, or None for no limit
+
+        Raises:
+            WorkspaceNotFoundError: If workspace doesn't exist
+        """
+        workspace_path = self.get_workspace(task_id)
+        usage = self._usage.get(task_id) or self._start_usage_tracking(task_id, workspace_path)
+        usage.quota_bytes = quota_bytes
+
+    def check_quota(self, task_id: int | None, additional_bytes: int) -> None:
+        """Ensure a pending write fits within the task's quota.
+
+        Untracked tasks are not limited.
+
+        Args:
+            task_id: ID of the task
+            additional_bytes: Net bytes the write will add (may be negative)
+
+        Raises:
+            WorkspaceQuotaExceededError: If the write would exceed the quota
+        """
+        if task_id is None or additional_bytes <= 0:
+            return
+        usage = self._usage.get(task_id)
+        if usage is None or usage.quota_bytes is None:
+            return
+
+        if usage.bytes_written + additional_bytes > usage.quota_bytes:
+            logger.warning(
+                "workspace_quota_exceeded",
+                task_id=task_id,
+                quota_bytes=usage.quota_bytes,
+                bytes_written=usage.bytes_written,
+                requested_bytes=additional_bytes,
+            )
+            raise WorkspaceQuotaExceededError(
+                task_id=task_id,
+                quota_bytes=usage.quota_bytes,
+                requested_bytes=additional_bytes,
+            )
+
+    def record_file_write(
+        self,
+        task_id: int | None,
+        previous_size: int | None,
+        new_size: int,
+        new_directories: int = 0,
+    ) -> None:
+        """Update running totals after a file was written.
+
+        Args:
+            task_id: ID of the task
+            previous_size: Size before the write, or None if the file was created
+            new_size: Size after the write
+            new_directories: Parent directories created for the file
+        """
+        usage = self._usage.get(task_id) if task_id is not None else None
+        if usage is None:
+            return
+
+        if previous_size is None:
+            usage.file_count += 1
+        usage.total_bytes += new_size - (previous_size or 0)
+        usage.directory_count += new_directories
+        usage.operations_since_reconcile += 1
+
+    def record_file_delete(self, task_id: int | None, size: int) -> None:
+        """Update running totals after a file was deleted.
+
+        Args:
+            task_id: ID of the task
+            size: Size of the deleted file
+        """
+        usage = self._usage.get(task_id) if task_id is not None else None
+        if usage is None:
+            return
+
+        usage.file_count -= 1
+        usage.total_bytes -= size
+        usage.operations_since_reconcile += 1
+
+    def record_directories_created(self, task_id: int | None, count: int) -> None:
+        """Update running totals after directories were created.
+
+        Args:
+            task_id: ID of the task
+            count: Number of directories created
+        """
+        usage = self._usage.get(task_id) if task_id is not None else None
+        if usage is None:
+            return
+
+        usage.directory_count += count
+        usage.operations_since_reconcile += 1
+
+    async def maybe_reconcile(self, task_id: int | None) -> None:
+        """Run a reconciliation scan if enough changes or time have accumulated.
+
+        Args:
+            task_id: ID of the task
+        """
+        if task_id is None:
+            return
+        usage = self._usage.get(task_id)
+        if usage is None:
+            return
+
+        elapsed = time.monotonic() - usage.last_reconciled
+        if (
+            usage.operations_since_reconcile >= settings.workspace_reconcile_interval_ops
+            or elapsed >= settings.workspace_reconcile_interval_seconds
+        ):
+            await self.reconcile_async(task_id)
+
+    async def reconcile_async(self, task_id: int) -> None:
+        """Recompute a workspace's totals with a full scan in a worker thread.
+
+        Corrects drift from changes made outside the filesystem tools
+        (shell commands, test runs, git operations). The difference between
+        the scan and the totals at its start is applied, so changes the
+        tools record while the scan runs are kept.
+
+        Args:
+            task_id: ID of the task
+        """
+        usage = self._usage.get(task_id)
+        workspace_path = self._workspaces.get(task_id)
+        if usage is None or workspace_path is None:
+            return
+
+        snapshot = (usage.file_count, usage.directory_count, usage.total_bytes)
+        operations = usage.operations_since_reconcile
+        file_count, dir_count, total_bytes = await asyncio.to_thread(
+            scan_workspace_usage, workspace_path
+        )
+
+        drift = total_bytes - snapshot[2]
+        usage.file_count += file_count - snapshot[0]
+        usage.directory_count += dir_count - snapshot[1]
+        usage.total_bytes += drift
+        usage.operations_since_reconcile -= operations
+        usage.last_reconciled = time.monotonic()
+
+        logger.debug(
+            "workspace_usage_reconciled",
+            task_id=task_id,
+            total_bytes=usage.total_bytes,
+            drift_bytes=drift,
+        )
+
+    def _start_usage_tracking(self, task_id: int, workspace_path: Path) -> WorkspaceUsage:
+        """Scan a workspace once and start tracking its usage.
+
+        Args:
+            task_id: ID of the task
+            workspace_path: Workspace root
+
+        Returns:
+            The new usage record
+        """
+        file_count, dir_count, total_bytes = scan_workspace_usage(workspace_path)
+        quota = settings.workspace_quota_bytes
+        usage = WorkspaceUsage(
+            file_count=file_count,
+            directory_count=dir_count,
+            total_bytes=total_bytes,
+            baseline_bytes=total_bytes,
+            quota_bytes=quota if quota > 0 else None,
+        )
+        self._usage[task_id] = usage
+        return usage
+
     def register_existing_workspace(self, task_id: int, workspace_path: str) -> Path:
         """Register an existing directory as a workspace.
 
@@ -237,6 +539,7 @@ class WorkspaceManager:
             raise WorkspaceNotFoundError(workspace_path)
 
         self._workspaces[task_id] = path
+        self._start_usage_tracking(task_id, path)
 
         logger.info(
             "workspace_registered",
@@ -0,0 +1,122 @@
+"""Benchmark: checkpointed state with artifact references vs. inline text.
+
+Every node merges and returns the workflow metadata, so it is serialized
+into a checkpoint after each node. This measures one review loop (planner
+with two refinements, then coder, tester and reviewer three times) with
+plan versions and code files recorded as before (inline plans, file
+metadata only), with the default in-memory artifact store, and with an
+artifact_store_dir.
+
+Run with:
+    pytest tests/benchmarks -m slow -s
+"""
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from src.agents.infrastructure import artifacts as artifacts_module
+from src.agents.infrastructure.artifacts import ArtifactStore, snapshot_code_files
+from src.agents.nodes.planner import _plan_version_content
+
+pytestmark = pytest.mark.slow
+
+PLAN_VERSIONS = 3
+PLAN_LINES = 400
+REVIEW_ITERATIONS = 3
+FILES = ("app.py", "models.py", "test_app.py")
+
+
+def _plan(version: int) -> str:
+    return "".join(
+        f"{n}. Implement step {n} of version {version}: update module_{n % 7}.py\n"
+        for n in range(PLAN_LINES)
+    )
+
+
+def _file(filepath: str, iteration: int) -> str:
+    return "".join(
+        f"def {filepath[:-3]}_op_{n}(a, b):\n    return a + b * {n + (n == iteration)}\n\n\n"
+        for n in range(60)
+    )
+
+
+def _code_files() -> dict[str, Any]:
+    return {
+        "file_count": len(FILES),
+        "all_valid": True,
+        "primary_filepath": FILES[0],
+        "files": [{"filepath": path, "language": "python"} for path in FILES],
+    }
+
+
+def _plan_history(plan_content: bool) -> list[dict[str, Any]]:
+    return [
+        {
+            "version": version,
+            "created_at": "2026-01-01T00:00:00",
+            **(
+                {"plan_content": _plan(version)}
+                if plan_content
+                else _plan_version_content(_plan(version))
+            ),
+            "validation": {"is_valid": version == PLAN_VERSIONS, "total_steps": PLAN_LINES},
+            "is_refinement": version > 1,
+        }
+        for version in range(1, PLAN_VERSIONS + 1)
+    ]
+
+
+def _review_loop(baseline: bool = False) -> tuple[int, float]:
+    """Bytes and time of the checkpoints written during one review loop."""
+    serde = JsonPlusSerializer()
+    metadata: dict[str, Any] = {"planner_model": "sonnet", "plan_history": []}
+    code_files: dict[str, Any] = {}
+    written = 0
+    start = time.perf_counter()
+
+    def checkpoint(node: str) -> None:
+        nonlocal metadata, written
+        metadata = {**metadata, f"{node}_completed_at": "2026-01-01T00:00:00"}
+        _, data = serde.dumps_typed({"metadata": metadata, "code_files": code_files})
+        written += len(data)
+
+    metadata = {**metadata, "plan_history": _plan_history(plan_content=baseline)}
+    checkpoint("planner")
+    for iteration in range(REVIEW_ITERATIONS):
+        contents = [_file(path, iteration) for path in FILES]
+        code_files = (
+            _code_files()
+            if baseline
+            else snapshot_code_files(_code_files(), contents, previous=code_files)
+        )
+        for node in ("coder", "tester", "reviewer"):
+            checkpoint(f"{node}_{iteration}")
+
+    return written, time.perf_counter() - start
+
+
+def test_checkpointed_state(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The default store adds nothing to checkpoints; a persistent one shrinks them."""
+    before_bytes, before_time = _review_loop(baseline=True)
+
+    memory = ArtifactStore(max_bytes=64 * 1024 * 1024, directory="")
+    monkeypatch.setattr(artifacts_module, "_artifact_store", memory)
+    default_bytes, default_time = _review_loop()
+
+    persistent = ArtifactStore(max_bytes=64 * 1024 * 1024, directory=tmp_path)
+    monkeypatch.setattr(artifacts_module, "_artifact_store", persistent)
+    ref_bytes, ref_time = _review_loop()
+
+    print(
+        f"\ncheckpoints of one review loop: before {before_bytes / 1024:.0f} KiB "
+        f"in {before_time * 1000:.2f} ms, default {default_bytes / 1024:.0f} KiB "
+        f"in {default_time * 1000:.2f} ms, artifact_store_dir {ref_bytes / 1024:.1f} KiB "
+        f"in {ref_time * 1000:.2f} ms ({before_bytes / ref_bytes:.0f}x smaller)"
+    )
+    assert default_bytes == before_bytes
+    assert len(memory) == 0
+    assert ref_bytes * 5 < before_bytes
@@ -0,0 +1,120 @@
+"""Benchmark: analyzers sharing one parse vs. parsing per analyzer.
+
+Runs every AST-based analyzer over the same generated 5,000-line module,
+once with caching disabled (each analyzer parses, as before the shared
+cache) and once through a fresh cache (one parse, one visitor pass).
+
+Run with:
+    pytest tests/benchmarks -m slow -s
+"""
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from src.agents.analyzers import ast_cache as ast_cache_module
+from src.agents.analyzers.ast_cache import ASTAnalysisCache
+from src.agents.analyzers.code_quality import CodeQualityAnalyzer
+from src.agents.analyzers.test_analyzer import analyze_coverage, extract_test_functions
+from src.agents.nodes.tester import detect_external_dependencies
+from src.agents.processing.formatter import _lint_python_code, validate_python_syntax
+
+pytestmark = pytest.mark.slow
+
+TARGET_LINES = 5_000
+ROUNDS = 3
+
+_CLASS_TEMPLATE = '''
+
+class Service{n}:
+    """Service number {n}."""
+
+    def __init__(self, client: httpx.Client, retries: int = 3) -> None:
+        self.client = client
+        self.retries = retries
+
+    def fetch(self, url: str, params=None) -> dict[str, Any]:
+        """Fetch a resource with retries."""
+        for attempt in range(self.retries):
+            try:
+                response = self.client.get(url, params=params or {{}})
+                if response.status_code == 200 and response.content:
+                    return json.loads(response.content)
+            except httpx.HTTPError:
+                logging.warning("attempt %s failed", attempt)
+        return {{}}
+
+    def transform(self, items, key="id"):
+        return [item[key] for item in items if item and key in item]
+
+    async def process(self, batch: list[dict[str, Any]]) -> int:
+        total = 0
+        for entry in batch:
+            total += 1 if entry.get("ok") else 0
+        return total
+
+
+def test_service_{n}_fetch() -> None:
+    """Test Service{n}.fetch."""
+    service = Service{n}(httpx.Client())
+    assert service.retries == 3
+'''
+
+
+def _generate_module(lines: int) -> str:
+    parts = [
+        '"""Generated module."""\nimport json\nimport logging\nfrom typing import Any\n\nimport httpx\n'
+    ]
+    n = 0
+    while sum(part.count("\n") for part in parts) < lines:
+        parts.append(_CLASS_TEMPLATE.format(n=n))
+        n += 1
+    return "".join(parts)
+
+
+def _run_analyzers(source: str) -> None:
+    validate_python_syntax(source)
+    _lint_python_code(source)
+    CodeQualityAnalyzer().analyze(source)
+    suite = extract_test_functions(source)
+    analyze_coverage(source, suite)
+    detect_external_dependencies(source)
+
+
+def _best_time(run: Callable[[], None]) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_shared_analysis_speedup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """One parse shared by all analyzers beats a parse per analyzer."""
+    source = _generate_module(TARGET_LINES)
+    assert source.count("\n") >= TARGET_LINES
+
+    def per_analyzer() -> None:
+        monkeypatch.setattr(ast_cache_module, "_analysis_cache", ASTAnalysisCache(max_entries=0))
+        _run_analyzers(source)
+
+    def shared() -> None:
+        monkeypatch.setattr(ast_cache_module, "_analysis_cache", ASTAnalysisCache(max_entries=8))
+        _run_analyzers(source)
+
+    uncached = _best_time(per_analyzer)
+    cached = _best_time(shared)
+    cold_parse = _best_time(lambda: ASTAnalysisCache(max_entries=0).analyze(source))
+    warm_cache = ASTAnalysisCache(max_entries=8)
+    warm_cache.analyze(source)
+    warm_lookup = _best_time(lambda: warm_cache.analyze(source))
+
+    print(
+        f"\n{source.count(chr(10))} lines: analyzers {uncached * 1000:.1f} ms -> "
+        f"{cached * 1000:.1f} ms ({uncached / cached:.1f}x); "
+        f"analysis {cold_parse * 1000:.1f} ms cold, {warm_lookup * 1000:.2f} ms cached"
+    )
+    assert cached < uncached
+    assert warm_lookup * 10 < cold_parse
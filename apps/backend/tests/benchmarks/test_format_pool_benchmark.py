@@ -0,0 +1,121 @@
+"""Benchmark: formatting multi-file coder output in worker processes.
+
+Formats a generated 24-file output (about 850 lines per file) three ways:
+sequentially on the event loop as before, through acreate_multi_file_result
+with a cold cache (worker processes), and again for a second iteration with
+one changed file (cache hits). Event loop lag is measured with a ticker task
+running alongside.
+
+The process-pool speedup scales with available cores; it is only asserted
+on machines with at least four.
+
+Run with:
+    pytest tests/benchmarks -m slow -s
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.agents.processing import formatter as formatter_module
+from src.agents.processing.formatter import (
+    FormatCache,
+    acreate_multi_file_result,
+    create_multi_file_result,
+)
+
+pytestmark = pytest.mark.slow
+
+FILES = 24
+FUNCTIONS_PER_FILE = 120
+
+_FUNCTION_TEMPLATE = '''
+def handler_{n}(request, retries=3):{trailing}
+    """Handle request {n}."""
+    for attempt in range(retries):
+        if request.get("id")==  {n}:
+            return {{"id": {n}, "attempt": attempt}}
+    return None
+'''
+
+
+def _generate_blocks(version: int = 0) -> list[tuple[str, str, str]]:
+    blocks = []
+    for index in range(FILES):
+        body = "".join(
+            _FUNCTION_TEMPLATE.format(n=index * 1000 + n, trailing="   ")
+            for n in range(FUNCTIONS_PER_FILE)
+        )
+        blocks.append((f"src/module_{index}.py", f"import os\n{body}", "python"))
+    if version:
+        filepath, content, language = blocks[0]
+        blocks[0] = (filepath, f"{content}\nVERSION = {version}\n", language)
+    return blocks
+
+
+async def _max_loop_lag(run: asyncio.Future[object]) -> float:
+    """Run until the future completes, returning the longest gap between ticks."""
+    lag = 0.0
+    last = time.perf_counter()
+    while not run.done():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        lag = max(lag, now - last)
+        last = now
+    await run
+    return lag
+
+
+@pytest.mark.asyncio
+async def test_parallel_formatting(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Worker formatting keeps the loop responsive; unchanged files are skipped."""
+    blocks = _generate_blocks()
+    workers = min(4, os.cpu_count() or 1)
+    monkeypatch.setattr(formatter_module.settings, "format_process_workers", workers)
+    monkeypatch.setattr(formatter_module, "_format_pool", None)
+
+    def fresh_cache() -> None:
+        monkeypatch.setattr(formatter_module, "_format_cache", FormatCache(max_entries=64))
+
+    # Warm up the worker processes so spawn time is not measured
+    fresh_cache()
+    with monkeypatch.context() as warmup:
+        warmup.setattr(formatter_module.settings, "format_parallel_min_chars", 0)
+        await acreate_multi_file_result(_generate_blocks(version=99)[: workers + 1])
+
+    try:
+        fresh_cache()
+        start = time.perf_counter()
+        expected = create_multi_file_result(blocks)
+        sequential = time.perf_counter() - start
+
+        fresh_cache()
+        start = time.perf_counter()
+        run = asyncio.ensure_future(acreate_multi_file_result(blocks))
+        lag = await _max_loop_lag(run)
+        parallel = time.perf_counter() - start
+
+        start = time.perf_counter()
+        second = await acreate_multi_file_result(_generate_blocks(version=1))
+        iteration = time.perf_counter() - start
+    finally:
+        formatter_module.shutdown_format_pool()
+
+    result = run.result()
+    assert [f.content for f in result.files] == [f.content for f in expected.files]
+    assert result.all_valid
+    assert second.files[1].format_result is result.files[1].format_result
+
+    lines = sum(content.count("\n") for _, content, _ in blocks)
+    print(
+        f"\n{FILES} files, {lines} lines, {workers} workers: sequential {sequential * 1000:.0f} ms "
+        f"(loop blocked throughout), processes {parallel * 1000:.0f} ms "
+        f"({sequential / parallel:.1f}x, max loop lag {lag * 1000:.1f} ms), "
+        f"next iteration with 1 changed file {iteration * 1000:.0f} ms"
+    )
+    assert lag < sequential / 4
+    assert iteration * 5 < sequential
+    if workers >= 4:
+        assert parallel * 2 < sequential
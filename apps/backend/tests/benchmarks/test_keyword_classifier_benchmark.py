@@ -0,0 +1,103 @@
+"""Micro-benchmarks: shared keyword classification vs. per-call-site loops.
+
+The baselines are the keyword loops plan validation and the supervisor ran
+before: a lowercase and a loop per keyword list, and a fresh lowercase of
+the task plus the full code on every routing step.
+
+Run with:
+    pytest tests/benchmarks -m slow -s
+"""
+
+import re
+import time
+from collections.abc import Callable
+
+import pytest
+
+from src.agents.analyzers.plan_validator import (
+    ACTIONABLE_VERBS,
+    COMPONENT_MENTION_PATTERN,
+    FILE_MENTION_PATTERN,
+    PLAN_CLASSIFIER,
+    TECHNICAL_KEYWORDS,
+)
+from src.agents.nodes.supervisor import SupervisorConfig
+
+pytestmark = pytest.mark.slow
+
+ROUNDS = 5
+CALLS = 200
+
+PLAN = "\n".join(
+    f"{i}. Implement the API endpoint with database validation in service_{i}.py\n"
+    f"   - Success: integration tests pass after step {i - 1}"
+    for i in range(1, 31)
+)
+CODE = "\n".join(f"def handler_{i}(items):\n    return sorted(items)\n" for i in range(2_000))
+
+
+def _plan_loops(plan: str) -> tuple[float, bool, int]:
+    """The previous approach: one lowercase and loop per use of the plan."""
+    plan_lower = plan.lower()
+    has_action_verbs = any(verb in plan_lower for verb in ACTIONABLE_VERBS)
+    plan_lower = plan.lower()
+    tech_score = 0.0
+    for keyword in TECHNICAL_KEYWORDS["high"]:
+        if keyword in plan_lower:
+            tech_score += 0.1
+    for keyword in TECHNICAL_KEYWORDS["medium"]:
+        if keyword in plan_lower:
+            tech_score += 0.05
+    mentions = len(re.findall(FILE_MENTION_PATTERN, plan_lower)) + len(
+        re.findall(COMPONENT_MENTION_PATTERN, plan_lower)
+    )
+    return tech_score, has_action_verbs, mentions
+
+
+def _plan_classifier(plan: str) -> tuple[float, bool, int]:
+    PLAN_CLASSIFIER.clear_cache()
+    features = PLAN_CLASSIFIER.classify(plan)
+    tech_score = features.count("high") * 0.1 + features.count("medium") * 0.05
+    mentions = features.counter("files") + features.counter("components")
+    return tech_score, features.has("action"), mentions
+
+
+def _security_loop(task: str, code: str) -> bool:
+    text = (task + " " + code).lower()
+    return any(keyword in text for keyword in SupervisorConfig.SECURITY_KEYWORDS)
+
+
+def _best_time(run: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            run()
+        timings.append((time.perf_counter() - start) / CALLS)
+    return min(timings)
+
+
+def test_plan_classification() -> None:
+    """One classification gives the scores of all plan keyword loops."""
+    assert _plan_classifier(PLAN) == pytest.approx(_plan_loops(PLAN))
+
+    baseline = _best_time(lambda: _plan_loops(PLAN))
+    classified = _best_time(lambda: _plan_classifier(PLAN))
+    print(
+        f"\nplan ({len(PLAN)} chars): loops {baseline * 1e6:.1f} us, "
+        f"classifier {classified * 1e6:.1f} us ({baseline / classified:.1f}x)"
+    )
+
+
+def test_repeated_security_checks() -> None:
+    """Routing steps re-checking unchanged code hit the classifier cache."""
+    task = "Sort a list of records"
+    assert SupervisorConfig.has_security_concerns(task, CODE) == _security_loop(task, CODE)
+
+    baseline = _best_time(lambda: _security_loop(task, CODE))
+    classified = _best_time(lambda: SupervisorConfig.has_security_concerns(task, CODE))
+    print(
+        f"\nsecurity check ({len(CODE)} chars of code): loop {baseline * 1e6:.1f} us, "
+        f"classifier {classified * 1e6:.1f} us ({baseline / classified:.1f}x)"
+    )
+    assert classified < baseline
@@ -0,0 +1,165 @@
+"""Micro-benchmarks: logging overhead per tool call.
+
+A tool call emits five events: the registry's tool list (debug), the ReAct
+loop's executing and completed events (debug) and the tool execution's
+started and completed events (info). The baseline is the previous
+configuration: stdlib bound loggers running every processor, fields built
+eagerly, and JSON rendering plus the write done in the caller.
+
+The time measured is what the caller (the event loop) spends; with the
+background pipeline, rendering and writing happen on the listener thread,
+whose drain time is reported separately.
+
+Run with:
+    pytest tests/benchmarks -m slow -s
+"""
+
+import logging
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+import structlog
+
+from src.core.config import settings
+from src.core.logging import configure_logging, get_logging_stats, lazy, reset_logging
+
+pytestmark = pytest.mark.slow
+
+ROUNDS = 5
+CALLS = 2_000
+
+TOOL_NAMES = [f"tool_{i}" for i in range(12)]
+TOOL_ARGS = {"path": "src/services/agent_run_service.py", "pattern": "def .*run", "limit": 50}
+TOOL_OUTPUT = "match\n" * 2_000
+
+
+def _configure_baseline(stream: Any, level: int) -> None:
+    """The previous configuration: every processor and the write in the caller."""
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            structlog.processors.JSONRenderer(),
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(level)
+
+
+def _tool_call_eager(logger: Any) -> None:
+    logger.debug("tools_retrieved_for_agent", tool_count=12, tool_names=list(TOOL_NAMES))
+    logger.debug("react_loop_tool_executing", tool_name="grep", args_preview=str(TOOL_ARGS)[:100])
+    logger.info("tool_execution_started", tool_name="grep", tool_call_id="call_1", task_id=1)
+    logger.info("tool_execution_completed", tool_name="grep", execution_time_ms=1.5, success=True)
+    logger.debug("react_loop_tool_completed", tool_name="grep", result_length=len(str(TOOL_OUTPUT)))
+
+
+def _tool_call_lazy(logger: Any) -> None:
+    logger.debug(
+        "tools_retrieved_for_agent",
+        tool_count=12,
+        tool_names=lazy(list, TOOL_NAMES),
+    )
+    logger.debug(
+        "react_loop_tool_executing",
+        tool_name="grep",
+        args_preview=lazy(lambda args: str(args)[:100], TOOL_ARGS),
+    )
+    logger.info("tool_execution_started", tool_name="grep", tool_call_id="call_1", task_id=1)
+    logger.info("tool_execution_completed", tool_name="grep", execution_time_ms=1.5, success=True)
+    logger.debug(
+        "react_loop_tool_completed",
+        tool_name="grep",
+        result_length=lazy(lambda content: len(str(content)), TOOL_OUTPUT),
+    )
+
+
+@pytest.fixture
+def devnull() -> Iterator[Any]:
+    """Send log output to os.devnull, restoring logging afterwards."""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    root.handlers.clear()  # pytest's capture handlers
+    with open(os.devnull, "w") as stream:
+        yield stream
+        reset_logging()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+        structlog.reset_defaults()
+
+
+def _best_time(run: Callable[[], object], drain: Callable[[], None] | None = None) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            run()
+        timings.append((time.perf_counter() - start) / CALLS)
+        if drain is not None:
+            drain()
+    return min(timings)
+
+
+def _wait_for_drain() -> None:
+    while get_logging_stats()["queued"]:
+        time.sleep(0.001)
+
+
+def _compare(devnull: Any, monkeypatch: pytest.MonkeyPatch, level_name: str) -> tuple[float, float]:
+    level = getattr(logging, level_name)
+    _configure_baseline(devnull, level)
+    baseline_logger = structlog.get_logger("codegraph.benchmark")
+    baseline = _best_time(lambda: _tool_call_eager(baseline_logger))
+    logging.getLogger().handlers.pop()
+
+    monkeypatch.setattr(settings, "log_level", level_name)
+    monkeypatch.setattr(settings, "log_format", "json")
+    monkeypatch.setattr(settings, "log_async", True)
+    with monkeypatch.context() as patch:
+        patch.setattr(sys, "stdout", devnull)
+        configure_logging()
+    logger = structlog.get_logger("codegraph.benchmark")
+    pipeline = _best_time(lambda: _tool_call_lazy(logger), drain=_wait_for_drain)
+
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        _tool_call_lazy(logger)
+    _wait_for_drain()
+    drained = (time.perf_counter() - start) / CALLS
+
+    print(
+        f"\nper tool call at {level_name}: previous {baseline * 1e6:.1f} us, "
+        f"pipeline {pipeline * 1e6:.1f} us in the caller ({baseline / pipeline:.1f}x), "
+        f"{drained * 1e6:.1f} us including the background write"
+    )
+    return baseline, pipeline
+
+
+def test_tool_call_overhead_at_info(devnull: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Production level: debug events cost nothing, info events are queued."""
+    baseline, pipeline = _compare(devnull, monkeypatch, "INFO")
+    assert pipeline < baseline
+
+
+def test_tool_call_overhead_at_debug(devnull: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Development level: all five events are logged."""
+    _compare(devnull, monkeypatch, "DEBUG")
+    stats = get_logging_stats()
+    print(f"debug events sampled out: {stats['sampled_out']}, dropped: {stats['dropped']}")
@@ -0,0 +1,91 @@
+"""Micro-benchmarks: linear verdict extraction vs. regex JSON scraping.
+
+The baseline is the previous parse_structured_verdict: a fenced-block regex,
+then a greedy brace regex, each candidate decoded in turn. Responses are
+long reviews with prose (containing braces) around the verdict object.
+
+Run with:
+    pytest tests/benchmarks -m slow -s
+"""
+
+import json
+import re
+import time
+from collections.abc import Callable
+
+import pytest
+
+from src.agents.nodes.reviewer import StructuredReviewVerdict, parse_structured_verdict
+
+pytestmark = pytest.mark.slow
+
+ROUNDS = 5
+CALLS = 20
+
+VERDICT = json.dumps(
+    {
+        "summary": "Solid implementation with a few gaps in error handling.",
+        "verdict": "REVISE",
+        "confidence": 0.8,
+        "issues": [
+            {"severity": "minor", "category": "style", "description": f"Issue {i}: use {{}}"}
+            for i in range(50)
+        ],
+        "action_items": ["Handle the empty input case"],
+    },
+    indent=2,
+)
+PROSE = "I read `handlers.py`; the mapping {key: value} is built per request.\n" * 400
+
+CASES = {
+    "bare json": VERDICT,
+    "fenced after prose": f"{PROSE}\n```json\n{VERDICT}\n```\n",
+    "raw in prose": f"{PROSE}\nFinal answer: {VERDICT}\nSee the dict {{a: b}} above.",
+}
+
+
+def _regex_scrape(response_text: str) -> StructuredReviewVerdict | None:
+    """The previous approach: fenced-block regex, then greedy brace regex."""
+    try:
+        return StructuredReviewVerdict.model_validate(json.loads(response_text.strip()))
+    except Exception:
+        pass
+    for match in re.findall(r"```(?:json)?\s*(\{[\s\S]*?\})\s*```", response_text):
+        try:
+            return StructuredReviewVerdict.model_validate(json.loads(match))
+        except Exception:
+            continue
+    for match in re.findall(r"\{[\s\S]*\}", response_text):
+        try:
+            data = json.loads(match)
+            if "verdict" in data and "summary" in data:
+                return StructuredReviewVerdict.model_validate(data)
+        except Exception:
+            continue
+    return None
+
+
+def _best_time(run: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            run()
+        timings.append((time.perf_counter() - start) / CALLS)
+    return min(timings)
+
+
+@pytest.mark.parametrize("case", list(CASES))
+def test_verdict_parsing(case: str) -> None:
+    """The linear extractor finds every verdict; the regex scrape misses some."""
+    text = CASES[case]
+    verdict = parse_structured_verdict(text)
+    assert verdict is not None and verdict.verdict == "REVISE"
+
+    scraped = _regex_scrape(text)
+    baseline = _best_time(lambda: _regex_scrape(text))
+    extracted = _best_time(lambda: parse_structured_verdict(text))
+    print(
+        f"\n{case:>18} ({len(text)} chars): regex {baseline * 1000:.2f} ms "
+        f"({'ok' if scraped else 'FAILED'}), linear {extracted * 1000:.2f} ms"
+    )
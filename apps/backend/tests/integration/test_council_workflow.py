@@ -171,6 +171,9 @@ def greet(name: str) -> str:
             deliberation_time_ms=1500,
             total_cost_usd=0.0,
             llm_mode="local",
+            cancelled_judges=[],
+            latency_saved_ms=0,
+            cost_saved_usd=0.0,
         )
 
     @pytest.mark.asyncio
@@ -265,6 +268,9 @@ def greet(name: str) -> str:
             deliberation_time_ms=1500,
             total_cost_usd=0.0,
             llm_mode="local",
+            cancelled_judges=[],
+            latency_saved_ms=0,
+            cost_saved_usd=0.0,
         )
 
         with patch("src.agents.council.node.CodeReviewCouncil") as MockCouncil:
@@ -4,11 +4,58 @@ Tests the AgentRunService and AgentRunTracker for persisting
 agent node executions during workflow processing.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.agents.infrastructure.tracking import NODE_TO_AGENT_TYPE, AgentRunTracker
-from src.models.agent_run import AgentRunStatus, AgentType
+from src.core.security import get_password_hash
+from src.models.agent_run import AgentRun, AgentRunStatus, AgentType
+from src.models.task import Task, TaskStatus
+from src.models.usage_metrics import UsageMetrics
+from src.models.user import User
 from src.services.agent_run_service import AgentRunService
 
 
+@pytest.fixture
+async def test_task(db_session: AsyncSession) -> Task:
+    """Create a pending task to track."""
+    user = User(
+        email="tracker@example.com",
+        hashed_password=get_password_hash("testpassword123"),
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.flush()
+    task = Task(title="Add greeting", description="Write hello()", user_id=user.id)
+    db_session.add(task)
+    await db_session.commit()
+    return task
+
+
+@contextmanager
+def recorded_statements(session: AsyncSession) -> Iterator[list[str]]:
+    """Record the SQL statements a session sends."""
+    statements: list[str] = []
+    engine = session.bind.sync_engine
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
 class TestAgentRunService:
     """Test the AgentRunService CRUD operations."""
 
@@ -94,6 +141,39 @@ class TestAgentRunTracker:
         assert summary["code_length"] == len(outputs["code"])
         assert "def hello" in summary["code_preview"]
 
+    def test_output_summary_references_full_content(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The full output is reachable through its artifact reference."""
+        from unittest.mock import MagicMock
+
+        from src.agents.infrastructure import artifacts
+
+        monkeypatch.setattr(artifacts, "_artifact_store", artifacts.ArtifactStore(0, tmp_path))
+        tracker = AgentRunTracker(db=MagicMock(), task_id=1)
+        code = "x = 1\n" * 200
+
+        summary = tracker._extract_output_summary("coder", {"code": code, "status": "testing"})
+
+        assert len(summary["code_preview"]) == 500
+        assert artifacts.ArtifactStore(directory=tmp_path).get(summary["code_ref"]) == code
+
+    def test_output_summary_without_persisted_artifacts(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """No reference is recorded that another process could not resolve."""
+        from unittest.mock import MagicMock
+
+        from src.agents.infrastructure import artifacts
+
+        monkeypatch.setattr(artifacts, "_artifact_store", artifacts.ArtifactStore(directory=""))
+        tracker = AgentRunTracker(db=MagicMock(), task_id=1)
+
+        summary = tracker._extract_output_summary("coder", {"code": "x = 1\n", "status": "testing"})
+
+        assert summary["code_ref"] is None
+        assert len(artifacts.get_artifact_store()) == 0
+
     def test_output_summary_extraction_tester(self) -> None:
         """Test output summary extraction for tester node."""
         from unittest.mock import MagicMock
@@ -133,6 +213,132 @@ class TestAgentRunTracker:
         assert summary["iterations"] == 1
 
 
+class TestAgentRunTrackerPersistence:
+    """Test node tracking against a database."""
+
+    async def test_node_start_and_end(self, db_session: AsyncSession, test_task: Task) -> None:
+        """Test a node is recorded from start to completion with usage."""
+        tracker = AgentRunTracker(db=db_session, task_id=test_task.id, model_used="m")
+        run_id = uuid4()
+
+        await tracker.on_chain_start({"name": "planner"}, {"task_id": test_task.id}, run_id=run_id)
+        await tracker.on_chain_end(
+            {
+                "plan": "1. Write hello()",
+                "metadata": {"planner_usage": {"input_tokens": 10, "output_tokens": 5}},
+            },
+            run_id=run_id,
+        )
+
+        run = (await db_session.execute(select(AgentRun))).scalar_one()
+        assert run.status == AgentRunStatus.COMPLETED
+        assert run.agent_type == AgentType.PLANNER
+        assert run.started_at is not None
+        assert run.completed_at is not None
+        assert run.output_data["plan_length"] == len("1. Write hello()")
+        status = await db_session.scalar(select(Task.status).where(Task.id == test_task.id))
+        assert status == TaskStatus.PLANNING
+        usage = (await db_session.execute(select(UsageMetrics))).scalar_one()
+        assert usage.agent_run_id == run.id
+        assert usage.total_tokens == 15
+        assert tracker.active_runs == {}
+
+    async def test_transitions_write_without_reads(
+        self, db_session: AsyncSession, test_task: Task
+    ) -> None:
+        """Test each transition is one transaction with no SELECT."""
+        tracker = AgentRunTracker(db=db_session, task_id=test_task.id)
+        run_id = uuid4()
+
+        with recorded_statements(db_session) as started:
+            await tracker.on_chain_start({"name": "coder"}, {}, run_id=run_id)
+        with recorded_statements(db_session) as ended:
+            await tracker.on_chain_end(
+                {"code": "x = 1", "metadata": {"coder_usage": {"input_tokens": 1}}},
+                run_id=run_id,
+            )
+
+        assert [s.split()[0] for s in started] == ["UPDATE", "INSERT"]
+        assert [s.split()[0] for s in ended] == ["UPDATE", "INSERT"]
+        assert "RETURNING" in started[1]
+
+    async def test_nested_chain_end_is_ignored(
+        self, db_session: AsyncSession, test_task: Task
+    ) -> None:
+        """Test a chain ending inside a node does not complete the node."""
+        tracker = AgentRunTracker(db=db_session, task_id=test_task.id)
+        node_run_id = uuid4()
+
+        await tracker.on_chain_start({"name": "tester"}, {}, run_id=node_run_id)
+        await tracker.on_chain_end({"output": "nested"}, run_id=uuid4())
+
+        run = (await db_session.execute(select(AgentRun))).scalar_one()
+        assert run.status == AgentRunStatus.RUNNING
+        assert node_run_id in tracker.active_runs
+
+    async def test_error_fails_only_its_run(
+        self, db_session: AsyncSession, test_task: Task
+    ) -> None:
+        """Test an error marks the erroring node's run failed."""
+        tracker = AgentRunTracker(db=db_session, task_id=test_task.id)
+        failing, running = uuid4(), uuid4()
+        await tracker.on_chain_start({"name": "coder"}, {}, run_id=failing)
+        await tracker.on_chain_start({"name": "tester"}, {}, run_id=running)
+
+        await tracker.on_chain_error(ValueError("boom"), run_id=failing)
+
+        runs = {
+            run.agent_type: run for run in (await db_session.execute(select(AgentRun))).scalars()
+        }
+        assert runs[AgentType.CODER].status == AgentRunStatus.FAILED
+        assert runs[AgentType.CODER].error_message == "boom"
+        assert runs[AgentType.TESTER].status == AgentRunStatus.RUNNING
+        assert list(tracker.active_runs) == [running]
+
+    async def test_cleanup_times_out_active_runs(
+        self, db_session: AsyncSession, test_task: Task
+    ) -> None:
+        """Test cleanup marks every remaining run timed out."""
+        tracker = AgentRunTracker(db=db_session, task_id=test_task.id)
+        await tracker.on_chain_start({"name": "coder"}, {}, run_id=uuid4())
+        await tracker.on_chain_start({"name": "reviewer"}, {}, run_id=uuid4())
+
+        await tracker.cleanup()
+
+        statuses = (await db_session.execute(select(AgentRun.status))).scalars().all()
+        assert statuses == [AgentRunStatus.TIMEOUT, AgentRunStatus.TIMEOUT]
+        assert tracker.active_runs == {}
+
+    async def test_untracked_node_is_ignored(
+        self, db_session: AsyncSession, test_task: Task
+    ) -> None:
+        """Test chains that are not agent nodes write nothing."""
+        tracker = AgentRunTracker(db=db_session, task_id=test_task.id)
+
+        with recorded_statements(db_session) as statements:
+            await tracker.on_chain_start({"name": "RunnableSequence"}, {}, run_id=uuid4())
+
+        assert statements == []
+        assert tracker.active_runs == {}
+
+    async def test_postgres_sends_one_statement_per_transition(self) -> None:
+        """Test PostgreSQL gets the status update as a CTE of the insert."""
+        db = MagicMock()
+        db.bind.dialect.name = "postgresql"
+        db.execute = AsyncMock(return_value=MagicMock())
+        db.commit = AsyncMock()
+        tracker = AgentRunTracker(db=db, task_id=1)
+
+        await tracker.on_chain_start({"name": "planner"}, {}, run_id=uuid4())
+
+        db.execute.assert_awaited_once()
+        db.commit.assert_awaited_once()
+        statement = db.execute.await_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("WITH task_status AS")
+        assert "INSERT INTO agent_runs" in sql
+
+
 class TestAgentRunServiceMethods:
     """Test AgentRunService method signatures and error handling."""
 
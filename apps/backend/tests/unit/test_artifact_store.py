@@ -0,0 +1,144 @@
+"""Unit tests for the content-addressed artifact store."""
+
+from pathlib import Path
+
+import pytest
+
+from src.agents.infrastructure import artifacts as artifacts_module
+from src.agents.infrastructure.artifacts import (
+    ArtifactNotFoundError,
+    ArtifactStore,
+    artifact_ref,
+    persistent_ref,
+    snapshot_code_files,
+    text_diff,
+)
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> ArtifactStore:
+    """Install a fresh global store persisted to a temporary directory."""
+    fresh = ArtifactStore(max_bytes=1024 * 1024, directory=tmp_path / "artifacts")
+    monkeypatch.setattr(artifacts_module, "_artifact_store", fresh)
+    return fresh
+
+
+@pytest.fixture
+def memory_store(monkeypatch: pytest.MonkeyPatch) -> ArtifactStore:
+    """Install a fresh in-memory global store (the default configuration)."""
+    fresh = ArtifactStore(max_bytes=1024 * 1024, directory="")
+    monkeypatch.setattr(artifacts_module, "_artifact_store", fresh)
+    return fresh
+
+
+def _code_files(*paths: str) -> dict[str, object]:
+    return {
+        "file_count": len(paths),
+        "all_valid": True,
+        "files": [{"filepath": path, "language": "python"} for path in paths],
+    }
+
+
+APP_V1 = "".join(f"def op_{n}(a, b):\n    return a + b * {n}\n\n\n" for n in range(8))
+APP_V2 = APP_V1.replace("return a + b * 3", "return b - a * 3")
+
+
+class TestArtifactStore:
+    """Tests for storing and resolving artifacts."""
+
+    def test_content_is_stored_once(self) -> None:
+        """Equal texts share one reference and one entry."""
+        store = ArtifactStore(max_bytes=1024, directory="")
+
+        ref = store.put("plan")
+
+        assert ref == artifact_ref("plan") == store.put("plan")
+        assert ref.startswith("sha256:")
+        assert store.get(ref) == "plan"
+        assert len(store) == 1
+
+    def test_eviction_by_size(self) -> None:
+        """The least recently used artifacts are dropped past the byte limit."""
+        store = ArtifactStore(max_bytes=10, directory="")
+        first = store.put("aaaa")
+        second = store.put("bbbb")
+        store.get(first)
+        store.put("cccc")
+
+        assert store.get(first) == "aaaa"
+        assert second not in store
+        with pytest.raises(ArtifactNotFoundError, match="Artifact not found"):
+            store.get(second)
+        assert store.get_stats()["bytes"] <= 10
+
+    def test_directory_survives_a_new_store(self, tmp_path: Path) -> None:
+        """Persisted artifacts resolve from another process's store."""
+        ref = ArtifactStore(max_bytes=0, directory=tmp_path).put("persisted é")
+
+        assert ArtifactStore(max_bytes=1024, directory=tmp_path).get(ref) == "persisted é"
+        assert ref in ArtifactStore(max_bytes=0, directory=tmp_path)
+
+    def test_persistent_ref_requires_a_directory(
+        self, memory_store: ArtifactStore, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Records keep their text unless the reference survives the process."""
+        assert persistent_ref("plan") is None
+        assert len(memory_store) == 0
+
+        persisted = ArtifactStore(max_bytes=1024, directory=tmp_path)
+        monkeypatch.setattr(artifacts_module, "_artifact_store", persisted)
+        ref = persistent_ref("plan")
+
+        assert ref == artifact_ref("plan")
+        assert ArtifactStore(max_bytes=0, directory=tmp_path).get(ref) == "plan"
+
+
+class TestSnapshotCodeFiles:
+    """Tests for per-iteration code file snapshots."""
+
+    def test_first_iteration_stores_contents(self, store: ArtifactStore) -> None:
+        """Every file is new; contents are referenced, not embedded."""
+        snapshot = snapshot_code_files(_code_files("app.py", "test_app.py"), [APP_V1, "t = 1\n"])
+
+        assert [f["changed"] for f in snapshot["files"]] == [True, True]
+        assert [f["diff"] for f in snapshot["files"]] == [None, None]
+        assert snapshot["removed_files"] == []
+        assert APP_V1 not in str(snapshot)
+        assert [store.get(f["content_ref"]) for f in snapshot["files"]] == [APP_V1, "t = 1\n"]
+
+    def test_revision_records_diffs(self, store: ArtifactStore) -> None:
+        """Changed files carry a diff; unchanged and removed files are marked."""
+        first = snapshot_code_files(_code_files("app.py", "old.py"), [APP_V1, "x = 1\n"])
+
+        second = snapshot_code_files(_code_files("app.py"), [APP_V2], previous=first)
+
+        [app] = second["files"]
+        assert app["changed"]
+        assert app["previous_ref"] == first["files"][0]["content_ref"]
+        assert app["diff"] == text_diff(APP_V1, APP_V2, "app.py")
+        assert "-    return a + b * 3\n+    return b - a * 3\n" in app["diff"]
+        assert second["removed_files"] == ["old.py"]
+
+        third = snapshot_code_files(_code_files("app.py"), [APP_V2], previous=second)
+        assert third["files"][0]["changed"] is False
+        assert third["files"][0]["diff"] is None
+
+    def test_rewrites_keep_only_the_reference(self, store: ArtifactStore) -> None:
+        """A diff larger than the new content is not recorded."""
+        first = snapshot_code_files(_code_files("app.py"), [APP_V1])
+
+        second = snapshot_code_files(_code_files("app.py"), ["y = 2\n"], previous=first)
+
+        assert second["files"][0]["changed"]
+        assert second["files"][0]["diff"] is None
+
+    def test_memory_store_keeps_metadata_only(self, memory_store: ArtifactStore) -> None:
+        """Without a persistent store no reference or diff is added."""
+        code_files = _code_files("app.py")
+        first = snapshot_code_files(code_files, [APP_V1])
+
+        second = snapshot_code_files(_code_files("app.py"), [APP_V2], previous=first)
+
+        assert first == code_files
+        assert second == _code_files("app.py")
+        assert len(memory_store) == 0
@@ -0,0 +1,174 @@
+"""Unit tests for the parse-once AST analysis cache."""
+
+import ast
+
+import pytest
+
+from src.agents.analyzers import ast_cache as ast_cache_module
+from src.agents.analyzers.ast_cache import ASTAnalysisCache, ClassInfo, FunctionInfo
+from src.agents.analyzers.code_quality import CodeQualityAnalyzer
+from src.agents.analyzers.test_analyzer import analyze_coverage, extract_test_functions
+from src.agents.nodes.tester import detect_external_dependencies
+from src.agents.processing.formatter import _lint_python_code, validate_python_syntax
+
+SOURCE = '''"""Module docstring."""
+import os.path
+import requests as http
+from typing import Any
+
+
+class Client:
+    """HTTP client."""
+
+    def fetch(self, url: str, retries=3) -> Any:
+        """Fetch a URL."""
+        for _ in range(retries):
+            if url and retries > 1:
+                return http.get(url)
+        return None
+
+    def _helper(self, items=[]):
+        def inner(x):
+            return x if x else None
+        try:
+            return [inner(i) for i in items if i]
+        except:
+            return []
+'''
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> ASTAnalysisCache:
+    """Install a fresh global cache."""
+    fresh = ASTAnalysisCache(max_entries=4)
+    monkeypatch.setattr(ast_cache_module, "_analysis_cache", fresh)
+    return fresh
+
+
+def _function(analysis: ast_cache_module.CodeAnalysis, name: str) -> FunctionInfo:
+    return next(f for f in analysis.functions if f.name == name)
+
+
+class TestCodeAnalysis:
+    """Tests for the facts collected in the single visitor pass."""
+
+    def test_definitions_in_source_order(self) -> None:
+        """Functions and classes carry their nesting and enclosing class."""
+        analysis = ASTAnalysisCache(max_entries=0).analyze(SOURCE)
+
+        assert analysis.module_docstring == "Module docstring."
+        assert analysis.classes == (ClassInfo("Client", 7, 0, "HTTP client."),)
+        assert [(f.name, f.depth, f.class_name) for f in analysis.functions] == [
+            ("fetch", 1, "Client"),
+            ("_helper", 1, "Client"),
+            ("inner", 2, None),
+        ]
+        assert [d.name for d in analysis.definitions()] == ["Client", "fetch", "_helper", "inner"]
+
+    def test_complexity_includes_nested_definitions(self) -> None:
+        """Decision points count for every enclosing function, like a per-function walk."""
+        analysis = ASTAnalysisCache(max_entries=0).analyze(SOURCE)
+
+        # for + if + and
+        assert _function(analysis, "fetch").complexity == 4
+        # inner's ternary + comprehension if + except
+        assert _function(analysis, "_helper").complexity == 4
+        assert _function(analysis, "inner").complexity == 2
+
+    def test_type_hints_and_defaults(self) -> None:
+        """self/cls are not counted; literal container defaults are."""
+        analysis = ASTAnalysisCache(max_entries=0).analyze(SOURCE)
+        fetch = _function(analysis, "fetch")
+        helper = _function(analysis, "_helper")
+
+        assert fetch.typed_parameters == ("url",)
+        assert fetch.untyped_parameters == ("retries",)
+        assert fetch.has_return_annotation
+        assert fetch.mutable_defaults == 0
+        assert helper.mutable_defaults == 1
+        assert analysis.bare_except_lines == (22,)
+
+    def test_imports_and_name_references(self) -> None:
+        """Imports keep aliases; attribute bases count as references."""
+        analysis = ASTAnalysisCache(max_entries=0).analyze(SOURCE)
+
+        assert [(i.module, i.names) for i in analysis.imports] == [
+            (None, (("os.path", None),)),
+            (None, (("requests", "http"),)),
+            ("typing", (("Any", None),)),
+        ]
+        assert analysis.name_references["http"] == (14, 14)
+        assert "http" in analysis.used_names
+        assert "inner" in analysis.defined_names
+
+    def test_syntax_error(self) -> None:
+        """Unparseable source yields only the error."""
+        analysis = ASTAnalysisCache(max_entries=0).analyze("def broken(:\n    pass")
+
+        assert not analysis.is_valid
+        assert analysis.syntax_error is not None
+        assert analysis.syntax_error.lineno == 1
+        assert analysis.functions == ()
+
+
+class TestASTAnalysisCache:
+    """Tests for the bounded, content-addressed cache."""
+
+    def test_identical_source_is_parsed_once(self) -> None:
+        """The second lookup returns the same artifact."""
+        cache = ASTAnalysisCache(max_entries=4)
+
+        first = cache.analyze(SOURCE)
+        second = cache.analyze(str(SOURCE))
+
+        assert second is first
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["hit_rate"] == 0.5
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        """Only the most recently used sources stay cached."""
+        cache = ASTAnalysisCache(max_entries=2)
+        a = cache.analyze("a = 1")
+        cache.analyze("b = 2")
+        cache.analyze("a = 1")
+        cache.analyze("c = 3")
+
+        assert len(cache) == 2
+        assert cache.analyze("a = 1") is a
+        misses = cache.misses
+        cache.analyze("b = 2")
+        assert cache.misses == misses + 1
+
+    def test_zero_entries_disables_caching(self) -> None:
+        """With caching off every lookup parses."""
+        cache = ASTAnalysisCache(max_entries=0)
+
+        assert cache.analyze(SOURCE) is not cache.analyze(SOURCE)
+        assert len(cache) == 0
+
+    def test_analyzers_share_one_parse(
+        self, cache: ASTAnalysisCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """All analyzers run over the same code parse it a single time."""
+        parses = 0
+        real_parse = ast.parse
+
+        def counting_parse(source: str, *args: object, **kwargs: object) -> ast.Module:
+            nonlocal parses
+            parses += 1
+            return real_parse(source)
+
+        monkeypatch.setattr(ast_cache_module.ast, "parse", counting_parse)
+
+        assert validate_python_syntax(SOURCE) == (True, None)
+        _lint_python_code(SOURCE)
+        result = CodeQualityAnalyzer().analyze(SOURCE)
+        suite = extract_test_functions(SOURCE)
+        coverage = analyze_coverage(SOURCE, suite)
+        dependencies = detect_external_dependencies(SOURCE)
+
+        assert parses == 1
+        assert cache.get_stats()["hits"] == 5
+        assert result.complexity.complexity_by_function == {"fetch": 4, "_helper": 4, "inner": 2}
+        assert coverage.classes_in_code == ["Client"]
+        assert [d.usage_locations for d in dependencies if d.name == "http"] == [[14, 14]]
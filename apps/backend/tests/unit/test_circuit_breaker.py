@@ -0,0 +1,321 @@
+"""Unit tests for model backend circuit breakers and per-run retry state."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableConfig
+
+from src.agents.infrastructure import circuit_breaker as circuit_breaker_module
+from src.agents.infrastructure import models as models_module
+from src.agents.infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerCallbackHandler,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+)
+from src.agents.infrastructure.error_handler import ErrorClassifier, ErrorType
+from src.agents.infrastructure.models import (
+    ModelFactory,
+    ModelPool,
+    ModelRateLimiter,
+    RateLimitCallbackHandler,
+    RateLimitConfig,
+)
+from src.agents.resilience import (
+    create_resilient_node,
+    get_node_retry_counts,
+    workflow_error_scope,
+)
+from src.agents.state import WorkflowState
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    """A fake clock for breaker timing."""
+    return _Clock()
+
+
+@pytest.fixture
+def breakers(monkeypatch: pytest.MonkeyPatch) -> CircuitBreakerRegistry:
+    """Install a fresh global registry that opens after two failures."""
+    registry = CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=30.0)
+    monkeypatch.setattr(circuit_breaker_module, "_circuit_breakers", registry)
+    return registry
+
+
+class TestCircuitBreaker:
+    """Tests for the breaker state machine."""
+
+    def test_opens_after_consecutive_failures(self, clock: _Clock) -> None:
+        """Failures below the threshold keep the circuit closed; a success resets them."""
+        breaker = CircuitBreaker("local", "sonnet", failure_threshold=2, clock=clock)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+    def test_open_circuit_fails_fast(self, clock: _Clock) -> None:
+        """Calls are rejected with the time left until the next probe."""
+        breaker = CircuitBreaker(
+            "local", "sonnet", failure_threshold=1, recovery_timeout=30.0, clock=clock
+        )
+        breaker.record_failure()
+        clock.now += 10
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+
+        assert exc_info.value.retry_after == pytest.approx(20.0)
+        assert breaker.get_stats()["rejected_calls"] == 1
+        assert not breaker.is_available()
+
+    def test_half_open_probe_success_closes(self, clock: _Clock) -> None:
+        """After the recovery timeout one probe passes and its success closes the circuit."""
+        breaker = CircuitBreaker(
+            "local", "sonnet", failure_threshold=1, recovery_timeout=30.0, clock=clock
+        )
+        breaker.record_failure()
+        clock.now += 30
+
+        assert breaker.before_call() is True
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success(probe=True)
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.before_call() is False
+
+    def test_half_open_probe_failure_reopens(self, clock: _Clock) -> None:
+        """A failed probe opens the circuit for another recovery period."""
+        breaker = CircuitBreaker(
+            "local", "sonnet", failure_threshold=3, recovery_timeout=30.0, clock=clock
+        )
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 30
+
+        probe = breaker.before_call()
+        breaker.record_failure(probe)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.retry_after == pytest.approx(30.0)
+        assert breaker.get_stats()["times_opened"] == 2
+
+    def test_released_probe_frees_slot(self, clock: _Clock) -> None:
+        """A cancelled probe lets the next call probe instead."""
+        breaker = CircuitBreaker("local", "sonnet", failure_threshold=1, clock=clock)
+        breaker.record_failure()
+        clock.now += breaker.recovery_timeout
+
+        breaker.release(breaker.before_call())
+
+        assert breaker.before_call() is True
+
+
+class TestCircuitBreakerRegistry:
+    """Tests for routing around open circuits."""
+
+    def test_route_falls_back_to_next_available_tier(
+        self, breakers: CircuitBreakerRegistry
+    ) -> None:
+        """Open tiers are skipped in fallback order."""
+        for _ in range(2):
+            breakers.get("cloud", "opus").record_failure()
+            breakers.get("cloud", "sonnet").record_failure()
+
+        assert breakers.route("cloud", "opus") == "haiku"
+        assert breakers.route("cloud", "sonnet") == "haiku"
+        assert breakers.route("local", "opus") == "opus"
+
+    def test_route_keeps_tier_when_no_fallback_is_available(
+        self, breakers: CircuitBreakerRegistry
+    ) -> None:
+        """With every candidate open the requested tier is kept and fails fast."""
+        for _ in range(2):
+            breakers.get("cloud", "haiku").record_failure()
+
+        assert breakers.route("cloud", "haiku") == "haiku"
+
+    def test_model_pool_serves_fallback_tier(
+        self, breakers: CircuitBreakerRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ModelPool hands out the fallback tier's model while a circuit is open."""
+        monkeypatch.setattr(models_module.settings, "enable_circuit_breaker", True)
+        monkeypatch.setattr(models_module.settings, "use_local_llm", False)
+        pool = ModelPool()
+        for _ in range(2):
+            breakers.get("cloud", "sonnet").record_failure()
+
+        assert pool.get_model("sonnet") is pool.get_model("haiku")
+
+    def test_local_tiers_share_one_breaker(
+        self, breakers: CircuitBreakerRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every local tier is served by the same vLLM server: one breaker, no fallback."""
+        monkeypatch.setattr(models_module.settings, "enable_circuit_breaker", True)
+        monkeypatch.setattr(models_module.settings, "use_local_llm", True)
+        pool = ModelPool()
+        for _ in range(2):
+            breakers.get("local", "sonnet").record_failure()
+
+        assert breakers.get("local", "opus") is breakers.get("local", "haiku")
+        assert breakers.get("local", "haiku").state == CircuitState.OPEN
+        assert breakers.route("local", "opus") == "opus"
+        assert pool.get_model("sonnet") is not pool.get_model("haiku")
+        assert list(breakers.get_stats()) == ["local/all"]
+
+
+class _FailingChatModel(BaseChatModel):
+    """Chat model that fails with a configurable error until told otherwise."""
+
+    error: Exception | None = None
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "failing"
+
+    def _generate(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="ok"))])
+
+
+class TestCircuitBreakerCallbackHandler:
+    """Tests for putting models behind breakers."""
+
+    async def test_backend_failures_open_circuit(self, breakers: CircuitBreakerRegistry) -> None:
+        """Once open, calls fail before reaching the backend."""
+        model = _FailingChatModel(
+            error=TimeoutError("Request timeout"),
+            callbacks=[CircuitBreakerCallbackHandler("sonnet", "local")],
+        )
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                await model.ainvoke([HumanMessage(content="hi")])
+
+        with pytest.raises(CircuitOpenError):
+            await model.ainvoke([HumanMessage(content="hi")])
+
+        assert model.calls == 2
+
+    async def test_request_errors_do_not_count(self, breakers: CircuitBreakerRegistry) -> None:
+        """Errors caused by the request say nothing about backend health."""
+        model = _FailingChatModel(
+            error=ValueError("context length exceeded"),
+            callbacks=[CircuitBreakerCallbackHandler("sonnet", "local")],
+        )
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await model.ainvoke([HumanMessage(content="hi")])
+
+        assert breakers.get("local", "sonnet").state == CircuitState.CLOSED
+
+    async def test_rejected_calls_skip_rate_limiter(
+        self, breakers: CircuitBreakerRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Calls rejected by an open circuit use no rate limit budget."""
+        limiter = ModelRateLimiter()
+        limiter._configs = {
+            **limiter._configs,
+            "local": {
+                "sonnet": RateLimitConfig(requests_per_minute=100, min_request_interval_ms=0)
+            },
+        }
+        monkeypatch.setattr(models_module, "_rate_limiter", limiter)
+        rate_limit = RateLimitCallbackHandler(
+            "sonnet", "local", CircuitBreakerCallbackHandler("sonnet", "local")
+        )
+        model = _FailingChatModel(callbacks=[rate_limit])
+        for _ in range(2):
+            breakers.get("local", "sonnet").record_failure()
+
+        for _ in range(3):
+            with pytest.raises(CircuitOpenError):
+                await model.ainvoke([HumanMessage(content="hi")])
+
+        status = limiter.get_status("sonnet", "local")
+        assert status["admitted_requests"] == 0
+        assert status["current_rpm"] == 0
+        assert rate_limit._estimates == {}
+        assert model.calls == 0
+
+    def test_circuit_open_is_classified(self) -> None:
+        """Fail-fast rejections get their own error type."""
+        error = CircuitOpenError("local", "sonnet", 12.0)
+        assert ErrorClassifier.classify(error) == ErrorType.CIRCUIT_OPEN
+
+    def test_factory_checks_breaker_before_rate_limiter(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The breaker runs before the rate limiter on every factory model."""
+        monkeypatch.setattr(models_module.settings, "enable_circuit_breaker", True)
+        monkeypatch.setattr(models_module.settings, "enable_model_rate_limiting", True)
+        model = ModelFactory.create("haiku")
+
+        [handler] = model.callbacks or []
+        assert isinstance(handler, RateLimitCallbackHandler)
+        assert isinstance(handler.circuit_breaker, CircuitBreakerCallbackHandler)
+        assert handler.raise_error is True
+
+
+class TestWorkflowErrorScope:
+    """Tests for retry state scoped to a workflow run."""
+
+    async def test_concurrent_runs_keep_separate_retry_counts(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A run's retries neither consume nor reset another run's budget."""
+
+        async def no_sleep(_: float) -> None:
+            return None
+
+        monkeypatch.setattr("src.agents.resilience.asyncio.sleep", no_sleep)
+        failing_started = asyncio.Event()
+        release_failing = asyncio.Event()
+
+        async def failing(state: WorkflowState, config: RunnableConfig) -> dict[str, Any]:
+            failing_started.set()
+            await release_failing.wait()
+            raise ConnectionError("connection refused")
+
+        async def succeeding(state: WorkflowState, config: RunnableConfig) -> dict[str, Any]:
+            return {"status": "ok"}
+
+        async def run(node: Any) -> tuple[dict[str, Any], dict[str, int]]:
+            with workflow_error_scope():
+                result = await create_resilient_node(node, "coder")({})  # type: ignore[typeddict-item]
+                return result, get_node_retry_counts()
+
+        failing_run = asyncio.create_task(run(failing))
+        await failing_started.wait()
+        ok_result, ok_counts = await run(succeeding)
+        release_failing.set()
+        failed_result, failed_counts = await failing_run
+
+        assert ok_result == {"status": "ok"}
+        assert ok_counts == {}
+        assert failed_result["status"] == "error"
+        assert failed_counts == {"coder:connection_error": 3}
+        assert get_node_retry_counts() == {}
@@ -3,14 +3,21 @@
 Tests formatting, linting, and syntax validation of generated code.
 """
 
+import asyncio
+
+import pytest
+
+from src.agents.processing import formatter as formatter_module
 from src.agents.processing.formatter import (
     CodeFile,
+    FormatCache,
     FormatResult,
     LintCategory,
     LintIssue,
     LintSeverity,
     MultiFileResult,
     SyntaxError_,
+    acreate_multi_file_result,
     create_multi_file_result,
     format_python_code,
     infer_filepath,
@@ -335,6 +342,140 @@ class TestCreateMultiFileResult:
         assert json_file.format_result is None
 
 
+@pytest.fixture
+def format_cache(monkeypatch: pytest.MonkeyPatch) -> FormatCache:
+    """Install a fresh global format cache."""
+    fresh = FormatCache(max_entries=8)
+    monkeypatch.setattr(formatter_module, "_format_cache", fresh)
+    return fresh
+
+
+BLOCKS = [
+    ("src/app.py", "def foo():\n  return 1", "python"),
+    ("README.md", "# App", "markdown"),
+    ("src/broken.py", "def foo(", "python"),
+    ("tests/test_app.py", "def test_foo():\n  assert foo() == 1", "python"),
+]
+
+
+class TestFormatCache:
+    """Tests for skipping files formatted in an earlier iteration."""
+
+    def test_unchanged_files_are_not_reformatted(
+        self, format_cache: FormatCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only new content is formatted on the next iteration."""
+        formatted: list[str] = []
+        real_format = formatter_module.format_python_code
+
+        def counting_format(code: str) -> FormatResult:
+            formatted.append(code)
+            return real_format(code)
+
+        monkeypatch.setattr(formatter_module, "format_python_code", counting_format)
+
+        first = create_multi_file_result(BLOCKS)
+        second = create_multi_file_result([*BLOCKS[:3], ("src/new.py", "x = 1", "python")])
+
+        assert formatted == ["def foo():\n  return 1", "def foo(", BLOCKS[3][1], "x = 1"]
+        assert second.files[0].format_result is first.files[0].format_result
+        assert format_cache.get_stats()["hits"] == 2
+
+    def test_identical_files_in_one_batch_format_once(self, format_cache: FormatCache) -> None:
+        """Duplicate content shares one result."""
+        result = create_multi_file_result([("a.py", "x=1", "python"), ("b.py", "x=1", "python")])
+
+        assert result.files[0].format_result is result.files[1].format_result
+        assert len(format_cache) == 1
+
+    def test_lru_eviction_and_disabled_cache(self) -> None:
+        """The cache is bounded and can be turned off."""
+        cache = FormatCache(max_entries=1)
+        result = format_python_code("a = 1")
+        cache.put("a = 1", result)
+        cache.put("b = 2", format_python_code("b = 2"))
+
+        assert cache.get("a = 1") is None
+        assert len(cache) == 1
+
+        disabled = FormatCache(max_entries=0)
+        disabled.put("a = 1", result)
+        assert disabled.get("a = 1") is None
+
+
+class TestAsyncMultiFileResult:
+    """Tests for formatting multi-file output off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_matches_sync_result_in_input_order(
+        self, format_cache: FormatCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files, contents and validity equal the synchronous path."""
+        monkeypatch.setattr(formatter_module.settings, "format_process_workers", 0)
+        expected = create_multi_file_result(BLOCKS, format_code=True)
+        format_cache.clear()
+
+        result = await acreate_multi_file_result(BLOCKS, format_code=True)
+
+        assert [f.filepath for f in result.files] == [b[0] for b in BLOCKS]
+        assert [f.content for f in result.files] == [f.content for f in expected.files]
+        assert [f.is_test for f in result.files] == [f.is_test for f in expected.files]
+        assert result.all_valid is expected.all_valid is False
+        assert result.files[1].format_result is None
+
+    @pytest.mark.asyncio
+    async def test_worker_processes_format_large_batches(
+        self, format_cache: FormatCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Batches above the size threshold go to the process pool."""
+        monkeypatch.setattr(formatter_module.settings, "format_process_workers", 1)
+        monkeypatch.setattr(formatter_module.settings, "format_parallel_min_chars", 0)
+        monkeypatch.setattr(formatter_module, "_format_pool", None)
+        blocks = [(f"src/mod{i}.py", f"def f{i}( ):\n  return {i}", "python") for i in range(6)]
+
+        try:
+            result = await acreate_multi_file_result(blocks)
+            pool = formatter_module._format_pool
+        finally:
+            formatter_module.shutdown_format_pool()
+
+        assert pool is not None
+        assert [f.content for f in result.files] == [
+            format_python_code(content).formatted_code for _, content, _ in blocks
+        ]
+        assert len(format_cache) == 6
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(
+        self, format_cache: FormatCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Other tasks keep running while files are formatted."""
+        monkeypatch.setattr(formatter_module.settings, "format_process_workers", 0)
+        started = asyncio.Event()
+        ticks = 0
+        real_format_all = formatter_module._format_all
+
+        def slow_format_all(sources: list[str]) -> list[FormatResult]:
+            started.set()
+            return real_format_all(sources * 200)[: len(sources)]
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        monkeypatch.setattr(formatter_module, "_format_all", slow_format_all)
+        task = asyncio.create_task(ticker())
+        try:
+            await acreate_multi_file_result(BLOCKS)
+        finally:
+            task.cancel()
+
+        assert started.is_set()
+        assert ticks > 1
+
+
 class TestInferFilepath:
     """Tests for filepath inference."""
 
@@ -3,8 +3,12 @@
 Tests the extraction and parsing of code blocks from LLM responses.
 """
 
+import random
+
 from src.agents.processing.parser import (
+    CODE_BLOCK_PATTERN,
     CodeBlock,
+    CodeBlockStreamParser,
     Language,
     combine_code_blocks,
     extract_filepath,
@@ -378,3 +382,77 @@ class TestFormatAsMarkdown:
         markdown = format_as_markdown(blocks)
 
         assert "# src/main.py" in markdown
+
+
+def _regex_blocks(response: str) -> list[tuple[str, int, str]]:
+    """Reference: (raw_block, start_line, content) per CODE_BLOCK_PATTERN match."""
+    return [
+        (m.group(0), response[: m.start()].count("\n") + 1, m.group(2).strip())
+        for m in CODE_BLOCK_PATTERN.finditer(response)
+    ]
+
+
+def _regex_explanations(response: str) -> list[str]:
+    """Reference: stripped text around the CODE_BLOCK_PATTERN matches."""
+    explanations = []
+    last_end = 0
+    for match in CODE_BLOCK_PATTERN.finditer(response):
+        if text := response[last_end : match.start()].strip():
+            explanations.append(text)
+        last_end = match.end()
+    if text := response[last_end:].strip():
+        explanations.append(text)
+    return explanations
+
+
+class TestCodeBlockStreamParser:
+    """Tests for incremental fence parsing."""
+
+    def test_matches_regex_grammar_for_any_chunking(self) -> None:
+        """Blocks equal the regex matches however the response is split."""
+        rng = random.Random(7)
+        pieces = ["```", "```python\n", "````\n", "``", "`", "\n", "x = 1", "py", " text ", "```js"]
+        for _ in range(300):
+            response = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 25)))
+            expected = _regex_blocks(response)
+
+            parser = CodeBlockStreamParser()
+            position = 0
+            while position < len(response):
+                step = rng.randint(1, 6)
+                parser.feed(response[position : position + step])
+                position += step
+            parsed = parser.finish()
+
+            blocks = [(b.raw_block, b.start_line, b.content) for b in parsed.code_blocks]
+            assert blocks == expected, response
+            assert parsed.explanations == _regex_explanations(response), response
+            assert parsed.raw_response == response
+
+    def test_blocks_are_returned_when_fence_closes(self) -> None:
+        """A file is available as soon as its closing fence streams in."""
+        parser = CodeBlockStreamParser()
+
+        assert parser.feed("Intro\n```py") == []
+        assert parser.feed("thon\n# src/app.py\nx = 1\n`") == []
+        [block] = parser.feed("``\nMore text\n```python\ny = 2\n")
+
+        assert block.filepath == "src/app.py"
+        assert block.content == "x = 1"
+        assert block.start_line == 2
+        assert block.language == Language.PYTHON
+
+        parsed = parser.finish()
+        assert len(parsed.code_blocks) == 1
+        assert parsed.explanations == ["Intro", "More text\n```python\ny = 2"]
+
+    def test_start_lines_in_large_response(self) -> None:
+        """Line numbers stay exact across many blocks."""
+        response = "".join(f"Step {i}\n```python\ndef f{i}():\n    pass\n```\n" for i in range(500))
+
+        blocks = parse_code_blocks(response).code_blocks
+
+        assert len(blocks) == 500
+        assert [b.start_line for b in blocks[:3]] == [2, 7, 12]
+        assert blocks[-1].start_line == 5 * 499 + 2
+        assert blocks[-1].metadata["functions"] == ["f499"]
@@ -0,0 +1,178 @@
+"""Unit tests for ReAct context-window management."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from src.agents.infrastructure.context_window import ContextWindowManager, context_budget_for
+from src.agents.infrastructure.models import ModelFactory, estimate_message_tokens
+from src.agents.nodes.react_executor import execute_react_loop
+from src.tools import get_registry, register_all_tools
+from src.tools.registry import AgentType
+
+
+def _tool_turn(
+    manager: ContextWindowManager, index: int, tool_name: str, args: dict[str, Any], output: str
+) -> None:
+    """Append an AI tool call and its result."""
+    call_id = f"call_{index}"
+    manager.add(
+        AIMessage(content="", tool_calls=[{"name": tool_name, "args": args, "id": call_id}])
+    )
+    manager.add(
+        ToolMessage(content=output, tool_call_id=call_id), tool_name=tool_name, tool_args=args
+    )
+
+
+def _big_output(label: str, lines: int = 400) -> str:
+    return "\n".join(f"{label} line {i}: " + "x" * 40 for i in range(lines))
+
+
+class TestContextWindowManager:
+    """Tests for history compaction."""
+
+    @pytest.fixture
+    def manager(self) -> ContextWindowManager:
+        """Manager with an initial prompt and a generous budget."""
+        manager = ContextWindowManager(budget_tokens=100_000, keep_recent_turns=2)
+        manager.extend([SystemMessage(content="system"), HumanMessage(content="task")])
+        return manager
+
+    def test_recent_outputs_are_sent_in_full(self, manager: ContextWindowManager) -> None:
+        """Nothing is compacted while the history is recent and within budget."""
+        _tool_turn(manager, 1, "read_file", {"path": "a.py"}, _big_output("a"))
+
+        assert manager.build() == manager.messages
+
+    def test_stale_outputs_are_elided(self, manager: ContextWindowManager) -> None:
+        """Outputs older than the recent turns become short stubs."""
+        _tool_turn(manager, 1, "read_file", {"path": "a.py"}, _big_output("a"))
+        _tool_turn(manager, 2, "read_file", {"path": "b.py"}, _big_output("b"))
+        _tool_turn(manager, 3, "read_file", {"path": "c.py"}, _big_output("c"))
+
+        sent = manager.build()
+
+        assert str(sent[3].content).startswith("[Elided read_file output")
+        assert "a line 0" in str(sent[3].content)
+        assert sent[3].tool_call_id == "call_1"  # type: ignore[attr-defined]
+        assert sent[5] is manager.messages[5]
+        assert sent[7] is manager.messages[7]
+        assert manager.stats.elided == 1
+
+    def test_repeated_reads_are_deduplicated(self, manager: ContextWindowManager) -> None:
+        """Earlier results of an identical call point to the newer one."""
+        _tool_turn(manager, 1, "read_file", {"path": "a.py"}, _big_output("a"))
+        _tool_turn(manager, 2, "read_file", {"path": "a.py"}, _big_output("a"))
+
+        sent = manager.build()
+
+        assert str(sent[3].content).startswith("[Superseded: read_file")
+        assert sent[5] is manager.messages[5]
+        assert manager.stats.deduplicated == 1
+
+    def test_compaction_is_stable_across_builds(self, manager: ContextWindowManager) -> None:
+        """Compacted messages are reused so the sent prefix does not change."""
+        for i in range(1, 4):
+            _tool_turn(manager, i, "grep_content", {"pattern": str(i)}, _big_output(str(i)))
+        first = manager.build()
+
+        _tool_turn(manager, 4, "grep_content", {"pattern": "4"}, _big_output("4"))
+        second = manager.build()
+
+        assert second[: len(first)][3] is first[3]
+
+    def test_budget_truncates_latest_output(self) -> None:
+        """A single output larger than the budget is cut down to fit."""
+        manager = ContextWindowManager(budget_tokens=2000)
+        manager.extend([HumanMessage(content="task")])
+        _tool_turn(manager, 1, "read_file", {"path": "huge.py"}, _big_output("h", lines=2000))
+
+        sent = manager.build()
+
+        assert "characters truncated" in str(sent[-1].content)
+        assert manager.stats.last_request_tokens <= 2000
+        assert estimate_message_tokens(sent) <= 2000
+
+    def test_input_grows_sublinearly(self) -> None:
+        """Per-iteration request size stays bounded as large outputs accumulate."""
+        manager = ContextWindowManager(budget_tokens=100_000, keep_recent_turns=2)
+        manager.extend([HumanMessage(content="task")])
+        sizes = []
+        for i in range(1, 11):
+            _tool_turn(manager, i, "read_file", {"path": f"{i}.py"}, _big_output(str(i)))
+            sizes.append(estimate_message_tokens(manager.build()))
+
+        full = estimate_message_tokens(manager.messages)
+        assert sizes[-1] < full / 3
+        assert sizes[-1] - sizes[4] < sizes[4]
+
+    def test_calibration_scales_estimates(self) -> None:
+        """Reported input tokens above the estimate tighten the budget."""
+        manager = ContextWindowManager(budget_tokens=3000, keep_recent_turns=10)
+        manager.extend([HumanMessage(content="task")])
+        _tool_turn(manager, 1, "read_file", {"path": "a.py"}, _big_output("a", lines=200))
+        estimate = estimate_message_tokens(manager.build())
+        assert manager.stats.truncated == 0
+
+        manager.record_usage(input_tokens=int(estimate * 1.5))
+        _tool_turn(manager, 2, "read_file", {"path": "b.py"}, _big_output("b", lines=50))
+        manager.build()
+
+        assert manager.stats.last_request_tokens <= 3000
+        assert manager.stats.elided + manager.stats.truncated > 0
+
+    def test_budget_reserves_completion_tokens(self) -> None:
+        """The default budget leaves room for the model's max_tokens."""
+        model = ModelFactory.create("sonnet")
+        assert context_budget_for(model) == 8192 - 4096
+
+
+class _ScriptedModel:
+    """Model stub that records requests and replays scripted responses."""
+
+    def __init__(self, responses: list[AIMessage]) -> None:
+        self.responses = iter(responses)
+        self.requests: list[list[BaseMessage]] = []
+
+    async def ainvoke(self, messages: list[BaseMessage], config: Any = None) -> AIMessage:
+        self.requests.append(list(messages))
+        return next(self.responses)
+
+
+class TestReactLoopContext:
+    """Tests for the ReAct loop's use of the context manager."""
+
+    @pytest.fixture
+    def workspace(self, tmp_path: Path) -> Iterator[Path]:
+        """Workspace with a large file and registered tools."""
+        (tmp_path / "big.py").write_text(_big_output("big"))
+        register_all_tools()
+        yield tmp_path
+        get_registry().clear()
+
+    async def test_repeated_reads_not_resent(self, workspace: Path) -> None:
+        """The loop returns full history but sends compacted requests."""
+        read = {"name": "read_file", "args": {"path": "big.py"}}
+        model = _ScriptedModel(
+            [
+                AIMessage(content="", tool_calls=[{**read, "id": "c1"}]),
+                AIMessage(content="", tool_calls=[{**read, "id": "c2"}]),
+                AIMessage(content="done"),
+            ]
+        )
+
+        messages, tool_calls, usage = await execute_react_loop(
+            model=model,
+            messages=[HumanMessage(content="task")],
+            state={"task_id": 1, "workspace_path": str(workspace)},
+            agent_type=AgentType.CODER,
+            max_context_tokens=50_000,
+        )
+
+        assert len(tool_calls) == 2
+        assert "big line 0" in str(messages[2].content)
+        assert str(model.requests[-1][2].content).startswith("[Superseded")
+        assert usage["context_tokens_saved"] > 0
@@ -158,6 +158,37 @@ class TestCostCalculator:
         # Input ratio = 0.80
         assert result["input_tokens"] == int(300000 * 0.80)
 
+    def test_calculate_with_prompt_cache(self) -> None:
+        """Test that cached input is billed at cache read/write prices."""
+        # 1M input of which 800K read from cache and 100K written to it
+        result = CostCalculator.calculate(
+            input_tokens=1_000_000,
+            output_tokens=0,
+            cache_read_tokens=800_000,
+            cache_creation_tokens=100_000,
+        )
+        # Sonnet: 0.1 * 3.00 + 0.8 * 0.30 + 0.1 * 3.75 = 0.915
+        assert result.claude_sonnet == pytest.approx(0.915, rel=0.01)
+        # GPT-5.2 has no write premium: 0.2 * 3.00 + 0.8 * 0.30 = 0.84
+        assert result.gpt52 == pytest.approx(0.84, rel=0.01)
+
+    def test_calculate_cache_savings(self) -> None:
+        """Test prompt cache hit rate and savings."""
+        result = CostCalculator.calculate_cache_savings(
+            input_tokens=1_000_000,
+            cache_read_tokens=800_000,
+            cache_creation_tokens=100_000,
+        )
+        assert result["hit_rate"] == pytest.approx(0.8)
+        # Sonnet: 3.00 uncached vs 0.915 cached
+        assert result["savings"]["vs_claude_sonnet"] == pytest.approx(2.085, rel=0.01)
+
+    def test_cache_savings_without_input(self) -> None:
+        """Test that an empty period has a zero hit rate."""
+        result = CostCalculator.calculate_cache_savings(input_tokens=0, cache_read_tokens=0)
+        assert result["hit_rate"] == 0.0
+        assert result["savings"]["vs_claude_haiku"] == 0.0
+
 
 class TestCostBreakdown:
     """Test suite for CostBreakdown dataclass."""
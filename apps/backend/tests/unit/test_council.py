@@ -1,7 +1,16 @@
 """Unit tests for council-based code review."""
 
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
 import pytest
+from langchain_core.messages import AIMessageChunk
 
+from src.agents.council.node import council_reviewer_node
 from src.agents.council.orchestrator import (
     MAINTAINABILITY_JUDGE_PROMPT,
     PERFORMANCE_JUDGE_PROMPT,
@@ -10,6 +19,10 @@ from src.agents.council.orchestrator import (
     CouncilConfig,
     JudgeConfig,
 )
+from src.agents.council.speculation import with_speculative_review
+from src.agents.council.streaming import IncrementalVerdictParser
+from src.agents.infrastructure import response_cache as response_cache_module
+from src.agents.infrastructure.response_cache import LLMResponseCache
 from src.agents.state import JudgeVerdictState
 
 
@@ -514,3 +527,359 @@ class TestJudgePrompts:
         ]:
             assert "JSON" in prompt
             assert "verdict" in prompt.lower()
+
+
+def _verdict_json(verdict: str, confidence: float) -> str:
+    return json.dumps(
+        {
+            "summary": f"The code warrants {verdict} from this reviewer.",
+            "verdict": verdict,
+            "confidence": confidence,
+            "strengths": [],
+            "issues": [],
+            "action_items": ["Tighten error handling"],
+        }
+    )
+
+
+class TestIncrementalVerdictParser:
+    """Tests for parsing verdicts from streamed chunks."""
+
+    def test_fields_split_across_chunks(self) -> None:
+        """Fields are found even when chunk boundaries split them."""
+        parser = IncrementalVerdictParser()
+        text = _verdict_json("REVISE", 0.8)
+        chunks = [text[i : i + 3] for i in range(0, len(text), 3)]
+
+        decided_at = [i for i, chunk in enumerate(chunks) if parser.feed(chunk)]
+
+        assert parser.verdict == "REVISE"
+        assert parser.confidence == 0.8
+        assert len(decided_at) == 1
+        assert decided_at[0] < len(chunks) - 1  # Before the action items
+        assert parser.text == text
+
+    def test_confidence_waits_for_delimiter(self) -> None:
+        """A number at the end of the buffer may still grow."""
+        parser = IncrementalVerdictParser()
+        parser.feed('{"verdict": "approve", "confidence": 0.')
+        parser.feed("9")
+
+        assert parser.verdict == "APPROVE"
+        assert parser.confidence is None
+
+        assert parser.feed("5,")
+        assert parser.confidence == 0.95
+
+
+class _StreamingJudgeModel:
+    """Model stub that streams a scripted verdict per judge persona."""
+
+    def __init__(self, scripts: dict[str, tuple[str, float, float]]) -> None:
+        # persona prompt -> (verdict, confidence, delay before the verdict)
+        self.scripts = scripts
+        self.calls: list[str] = []
+        self.cancelled: list[str] = []
+        self.messages: list[list[Any]] = []
+
+    async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[Any]:
+        self.messages.append(messages)
+        persona_prompt = messages[0][1]
+        prompt = next(p for p in self.scripts if persona_prompt.startswith(p))
+        self.calls.append(prompt)
+        verdict, confidence, delay = self.scripts[prompt]
+        text = _verdict_json(verdict, confidence)
+        try:
+            yield AIMessageChunk(content=text[:20])
+            await asyncio.sleep(delay)
+            for i in range(20, len(text), 20):
+                yield AIMessageChunk(content=text[i : i + 20])
+        except asyncio.CancelledError:
+            self.cancelled.append(prompt)
+            raise
+        yield AIMessageChunk(
+            content="",
+            usage_metadata={"input_tokens": 100, "output_tokens": 50, "total_tokens": 150},
+        )
+
+
+class TestCouncilQuorum:
+    """Tests for streamed judges with early quorum."""
+
+    @pytest.fixture
+    def council(self) -> CodeReviewCouncil:
+        """Create a local council with quorum mode enabled."""
+        config = CouncilConfig.default_local()
+        config.early_quorum = True
+        return CodeReviewCouncil(config=config)
+
+    async def _convene(self, council: CodeReviewCouncil, model: _StreamingJudgeModel) -> Any:
+        pool = MagicMock()
+        pool.get_model.return_value = model
+        with patch("src.agents.council.orchestrator.get_model_pool", return_value=pool):
+            return await asyncio.wait_for(council.convene("code", "tests", "plan"), timeout=5)
+
+    def test_settled_when_remaining_judge_cannot_flip(self, council: CodeReviewCouncil) -> None:
+        """Two confident REVISE votes outweigh any third vote."""
+        votes = {"security_judge": ("REVISE", 0.9), "performance_judge": ("REVISE", 0.9)}
+
+        assert council._verdict_is_settled(votes, ["maintainability_judge"])  # type: ignore[arg-type]
+
+    def test_not_settled_without_votes(self, council: CodeReviewCouncil) -> None:
+        """Nothing is settled before any judge has voted."""
+        judges = ["security_judge", "performance_judge", "maintainability_judge"]
+
+        assert not council._verdict_is_settled({}, judges)
+
+    def test_abstention_matches_settled_verdict(self, council: CodeReviewCouncil) -> None:
+        """Aggregating with the cancelled judge abstaining keeps the settled verdict."""
+        votes = {"security_judge": ("REVISE", 0.9), "performance_judge": ("REVISE", 0.9)}
+
+        verdict, _, consensus, dissenting = council._aggregate_votes(
+            votes,  # type: ignore[arg-type]
+            abstained=["maintainability_judge"],
+        )
+
+        assert verdict == "REVISE"
+        assert consensus == "unanimous"
+        assert dissenting == []
+
+    def test_single_vote_can_settle(self, council: CodeReviewCouncil) -> None:
+        """A 0.35-weight REVISE vote caps APPROVE below the 0.7 threshold."""
+        votes = {"security_judge": ("REVISE", 0.9)}
+        pending = ["performance_judge", "maintainability_judge"]
+
+        assert council._verdict_is_settled(votes, pending)  # type: ignore[arg-type]
+
+    def test_not_settled_when_remaining_judge_decides(self, council: CodeReviewCouncil) -> None:
+        """APPROVE needs the third judge to clear the confidence threshold."""
+        votes = {"security_judge": ("APPROVE", 0.9), "performance_judge": ("APPROVE", 0.9)}
+
+        assert not council._verdict_is_settled(votes, ["maintainability_judge"])  # type: ignore[arg-type]
+
+    async def test_slow_judge_cancelled_once_settled(self, council: CodeReviewCouncil) -> None:
+        """Latency follows the deciding judge and savings are recorded.
+
+        With a 0.35-weight REVISE vote, APPROVE can reach at most 0.65 and
+        never clears the 0.7 threshold, so the other judges are cancelled.
+        """
+        model = _StreamingJudgeModel(
+            {
+                SECURITY_JUDGE_PROMPT: ("REVISE", 0.9, 0.01),
+                PERFORMANCE_JUDGE_PROMPT: ("APPROVE", 1.0, 30.0),
+                MAINTAINABILITY_JUDGE_PROMPT: ("APPROVE", 1.0, 30.0),
+            }
+        )
+
+        result = await self._convene(council, model)
+
+        assert result["final_verdict"] == "REVISE"
+        assert result["cancelled_judges"] == ["performance_judge", "maintainability_judge"]
+        assert set(result["judge_verdicts"]) == {"security_judge"}
+        assert result["judge_verdicts"]["security_judge"]["action_items"]
+        assert sorted(model.cancelled) == sorted(
+            [PERFORMANCE_JUDGE_PROMPT, MAINTAINABILITY_JUDGE_PROMPT]
+        )
+        assert result["deliberation_time_ms"] < 1000
+        assert result["latency_saved_ms"] > 0
+
+    async def test_waits_for_deciding_judge(self, council: CodeReviewCouncil) -> None:
+        """No judge is cancelled while its vote can still change the outcome."""
+        model = _StreamingJudgeModel(
+            {
+                SECURITY_JUDGE_PROMPT: ("APPROVE", 0.9, 0.0),
+                PERFORMANCE_JUDGE_PROMPT: ("APPROVE", 0.9, 0.0),
+                MAINTAINABILITY_JUDGE_PROMPT: ("APPROVE", 0.9, 0.05),
+            }
+        )
+
+        result = await self._convene(council, model)
+
+        assert result["final_verdict"] == "APPROVE"
+        assert result["cancelled_judges"] == []
+        assert len(result["judge_verdicts"]) == 3
+        assert result["latency_saved_ms"] == 0
+
+    async def test_persona_prefix_and_code_last(self, council: CodeReviewCouncil) -> None:
+        """The static persona is the system prompt; the code goes in the human turn."""
+        model = _StreamingJudgeModel(
+            {
+                SECURITY_JUDGE_PROMPT: ("APPROVE", 0.9, 0.0),
+                PERFORMANCE_JUDGE_PROMPT: ("APPROVE", 0.9, 0.0),
+                MAINTAINABILITY_JUDGE_PROMPT: ("APPROVE", 0.9, 0.0),
+            }
+        )
+
+        await self._convene(council, model)
+
+        for (system_role, system), (human_role, human) in model.messages:
+            assert (system_role, human_role) == ("system", "human")
+            assert system.startswith(tuple(model.scripts))
+            assert "## Generated Code" not in system
+            assert human.endswith("## Context (Execution Plan)\nplan")
+            assert "## Generated Code\ncode" in human
+
+
+class TestSpeculativeReview:
+    """Tests for code-only judges running alongside the tester."""
+
+    @pytest.fixture
+    def model(self) -> Iterator[_StreamingJudgeModel]:
+        """Judge model stub served by a patched model pool."""
+        model = _StreamingJudgeModel(
+            {
+                SECURITY_JUDGE_PROMPT: ("REVISE", 0.9, 0.2),
+                PERFORMANCE_JUDGE_PROMPT: ("REVISE", 0.8, 0.0),
+                MAINTAINABILITY_JUDGE_PROMPT: ("REVISE", 0.8, 0.0),
+            }
+        )
+        pool = MagicMock()
+        pool.get_model.return_value = model
+        with patch("src.agents.council.orchestrator.get_model_pool", return_value=pool):
+            yield model
+
+    @pytest.fixture
+    def state(self) -> dict[str, Any]:
+        """Workflow state after the coder."""
+        return {"task_id": 1, "code": "def f(): pass", "plan": "1. Write f", "metadata": {}}
+
+    @staticmethod
+    async def _tester(state: Any, config: Any) -> dict[str, Any]:
+        await asyncio.sleep(0.2)
+        return {"test_results": "def test_f(): f()", "status": "reviewing"}
+
+    async def test_judges_overlap_with_tester(
+        self, model: _StreamingJudgeModel, state: dict[str, Any]
+    ) -> None:
+        """Only code-only judges run, concurrently with the tester."""
+        tester = with_speculative_review(self._tester)
+
+        start = time.monotonic()
+        result = await tester(state, {})  # type: ignore[arg-type]
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.35
+        assert result["test_results"] == "def test_f(): f()"
+        assert len(result["speculative_review"]["judge_verdicts"]) == 1
+        assert model.calls == [SECURITY_JUDGE_PROMPT]
+
+    async def test_reviewer_reuses_speculative_verdicts(
+        self, model: _StreamingJudgeModel, state: dict[str, Any]
+    ) -> None:
+        """The full review does not invoke the speculative judges again."""
+        state.update(await with_speculative_review(self._tester)(state, {}))  # type: ignore[arg-type]
+        model.calls.clear()
+
+        result = await council_reviewer_node(state)  # type: ignore[arg-type]
+
+        assert SECURITY_JUDGE_PROMPT not in model.calls
+        assert len(model.calls) == 2
+        assert len(result["metadata"]["judge_verdicts"]) == 3
+        assert len(result["metadata"]["council_review"]["speculative_judges"]) == 1
+
+    async def test_changed_code_discards_speculation(
+        self, model: _StreamingJudgeModel, state: dict[str, Any]
+    ) -> None:
+        """Verdicts on outdated code are not reused."""
+        state.update(await with_speculative_review(self._tester)(state, {}))  # type: ignore[arg-type]
+        state["code"] = "def f(): return 1"
+        model.calls.clear()
+
+        result = await council_reviewer_node(state)  # type: ignore[arg-type]
+
+        assert SECURITY_JUDGE_PROMPT in model.calls
+        assert result["metadata"]["council_review"]["speculative_judges"] == []
+
+    async def test_tester_error_cancels_speculation(
+        self, model: _StreamingJudgeModel, state: dict[str, Any]
+    ) -> None:
+        """A failed tester returns its error without waiting for the judges."""
+
+        async def failing_tester(state: Any, config: Any) -> dict[str, Any]:
+            await asyncio.sleep(0.01)
+            return {"status": "error", "error": "tester failed"}
+
+        result = await with_speculative_review(failing_tester)(state, {})  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+
+        assert "speculative_review" not in result
+        assert model.cancelled == [SECURITY_JUDGE_PROMPT]
+
+
+class TestCouncilResponseCache:
+    """Tests for reusing judge responses on identical reviews."""
+
+    async def test_identical_review_replays_cached_verdicts(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Re-reviewing unchanged code makes no judge calls."""
+        monkeypatch.setattr(
+            response_cache_module, "_response_cache", LLMResponseCache(enabled=True)
+        )
+        model = _StreamingJudgeModel(
+            {
+                SECURITY_JUDGE_PROMPT: ("APPROVE", 0.9, 0.0),
+                PERFORMANCE_JUDGE_PROMPT: ("APPROVE", 0.9, 0.0),
+                MAINTAINABILITY_JUDGE_PROMPT: ("REVISE", 0.8, 0.0),
+            }
+        )
+        model.temperature = 0.0  # type: ignore[attr-defined]
+        council = CodeReviewCouncil(config=CouncilConfig.default_local())
+        pool = MagicMock()
+        pool.get_model.return_value = model
+
+        with patch("src.agents.council.orchestrator.get_model_pool", return_value=pool):
+            first = await council.convene("code", "tests", "plan")
+            second = await council.convene("code", "tests", "plan")
+
+        assert len(model.calls) == 3
+        assert second["final_verdict"] == first["final_verdict"]
+        assert all(v["response_cached"] for v in second["judge_verdicts"].values())
+        assert not any(v["response_cached"] for v in first["judge_verdicts"].values())
+        assert second["total_cost_usd"] == 0.0
+
+
+class _ToolCallJudgeModel(_StreamingJudgeModel):
+    """Model stub streaming its verdict as forced tool-call arguments."""
+
+    async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[Any]:
+        async for chunk in super().astream(messages, config):
+            if chunk.content:
+                yield AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {"name": None, "args": chunk.content, "id": None, "index": 0}
+                    ],
+                )
+            else:
+                yield chunk
+
+
+class TestStructuredVerdictOutput:
+    """Tests for verdicts returned through native structured output."""
+
+    async def test_tool_call_verdicts_are_parsed(self) -> None:
+        """Verdicts streamed as tool-call arguments are parsed without text fallback."""
+        model = _ToolCallJudgeModel(
+            {
+                SECURITY_JUDGE_PROMPT: ("APPROVE", 0.9, 0.0),
+                PERFORMANCE_JUDGE_PROMPT: ("REJECT", 0.6, 0.0),
+                MAINTAINABILITY_JUDGE_PROMPT: ("REVISE", 0.8, 0.0),
+            }
+        )
+        bound = MagicMock()
+        bound.astream = model.astream
+        council = CodeReviewCouncil(config=CouncilConfig.default_local())
+        pool = MagicMock()
+        pool.get_model.return_value = model
+
+        with (
+            patch("src.agents.council.orchestrator.get_model_pool", return_value=pool),
+            patch("src.agents.council.orchestrator.bind_verdict_output", return_value=bound),
+        ):
+            result = await council.convene("code", "tests", "plan")
+
+        verdicts = result["judge_verdicts"]
+        assert verdicts["performance_judge"]["verdict"] == "REJECT"
+        assert verdicts["performance_judge"]["confidence"] == 0.6
+        assert all(v["verdict_source"] == "structured" for v in verdicts.values())
@@ -0,0 +1,283 @@
+"""Unit tests for incremental council re-review."""
+
+import json
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+
+from src.agents.analyzers import ast_cache as ast_cache_module
+from src.agents.analyzers.ast_cache import ASTAnalysisCache, analyze_source
+from src.agents.council import incremental as incremental_module
+from src.agents.council.incremental import (
+    TESTS_FILEPATH,
+    build_review_memory,
+    collect_units,
+    diff_units,
+    extract_units,
+    issue_id,
+    locate_issue,
+    prepare_incremental_review,
+)
+from src.agents.council.node import council_reviewer_node
+from src.agents.state import JudgeVerdictState
+
+CODE_V1 = '''"""Users."""
+import hashlib
+
+MAX_USERS = 10
+
+
+class UserStore:
+    """Stores users."""
+
+    backend = "memory"
+
+    def add(self, name):
+        return name
+
+    @staticmethod
+    def hash_password(password):
+        return hashlib.md5(password.encode()).hexdigest()
+
+
+def report(store):
+    return str(store)
+'''
+
+# hash_password fixed; add() only reformatted
+CODE_V2 = CODE_V1.replace("hashlib.md5(", "hashlib.sha256(").replace(
+    "    def add(self, name):\n        return name",
+    "    def add(self,name):  # add a user\n        return (name)",
+)
+
+# A module large enough that its full review costs more than the change
+LARGE_CODE_V1 = CODE_V1 + "".join(
+    f'\n\ndef lookup_{n}(store, key):\n    """Look up key {n}."""\n'
+    f"    return store.get(key, {n})\n"
+    for n in range(40)
+)
+
+TESTS = "def test_add():\n    assert UserStore().add('a') == 'a'\n"
+PLAN = "1. Create a user store\n2. Hash passwords"
+
+
+def _files(code: str) -> dict[str, str]:
+    return {"users.py": code, TESTS_FILEPATH: TESTS}
+
+
+def _verdict(name: str, issues: list[dict[str, Any]]) -> JudgeVerdictState:
+    return JudgeVerdictState(
+        judge_name=name,
+        persona=name,
+        model_tier="local",
+        verdict="REVISE" if issues else "APPROVE",
+        confidence=0.9,
+        issues=issues,
+        reasoning="Reviewed.",
+        strengths=[],
+        action_items=[],
+        tokens_used=0,
+        latency_ms=0,
+        cost_usd=0.0,
+    )
+
+
+def _issue(description: str, line: int | None, severity: str = "major") -> dict[str, Any]:
+    return {
+        "severity": severity,
+        "category": "security",
+        "description": description,
+        "file_path": "users.py" if line else None,
+        "line_number": line,
+        "suggested_fix": None,
+    }
+
+
+class TestReviewUnits:
+    """Tests for splitting code into fingerprinted units."""
+
+    def test_units_cover_functions_methods_and_module(self) -> None:
+        """Methods are separate units; class bodies and module code have their own."""
+        units = extract_units("users.py", CODE_V1)
+
+        assert [u.name for u in units] == [
+            "<module>",
+            "UserStore",
+            "UserStore.add",
+            "UserStore.hash_password",
+            "report",
+        ]
+        hash_password = units[3]
+        assert hash_password.source.startswith("    @staticmethod\n")
+        assert (hash_password.start_line, hash_password.end_line) == (15, 17)
+
+    def test_formatting_changes_keep_digests(self) -> None:
+        """Only real code changes count as modifications."""
+        diff = diff_units(
+            {u.unit_id: u.digest for u in collect_units(_files(CODE_V1)).values()},
+            collect_units(_files(CODE_V2 + "\n\ndef extra():\n    pass\n")),
+        )
+
+        assert diff.modified == ("users.py::UserStore.hash_password",)
+        assert diff.added == ("users.py::extra",)
+        assert diff.removed == ()
+        assert "users.py::UserStore.add" in diff.unchanged
+
+    def test_parse_shared_with_analyzers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Code already analyzed this round is not parsed again."""
+        cache = ASTAnalysisCache(max_entries=4)
+        monkeypatch.setattr(ast_cache_module, "_analysis_cache", cache)
+        analyze_source(CODE_V1)
+
+        extract_units("users.py", CODE_V1)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_unparseable_and_empty_files(self) -> None:
+        """Invalid Python is one unit; empty files have none."""
+        assert [u.name for u in extract_units("broken.py", "def f(:\n")] == ["<module>"]
+        assert extract_units(TESTS_FILEPATH, "") == []
+
+
+class TestIssueTracking:
+    """Tests for issue IDs and locations."""
+
+    def test_issue_is_located_in_narrowest_unit(self) -> None:
+        """A line inside a method belongs to the method, not the class."""
+        units = collect_units(_files(CODE_V1))
+
+        assert locate_issue(_issue("MD5", 17), units) == "users.py::UserStore.hash_password"
+        assert locate_issue(_issue("Class attribute", 10), units) == "users.py::UserStore"
+        assert locate_issue(_issue("No location", None), units) is None
+
+    def test_repeated_issue_keeps_its_id(self) -> None:
+        """A finding prefixed with its ID is the same finding."""
+        original = issue_id("security_judge", _issue("Weak hash", 17))
+        repeated = _issue(f"[{original}] Still uses a weak hash", 17)
+
+        assert original.startswith("I-")
+        assert issue_id("security_judge", repeated) == original
+        assert issue_id("other_judge", _issue("Weak hash", 17)) != original
+
+
+class TestIncrementalReview:
+    """Tests for planning an incremental review."""
+
+    @pytest.fixture
+    def memory(self) -> dict[str, Any]:
+        """Memory after a first review that found two issues."""
+        verdicts = {
+            "security_judge": _verdict(
+                "security_judge",
+                [_issue("MD5 is a weak hash", 17), _issue("MAX_USERS is unused", 4, "minor")],
+            ),
+            "performance_judge": _verdict("performance_judge", [_issue("Slow", None)]),
+        }
+        return build_review_memory(_files(CODE_V1), PLAN, verdicts)
+
+    def test_context_contains_only_changed_units(self, memory: dict[str, Any]) -> None:
+        """Unchanged code is summarized through its findings only."""
+        review = prepare_incremental_review(memory, _files(CODE_V2), PLAN)
+
+        assert review is not None
+        assert review.round == 2
+        assert review.diff.changed == ("users.py::UserStore.hash_password",)
+        assert "hashlib.sha256(" in review.context
+        assert "def report(store)" not in review.context
+        assert TESTS not in review.context
+        assert "MD5 is a weak hash" in review.context
+        assert review.carried_issues["security_judge"][0]["description"] == "MAX_USERS is unused"
+        assert "performance_judge" not in review.carried_issues
+
+    def test_full_review_when_plan_or_most_code_changed(self, memory: dict[str, Any]) -> None:
+        """Incremental review needs the same plan and a small enough change."""
+        assert prepare_incremental_review(None, _files(CODE_V2), PLAN) is None
+        assert prepare_incremental_review(memory, _files(CODE_V2), PLAN + "\n3. More") is None
+        assert prepare_incremental_review(memory, _files("def other():\n    pass\n"), PLAN) is None
+
+    def test_memory_tracks_resolved_and_carried_issues(self, memory: dict[str, Any]) -> None:
+        """Unreported findings in changed code resolve; carried ones stay open."""
+        review = prepare_incremental_review(memory, _files(CODE_V2), PLAN)
+        assert review is not None
+        weak_hash, unused = memory["issues"][0]["issue_id"], memory["issues"][1]["issue_id"]
+        verdicts = {
+            "security_judge": _verdict("security_judge", review.carried_issues["security_judge"]),
+            "performance_judge": _verdict("performance_judge", [_issue("Store is unbounded", 12)]),
+        }
+
+        updated = build_review_memory(_files(CODE_V2), PLAN, verdicts, memory, review)
+
+        open_ids = [issue["issue_id"] for issue in updated["issues"]]
+        assert unused in open_ids
+        assert weak_hash not in open_ids
+        assert weak_hash in updated["resolved_issue_ids"]
+        assert updated["round"] == 2
+        assert updated["issues"][1]["unit_id"] == "users.py::UserStore.add"
+
+
+class _RecordingJudgeModel:
+    """Model stub recording each judge's review context."""
+
+    def __init__(self, issues: list[dict[str, Any]]) -> None:
+        self.issues = issues
+        self.contexts: list[str] = []
+
+    async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[Any]:
+        self.contexts.append(messages[1][1])
+        yield AIMessageChunk(
+            content=json.dumps(
+                {
+                    "summary": "Password hashing needs work.",
+                    "verdict": "REVISE" if self.issues else "APPROVE",
+                    "confidence": 0.9,
+                    "issues": self.issues,
+                }
+            ),
+            usage_metadata={"input_tokens": 100, "output_tokens": 50, "total_tokens": 150},
+        )
+
+
+class TestCouncilReviewerNodeIncremental:
+    """Tests for incremental review in the council node."""
+
+    @pytest.fixture
+    def model(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[_RecordingJudgeModel]:
+        """Judge model stub reporting one finding, with incremental review on."""
+        monkeypatch.setattr(incremental_module.settings, "council_incremental_review", True)
+        model = _RecordingJudgeModel([_issue("MD5 is a weak hash", 17)])
+        pool = MagicMock()
+        pool.get_model.return_value = model
+        with patch("src.agents.council.orchestrator.get_model_pool", return_value=pool):
+            yield model
+
+    async def test_second_round_reviews_only_the_change(self, model: _RecordingJudgeModel) -> None:
+        """The re-review context is smaller and open findings carry forward."""
+        state: dict[str, Any] = {
+            "task_id": 1,
+            "code": LARGE_CODE_V1,
+            "code_files": {"primary_filepath": "users.py"},
+            "test_results": TESTS,
+            "plan": PLAN,
+            "metadata": {},
+        }
+        first = await council_reviewer_node(state)  # type: ignore[arg-type]
+        first_context = model.contexts[-1]
+        state.update(first, code=LARGE_CODE_V1.replace("hashlib.md5(", "hashlib.sha256("))
+        model.issues = []
+
+        second = await council_reviewer_node(state)  # type: ignore[arg-type]
+
+        review = second["metadata"]["council_review"]
+        assert first["metadata"]["council_review"]["review_mode"] == "full"
+        assert review["review_mode"] == "incremental"
+        assert review["changed_units"] == ["users.py::UserStore.hash_password"]
+        assert len(model.contexts[-1]) < len(first_context) / 2
+        assert LARGE_CODE_V1 in first_context
+        assert "def report(store)" not in model.contexts[-1]
+        assert review["resolved_issue_ids"] == [
+            issue["issue_id"] for issue in first["review_memory"]["issues"]
+        ]
+        assert second["review_memory"]["issues"] == []
@@ -0,0 +1,80 @@
+"""Unit tests for linear JSON object extraction."""
+
+import json
+
+from src.agents.processing.json_extract import JsonObjectScanner, iter_json_objects
+
+VERDICT = {"summary": "Looks good {overall}", "verdict": "APPROVE", "confidence": 0.9}
+
+
+class TestJsonObjectScanner:
+    """Tests for locating objects in model output."""
+
+    def test_objects_in_prose_and_fences(self) -> None:
+        """Objects are found around prose and inside code fences, in order."""
+        text = (
+            'Here is an example: {"verdict": "REVISE"} and the answer:\n'
+            f"```json\n{json.dumps(VERDICT, indent=2)}\n```\nThanks!"
+        )
+
+        assert list(iter_json_objects(text)) == [{"verdict": "REVISE"}, VERDICT]
+
+    def test_braces_and_quotes_inside_strings(self) -> None:
+        """Braces, escaped quotes and backslashes in strings do not end an object."""
+        data = {"description": 'Use "{" and "}" \\ carefully', "nested": {"a": [1, {"b": 2}]}}
+
+        assert list(iter_json_objects(f"It's done: {json.dumps(data)}")) == [data]
+
+    def test_stray_braces_do_not_hide_objects(self) -> None:
+        """An unmatched or non-JSON brace group in prose is skipped."""
+        text = 'Use a dict {key: value}. Unclosed { here. {"verdict": "APPROVE"}'
+
+        assert list(iter_json_objects(text)) == [{"verdict": "APPROVE"}]
+
+    def test_brace_in_quoted_prose_does_not_hide_fenced_verdict(self) -> None:
+        """A quoted brace in prose starts no string that swallows the answer."""
+        fence = f"```json\n{json.dumps(VERDICT, indent=2)}\n```"
+        quoted = f'Escape a literal brace as `"{{"` in templates.\n{fence}'
+        formatted = f'The f-string `f"{{x"` is missing a brace.\n{fence}'
+
+        assert list(iter_json_objects(quoted)) == [VERDICT]
+        assert list(iter_json_objects(formatted)) == [VERDICT]
+
+    def test_brace_at_chunk_end_waits_for_next_chunk(self) -> None:
+        """Whether a trailing brace opens an object is decided by what follows."""
+        for chunks in (["Use {", " x}. ", "{ ", ' "a": 1}'], ["{", "}", ' f"{', 'x"', '{"b": 2}']):
+            scanner = JsonObjectScanner()
+            for chunk in chunks:
+                scanner.feed(chunk)
+            assert list(scanner.objects()) == list(iter_json_objects("".join(chunks)))
+
+        assert list(iter_json_objects('Use { x}. {  "a": 1}')) == [{"a": 1}]
+        assert list(iter_json_objects('{} f"{x"{"b": 2}')) == [{}, {"b": 2}]
+
+    def test_only_outermost_objects_are_reported(self) -> None:
+        """Nested objects are part of their enclosing object."""
+        scanner = JsonObjectScanner()
+        text = '{"a": {"b": {}}} {"c": 1}'
+        scanner.feed(text)
+
+        assert scanner.spans == [(0, 16), (17, 25)]
+        assert list(scanner.objects()) == [{"a": {"b": {}}}, {"c": 1}]
+
+    def test_streamed_chunks_match_whole_text(self) -> None:
+        """Chunk boundaries, including inside escapes, do not change the result."""
+        text = 'Answer: {"summary": "a \\"quoted\\" } brace\\\\", "verdict": "REJECT"} done'
+        expected = list(iter_json_objects(text))
+
+        for size in (1, 2, 3, 7):
+            scanner = JsonObjectScanner()
+            for i in range(0, len(text), size):
+                scanner.feed(text[i : i + size])
+            assert list(scanner.objects()) == expected
+            assert scanner.text == text
+            assert len(scanner) == len(text)
+
+        assert expected == [{"summary": 'a "quoted" } brace\\', "verdict": "REJECT"}]
+
+    def test_incomplete_object_is_not_reported(self) -> None:
+        """A truncated response yields nothing."""
+        assert list(iter_json_objects('{"verdict": "APPROVE", "summary": "cut')) == []
@@ -0,0 +1,94 @@
+"""Unit tests for the shared keyword classifier."""
+
+import re
+
+from src.agents.analyzers.keyword_classifier import KeywordClassifier
+from src.agents.analyzers.plan_validator import (
+    ACTIONABLE_VERBS,
+    COMPONENT_MENTION_PATTERN,
+    FILE_MENTION_PATTERN,
+    PLAN_CLASSIFIER,
+    TECHNICAL_KEYWORDS,
+)
+from src.agents.infrastructure.models import TaskComplexityAnalyzer
+from src.agents.nodes.supervisor import SupervisorConfig
+
+TEXTS = [
+    "",
+    "Create a simple hello world function",
+    "Design a distributed, concurrent WebSocket service with Authentication",
+    "1. Add API gateway in router.py and models.py\n2. Update schema.json; test the Handler",
+    "Refactor the OAuth token refresh; fix bug in SQL query (see db.sql)",
+    "İstanbul: Database Migration with rollback and ENCRYPTION",
+]
+
+
+class TestKeywordClassifier:
+    """Tests for classification semantics."""
+
+    def test_matches_substring_reference(self) -> None:
+        """Each class counts its keywords occurring anywhere in the lowercased text."""
+        for text in TEXTS:
+            features = PLAN_CLASSIFIER.classify(text)
+            lowered = text.lower()
+
+            assert features.count("high") == sum(k in lowered for k in TECHNICAL_KEYWORDS["high"])
+            assert features.count("medium") == sum(
+                k in lowered for k in TECHNICAL_KEYWORDS["medium"]
+            )
+            assert features.has("action") == any(verb in lowered for verb in ACTIONABLE_VERBS)
+            assert features.counter("files") == len(re.findall(FILE_MENTION_PATTERN, lowered))
+            assert features.counter("components") == len(
+                re.findall(COMPONENT_MENTION_PATTERN, lowered)
+            )
+
+    def test_overlapping_keywords_all_match(self) -> None:
+        """Keywords that are prefixes or parts of other keywords are each reported."""
+        classifier = KeywordClassifier(
+            {"a": ["api", "api gateway", "gateway"], "b": ["API", "auth"]}, cache_size=0
+        )
+
+        features = classifier.classify("Behind the API Gateway, authentication")
+
+        assert features.matches("a") == ("api", "api gateway", "gateway")
+        assert features.matches("b") == ("api", "auth")
+        assert features.vector == (3, 2)
+
+    def test_counters_follow_findall(self) -> None:
+        """Counters report non-overlapping regex matches, after class counts in the vector."""
+        classifier = KeywordClassifier({"x": ["py"]}, counters={"files": r"\w+\.py\b"})
+
+        features = classifier.classify("Edit A.py, b.PY and c.pyc")
+
+        assert features.counter("files") == 2
+        assert features.vector == (1, 2)
+
+    def test_results_are_cached_by_text(self) -> None:
+        """The same text is classified once; the cache is bounded."""
+        classifier = KeywordClassifier({"x": ["token"]}, cache_size=2)
+
+        first = classifier.classify("token")
+        assert classifier.classify("token") is first
+
+        classifier.classify("a")
+        classifier.classify("b")
+        assert classifier.classify("token") is not first
+
+        classifier.clear_cache()
+        assert KeywordClassifier({"x": ["token"]}, cache_size=0).classify("token").has("x")
+
+
+class TestClassifierCallSites:
+    """Tests for the analyzers built on the classifier."""
+
+    def test_task_complexity_levels(self) -> None:
+        """Task complexity keeps its keyword thresholds."""
+        assert TaskComplexityAnalyzer.analyze("Create a simple hello world function") == "low"
+        assert TaskComplexityAnalyzer.analyze(TEXTS[2]) == "high"
+        assert TaskComplexityAnalyzer.analyze("Add a settings page") == "medium"
+
+    def test_security_concerns_in_task_or_code(self) -> None:
+        """Security keywords are found in either text, case-insensitively."""
+        assert SupervisorConfig.has_security_concerns("Add login", "check_PASSWORD(user)")
+        assert SupervisorConfig.has_security_concerns("Handle CSRF", "")
+        assert not SupervisorConfig.has_security_concerns("Sort a list", "sorted(items)")
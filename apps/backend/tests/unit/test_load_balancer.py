@@ -0,0 +1,204 @@
+"""Unit tests for load balancing and hedging over local LLM replicas."""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.agents.infrastructure import models as models_module
+from src.agents.infrastructure.load_balancer import LoadBalancingTransport
+from src.agents.infrastructure.models import ModelPool
+
+
+class _Replica:
+    """Stub OpenAI-compatible replica served from a background thread."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.delay = 0.0
+        self.health_status = 200
+        self.paths: list[str] = []
+        replica = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                replica.paths.append(self.path)
+                time.sleep(replica.delay)
+                self._reply(200, {"replica": replica.name, "echo": json.loads(body)})
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._reply(replica.health_status, {})
+
+            def _reply(self, status: int, payload: dict[str, object]) -> None:
+                data = json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except OSError:
+                    pass  # Client cancelled a hedged request
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def replicas() -> Iterator[Callable[[str], _Replica]]:
+    """Factory for stub replicas that are shut down after the test."""
+    started: list[_Replica] = []
+
+    def start(name: str) -> _Replica:
+        replica = _Replica(name)
+        started.append(replica)
+        return replica
+
+    yield start
+    for replica in started:
+        replica.stop()
+
+
+def _closed_port_url() -> str:
+    """URL of a local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/v1"
+
+
+async def _complete(client: httpx.AsyncClient, base_url: str) -> str:
+    response = await client.post(f"{base_url}/chat/completions", json={"prompt": "hi"})
+    response.raise_for_status()
+    return str(response.json()["replica"])
+
+
+class TestLoadBalancingTransport:
+    """Tests for routing, failover, health checks and hedging."""
+
+    async def test_requests_go_to_least_outstanding_replica(
+        self, replicas: Callable[[str], _Replica]
+    ) -> None:
+        """A replica busy with a slow request is skipped; paths are preserved."""
+        a, b = replicas("a"), replicas("b")
+        a.delay = 0.3
+        transport = LoadBalancingTransport([a.url, b.url], health_check_interval=0)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            slow = asyncio.create_task(_complete(client, a.url))
+            await asyncio.sleep(0.05)
+            assert await _complete(client, a.url) == "b"
+            assert await slow == "a"
+
+        assert b.paths == ["/v1/chat/completions"]
+        assert all(e.outstanding == 0 for e in transport.endpoints)
+
+    async def test_unreachable_replica_fails_over(
+        self, replicas: Callable[[str], _Replica]
+    ) -> None:
+        """A refused connection takes the replica out of rotation and retries elsewhere."""
+        b = replicas("b")
+        dead = _closed_port_url()
+        transport = LoadBalancingTransport([dead, b.url], health_check_interval=60)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            assert await _complete(client, dead) == "b"
+            assert await _complete(client, dead) == "b"
+
+        stats = transport.get_stats()["endpoints"]
+        assert stats[dead]["healthy"] is False
+        assert stats[dead]["requests"] == 1
+
+    async def test_health_check_removes_and_restores_replica(
+        self, replicas: Callable[[str], _Replica]
+    ) -> None:
+        """Replicas failing /health get no traffic until they pass again."""
+        a, b = replicas("a"), replicas("b")
+        b.health_status = 503
+        transport = LoadBalancingTransport([a.url, b.url], health_check_interval=60)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await transport.check_health()
+            served = {await _complete(client, a.url) for _ in range(3)}
+            assert served == {"a"}
+
+            b.health_status = 200
+            await transport.check_health()
+            served = {await _complete(client, a.url) for _ in range(3)}
+            assert served == {"a", "b"}
+
+    async def test_slow_request_is_hedged_on_second_replica(
+        self, replicas: Callable[[str], _Replica]
+    ) -> None:
+        """After the hedging delay a duplicate wins and the slow request is cancelled."""
+        a, b = replicas("a"), replicas("b")
+        transport = LoadBalancingTransport(
+            [a.url, b.url],
+            hedge=True,
+            hedge_min_delay=0.05,
+            hedge_min_samples=2,
+            health_check_interval=0,
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            # Too few latencies yet: no hedging
+            assert transport.hedge_delay() is None
+            await _complete(client, a.url)
+            await _complete(client, a.url)
+            assert transport.hedge_delay() == pytest.approx(0.05)
+
+            a.delay = 1.0
+            start = time.monotonic()
+            assert await _complete(client, a.url) == "b"
+            assert time.monotonic() - start < 0.8
+
+        assert transport.hedged_requests == 1
+        assert transport.hedges_won == 1
+        assert all(e.outstanding == 0 for e in transport.endpoints)
+
+    def test_health_url_is_next_to_api_root(self) -> None:
+        """vLLM serves /health at the server root, not under /v1."""
+        transport = LoadBalancingTransport(["http://gpu-1:8001/v1"])
+        assert str(transport.endpoints[0].health_url) == "http://gpu-1:8001/health"
+
+
+class TestModelPoolReplicas:
+    """Tests for wiring the balancer into the shared local client."""
+
+    def test_local_client_balances_over_replicas(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With replicas configured, the local async client uses the balancer."""
+        monkeypatch.setattr(
+            models_module.settings, "local_llm_replica_urls", ["http://gpu-2:8001/v1"]
+        )
+        pool = ModelPool()
+
+        _, async_client = pool.http_clients("local")
+        _, cloud_client = pool.http_clients("cloud")
+
+        transport = async_client._transport
+        assert isinstance(transport, LoadBalancingTransport)
+        assert [str(e.base_url) for e in transport.endpoints] == [
+            models_module.settings.local_llm_base_url,
+            "http://gpu-2:8001/v1",
+        ]
+        assert not isinstance(cloud_client._transport, LoadBalancingTransport)
@@ -0,0 +1,331 @@
+"""Tests for the structured logging pipeline."""
+
+import io
+import json
+import logging
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from threading import Event
+
+import pytest
+import structlog
+
+from src.core import logging as logging_module
+from src.core.config import settings
+from src.core.logging import (
+    LogWriter,
+    WriterHandler,
+    configure_logging,
+    dumps_json,
+    format_timestamp,
+    get_logger,
+    get_logging_stats,
+    lazy,
+    reset_logging,
+    shutdown_logging,
+    snapshot_value,
+)
+
+
+@pytest.fixture
+def configured(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Configure JSON logging at INFO, restoring the defaults afterwards."""
+    monkeypatch.setattr(settings, "log_level", "INFO")
+    monkeypatch.setattr(settings, "log_format", "json")
+    root_level = logging.getLogger().level
+    yield
+    reset_logging()
+    structlog.reset_defaults()
+    logging.getLogger().setLevel(root_level)
+
+
+def _read_events(capsys: pytest.CaptureFixture[str]) -> list[dict]:
+    """Flush the pipeline and parse the lines written to stdout."""
+    shutdown_logging()
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines() if line]
+
+
+class TestLoggingPipeline:
+    """Test events from logger call to rendered line."""
+
+    @pytest.mark.parametrize("log_async", [True, False])
+    def test_renders_json_events(
+        self,
+        configured: None,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        log_async: bool,
+    ) -> None:
+        """Test events are rendered with their level, logger and timestamp."""
+        monkeypatch.setattr(settings, "log_async", log_async)
+        configure_logging()
+
+        get_logger("codegraph.test").info("tool_execution_started", tool_name="search")
+
+        (event,) = _read_events(capsys)
+        assert event["event"] == "tool_execution_started"
+        assert event["tool_name"] == "search"
+        assert event["level"] == "info"
+        assert event["logger"] == "codegraph.test"
+        assert event["timestamp"].endswith("Z")
+
+    def test_lazy_fields_skipped_below_level(
+        self, configured: None, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test lazy fields are computed only for events that are logged."""
+        configure_logging()
+        calls: list[str] = []
+
+        def tool_names() -> list[str]:
+            calls.append("evaluated")
+            return ["search", "read_file"]
+
+        logger = get_logger("codegraph.test")
+        logger.debug("tools_retrieved_for_agent", tool_names=lazy(tool_names))
+        assert calls == []
+
+        logger.info("tools_retrieved_for_agent", tool_names=lazy(tool_names))
+        (event,) = _read_events(capsys)
+        assert event["tool_names"] == ["search", "read_file"]
+        assert calls == ["evaluated"]
+
+    def test_lazy_field_arguments(
+        self, configured: None, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test lazy fields receive their bound arguments."""
+        configure_logging()
+
+        get_logger("codegraph.test").info("result", length=lazy(len, "abcd"))
+
+        (event,) = _read_events(capsys)
+        assert event["length"] == 4
+
+    def test_failing_lazy_field_does_not_raise(
+        self, configured: None, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a lazy field that raises is reported in the event."""
+        configure_logging()
+
+        get_logger("codegraph.test").info("result", value=lazy(lambda: 1 / 0))
+
+        (event,) = _read_events(capsys)
+        assert "ZeroDivisionError" in event["value"]
+
+    def test_lazy_fields_without_configuration(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test lazy fields render through structlog's default pipeline."""
+        structlog.reset_defaults()
+
+        structlog.get_logger("codegraph.test").info("tools", names=lazy(list, "ab"))
+
+        assert "names=['a', 'b']" in capsys.readouterr().out
+
+    def test_mutable_values_snapshotted(
+        self, configured: None, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test queued events show values as they were when logged."""
+        configure_logging()
+        tools = ["search"]
+        state = {"files": tools}
+
+        get_logger("codegraph.test").info("tools_loaded", tools=tools, state=state)
+        tools.append("read_file")
+
+        (event,) = _read_events(capsys)
+        assert event["tools"] == ["search"]
+        assert event["state"] == {"files": ["search"]}
+
+    def test_events_after_shutdown_written_in_caller(
+        self, configured: None, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test events logged after shutdown (e.g. from atexit) are not lost."""
+        configure_logging()
+        shutdown_logging()
+
+        get_logger("codegraph.test").warning("late_event")
+
+        (event,) = _read_events(capsys)
+        assert event["event"] == "late_event"
+        assert get_logging_stats()["async"] is False
+
+    def test_exception_captured_before_queueing(
+        self, configured: None, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test logger.exception renders the traceback on the background thread."""
+        configure_logging()
+
+        try:
+            raise ValueError("tool failed")
+        except ValueError:
+            get_logger("codegraph.test").exception("tool_execution_unexpected_error")
+
+        (event,) = _read_events(capsys)
+        assert event["level"] == "error"
+        assert "ValueError: tool failed" in event["exception"]
+
+    def test_stdlib_records_rendered(
+        self, configured: None, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test records from standard library loggers go through the same pipeline."""
+        configure_logging()
+
+        logging.getLogger("uvicorn.error").warning("Started %s", "server")
+
+        (event,) = _read_events(capsys)
+        assert event["event"] == "Started server"
+        assert event["logger"] == "uvicorn.error"
+        assert event["level"] == "warning"
+
+    def test_reconfiguring_replaces_handler(self, configured: None) -> None:
+        """Test configuring twice leaves a single pipeline handler installed."""
+        configure_logging()
+        configure_logging()
+
+        installed = [
+            handler
+            for handler in logging.getLogger().handlers
+            if isinstance(handler, WriterHandler)
+        ]
+        assert installed == [logging_module._handler]
+        assert get_logging_stats()["async"] is True
+
+
+class TestLogWriter:
+    """Test the writer's background thread and backpressure handling."""
+
+    @pytest.fixture
+    def blocked_writer(self) -> Iterator[LogWriter]:
+        """A started writer whose thread is held inside its first render."""
+        gate = Event()
+
+        def render(item: str) -> str:
+            gate.wait()
+            return item
+
+        writer = LogWriter(render, io.StringIO(), capacity=4, debug_sample_rate=2)
+        writer.start()
+        writer.submit(logging.INFO, "first")
+        while writer.queue.qsize():
+            time.sleep(0.001)
+        yield writer
+        gate.set()
+        writer.close()
+
+    def test_debug_sampled_then_dropped(self, blocked_writer: LogWriter) -> None:
+        """Test debug events are sampled from half capacity and dropped at capacity."""
+        writer = blocked_writer
+
+        for _ in range(2):
+            writer.submit(logging.DEBUG, "debug")
+        assert writer.queue.qsize() == 2
+
+        for _ in range(4):
+            writer.submit(logging.DEBUG, "debug")
+        assert writer.queue.qsize() == 4
+        assert writer.sampled_out == 2
+
+        writer.submit(logging.DEBUG, "debug")
+        assert writer.dropped == 1
+        assert writer.queue.qsize() == 4
+
+    def test_info_and_above_never_dropped(self, blocked_writer: LogWriter) -> None:
+        """Test events at INFO and above are queued beyond capacity."""
+        writer = blocked_writer
+
+        for level in (logging.INFO, logging.WARNING, logging.ERROR) * 2:
+            writer.submit(level, "event")
+
+        assert writer.queue.qsize() == 6
+        assert writer.dropped == 0
+
+    def test_close_writes_queued_events(self) -> None:
+        """Test closing the writer flushes every queued event in order."""
+        stream = io.StringIO()
+        writer = LogWriter(str, stream)
+        writer.start()
+
+        for index in range(100):
+            writer.submit(logging.INFO, index)
+        writer.close()
+
+        assert stream.getvalue().splitlines() == [str(index) for index in range(100)]
+        assert not writer.running
+
+    def test_not_started_writes_in_caller(self) -> None:
+        """Test a writer without a thread renders and writes immediately."""
+        stream = io.StringIO()
+        writer = LogWriter(str.upper, stream)
+
+        writer.submit(logging.DEBUG, "event")
+
+        assert stream.getvalue() == "EVENT\n"
+
+    def test_render_failure_does_not_raise(self) -> None:
+        """Test an event that cannot be rendered is written as a placeholder."""
+        stream = io.StringIO()
+        writer = LogWriter(lambda item: 1 / 0, stream)
+
+        writer.submit(logging.INFO, "event")
+
+        assert "unrenderable log event" in stream.getvalue()
+
+
+class TestSnapshotValue:
+    """Test copying field values before they are queued."""
+
+    def test_containers_copied(self) -> None:
+        """Test nested containers are copied, not shared."""
+        value = {"a": [1, {"b": {2}}], "c": (3, [4])}
+        snapshot = snapshot_value(value)
+
+        value["a"][1]["b"].add(5)  # type: ignore[index, union-attr]
+        value["c"][1].append(6)  # type: ignore[index, union-attr]
+
+        assert snapshot == {"a": [1, {"b": {2}}], "c": (3, [4])}
+
+    def test_immutable_values_kept(self) -> None:
+        """Test immutable values the renderer formats natively are queued as they are."""
+        moment = datetime(2026, 1, 1, tzinfo=UTC)
+        assert snapshot_value(moment) is moment
+
+    def test_objects_rendered_as_repr(self) -> None:
+        """Test other objects are replaced by their repr."""
+
+        class Job:
+            def __repr__(self) -> str:
+                return "<Job 1>"
+
+        assert snapshot_value([Job()]) == ["<Job 1>"]
+
+
+class TestDumpsJson:
+    """Test the JSON serializer used by the renderer."""
+
+    def test_matches_standard_json(self) -> None:
+        """Test output decodes to the same event."""
+        event = {"event": "done", "count": 3, "names": ["a", "b"], "ok": True}
+        assert json.loads(dumps_json(event)) == event
+
+    def test_non_json_values_use_default(self) -> None:
+        """Test values without a JSON type are rendered by the fallback."""
+        rendered = json.loads(dumps_json({"value": object()}, default=lambda _: "object"))
+        assert rendered == {"value": "object"}
+
+    def test_large_integers(self) -> None:
+        """Test integers beyond 64 bits still serialize."""
+        assert json.loads(dumps_json({"value": 2**70})) == {"value": 2**70}
+
+
+class TestFormatTimestamp:
+    """Test event timestamp formatting."""
+
+    @pytest.mark.parametrize("created", [0.0, 1_700_000_000.5, 1_700_000_061.25])
+    def test_matches_datetime_iso(self, created: float) -> None:
+        """Test the cached formatting matches datetime's ISO format."""
+        expected = datetime.fromtimestamp(created, UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        assert format_timestamp(created) == expected
+
+    def test_consecutive_seconds(self) -> None:
+        """Test a new second is formatted, not taken from the cache."""
+        assert format_timestamp(1_700_000_000.0).endswith(":20.000000Z")
+        assert format_timestamp(1_700_000_001.0).endswith(":21.000000Z")
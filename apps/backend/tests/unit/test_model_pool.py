@@ -0,0 +1,73 @@
+"""Unit tests for the shared model pool."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from src.agents.infrastructure import models as models_module
+from src.agents.infrastructure.models import (
+    ModelPool,
+    close_model_pool,
+    get_coder_model_with_tools,
+    get_model_pool,
+    get_planner_model,
+)
+from src.tools import get_registry
+from src.tools.registry import AgentType
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> Iterator[ModelPool]:
+    """Install a fresh global model pool and clean the tool registry afterwards."""
+    instance = ModelPool()
+    monkeypatch.setattr(models_module, "_model_pool", instance)
+    yield instance
+    get_registry().clear()
+
+
+class TestModelPool:
+    """Tests for ModelPool caching."""
+
+    def test_models_are_shared_per_tier(self, pool: ModelPool) -> None:
+        """Repeated lookups return one instance per tier and overrides."""
+        assert pool.get_model("sonnet") is pool.get_model("sonnet")
+        assert pool.get_model("sonnet") is not pool.get_model("haiku")
+        assert pool.get_model("sonnet") is not pool.get_model("sonnet", max_tokens=100)
+        assert get_planner_model() is pool.get_model("sonnet")
+
+    def test_local_models_share_http_pool(self, pool: ModelPool) -> None:
+        """Local models reuse the backend's keep-alive HTTP clients."""
+        sync_client, async_client = pool.http_clients("local")
+
+        model = pool.get_model("opus")
+
+        assert model.http_async_client is async_client  # type: ignore[union-attr]
+        assert model.http_client is sync_client  # type: ignore[union-attr]
+        assert pool.get_model("haiku").http_async_client is async_client  # type: ignore[union-attr]
+
+    def test_tool_bound_models_are_memoised(self, pool: ModelPool) -> None:
+        """Tool binding happens once per agent type, tier and tool-set version."""
+        first = get_coder_model_with_tools()
+
+        assert get_coder_model_with_tools() is first
+        assert pool.get_model_with_tools(AgentType.PLANNER) is not first
+
+    def test_tool_set_change_rebinds(self, pool: ModelPool) -> None:
+        """Re-registering tools invalidates bound runnables."""
+        first = pool.get_model_with_tools(AgentType.REVIEWER)
+        version = get_registry().version
+
+        get_registry().clear()
+        second = pool.get_model_with_tools(AgentType.REVIEWER)
+
+        assert get_registry().version > version
+        assert second is not first
+
+    async def test_close_releases_clients(self, pool: ModelPool) -> None:
+        """Closing the global pool closes its HTTP clients."""
+        _, async_client = pool.http_clients("local")
+
+        await close_model_pool()
+
+        assert async_client.is_closed
+        assert get_model_pool() is not pool
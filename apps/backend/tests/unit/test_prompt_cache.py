@@ -0,0 +1,138 @@
+"""Unit tests for prompt prefix caching."""
+
+from typing import Any
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from src.agents.infrastructure.prompt_cache import (
+    MAX_CACHE_BREAKPOINTS,
+    PromptCachingChatAnthropic,
+    apply_cache_breakpoints,
+    extract_cache_usage,
+)
+
+
+def _breakpoints(payload: dict[str, Any]) -> int:
+    """Count cache_control markers in a payload."""
+    return str(payload).count("cache_control")
+
+
+class TestApplyCacheBreakpoints:
+    """Tests for breakpoint placement."""
+
+    def test_marks_tools_system_and_history(self) -> None:
+        """Tools, system prompt and the last message get one breakpoint each."""
+        payload: dict[str, Any] = {
+            "tools": [{"name": "a"}, {"name": "b"}],
+            "system": "You are a coder.",
+            "messages": [
+                {"role": "user", "content": "Task"},
+                {"role": "assistant", "content": [{"type": "tool_use", "id": "1"}]},
+                {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "1"}]},
+            ],
+        }
+
+        assert apply_cache_breakpoints(payload) == 3
+        assert "cache_control" in payload["tools"][-1]
+        assert "cache_control" not in payload["tools"][0]
+        assert payload["system"] == [
+            {"type": "text", "text": "You are a coder.", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert "cache_control" in payload["messages"][-1]["content"][-1]
+        assert "cache_control" not in str(payload["messages"][0])
+
+    def test_single_turn_without_tools_only_caches_system(self) -> None:
+        """A one-shot prompt does not pay cache writes for its unique message."""
+        payload: dict[str, Any] = {
+            "system": "You are a planner.",
+            "messages": [{"role": "user", "content": "Plan this"}],
+        }
+
+        assert apply_cache_breakpoints(payload) == 1
+        assert payload["messages"][0]["content"] == "Plan this"
+
+    def test_respects_existing_breakpoints(self) -> None:
+        """Caller-provided breakpoints count toward the API limit."""
+        marker = {"type": "ephemeral"}
+        payload: dict[str, Any] = {
+            "tools": [{"name": "a"}],
+            "system": [
+                {"type": "text", "text": "one", "cache_control": marker},
+                {"type": "text", "text": "two", "cache_control": marker},
+                {"type": "text", "text": "three", "cache_control": marker},
+            ],
+            "messages": [
+                {"role": "user", "content": "x"},
+                {"role": "assistant", "content": "y"},
+            ],
+        }
+
+        apply_cache_breakpoints(payload)
+
+        assert _breakpoints(payload) == MAX_CACHE_BREAKPOINTS
+        assert "cache_control" in payload["tools"][0]
+
+    def test_skips_thinking_blocks(self) -> None:
+        """Thinking blocks cannot carry a breakpoint."""
+        payload: dict[str, Any] = {
+            "messages": [
+                {"role": "user", "content": "x"},
+                {"role": "assistant", "content": [{"type": "thinking", "thinking": "..."}]},
+            ],
+        }
+
+        assert apply_cache_breakpoints(payload) == 0
+
+
+class TestPromptCachingChatAnthropic:
+    """Tests for the caching Anthropic model."""
+
+    def test_request_payload_has_breakpoints(self) -> None:
+        """Tool definitions, system prompt and ReAct history are marked."""
+        model = PromptCachingChatAnthropic(model="claude-sonnet-4-5", api_key="test-key")
+        bound = model.bind_tools(
+            [{"name": "read_file", "description": "Read", "input_schema": {"type": "object"}}]
+        )
+
+        payload = model._get_request_payload(
+            [
+                SystemMessage(content="You are a coder."),
+                HumanMessage(content="Task"),
+                AIMessage(
+                    content="",
+                    tool_calls=[{"name": "read_file", "args": {}, "id": "call_1"}],
+                ),
+                ToolMessage(content="file contents", tool_call_id="call_1"),
+            ],
+            **bound.kwargs,  # type: ignore[attr-defined]
+        )
+
+        assert "cache_control" in payload["tools"][-1]
+        assert "cache_control" in payload["system"][-1]
+        assert "cache_control" in payload["messages"][-1]["content"][-1]
+        assert _breakpoints(payload) == 3
+
+
+class TestExtractCacheUsage:
+    """Tests for cache token extraction."""
+
+    def test_reads_input_token_details(self) -> None:
+        """Cache reads and writes come from input_token_details."""
+        usage = {
+            "input_tokens": 1200,
+            "output_tokens": 50,
+            "input_token_details": {"cache_read": 1000, "cache_creation": 150},
+        }
+
+        assert extract_cache_usage(usage) == {
+            "cache_read_tokens": 1000,
+            "cache_creation_tokens": 150,
+        }
+
+    def test_missing_details_are_zero(self) -> None:
+        """Providers without cache reporting yield zeros."""
+        assert extract_cache_usage(None) == {"cache_read_tokens": 0, "cache_creation_tokens": 0}
+        assert extract_cache_usage({"input_token_details": {"cache_read": None}}) == {
+            "cache_read_tokens": 0,
+            "cache_creation_tokens": 0,
+        }
@@ -0,0 +1,180 @@
+"""Unit tests for the model rate limiter admission controller."""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.agents.infrastructure import models as models_module
+from src.agents.infrastructure.models import (
+    ModelFactory,
+    ModelRateLimiter,
+    RateLimitCallbackHandler,
+    RateLimitConfig,
+    SlidingWindowCounter,
+    estimate_message_tokens,
+)
+
+
+@pytest.fixture
+def limiter(monkeypatch: pytest.MonkeyPatch) -> ModelRateLimiter:
+    """Install a fresh global limiter with a fast local sonnet config."""
+    instance = ModelRateLimiter()
+    instance._configs = {
+        **instance._configs,
+        "local": {
+            "sonnet": RateLimitConfig(
+                requests_per_minute=100,
+                tokens_per_minute=1000,
+                min_request_interval_ms=0,
+            ),
+        },
+    }
+    monkeypatch.setattr(models_module, "_rate_limiter", instance)
+    return instance
+
+
+class TestSlidingWindowCounter:
+    """Tests for the bucketed sliding window."""
+
+    def test_totals_expire_with_window(self) -> None:
+        """Amounts leave the total once their bucket falls out of the window."""
+        counter = SlidingWindowCounter(window_seconds=60.0, buckets=60)
+        counter.add(100.0, 5)
+        counter.add(130.0, 3)
+
+        assert counter.total(130.5) == 8
+        assert counter.total(160.5) == 3
+        assert counter.total(1000.0) == 0
+
+    def test_time_until_freed(self) -> None:
+        """Wait time is until enough of the oldest amounts expire."""
+        counter = SlidingWindowCounter(window_seconds=60.0, buckets=60)
+        counter.add(100.0, 5)
+        counter.add(130.0, 3)
+
+        assert counter.time_until_freed(140.0, 4) == pytest.approx(20.0)
+        assert counter.time_until_freed(140.0, 7) == pytest.approx(50.0)
+        assert counter.time_until_freed(140.0, 0) == 0.0
+
+
+class TestModelRateLimiter:
+    """Tests for admission, fairness and adaptation."""
+
+    async def test_admits_immediately_under_limit(self, limiter: ModelRateLimiter) -> None:
+        """Requests within limits do not wait."""
+        waited = await limiter.acquire("sonnet", "local", tokens=100)
+
+        status = limiter.get_status("sonnet", "local")
+        assert waited == 0.0
+        assert status["current_rpm"] == 1
+        assert status["current_tpm"] == 100
+
+    async def test_waiters_are_admitted_in_fifo_order(self, limiter: ModelRateLimiter) -> None:
+        """Queued requests are admitted in arrival order and report wait time."""
+        limiter.record_rate_limited("sonnet", "local", retry_after=0.05)
+        order: list[int] = []
+
+        async def request(index: int) -> None:
+            await limiter.acquire("sonnet", "local")
+            order.append(index)
+
+        await asyncio.gather(*(request(i) for i in range(5)))
+
+        status = limiter.get_status("sonnet", "local")
+        assert order == [0, 1, 2, 3, 4]
+        assert status["queued_requests"] == 5
+        assert status["queue_depth"] == 0
+        assert status["max_queue_wait_ms"] >= 40
+
+    async def test_token_budget_blocks_until_window_frees(self, limiter: ModelRateLimiter) -> None:
+        """A request exceeding the TPM budget queues behind the window."""
+        await limiter.acquire("sonnet", "local", tokens=900)
+
+        task = asyncio.create_task(limiter.acquire("sonnet", "local", tokens=200))
+        await asyncio.sleep(0.05)
+
+        assert not task.done()
+        assert limiter.get_status("sonnet", "local")["queue_depth"] == 1
+
+        # Actual usage was lower than estimated: the reconcile frees the budget
+        limiter.record_response("sonnet", "local", estimated_tokens=900, actual_tokens=300)
+        await asyncio.wait_for(task, timeout=1.0)
+        assert limiter.get_status("sonnet", "local")["current_tpm"] == 500
+
+    async def test_cancelled_waiter_leaves_queue(self, limiter: ModelRateLimiter) -> None:
+        """Cancelling a queued acquire removes it without blocking others."""
+        limiter.record_rate_limited("sonnet", "local", retry_after=0.05)
+        first = asyncio.create_task(limiter.acquire("sonnet", "local"))
+        second = asyncio.create_task(limiter.acquire("sonnet", "local"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.wait_for(second, timeout=1.0)
+
+        assert first.cancelled()
+        assert limiter.get_status("sonnet", "local")["queue_depth"] == 0
+
+    async def test_rate_limited_response_backs_off_and_recovers(
+        self, limiter: ModelRateLimiter
+    ) -> None:
+        """429s block for retry-after and halve limits; successes recover them."""
+        limiter.record_rate_limited("sonnet", "local", retry_after=0.1)
+        assert limiter.get_status("sonnet", "local")["effective_rpm"] == 50
+
+        start = time.monotonic()
+        await limiter.acquire("sonnet", "local")
+        assert time.monotonic() - start >= 0.09
+
+        limiter.record_response("sonnet", "local")
+        assert limiter.get_status("sonnet", "local")["effective_rpm"] == 51
+
+    def test_headers_lower_limits(self, limiter: ModelRateLimiter) -> None:
+        """Rate limit headers cap the effective limits."""
+        limiter.record_response(
+            "sonnet",
+            "local",
+            headers={
+                "anthropic-ratelimit-requests-limit": "20",
+                "x-ratelimit-limit-tokens": "500",
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "1m30s",
+            },
+        )
+
+        status = limiter.get_status("sonnet", "local")
+        state = limiter._get_state("sonnet", "local")
+        assert status["effective_rpm"] == 20
+        assert status["effective_tpm"] == 500
+        assert state.blocked_until - time.monotonic() == pytest.approx(90, abs=1)
+
+
+class TestRateLimitCallbackHandler:
+    """Tests for wiring the limiter into models."""
+
+    def test_estimate_message_tokens(self) -> None:
+        """Estimates scale with content and include bound tools."""
+        messages = [HumanMessage(content="x" * 400)]
+        base = estimate_message_tokens(messages)
+        assert base == 104
+        assert estimate_message_tokens(messages, tools=[{"name": "t" * 40}]) > base
+
+    async def test_model_calls_go_through_limiter(self, limiter: ModelRateLimiter) -> None:
+        """Every invocation is admitted and reconciled by the limiter."""
+        model = GenericFakeChatModel(
+            messages=iter([AIMessage(content="ok"), AIMessage(content="again")]),
+            callbacks=[RateLimitCallbackHandler("sonnet", "local")],
+        )
+
+        await model.ainvoke([HumanMessage(content="hello")])
+        async for _ in model.astream([HumanMessage(content="hello")]):
+            pass
+
+        assert limiter.get_status("sonnet", "local")["admitted_requests"] == 2
+
+    def test_factory_attaches_handler(self) -> None:
+        """Models from ModelFactory carry the rate limit callback."""
+        model = ModelFactory.create("haiku")
+        assert any(isinstance(cb, RateLimitCallbackHandler) for cb in model.callbacks or [])
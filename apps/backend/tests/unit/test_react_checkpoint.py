@@ -0,0 +1,172 @@
+"""Unit tests for resuming ReAct loops from checkpoints on retry."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig
+
+from src.agents.infrastructure.react_checkpoint import (
+    ReactCheckpointStore,
+    get_checkpoint_store,
+    react_checkpoint_scope,
+)
+from src.agents.nodes.react_executor import execute_react_loop
+from src.agents.resilience import create_resilient_node, reset_workflow_error_handler
+from src.agents.state import WorkflowState
+from src.tools import get_registry, register_all_tools
+from src.tools.registry import AgentType
+
+
+class TestReactCheckpointStore:
+    """Tests for checkpoint keys and scoping."""
+
+    def test_key_is_stable_across_attempts(self) -> None:
+        """The same loop gets the same key on every attempt."""
+        store = ReactCheckpointStore()
+        messages = [HumanMessage(content="task")]
+
+        store.begin_attempt()
+        first = store.next_key("coder", messages)
+        store.begin_attempt()
+        second = store.next_key("coder", messages)
+
+        assert first == second
+
+    def test_identical_loops_get_distinct_keys(self) -> None:
+        """Repeated identical loops in one attempt are told apart by position."""
+        store = ReactCheckpointStore()
+        messages = [HumanMessage(content="task")]
+
+        store.begin_attempt()
+        keys = {store.next_key("coder", messages), store.next_key("coder", messages)}
+
+        assert len(keys) == 2
+
+    def test_key_depends_on_agent_and_messages(self) -> None:
+        """Different agents or prompts never share a checkpoint."""
+        store = ReactCheckpointStore()
+        task = [HumanMessage(content="task")]
+
+        keys = {
+            store.next_key("coder", task),
+            store.next_key("tester", task),
+            store.next_key("coder", [HumanMessage(content="other")]),
+        }
+
+        assert len(keys) == 3
+
+    def test_scope_is_restored(self) -> None:
+        """No store is active outside react_checkpoint_scope."""
+        assert get_checkpoint_store() is None
+        with react_checkpoint_scope() as store:
+            assert get_checkpoint_store() is store
+        assert get_checkpoint_store() is None
+
+
+class _FlakyModel:
+    """Model stub that replays scripted responses and fails once on a given call."""
+
+    def __init__(self, responses: list[AIMessage], fail_on_call: int) -> None:
+        self.responses = iter(responses)
+        self.fail_on_call = fail_on_call
+        self.requests: list[list[BaseMessage]] = []
+
+    async def ainvoke(self, messages: list[BaseMessage], config: Any = None) -> AIMessage:
+        self.requests.append(list(messages))
+        if len(self.requests) == self.fail_on_call:
+            raise TimeoutError("Request timeout")
+        return next(self.responses)
+
+
+class TestResilientReactResume:
+    """Tests for ReAct loops resumed by create_resilient_node."""
+
+    @pytest.fixture
+    def workspace(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+        """Workspace with a file, registered tools and no retry delay."""
+
+        async def no_sleep(_: float) -> None:
+            return None
+
+        monkeypatch.setattr("src.agents.resilience.asyncio.sleep", no_sleep)
+        (tmp_path / "a.py").write_text("print('a')\n")
+        register_all_tools()
+        reset_workflow_error_handler()
+        yield tmp_path
+        reset_workflow_error_handler()
+        get_registry().clear()
+
+    async def test_retry_resumes_after_completed_iteration(self, workspace: Path) -> None:
+        """A timeout on the second LLM turn does not repeat the first turn or its tools."""
+        model = _FlakyModel(
+            [
+                AIMessage(
+                    content="",
+                    tool_calls=[{"name": "read_file", "args": {"path": "a.py"}, "id": "c1"}],
+                ),
+                AIMessage(content="done"),
+            ],
+            fail_on_call=2,
+        )
+
+        async def node(state: WorkflowState, config: RunnableConfig) -> dict[str, Any]:
+            messages, tool_calls, usage = await execute_react_loop(
+                model=model,
+                messages=[HumanMessage(content="task")],
+                state=state,
+                agent_type=AgentType.CODER,
+            )
+            return {"messages": messages, "tool_calls": tool_calls, "usage": usage}
+
+        resilient = create_resilient_node(node, "coder")
+        result = await resilient({"task_id": 1, "workspace_path": str(workspace)})  # type: ignore[typeddict-item]
+
+        # Calls: turn 1, failing turn 2, retried turn 2 (not turn 1 again)
+        assert len(model.requests) == 3
+        assert len(model.requests[2]) == 3
+        assert len(result["tool_calls"]) == 1
+        assert result["messages"][-1].content == "done"
+        assert result["usage"]["iterations"] == 2
+        assert result["metadata"]["recovered_from_error"] is True
+
+    async def test_completed_loop_is_not_rerun(self, workspace: Path) -> None:
+        """A failure after the loop finished reuses its result on retry."""
+        model = _FlakyModel([AIMessage(content="done")], fail_on_call=0)
+        attempts = 0
+
+        async def node(state: WorkflowState, config: RunnableConfig) -> dict[str, Any]:
+            nonlocal attempts
+            attempts += 1
+            messages, _, _ = await execute_react_loop(
+                model=model,
+                messages=[HumanMessage(content="task")],
+                state=state,
+                agent_type=AgentType.CODER,
+            )
+            if attempts == 1:
+                raise TimeoutError("Request timeout while saving")
+            return {"messages": messages}
+
+        resilient = create_resilient_node(node, "coder")
+        result = await resilient({"task_id": 1, "workspace_path": str(workspace)})  # type: ignore[typeddict-item]
+
+        assert attempts == 2
+        assert len(model.requests) == 1
+        assert result["messages"][-1].content == "done"
+
+    async def test_no_checkpoints_outside_resilient_node(self, workspace: Path) -> None:
+        """Plain calls to the loop start from scratch every time."""
+        model = _FlakyModel([AIMessage(content="one"), AIMessage(content="two")], fail_on_call=0)
+
+        for _ in range(2):
+            await execute_react_loop(
+                model=model,
+                messages=[HumanMessage(content="task")],
+                state={"task_id": 1, "workspace_path": str(workspace)},
+                agent_type=AgentType.CODER,
+            )
+
+        assert len(model.requests) == 2
@@ -0,0 +1,189 @@
+"""Unit tests for the LLM response cache."""
+
+from pathlib import Path
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.agents.infrastructure.response_cache import (
+    RESPONSE_CACHE_PREFIX,
+    DirectoryResponseStore,
+    LLMResponseCache,
+    LRUResponseStore,
+    RedisResponseStore,
+    extract_response_cache_usage,
+)
+
+MESSAGES = [("system", "You refine plans."), ("human", "Refine this plan")]
+
+
+class _CountingChatModel(BaseChatModel):
+    """Chat model answering with a numbered reply and token usage."""
+
+    temperature: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "counting"
+
+    def _generate(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        message = AIMessage(
+            content=f"reply {self.calls}",
+            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class _FakeRedis:
+    """Minimal async Redis stand-in recording TTLs."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.data[key] = value.encode()
+        if ex is not None:
+            self.ttls[key] = ex
+
+
+class _BrokenStore:
+    """Store whose backend is down."""
+
+    async def get(self, key: str) -> str | None:
+        raise ConnectionError("redis unavailable")
+
+    async def set(self, key: str, value: str) -> None:
+        raise ConnectionError("redis unavailable")
+
+
+class TestCacheKey:
+    """Tests for content addressing."""
+
+    def test_identical_requests_share_key(self) -> None:
+        """Key depends on content, not on the model instance."""
+        cache = LLMResponseCache(enabled=True)
+
+        assert cache.key_for(_CountingChatModel(), MESSAGES) == cache.key_for(
+            _CountingChatModel(), list(MESSAGES)
+        )
+
+    def test_messages_and_tools_change_key(self) -> None:
+        """Different prompts or bound tool schemas never share a response."""
+        cache = LLMResponseCache(enabled=True)
+        model = _CountingChatModel()
+        tool = {"type": "function", "function": {"name": "read_file", "parameters": {}}}
+
+        keys = {
+            cache.key_for(model, MESSAGES),
+            cache.key_for(model, [("human", "Other plan")]),
+            cache.key_for(model.bind(tools=[tool]), MESSAGES),
+        }
+
+        assert len(keys) == 3
+
+    def test_nonzero_temperature_bypasses_cache(self) -> None:
+        """Sampled responses are only cached when explicitly allowed."""
+        cache = LLMResponseCache(enabled=True)
+        model = _CountingChatModel(temperature=0.7)
+
+        assert cache.key_for(model, MESSAGES) is None
+        assert cache.key_for(model, MESSAGES, allow_nondeterministic=True) is not None
+        assert cache.get_stats()["bypassed"] == 1
+
+    def test_disabled_cache_has_no_keys(self) -> None:
+        """With caching off every call goes to the model."""
+        assert LLMResponseCache(enabled=False).key_for(_CountingChatModel(), MESSAGES) is None
+
+
+class TestLLMResponseCache:
+    """Tests for serving responses from the cache tiers."""
+
+    async def test_repeated_call_is_served_from_cache(self) -> None:
+        """The second identical call costs no LLM call and no tokens."""
+        cache = LLMResponseCache(enabled=True)
+        model = _CountingChatModel()
+
+        first = await cache.ainvoke(model, MESSAGES)
+        second = await cache.ainvoke(model, MESSAGES)
+
+        assert model.calls == 1
+        assert second.content == first.content == "reply 1"
+        assert extract_response_cache_usage(first) == {
+            "response_cache_hits": 0,
+            "response_cache_misses": 1,
+        }
+        assert extract_response_cache_usage(second) == {
+            "response_cache_hits": 1,
+            "response_cache_misses": 0,
+        }
+        assert second.usage_metadata["total_tokens"] == 0  # type: ignore[attr-defined]
+        assert cache.get_stats()["hit_rate"] == 0.5
+
+    async def test_bypassed_call_has_no_cache_usage(self) -> None:
+        """Calls that skip the cache report neither hits nor misses."""
+        cache = LLMResponseCache(enabled=True)
+        response = await cache.ainvoke(_CountingChatModel(temperature=1.0), MESSAGES)
+
+        assert extract_response_cache_usage(response) == {
+            "response_cache_hits": 0,
+            "response_cache_misses": 0,
+        }
+
+    async def test_lru_evicts_least_recently_used(self) -> None:
+        """The store keeps only its most recently used entries."""
+        store = LRUResponseStore(max_entries=2)
+        await store.set("a", "1")
+        await store.set("b", "2")
+        await store.get("a")
+        await store.set("c", "3")
+
+        assert await store.get("b") is None
+        assert await store.get("a") == "1"
+        assert len(store) == 2
+
+    async def test_slower_tier_hit_backfills_faster_tier(self, tmp_path: Path) -> None:
+        """Recorded responses replay in a new process and warm the LRU."""
+        model = _CountingChatModel()
+        recorder = LLMResponseCache([DirectoryResponseStore(tmp_path)], enabled=True)
+        await recorder.ainvoke(model, MESSAGES)
+
+        lru = LRUResponseStore()
+        replay = LLMResponseCache([lru, DirectoryResponseStore(tmp_path)], enabled=True)
+        response = await replay.ainvoke(model, MESSAGES)
+
+        assert model.calls == 1
+        assert response.content == "reply 1"
+        assert len(lru) == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    async def test_redis_tier_uses_prefix_and_ttl(self) -> None:
+        """Responses shared through Redis expire after the configured TTL."""
+        redis = _FakeRedis()
+        cache = LLMResponseCache([RedisResponseStore(redis, ttl=60)], enabled=True)  # type: ignore[arg-type]
+
+        await cache.ainvoke(_CountingChatModel(), MESSAGES)
+        second = await cache.ainvoke(_CountingChatModel(), MESSAGES)
+
+        [key] = redis.data
+        assert key.startswith(RESPONSE_CACHE_PREFIX)
+        assert redis.ttls[key] == 60
+        assert second.content == "reply 1"
+
+    async def test_store_errors_fall_back_to_model(self) -> None:
+        """An unavailable tier only costs the cache benefit."""
+        cache = LLMResponseCache([_BrokenStore()], enabled=True)
+        model = _CountingChatModel()
+
+        await cache.ainvoke(model, MESSAGES)
+        response = await cache.ainvoke(model, MESSAGES)
+
+        assert model.calls == 2
+        assert response.content == "reply 2"
@@ -4,12 +4,27 @@ Tests the reviewer node's ability to assess code quality, extract verdicts,
 and the conditional routing that enables the review loop.
 """
 
+import json
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, patch
 
 import pytest
-
-from src.agents.nodes.reviewer import ReviewVerdict, extract_verdict_from_text, reviewer_node
+from langchain_anthropic import ChatAnthropic
+from langchain_openai import ChatOpenAI
+
+from src.agents.nodes.reviewer import (
+    VERDICT_OUTPUT_NAME,
+    ReviewVerdict,
+    bind_verdict_output,
+    extract_verdict_from_text,
+    get_verdict_parse_stats,
+    parse_structured_verdict,
+    parse_verdict,
+    reset_verdict_parse_stats,
+    reviewer_node,
+)
 from src.agents.state import WorkflowState
+from src.core.config import settings
 from src.core.logging import get_logger
 from tests.ai.utils import WorkflowStateBuilder
 
@@ -251,10 +266,89 @@ class TestReviewerNode:
             assert "review_completed_at" in result["metadata"]
             assert result["metadata"]["reviewer_model"] == "sonnet"
             assert "verdict" in result["metadata"]
+            assert result["metadata"]["verdict_source"] == "fallback"
 
             logger.info("Reviewer metadata test passed")
 
 
+VERDICT_JSON = json.dumps(
+    {
+        "summary": "Clean code with thorough tests.",
+        "verdict": "APPROVE",
+        "confidence": 0.9,
+        "issues": [{"severity": "minor", "category": "style", "description": "Use {} literal"}],
+    }
+)
+
+
+class TestVerdictParsing:
+    """Tests for structured verdict parsing and its fallback metric."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_stats(self) -> Iterator[None]:
+        reset_verdict_parse_stats()
+        yield
+        reset_verdict_parse_stats()
+
+    def test_sources(self) -> None:
+        """Whole, embedded and missing JSON verdicts are told apart."""
+        embedded = f"Reviewed {{3}} files.\n```json\n{VERDICT_JSON}\n```\nVerdict: APPROVE"
+
+        assert parse_verdict(VERDICT_JSON)[1] == "json"
+        assert parse_verdict(VERDICT_JSON, structured_output=True)[1] == "structured"
+        verdict, source = parse_verdict(embedded)
+        assert source == "extracted"
+        assert verdict.issues[0].description == "Use {} literal"
+        verdict, source = parse_verdict("Needs work. REVISE. Confidence: 40%")
+        assert source == "fallback"
+        assert (verdict.verdict, verdict.confidence) == ("REVISE", 0.4)
+
+    def test_skips_objects_that_are_not_verdicts(self) -> None:
+        """Example or invalid objects before the verdict are ignored."""
+        text = f'Format: {{"verdict": "APPROVE"}} and {{"a": 1}}. Answer: {VERDICT_JSON}'
+
+        verdict = parse_structured_verdict(text)
+
+        assert verdict is not None
+        assert verdict.summary == "Clean code with thorough tests."
+        assert parse_structured_verdict('{"verdict": "MAYBE", "summary": "x"}') is None
+
+    def test_quoted_braces_in_prose_keep_fenced_verdict(self) -> None:
+        """Braces quoted in the review text do not hide the fenced verdict."""
+        for prose in ('Write `"{"` for a literal brace.', 'The f-string `f"{x"` is broken.'):
+            verdict = parse_structured_verdict(f"{prose}\n```json\n{VERDICT_JSON}\n```")
+
+            assert verdict is not None
+            assert verdict.verdict == "APPROVE"
+
+    def test_fallback_rate_is_tracked(self) -> None:
+        """Every parsed verdict is counted by source."""
+        parse_verdict(VERDICT_JSON)
+        parse_verdict(VERDICT_JSON)
+        parse_verdict(VERDICT_JSON, structured_output=True)
+        parse_verdict("APPROVE - ready to ship")
+
+        stats = get_verdict_parse_stats().get_stats()
+
+        assert (stats["json"], stats["structured"], stats["fallback"]) == (2, 1, 1)
+        assert stats["total"] == 4
+        assert stats["fallback_rate"] == 0.25
+
+    def test_native_output_binding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Claude gets a forced tool call, vLLM a JSON schema, others nothing."""
+        claude = ChatAnthropic(model_name="claude-sonnet-4-5", api_key="test")  # type: ignore[call-arg]
+        local = ChatOpenAI(model="local", api_key="test", base_url="http://localhost:8001/v1")  # type: ignore[arg-type]
+        other = object()
+
+        assert bind_verdict_output(claude).kwargs["tool_choice"]["name"] == VERDICT_OUTPUT_NAME
+        response_format = bind_verdict_output(local).kwargs["response_format"]
+        assert response_format["json_schema"]["name"] == VERDICT_OUTPUT_NAME
+        assert bind_verdict_output(other) is other
+
+        monkeypatch.setattr(settings, "structured_verdict_output", False)
+        assert bind_verdict_output(claude) is claude
+
+
 class TestReviewLoop:
     """Test the review loop conditional routing."""
 
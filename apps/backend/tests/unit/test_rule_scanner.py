@@ -0,0 +1,138 @@
+"""Unit tests for the multi-pattern rule scanner."""
+
+import re
+
+from src.agents.analyzers.code_quality import (
+    DEFAULT_RULE_SCANNER,
+    CodeQualityAnalyzer,
+    IssueCategory,
+    IssueSeverity,
+)
+from src.agents.analyzers.rule_scanner import RuleScanner, ScanRule, literal_prefix
+
+SOURCE = """import os, pickle
+data = pickle.loads(blob); eval(data)
+PASSWORD = "hunter2"
+exec
+(code)
+for i in range(len(items)):
+    result.append(items[i])
+total += a + b
+"""
+
+
+def _naive_scan(scanner: RuleScanner, source: str) -> list[tuple[int, str]]:
+    """Reference implementation: every pattern over every line."""
+    return sorted(
+        (number, rule.rule_id)
+        for rule in scanner.rules
+        for number, line in enumerate(source.splitlines(), 1)
+        if re.search(rule.pattern, line, rule.flags)
+    )
+
+
+def _scan(scanner: RuleScanner, source: str) -> list[tuple[int, str]]:
+    return [(m.line_number, m.rule.rule_id) for m in scanner.scan(source)]
+
+
+class TestRuleScanner:
+    """Tests for matching semantics."""
+
+    def test_matches_per_line_reference(self) -> None:
+        """Results equal a per-pattern, per-line search, in line order."""
+        matches = _scan(DEFAULT_RULE_SCANNER, SOURCE)
+
+        assert sorted(matches) == _naive_scan(DEFAULT_RULE_SCANNER, SOURCE)
+        assert matches == sorted(matches, key=lambda m: m[0])
+
+    def test_reports_every_rule_on_a_line(self) -> None:
+        """Several rules matching one line are all reported."""
+        matches = _scan(DEFAULT_RULE_SCANNER, SOURCE)
+
+        assert (2, "pickle-load") in matches
+        assert (2, "eval-call") in matches
+
+    def test_matches_do_not_span_lines(self) -> None:
+        """A pattern that would only match across a newline is not reported."""
+        matches = _scan(DEFAULT_RULE_SCANNER, SOURCE)
+
+        assert not [m for m in matches if m[1] == "exec-call"]
+
+    def test_flags_are_scoped_per_rule(self) -> None:
+        """Case-insensitivity and line anchors apply only to the rule that sets them."""
+        scanner = RuleScanner(
+            [
+                ScanRule("upper", r"TODO", "todo"),
+                ScanRule("any-case", r"fixme", "fixme", ignore_case=True),
+                ScanRule("trailing", r"pass$", "pass at end of line"),
+            ]
+        )
+
+        matches = _scan(scanner, "x = 1  # todo FIXME\npass\npass  # no\n")
+
+        assert matches == [(1, "any-case"), (2, "trailing")]
+
+    def test_non_ascii_source_falls_back_to_regex(self) -> None:
+        """Case-insensitive rules still match when lowercasing would shift offsets."""
+        source = "name = 'İstanbul'\nresult = EVAL(x)\n"
+
+        assert _scan(DEFAULT_RULE_SCANNER, source) == [(2, "eval-call")]
+
+    def test_empty_rules_and_source(self) -> None:
+        """Nothing to scan yields nothing."""
+        assert RuleScanner([]).scan(SOURCE) == []
+        assert DEFAULT_RULE_SCANNER.scan("") == []
+
+    def test_extend_adds_user_rules(self) -> None:
+        """Extending keeps the built-in rules and appends new ones."""
+        scanner = DEFAULT_RULE_SCANNER.extend([ScanRule("print", r"\bprint\(", "Use logging")])
+
+        assert len(scanner.rules) == len(DEFAULT_RULE_SCANNER.rules) + 1
+        assert _scan(scanner, "print(eval(x))") == [(1, "eval-call"), (1, "print")]
+
+
+class TestLiteralPrefix:
+    """Tests for prefilter extraction."""
+
+    def test_plain_and_escaped_characters(self) -> None:
+        """Escaped punctuation is literal; classes end the prefix."""
+        assert literal_prefix(r"os\.system\s*\(") == "os.system"
+        assert literal_prefix(r"\beval\s*\(") == "eval"
+        assert literal_prefix(r"\.append\([^)]+\)\s*$") == ".append("
+
+    def test_optional_characters_are_excluded(self) -> None:
+        """A quantified character is not required."""
+        assert literal_prefix(r"pickle\.loads?\s*\(") == "pickle.load"
+        assert literal_prefix(r"ab{2}") == "a"
+
+    def test_no_prefix_for_alternation_or_classes(self) -> None:
+        """Patterns whose start is not plain text get no prefilter."""
+        assert literal_prefix(r"foo|bar") == ""
+        assert literal_prefix(r"[a-z]+x") == ""
+        assert literal_prefix(r"(?i)secret") == ""
+
+
+class TestCodeQualityAnalyzerRules:
+    """Tests for user-defined rules in the quality analyzer."""
+
+    def test_extra_rules_are_reported(self) -> None:
+        """Custom rules produce issues with their category and severity."""
+        analyzer = CodeQualityAnalyzer(
+            extra_rules=[
+                ScanRule(
+                    "requests-no-timeout",
+                    r"requests\.get\([^)]*\)$",
+                    "HTTP call without timeout",
+                    IssueSeverity.MEDIUM,
+                    IssueCategory.CORRECTNESS,
+                )
+            ]
+        )
+
+        result = analyzer.analyze("import requests\n\nrequests.get(url)\n")
+
+        [issue] = [i for i in result.issues if i.message == "HTTP call without timeout"]
+        assert issue.category == IssueCategory.CORRECTNESS
+        assert issue.severity == IssueSeverity.MEDIUM
+        assert issue.line_number == 3
+        assert CodeQualityAnalyzer().rule_scanner is DEFAULT_RULE_SCANNER
@@ -0,0 +1,81 @@
+"""Unit tests for streaming workflow execution."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from src.agents import graph as graph_module
+from src.agents.execution import stream_workflow
+from src.agents.resilience import get_error_handler
+
+
+class _EventGraph:
+    """Graph stub whose event stream records the run's error handler."""
+
+    def __init__(self, events: int = 3, delay: float = 0.0) -> None:
+        self.events = events
+        self.delay = delay
+        self.handlers: list[Any] = []
+        self.closed = asyncio.Event()
+
+    async def astream_events(self, state: Any, config: Any, version: str) -> AsyncIterator[Any]:
+        try:
+            for index in range(self.events):
+                await asyncio.sleep(self.delay)
+                self.handlers.append(get_error_handler())
+                yield {"event": "on_chain_stream", "index": index}
+        finally:
+            self.closed.set()
+
+
+@pytest.fixture
+def install_graph(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Make stream_workflow run the given graph stub."""
+
+    def install(graph: _EventGraph) -> None:
+        monkeypatch.setattr(graph_module, "get_compiled_graph", lambda: graph)
+
+    return install
+
+
+class TestStreamWorkflow:
+    """Tests for stream_workflow's error scope and timeout handling."""
+
+    async def test_error_scope_not_visible_between_events(self, install_graph: Any) -> None:
+        """The graph has one error handler for the run; the consumer sees none."""
+        graph = _EventGraph()
+        install_graph(graph)
+        seen: list[Any] = []
+
+        async for _ in stream_workflow("Build auth", task_id=1):
+            seen.append(get_error_handler())
+
+        assert len(graph.handlers) == 3
+        assert graph.handlers[0] is not None
+        assert all(handler is graph.handlers[0] for handler in graph.handlers)
+        assert seen == [None, None, None]
+
+    async def test_close_from_another_task_stops_the_graph(self, install_graph: Any) -> None:
+        """Closing the stream early, from any context, stops the run."""
+        graph = _EventGraph(events=100, delay=0.01)
+        install_graph(graph)
+        stream = stream_workflow("Build auth", task_id=1)
+
+        assert (await anext(stream))["index"] == 0
+        await asyncio.create_task(stream.aclose())
+
+        await asyncio.wait_for(graph.closed.wait(), timeout=1)
+
+    async def test_timeout_yields_error_event(self, install_graph: Any) -> None:
+        """A run exceeding its timeout ends with an error event."""
+        graph = _EventGraph(events=100, delay=0.05)
+        install_graph(graph)
+
+        stream = stream_workflow("Build auth", task_id=1, timeout_seconds=0.1)  # type: ignore[arg-type]
+        events = [event async for event in stream]
+
+        assert events[-1]["type"] == "error"
+        assert "timeout" in events[-1]["data"]["error"]
+        assert graph.closed.is_set()
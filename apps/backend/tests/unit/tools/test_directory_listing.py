@@ -0,0 +1,107 @@
+"""Tests for the scandir walker and paginated directory listing."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.tools.base import ToolContext, set_current_context
+from src.tools.filesystem import list_directory
+from src.tools.filesystem.ignore import IgnoreMatcher
+from src.tools.filesystem.walker import walk_directory
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Create a small project tree with vendored and ignored content."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "core.py").write_text("x = 1\n")
+    (tmp_path / "src" / "main.py").write_text("print('hi')\n")
+    (tmp_path / "README.md").write_text("# Readme\n")
+    (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "lib" / "index.js").write_text("")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.txt").write_text("")
+    (tmp_path / "debug.log").write_text("")
+    (tmp_path / ".gitignore").write_text("build/\n*.log\n")
+    return tmp_path
+
+
+@pytest.fixture
+def context(tree: Path) -> Iterator[None]:
+    """Set a tool context rooted at the tree."""
+    set_current_context(ToolContext(workspace_path=str(tree)))
+    yield
+    set_current_context(None)
+
+
+class TestWalkDirectory:
+    """Tests for walk_directory."""
+
+    def test_preorder_path_order(self, tree: Path) -> None:
+        """Entries are yielded depth-first in lexicographic path order."""
+        paths = [e.path for e in walk_directory(tree, tree)]
+        assert paths == sorted(paths, key=lambda p: p.split("/"))
+        assert "src/pkg/core.py" in paths
+
+    def test_ignored_directories_are_pruned(self, tree: Path) -> None:
+        """Directories rejected by the ignore predicate are never entered."""
+        paths = [
+            e.path for e in walk_directory(tree, tree, is_ignored=IgnoreMatcher(tree).is_ignored)
+        ]
+        assert not any(p.startswith(("node_modules", "build")) for p in paths)
+        assert "src/pkg/core.py" in paths
+
+    def test_resume_after_cursor(self, tree: Path) -> None:
+        """Resuming after a path yields exactly the remaining entries."""
+        all_paths = [e.path for e in walk_directory(tree, tree)]
+        cursor = all_paths[2]
+
+        resumed = [e.path for e in walk_directory(tree, tree, after=cursor)]
+
+        assert resumed == all_paths[3:]
+
+    def test_max_depth_bounds_walk(self, tree: Path) -> None:
+        """Entries deeper than max_depth are not yielded."""
+        paths = [e.path for e in walk_directory(tree, tree, max_depth=0)]
+        assert "src" in paths
+        assert "src/main.py" not in paths
+
+
+class TestListDirectory:
+    """Tests for the list_directory tool."""
+
+    async def test_respects_gitignore_and_vendored_dirs(self, context: None) -> None:
+        """Ignored and vendored paths are left out of the listing."""
+        output = await list_directory.ainvoke({"recursive": True})
+
+        assert "src/pkg/core.py" in output
+        assert "node_modules" not in output
+        assert "build" not in output
+        assert "debug.log" not in output
+
+    async def test_pagination_with_cursor(self, context: None) -> None:
+        """Truncated listings return a cursor that continues the walk."""
+        first = await list_directory.ainvoke({"recursive": True, "max_entries": 2})
+        assert "cursor='" in first
+        cursor = first.split("cursor='")[1].split("'")[0]
+
+        second = await list_directory.ainvoke(
+            {"recursive": True, "max_entries": 100, "cursor": cursor}
+        )
+
+        assert "Listing truncated" not in second
+        assert "src/pkg/core.py" in first + second
+        first_entries = {line for line in first.splitlines() if line.startswith("  ")}
+        second_entries = {line for line in second.splitlines() if line.startswith("  ")}
+        assert not first_entries & second_entries
+
+    async def test_token_budget_truncates(self, tree: Path, context: None) -> None:
+        """Output stops once the token budget is spent."""
+        for i in range(200):
+            (tree / f"file_{i:03d}.txt").write_text("")
+
+        output = await list_directory.ainvoke({"max_tokens": 100, "max_entries": 1000})
+
+        assert "Listing truncated" in output
+        assert len(output) < 1000
@@ -0,0 +1,189 @@
+"""Tests for cached git sessions and the git tools built on them."""
+
+import shutil
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.core.config import settings
+from src.tools.base import ToolContext, ToolPermission, set_current_context
+from src.tools.execution import run_python
+from src.tools.filesystem import write_file
+from src.tools.git import git_add, git_branch_list, git_commit, git_diff, git_status
+from src.tools.git.session import get_git_session, parse_porcelain_v2
+from src.tools.security.workspace import WorkspaceManager
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Create a git repository with one commit and set a tool context."""
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Test")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "Test")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "app.py").write_text("print('v1')\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "initial")
+
+    set_current_context(
+        ToolContext(
+            workspace_path=str(tmp_path),
+            permissions={ToolPermission.READ, ToolPermission.WRITE},
+        )
+    )
+    yield tmp_path
+    set_current_context(None)
+
+
+class TestParsePorcelainV2:
+    """Tests for porcelain v2 status parsing."""
+
+    def test_parses_branch_headers_and_entries(self) -> None:
+        """Branch info, renames and untracked files are parsed."""
+        output = "\0".join(
+            [
+                "# branch.oid 644f65e2ec40c157d603762f35958e1eb0424d54",
+                "# branch.head main",
+                "# branch.upstream origin/main",
+                "# branch.ab +2 -1",
+                "1 .M N... 100644 100644 100644 aaa aaa app.py",
+                "2 R. N... 100644 100644 100644 bbb bbb R100 new name.py",
+                "old.py",
+                "? notes.txt",
+                "",
+            ]
+        )
+
+        snapshot = parse_porcelain_v2(output)
+
+        assert snapshot.branch == "main"
+        assert snapshot.upstream == "origin/main"
+        assert (snapshot.ahead, snapshot.behind) == (2, 1)
+        assert [e.path for e in snapshot.entries] == ["app.py", "new name.py", "notes.txt"]
+        assert snapshot.entries[1].original_path == "old.py"
+        assert snapshot.staged_paths == ["new name.py"]
+
+    def test_detached_head(self) -> None:
+        """Detached HEAD is reported as 'HEAD'."""
+        snapshot = parse_porcelain_v2("# branch.oid abc\0# branch.head (detached)\0")
+        assert snapshot.branch == "HEAD"
+
+
+class TestGitSession:
+    """Tests for session caching and invalidation."""
+
+    async def test_status_is_cached_until_workspace_write(self, repo: Path) -> None:
+        """Repeated git_status calls reuse one status subprocess."""
+        session = get_git_session(str(repo))
+        assert session is not None
+
+        first = await git_status.ainvoke({})
+        await git_status.ainvoke({})
+        assert "Branch: main" in first
+        assert "Working tree is clean" in first
+        assert session.subprocess_count == 1
+
+        await write_file.ainvoke({"path": "app.py", "content": "print('v2')\n"})
+        changed = await git_status.ainvoke({})
+
+        assert "M app.py" in changed
+        assert session.subprocess_count == 2
+
+    async def test_diff_uses_single_subprocess(self, repo: Path) -> None:
+        """Stat summary and patch come from one git diff call."""
+        (repo / "app.py").write_text("print('v2')\n")
+        session = get_git_session(str(repo))
+        assert session is not None
+
+        output = await git_diff.ainvoke({})
+
+        assert "Files changed: 1, +1, -1" in output
+        assert "+print('v2')" in output
+        assert session.subprocess_count == 1
+
+    async def test_commit_flow_and_object_reads(self, repo: Path) -> None:
+        """Add/commit invalidate caches and cat-file reads new objects."""
+        session = get_git_session(str(repo))
+        assert session is not None
+        await session.read_object("HEAD")
+
+        (repo / "lib.py").write_text("x = 1\n")
+        assert "lib.py" in await git_add.ainvoke({"paths": ["lib.py"]})
+        result = await git_commit.ainvoke({"message": "add lib"})
+        assert "1 file(s) changed" in result
+
+        obj = await session.read_object("HEAD:lib.py")
+        assert obj is not None
+        assert obj[1] == "blob"
+        assert obj[2] == b"x = 1\n"
+        assert await session.resolve("does-not-exist") is None
+        assert "Working tree is clean" in await git_status.ainvoke({})
+        await session.close()
+
+    async def test_branch_list_single_call(self, repo: Path) -> None:
+        """Local branches and the current branch come from for-each-ref."""
+        _git(repo, "branch", "feature/x")
+        session = get_git_session(str(repo))
+        assert session is not None
+
+        output = await git_branch_list.ainvoke({})
+
+        assert "Current branch: main" in output
+        assert "* main" in output
+        assert "feature/x" in output
+        assert session.subprocess_count == 1
+
+    async def test_status_expires_after_ttl(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Changes made by other processes show up once the cache expires."""
+        monkeypatch.setattr(settings, "git_status_cache_ttl_seconds", 60.0)
+        await git_status.ainvoke({})
+        (repo / "app.py").write_text("print('external')\n")
+
+        assert "Working tree is clean" in await git_status.ainvoke({})
+
+        monkeypatch.setattr(settings, "git_status_cache_ttl_seconds", 0.0)
+        assert "M app.py" in await git_status.ainvoke({})
+
+    async def test_run_python_invalidates_status(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files written by run_python are seen by the next status."""
+        monkeypatch.setattr(settings, "git_status_cache_ttl_seconds", 60.0)
+        await git_status.ainvoke({})
+
+        code = "open('generated.txt', 'w').write('x')"
+        await run_python.ainvoke({"code": code, "working_dir": str(repo)})
+
+        assert "generated.txt" in await git_status.ainvoke({})
+
+    async def test_workspace_cleanup_closes_session(self, tmp_path: Path) -> None:
+        """Removing a workspace stops its session's cat-file process."""
+        manager = WorkspaceManager(str(tmp_path / "workspaces"))
+        workspace = manager.create_workspace(3)
+        _git(workspace, "init", "-q")
+        session = get_git_session(str(workspace))
+        assert session is not None
+        await session.read_object("HEAD")
+        process = session._cat_file
+        assert process is not None
+
+        await manager.cleanup_workspace_async(3)
+
+        assert process.returncode is not None
+        assert get_git_session(str(workspace)) is None
+
+    def test_non_repository_has_no_session(self, tmp_path: Path) -> None:
+        """Directories outside a repository get no session."""
+        assert get_git_session(str(tmp_path)) is None
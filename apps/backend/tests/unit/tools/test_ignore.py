@@ -0,0 +1,155 @@
+"""Tests for the gitignore-aware ignore matcher and the search tools using it."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.tools.base import ToolContext, set_current_context
+from src.tools.filesystem import grep_content, search_files
+from src.tools.filesystem.ignore import IgnoreMatcher, IgnoreRules
+
+
+def _rules(*lines: str) -> IgnoreRules:
+    return IgnoreRules.from_lines(lines)
+
+
+class TestIgnoreRules:
+    """Tests for gitignore pattern semantics."""
+
+    def test_unanchored_pattern_matches_at_any_depth(self) -> None:
+        """Patterns without a slash match the name in any directory."""
+        rules = _rules("*.log")
+        assert rules.match("debug.log", False) is True
+        assert rules.match("a/b/debug.log", False) is True
+        assert rules.match("debug.txt", False) is None
+
+    def test_anchored_pattern_matches_from_base(self) -> None:
+        """Patterns with a slash are relative to the ignore file's directory."""
+        rules = _rules("/build", "docs/*.md")
+        assert rules.match("build", True) is True
+        assert rules.match("src/build", True) is None
+        assert rules.match("docs/index.md", False) is True
+        assert rules.match("docs/api/index.md", False) is None
+
+    def test_directory_only_pattern(self) -> None:
+        """A trailing slash only matches directories."""
+        rules = _rules("out/")
+        assert rules.match("out", True) is True
+        assert rules.match("out", False) is None
+
+    def test_double_star(self) -> None:
+        """'**' components match any number of directories."""
+        rules = _rules("**/generated", "logs/**", "a/**/z")
+        assert rules.match("x/y/generated", True) is True
+        assert rules.match("generated", True) is True
+        assert rules.match("logs/2024/app.txt", False) is True
+        assert rules.match("a/z", False) is True
+        assert rules.match("a/b/c/z", False) is True
+
+    def test_negation_last_rule_wins(self) -> None:
+        """Later negations re-include earlier matches."""
+        rules = _rules("*.log", "!keep.log")
+        assert rules.match("debug.log", False) is True
+        assert rules.match("keep.log", False) is False
+
+    def test_comments_escapes_and_classes(self) -> None:
+        """Comments are skipped and escapes and classes are honoured."""
+        rules = _rules("# comment", "", r"\#hash", "file[0-9].txt")
+        assert rules.match("#hash", False) is True
+        assert rules.match("file7.txt", False) is True
+        assert rules.match("fileX.txt", False) is None
+
+
+class TestIgnoreMatcher:
+    """Tests for per-directory rule precedence."""
+
+    def test_nested_ignore_files_take_precedence(self, tmp_path: Path) -> None:
+        """Deeper rule files override shallower ones and the global list."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / ".gitignore").write_text("*.tmp\n")
+        (tmp_path / "pkg" / ".gitignore").write_text("!keep.tmp\n")
+        (tmp_path / "pkg" / ".ignore").write_text("secret.txt\n")
+
+        matcher = IgnoreMatcher(tmp_path, global_patterns=["vendor/"])
+
+        assert matcher.is_ignored("a.tmp", False)
+        assert matcher.is_ignored("pkg/a.tmp", False)
+        assert not matcher.is_ignored("pkg/keep.tmp", False)
+        assert matcher.is_ignored("pkg/secret.txt", False)
+        assert matcher.is_ignored("pkg/vendor", True)
+        assert not matcher.is_ignored("pkg/main.py", False)
+
+    def test_gitignore_can_override_global_list(self, tmp_path: Path) -> None:
+        """Workspace rules re-include paths the global list excludes."""
+        (tmp_path / ".gitignore").write_text("!venv/\n")
+        matcher = IgnoreMatcher(tmp_path, global_patterns=["venv/"])
+        assert not matcher.is_ignored("venv", True)
+
+    def test_recompiles_after_file_changes(self, tmp_path: Path) -> None:
+        """Edited ignore files are picked up by new matchers."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("*.a\n")
+        assert IgnoreMatcher(tmp_path, global_patterns=[]).is_ignored("x.a", False)
+
+        gitignore.write_text("*.bb\n")
+        matcher = IgnoreMatcher(tmp_path, global_patterns=[])
+        assert not matcher.is_ignored("x.a", False)
+        assert matcher.is_ignored("x.bb", False)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Iterator[Path]:
+    """Create a project with ignored, vendored and hidden content."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "app.py").write_text("import os\n")
+    (tmp_path / "src" / "pkg" / "util.py").write_text("import sys\n")
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "index.py").write_text("import os\n")
+    (tmp_path / "dist").mkdir()
+    (tmp_path / "dist" / "bundle.py").write_text("import os\n")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "secret.py").write_text("import os\n")
+    (tmp_path / ".gitignore").write_text("dist/\n")
+
+    set_current_context(ToolContext(workspace_path=str(tmp_path)))
+    yield tmp_path
+    set_current_context(None)
+
+
+class TestSearchTools:
+    """Tests for search_files and grep_content traversal."""
+
+    async def test_search_files_skips_ignored_trees(self, project: Path) -> None:
+        """Recursive file search leaves out ignored, vendored and hidden paths."""
+        output = await search_files.ainvoke({"pattern": "**/*.py"})
+
+        assert "src/app.py" in output
+        assert "src/pkg/util.py" in output
+        assert "node_modules" not in output
+        assert "dist" not in output
+        assert ".hidden" not in output
+
+    async def test_search_files_non_recursive_pattern(self, project: Path) -> None:
+        """Patterns without '**' only match at the depth they describe."""
+        output = await search_files.ainvoke({"pattern": "*.py", "path": "src"})
+
+        assert "src/app.py" in output
+        assert "util.py" not in output
+
+        nested = await search_files.ainvoke({"pattern": "pkg/*.py", "path": "src"})
+        assert "src/pkg/util.py" in nested
+
+    async def test_search_files_truncates(self, project: Path) -> None:
+        """Results stop at max_results."""
+        output = await search_files.ainvoke({"pattern": "**/*.py", "max_results": 1})
+        assert "(truncated to 1)" in output
+
+    async def test_grep_content_skips_ignored_trees(self, project: Path) -> None:
+        """Content search only reads files that are not ignored."""
+        output = await grep_content.ainvoke({"pattern": "import os", "file_pattern": "*.py"})
+
+        assert "src/app.py" in output
+        assert "Searched 2 files" in output
+        assert "node_modules" not in output
+        assert "dist/" not in output
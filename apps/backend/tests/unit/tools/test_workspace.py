@@ -0,0 +1,344 @@
+"""Tests for workspace management and provisioning strategies."""
+
+import errno
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.tools.base import ToolContext, ToolPermission, set_current_context
+from src.tools.exceptions import WorkspaceQuotaExceededError
+from src.tools.filesystem import create_directory, delete_file, edit_file, write_file
+from src.tools.security import provisioning as provisioning_module
+from src.tools.security import workspace as workspace_module
+from src.tools.security.provisioning import (
+    CopyStrategy,
+    GitCloneStrategy,
+    HardlinkStrategy,
+    ProvisioningStrategy,
+    ReflinkStrategy,
+    WorkspaceProvisioner,
+    break_hardlink,
+    break_workspace_hardlinks,
+    break_workspace_hardlinks_async,
+)
+from src.tools.security.workspace import WorkspaceManager
+
+
+@pytest.fixture
+def source_repo(tmp_path: Path) -> Path:
+    """Create a small source repository tree."""
+    source = tmp_path / "source"
+    (source / "src").mkdir(parents=True)
+    (source / "src" / "main.py").write_text("print('hello')\n")
+    (source / "README.md").write_text("# Project\n")
+    (source / "__pycache__").mkdir()
+    (source / "__pycache__" / "main.cpython-312.pyc").write_bytes(b"\x00")
+    return source
+
+
+class _FailingStrategy(ProvisioningStrategy):
+    """Strategy that creates a partial target and then fails."""
+
+    name = "failing"
+
+    def is_supported(self, source: Path, target: Path) -> bool:
+        return True
+
+    def provision(self, source: Path, target: Path) -> None:
+        target.mkdir(parents=True)
+        (target / "partial.txt").write_text("partial")
+        raise OSError("simulated failure")
+
+
+class TestWorkspaceProvisioner:
+    """Tests for the provisioning strategy chain."""
+
+    def test_copy_is_always_final_fallback(self) -> None:
+        """Copy is appended when not explicitly configured."""
+        provisioner = WorkspaceProvisioner(["hardlink"])
+        assert [s.name for s in provisioner.strategies] == ["hardlink", "copy"]
+
+    def test_hardlink_is_opt_in(self) -> None:
+        """The default chain never shares inodes with the source."""
+        provisioner = WorkspaceProvisioner()
+        assert [s.name for s in provisioner.strategies] == ["reflink", "git_clone", "copy"]
+
+    def test_unknown_strategy_rejected(self) -> None:
+        """Unknown strategy names raise ValueError."""
+        with pytest.raises(ValueError, match="nope"):
+            WorkspaceProvisioner(["nope"])
+
+    def test_hardlink_shares_inodes_and_skips_ignored(
+        self, source_repo: Path, tmp_path: Path
+    ) -> None:
+        """Hardlink farm shares file data and applies ignore patterns."""
+        target = tmp_path / "ws"
+        result = WorkspaceProvisioner(["hardlink"]).provision(source_repo, target)
+
+        assert result.strategy.name == "hardlink"
+        assert (target / "src" / "main.py").stat().st_ino == (
+            source_repo / "src" / "main.py"
+        ).stat().st_ino
+        assert not (target / "__pycache__").exists()
+
+    def test_failed_strategy_falls_back_cleanly(self, source_repo: Path, tmp_path: Path) -> None:
+        """A failing strategy's partial output is removed before fallback."""
+        provisioner = WorkspaceProvisioner(["copy"])
+        provisioner._strategies.insert(0, _FailingStrategy())
+        target = tmp_path / "ws"
+
+        result = provisioner.provision(source_repo, target)
+
+        assert result.strategy.name == "copy"
+        assert not (target / "partial.txt").exists()
+        assert (target / "README.md").read_text() == "# Project\n"
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_git_clone_has_its_own_refs(self, source_repo: Path, tmp_path: Path) -> None:
+        """Clones copy ignored files and keep branches and commits to themselves."""
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        (source_repo / ".gitignore").write_text(".env\n__pycache__/\n")
+        (source_repo / ".env").write_text("TOKEN=1\n")
+        subprocess.run([*git, "init", "-q"], cwd=source_repo, check=True)
+        subprocess.run([*git, "add", "."], cwd=source_repo, check=True)
+        subprocess.run([*git, "commit", "-qm", "init"], cwd=source_repo, check=True)
+
+        strategy = GitCloneStrategy()
+        target = tmp_path / "ws"
+        assert strategy.is_supported(source_repo, target) is True
+
+        strategy.provision(source_repo, target)
+        assert (target / "src" / "main.py").read_text() == "print('hello')\n"
+        assert (target / ".env").read_text() == "TOKEN=1\n"
+        assert not (target / "__pycache__").exists()
+
+        subprocess.run([*git, "checkout", "-qb", "feature"], cwd=target, check=True)
+        subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "ws"], cwd=target, check=True)
+        branches = subprocess.run(
+            ["git", "branch", "--format=%(refname:short)"],
+            cwd=source_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert "feature" not in branches.stdout.split()
+        remotes = subprocess.run(
+            ["git", "remote"], cwd=target, capture_output=True, text=True, check=True
+        )
+        assert remotes.stdout == ""
+
+        strategy.release(source_repo, target)
+        assert not target.exists()
+        assert (source_repo / "src" / "main.py").exists()
+
+        (source_repo / "dirty.txt").write_text("uncommitted")
+        assert strategy.is_supported(source_repo, target) is False
+
+    def test_copy_strategy_creates_independent_files(
+        self, source_repo: Path, tmp_path: Path
+    ) -> None:
+        """Copies do not share inodes with the source."""
+        target = tmp_path / "ws"
+        CopyStrategy().provision(source_repo, target)
+        assert (target / "README.md").stat().st_ino != (source_repo / "README.md").stat().st_ino
+
+
+class TestReflinkStrategy:
+    """Tests for detecting filesystems without reflink support."""
+
+    @pytest.fixture
+    def clone_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Make every clone fail as on ext4 (EOPNOTSUPP), recording the sources."""
+        calls: list[str] = []
+
+        def fail(src: str, dst: str) -> str:
+            calls.append(src)
+            raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+        monkeypatch.setattr(provisioning_module, "_reflink_file", fail)
+        monkeypatch.setattr(ReflinkStrategy, "_supported_devices", {})
+        monkeypatch.setattr(provisioning_module.sys, "platform", "linux")
+        return calls
+
+    def test_probe_runs_once_per_filesystem(
+        self, source_repo: Path, tmp_path: Path, clone_calls: list[str]
+    ) -> None:
+        """Support is probed with a temporary file and cached."""
+        assert ReflinkStrategy().is_supported(source_repo, tmp_path / "ws" / "1") is False
+        assert ReflinkStrategy().is_supported(source_repo, tmp_path / "2") is False
+
+        assert len(clone_calls) == 1
+        assert list(tmp_path.iterdir()) == [source_repo]
+
+    def test_unsupported_clone_stops_tree_walk(
+        self, source_repo: Path, tmp_path: Path, clone_calls: list[str]
+    ) -> None:
+        """The first file the filesystem cannot clone ends the attempt."""
+        with pytest.raises(OSError, match="Reflink not supported"):
+            ReflinkStrategy().provision(source_repo, tmp_path / "ws")
+
+        assert len(clone_calls) == 1
+
+    def test_copy_failures_are_summarised(
+        self, source_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Other per-file failures are reported as a count and a sample of paths."""
+
+        def deny(src: str, dst: str) -> str:
+            raise PermissionError(errno.EACCES, "Permission denied")
+
+        monkeypatch.setattr(CopyStrategy, "_copy_function", lambda self: deny)
+        for n in range(10):
+            (source_repo / f"module_{n}.py").write_text("")
+
+        with pytest.raises(OSError, match=r"^12 entries failed to copy") as exc_info:
+            CopyStrategy().provision(source_repo, tmp_path / "ws")
+
+        assert str(exc_info.value).count(str(source_repo)) == 3
+
+
+class TestBreakHardlink:
+    """Tests for copy-on-write of hardlinked files."""
+
+    def test_write_after_break_leaves_source_untouched(
+        self, source_repo: Path, tmp_path: Path
+    ) -> None:
+        """Breaking the link gives the workspace file its own inode."""
+        target = tmp_path / "ws"
+        HardlinkStrategy().provision(source_repo, target)
+        linked = target / "README.md"
+
+        break_hardlink(linked)
+        linked.write_text("changed")
+
+        assert linked.stat().st_nlink == 1
+        assert (source_repo / "README.md").read_text() == "# Project\n"
+
+    def test_missing_file_is_noop(self, tmp_path: Path) -> None:
+        """Files that don't exist yet are ignored."""
+        assert break_hardlink(tmp_path / "missing.txt") is False
+
+    async def test_workspace_links_broken_before_subprocesses(
+        self, source_repo: Path, tmp_path: Path
+    ) -> None:
+        """Every file of a hardlink farm gets its own inode, once."""
+        target = tmp_path / "ws"
+        HardlinkStrategy().provision(source_repo, target)
+
+        assert await break_workspace_hardlinks_async(target / "src") == 2
+
+        assert (target / "src" / "main.py").stat().st_nlink == 1
+        assert (target / "README.md").stat().st_nlink == 1
+        assert break_workspace_hardlinks(target) == 0
+
+    def test_other_workspaces_untouched(self, source_repo: Path, tmp_path: Path) -> None:
+        """Paths outside hardlink farms are not walked."""
+        target = tmp_path / "ws"
+        CopyStrategy().provision(source_repo, target)
+        (target / "alias.md").hardlink_to(target / "README.md")
+
+        assert break_workspace_hardlinks(target) == 0
+        assert (target / "README.md").stat().st_nlink == 2
+
+
+class TestWorkspaceManager:
+    """Tests for WorkspaceManager provisioning integration."""
+
+    async def test_create_and_cleanup_async(self, source_repo: Path, tmp_path: Path) -> None:
+        """Workspaces are provisioned and released off the event loop."""
+        manager = WorkspaceManager(
+            str(tmp_path / "workspaces"),
+            provisioner=WorkspaceProvisioner(["hardlink"]),
+        )
+
+        workspace = await manager.create_workspace_async(1, str(source_repo))
+        assert (workspace / "src" / "main.py").exists()
+        assert manager.workspace_exists(1)
+
+        await manager.cleanup_workspace_async(1)
+        assert not workspace.exists()
+        assert (source_repo / "src" / "main.py").exists()
+
+
+@pytest.fixture
+def tracked_workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Register a workspace with the global manager and set a tool context."""
+    manager = WorkspaceManager(str(tmp_path / "workspaces"))
+    monkeypatch.setattr(workspace_module, "_workspace_manager", manager)
+
+    workspace = manager.create_workspace(7)
+    set_current_context(
+        ToolContext(
+            workspace_path=str(workspace),
+            task_id=7,
+            permissions={ToolPermission.READ, ToolPermission.WRITE, ToolPermission.DELETE},
+        )
+    )
+    yield manager
+    set_current_context(None)
+
+
+class TestWorkspaceUsage:
+    """Tests for incremental usage tracking and disk quotas."""
+
+    async def test_tools_update_running_totals(self, tracked_workspace: WorkspaceManager) -> None:
+        """Filesystem tools keep stats in sync without rescanning."""
+        await write_file.ainvoke({"path": "pkg/mod.py", "content": "x = 1\n"})
+        await edit_file.ainvoke({"path": "pkg/mod.py", "old_content": "1", "new_content": "100"})
+        await create_directory.ainvoke({"path": "docs/api"})
+        await write_file.ainvoke({"path": "notes.txt", "content": "abc"})
+        await delete_file.ainvoke({"path": "notes.txt"})
+
+        stats = tracked_workspace.get_workspace_stats(7)
+        assert stats["file_count"] == 1
+        assert stats["directory_count"] == 3
+        assert stats["total_size_bytes"] == len("x = 100\n")
+
+        workspace = tracked_workspace.get_workspace(7)
+        assert workspace_module.scan_workspace_usage(workspace) == (1, 3, len("x = 100\n"))
+
+    async def test_quota_blocks_oversized_write(self, tracked_workspace: WorkspaceManager) -> None:
+        """Writes beyond the quota are rejected before touching disk."""
+        tracked_workspace.set_quota(7, 10)
+
+        await write_file.ainvoke({"path": "small.txt", "content": "12345"})
+        with pytest.raises(WorkspaceQuotaExceededError):
+            await write_file.ainvoke({"path": "big.txt", "content": "x" * 20})
+
+        assert not (tracked_workspace.get_workspace(7) / "big.txt").exists()
+        assert tracked_workspace.get_workspace_stats(7)["bytes_written"] == 5
+
+    async def test_reconcile_corrects_external_changes(
+        self, tracked_workspace: WorkspaceManager
+    ) -> None:
+        """A reconciliation scan picks up files written outside the tools."""
+        (tracked_workspace.get_workspace(7) / "generated.bin").write_bytes(b"\x00" * 64)
+        assert tracked_workspace.get_workspace_stats(7)["file_count"] == 0
+
+        await tracked_workspace.reconcile_async(7)
+
+        stats = tracked_workspace.get_workspace_stats(7)
+        assert stats["file_count"] == 1
+        assert stats["total_size_bytes"] == 64
+
+    async def test_reconcile_keeps_writes_recorded_during_scan(
+        self, tracked_workspace: WorkspaceManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Totals recorded while the scan runs are not overwritten by its result."""
+        workspace = tracked_workspace.get_workspace(7)
+        (workspace / "generated.bin").write_bytes(b"\x00" * 64)
+        scan = workspace_module.scan_workspace_usage
+
+        def scan_during_write(root: Path) -> tuple[int, int, int]:
+            result = scan(root)
+            tracked_workspace.record_file_write(7, None, 10)
+            return result
+
+        monkeypatch.setattr(workspace_module, "scan_workspace_usage", scan_during_write)
+        await tracked_workspace.reconcile_async(7)
+
+        stats = tracked_workspace.get_workspace_stats(7)
+        assert stats["file_count"] == 2
+        assert stats["total_size_bytes"] == 74